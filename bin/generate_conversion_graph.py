@@ -26,6 +26,12 @@ removing a conversion::
 Layout is force-directed, so the seed decides whether the result is readable. The default
 was chosen by ``--search``, which scores candidates on node spacing, node-to-edge
 clearance, and edge crossings; re-run it after the graph changes.
+
+The same source scan also produces ``qbraid/transpiler/conversions/_manifest.py``, the static
+list of conversion functions the default ``ConversionGraph`` is built from without importing
+any quantum SDK. Regenerate it after adding, removing, or re-decorating a conversion::
+
+    python bin/generate_conversion_graph.py --manifest
 """
 from __future__ import annotations
 
@@ -40,6 +46,7 @@ import rustworkx as rx
 
 REPO = pathlib.Path(__file__).resolve().parent.parent
 CONVERSIONS = REPO / "qbraid" / "transpiler" / "conversions"
+MANIFEST = CONVERSIONS / "_manifest.py"
 OUT_DIR = REPO / "docs" / "_static"
 
 # Seed chosen by --search over 0..6000. See module docstring.
@@ -142,6 +149,85 @@ def parse_conversions(aliases: set[str]) -> list[tuple[str, str, bool]]:
     return edges
 
 
+def _decorator_name(node: ast.expr) -> str:
+    """Return the name of a decorator, whether applied bare or called with arguments."""
+    return getattr(node, "id", "") or getattr(getattr(node, "func", None), "id", "")
+
+
+def parse_manifest() -> list[tuple]:
+    """Return a manifest entry for every conversion function the conversions package exports.
+
+    Each entry is ``(source, target, module, function, weight, requires_extras, non_mutating)``.
+    Only names re-exported by a subpackage ``__init__`` are included, since those are the
+    functions ``qbraid.transpiler.conversions`` registers. Entries are ordered by subpackage,
+    then by function name.
+    """
+    entries = []
+    for init in sorted(CONVERSIONS.glob("*/__init__.py")):
+        package = init.parent.name
+        for node in ast.parse(init.read_text()).body:
+            if not isinstance(node, ast.ImportFrom) or node.level != 1:
+                continue
+            source_file = init.parent / f"{node.module}.py"
+            functions = {
+                fn.name: fn
+                for fn in ast.parse(source_file.read_text()).body
+                if isinstance(fn, ast.FunctionDef)
+            }
+            for alias in node.names:
+                weight, extras, non_mutating = None, (), False
+                for dec in functions[alias.name].decorator_list:
+                    name = _decorator_name(dec)
+                    if name == "weight":
+                        weight = ast.literal_eval(dec.args[0])
+                    elif name == "requires_extras":
+                        extras = tuple(ast.literal_eval(arg) for arg in dec.args)
+                    elif name == "non_mutating":
+                        non_mutating = True
+                source, _, target = alias.name.partition("_to_")
+                module = f"qbraid.transpiler.conversions.{package}.{node.module}"
+                entries.append((source, target, module, alias.name, weight, extras, non_mutating))
+    return sorted(entries, key=lambda entry: (entry[2].split(".")[3], entry[3]))
+
+
+def _literal(value) -> str:
+    """Return the source of a manifest value, quoted as ``black`` would."""
+    if isinstance(value, str):
+        return f'"{value}"'
+    if isinstance(value, tuple):
+        items = ", ".join(_literal(item) for item in value)
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    return repr(value)
+
+
+def render_manifest(entries: list[tuple]) -> str:
+    """Return the source of the manifest module, formatted as ``black`` would."""
+    header = (REPO / "qbraid" / "transpiler" / "conversions" / "__init__.py").read_text()
+    license_text = header.split('"""', 1)[0]
+    lines = [
+        license_text.rstrip("\n"),
+        "",
+        '"""',
+        "Static manifest of the conversion functions in qbraid.transpiler.conversions.",
+        "",
+        "Generated by ``python bin/generate_conversion_graph.py --manifest``. Do not edit.",
+        "",
+        '"""',
+        "from typing import Optional",
+        "",
+        "# (source, target, module, function, weight, requires_extras, non_mutating)",
+        "ManifestEntry = tuple[str, str, str, str, Optional[float], tuple[str, ...], bool]",
+        "",
+        "CONVERSION_MANIFEST: list[ManifestEntry] = [",
+    ]
+    for entry in entries:
+        lines.append("    (")
+        lines.extend(f"        {_literal(value)}," for value in entry)
+        lines.append("    ),")
+    lines.append("]")
+    return "\n".join(lines) + "\n"
+
+
 def build_graph(edges: list[tuple[str, str, bool]]) -> tuple[rx.PyDiGraph, list[str]]:
     """Return a rustworkx digraph over every node the diagram shows, and its node order."""
     nodes = sorted({n for src, tgt, _ in edges for n in (src, tgt)} | set(ISOLATED_TYPES))
@@ -403,7 +489,7 @@ def _legend(c: dict[str, str], graph: rx.PyDiGraph) -> str:
 
 
 def main() -> None:
-    """Write both SVG variants, or search for a layout seed."""
+    """Write both SVG variants or the conversion manifest, or search for a layout seed."""
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
     parser.add_argument(
@@ -412,8 +498,19 @@ def main() -> None:
         metavar="N",
         help="score seeds 0..N and print the best, instead of writing files",
     )
+    parser.add_argument(
+        "--manifest",
+        action="store_true",
+        help=f"write {MANIFEST.relative_to(REPO)} instead of the SVG diagrams",
+    )
     args = parser.parse_args()
 
+    if args.manifest:
+        entries = parse_manifest()
+        MANIFEST.write_text(render_manifest(entries))
+        print(f"{len(entries)} conversions, wrote {MANIFEST.relative_to(REPO)}")
+        return
+
     aliases = native_aliases() | EXTERNAL_ALIASES | set(ISOLATED_TYPES)
     edges = parse_conversions(aliases)
     graph, names = build_graph(edges)
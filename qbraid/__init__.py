@@ -26,6 +26,8 @@ Functions
     about
     clear_cache
     cache_disabled
+    enable_persistent_cache
+    disable_persistent_cache
 
 Exceptions
 -----------
@@ -40,7 +42,12 @@ import importlib
 from typing import TYPE_CHECKING
 
 from ._about import about
-from ._caching import cache_disabled, clear_cache
+from ._caching import (
+    cache_disabled,
+    clear_cache,
+    disable_persistent_cache,
+    enable_persistent_cache,
+)
 from ._version import __version__
 from .exceptions import QbraidError
 
@@ -50,6 +57,8 @@ __all__ = [
     "__version__",
     "clear_cache",
     "cache_disabled",
+    "enable_persistent_cache",
+    "disable_persistent_cache",
 ]
 
 _lazy = {
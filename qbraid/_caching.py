@@ -14,8 +14,8 @@
 
 """
 Functions and decorators for efficient caching to improve function and method performance.
-Includes bounded method-result caching with TTL expiration and customizable caching for
-specific needs.
+Includes bounded method-result caching with TTL expiration, customizable caching for
+specific needs, and an optional on-disk tier shared between processes.
 
 """
 
@@ -23,23 +23,57 @@ import functools
 import hashlib
 import json
 import os
+import pickle
+import sqlite3
 import threading
 import time
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from contextlib import contextmanager
-from typing import Any, Callable, Generator, Optional, TypeVar, overload
+from pathlib import Path
+from typing import Any, Callable, Generator, Hashable, Optional, TypeVar, Union, overload
+
+from ._logging import logger
+from ._version import __version__
 
 TFunc = TypeVar("TFunc", bound=Callable)
 
 
 _CACHE_REGISTRY = []
 
+_MISSING = object()
+
+DEFAULT_PERSISTENT_CACHE_PATH = Path.home() / ".qbraid" / "cache" / "cached_methods.sqlite"
+
 # Mirrors the field layout of ``functools.lru_cache().cache_info()`` so callers
 # relying on ``cache_info().currsize`` (etc.) keep working.
 CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
 
-def _generate_cache_key(instance: Any, func_name: str, args: tuple, kwargs: dict) -> str:
+def _instance_key(instance: Any) -> int:
+    """Return ``hash(instance)``, or ``id(instance)`` if the instance is unhashable."""
+    try:
+        return hash(instance)
+    except TypeError:
+        return id(instance)
+
+
+def _json_cache_key(instance: Any, func_name: str, args: tuple, kwargs: dict) -> str:
+    """Generate a cache key as the SHA-256 of the JSON-serialized class name, instance
+    identity, function name, args, and kwargs. Supports unhashable (JSON-serializable)
+    arguments such as ``list`` and ``dict``.
+    """
+    key_data = {
+        "class_name": instance.__class__.__name__,
+        "instance_key": _instance_key(instance),
+        "func_name": func_name,
+        "args": args,
+        "kwargs": kwargs,
+    }
+    key_str = json.dumps(key_data, sort_keys=True)
+    return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+def _generate_cache_key(instance: Any, func_name: str, args: tuple, kwargs: dict) -> Hashable:
     """Generate a cache key based on the class name, instance identity, function name,
     args, and kwargs.
 
@@ -48,78 +82,394 @@ def _generate_cache_key(instance: Any, func_name: str, args: tuple, kwargs: dict
     so same credentials → shared cache; different credentials → separate entries). Classes
     that are unhashable (e.g. define ``__eq__`` without ``__hash__``) fall back to
     ``id(instance)``, degrading to per-instance caching rather than raising.
+
+    When every argument is hashable, the key is a plain tuple, which is much cheaper to build
+    than a serialized digest. Otherwise, the key falls back to :func:`_json_cache_key`. The
+    tuple records the type of each argument, since e.g. ``1``, ``True``, and ``1.0`` hash and
+    compare equal but must not share a cache entry.
     """
+    key = (
+        instance.__class__.__name__,
+        _instance_key(instance),
+        func_name,
+        tuple((type(arg), arg) for arg in args),
+        tuple(sorted((name, type(value), value) for name, value in kwargs.items())),
+    )
     try:
-        instance_key = hash(instance)
+        hash(key)
     except TypeError:
-        instance_key = id(instance)
+        return _json_cache_key(instance, func_name, args, kwargs)
+    return key
+
+
+class PersistentMethodCache:
+    """
+    On-disk store of :py:func:`cached_method` results, backed by a sqlite database.
+
+    Serves as a second cache tier behind the in-memory cache of methods decorated with
+    ``@cached_method(persist=True)``, so that results survive the process and are shared
+    between processes using the same database file. Entries are grouped by namespace, which
+    identifies the credentials of the instance the method was called on. Results are stored
+    pickled, and results that cannot be pickled are not stored.
+
+    .. warning::
+
+        Stored results are unpickled on read, and unpickling data can execute arbitrary
+        code. Only open cache files that you created, or otherwise trust. New database files
+        are created readable and writable by their owner only, in a directory only their
+        owner can access.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the sqlite database file. It is created,
+            along with its parent directories, if it does not exist.
+        maxsize (Optional[int]): The maximum number of stored results. When exceeded, the
+            oldest entries are evicted. If None, the store size is unbounded.
+        ttl (Optional[float]): The number of seconds after which a stored result expires.
+            If None, entries never expire.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        maxsize: Optional[int] = 1024,
+        ttl: Optional[float] = 3600,
+    ):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer or None.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number or None.")
+        self._path = os.fspath(path)
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = threading.RLock()
+        if self._path != ":memory:" and not os.path.exists(self._path):
+            Path(self._path).parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            os.close(os.open(self._path, os.O_CREAT | os.O_WRONLY, 0o600))
+        self._conn = sqlite3.connect(self._path, check_same_thread=False, timeout=10)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                "created REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+
+    @property
+    def path(self) -> str:
+        """Return the path of the sqlite database file."""
+        return self._path
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        """Return the maximum number of stored results."""
+        return self._maxsize
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """Return the number of seconds after which a stored result expires."""
+        return self._ttl
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Return the result stored under key in the given namespace, or default."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM results WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return default
+            value, created = row
+            if self._ttl is not None and (time.time() - created) >= self._ttl:
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM results WHERE namespace = ? AND key = ?", (namespace, key)
+                    )
+                return default
+        try:
+            return pickle.loads(value)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.debug("Discarding unreadable persistent cache entry: %s", err)
+            return default
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a result under key in the given namespace."""
+        if self._maxsize == 0:
+            return
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError) as err:
+            logger.debug("Skipping persistent cache: result is not picklable: %s", err)
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (namespace, key, value, created) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, sqlite3.Binary(data), time.time()),
+            )
+            if self._maxsize is not None:
+                self._conn.execute(
+                    "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results "
+                    "ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                    (self._maxsize,),
+                )
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Remove all stored results, or only those in the given namespace."""
+        with self._lock, self._conn:
+            if namespace is None:
+                self._conn.execute("DELETE FROM results")
+            else:
+                self._conn.execute("DELETE FROM results WHERE namespace = ?", (namespace,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the sqlite database."""
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self._path}', maxsize={self._maxsize}, ttl={self._ttl})"
+
+
+_persistent_cache: Optional[PersistentMethodCache] = None
+_persistent_cache_configured = False
+_persistent_cache_lock = threading.Lock()
+
+
+def enable_persistent_cache(
+    path: Optional[Union[str, os.PathLike]] = None,
+    maxsize: Optional[int] = 1024,
+    ttl: Optional[float] = 3600,
+) -> PersistentMethodCache:
+    """
+    Enable the on-disk tier of methods decorated with ``@cached_method(persist=True)``,
+    such as the device lookups of :py:class:`~qbraid.runtime.QbraidProvider`.
+
+    Setting the environment variable ``QBRAID_PERSISTENT_CACHE=1`` enables the on-disk tier
+    with the default settings, unless this function or :py:func:`disable_persistent_cache`
+    is called first.
+
+    Args:
+        path (optional, Union[str, os.PathLike]): The path of the sqlite database file.
+            Defaults to ``~/.qbraid/cache/cached_methods.sqlite``.
+        maxsize (optional, int): The maximum number of stored results. Defaults to 1024.
+        ttl (optional, float): The number of seconds after which a stored result expires.
+            Defaults to 3600.
+
+    Returns:
+        PersistentMethodCache: The store now used as the on-disk tier.
+    """
+    global _persistent_cache, _persistent_cache_configured  # pylint: disable=global-statement
+    store = PersistentMethodCache(
+        path if path is not None else DEFAULT_PERSISTENT_CACHE_PATH, maxsize=maxsize, ttl=ttl
+    )
+    with _persistent_cache_lock:
+        previous, _persistent_cache = _persistent_cache, store
+        _persistent_cache_configured = True
+    if previous is not None:
+        previous.close()
+    return store
+
+
+def disable_persistent_cache() -> None:
+    """Disable the on-disk tier of methods decorated with ``@cached_method(persist=True)``."""
+    global _persistent_cache, _persistent_cache_configured  # pylint: disable=global-statement
+    with _persistent_cache_lock:
+        previous, _persistent_cache = _persistent_cache, None
+        _persistent_cache_configured = True
+    if previous is not None:
+        previous.close()
+
+
+def _get_persistent_cache() -> Optional[PersistentMethodCache]:
+    """Return the on-disk tier, enabling it first if requested by environment variable."""
+    if not _persistent_cache_configured and os.getenv("QBRAID_PERSISTENT_CACHE") == "1":
+        enable_persistent_cache()
+    return _persistent_cache
+
+
+def _persistent_cache_key(func: Callable[..., Any], args: tuple, kwargs: dict) -> Optional[str]:
+    """Generate a cache key that is stable across processes, or None if the arguments
+    are not JSON-serializable. Includes the qBraid version, so results stored by other
+    versions are never read.
+    """
     key_data = {
-        "class_name": instance.__class__.__name__,
-        "instance_key": instance_key,
-        "func_name": func_name,
+        "version": __version__,
+        "func": f"{func.__module__}.{func.__qualname__}",
         "args": args,
         "kwargs": kwargs,
     }
-    key_str = json.dumps(key_data, sort_keys=True)
+    try:
+        key_str = json.dumps(key_data, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
     return hashlib.sha256(key_str.encode()).hexdigest()
 
 
-def _cached_method_wrapper(ttl: int = 120, maxsize: Optional[int] = 128) -> Callable:
+def _call_with_persistent_cache(
+    func: Callable[..., Any], instance: Any, args: tuple, kwargs: dict
+) -> Any:
+    """Call a method, reusing its result from the on-disk tier if enabled and applicable."""
+    store = _get_persistent_cache()
+    namespace_func = getattr(instance, "_cache_namespace", None) if store is not None else None
+    namespace = namespace_func() if namespace_func is not None else None
+    disk_key = _persistent_cache_key(func, args, kwargs) if namespace else None
+    if disk_key is None:
+        return func(instance, *args, **kwargs)
+
+    result = store.get(namespace, disk_key, _MISSING)
+    if result is _MISSING:
+        result = func(instance, *args, **kwargs)
+        store.set(namespace, disk_key, result)
+    return result
+
+
+class _InFlight:
+    """A pending computation of a cached method result, which concurrent callers wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> Any:
+        """Block until the computation finishes, then return its result or raise its error."""
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+# pylint: disable-next=too-many-statements
+def _cached_method_wrapper(
+    ttl: int = 120,
+    maxsize: Optional[int] = 128,
+    persist: bool = False,
+    stale_while_revalidate: int = 0,
+) -> Callable:
     """A decorator to cache the results of methods with optional TTL and maxsize options.
 
-    Entries are keyed by ``_generate_cache_key``, a SHA-256 of the JSON-serialized
-    (class, method, args, kwargs). Because the key is derived from a JSON serialization
-    rather than by hashing the raw arguments, decorated methods may be called with
-    unhashable arguments (e.g. ``list`` / ``dict``) and still be cached — unlike a plain
-    ``functools.lru_cache``, which raises ``TypeError: unhashable type`` for such args.
+    Entries are keyed by ``_generate_cache_key``: a tuple of (class, instance, method, args,
+    kwargs) when the arguments are hashable, or else a SHA-256 of their JSON serialization.
+    Decorated methods may therefore be called with unhashable arguments (e.g. ``list`` /
+    ``dict``) and still be cached — unlike a plain ``functools.lru_cache``, which raises
+    ``TypeError: unhashable type`` for such args.
 
     ``maxsize`` bounds the cache, evicting the oldest entry *by insertion time* — not
     strict LRU, since reads don't refresh the timestamp (it also drives TTL expiry, and
-    refreshing it on hits would keep hot entries stale forever). ``maxsize=0`` disables
-    caching entirely, matching ``functools.lru_cache``. Cache reads/writes are guarded
-    by a per-method lock; the decorated function itself runs outside the lock, so slow
-    concurrent misses may compute duplicates but never serialize.
+    refreshing it on hits would keep hot entries stale forever). Entries are kept in
+    insertion order, so both eviction and dropping expired entries take constant time per
+    entry removed. ``maxsize=0`` disables the in-memory cache, matching ``functools.lru_cache``.
+    Cache reads/writes are guarded by a per-method lock; the decorated function itself runs
+    outside the lock. Concurrent misses on the same key are coalesced: the first caller
+    computes the result while the others wait for it (and receive its exception, if it
+    raises), so an expired entry triggers one call rather than one per thread. Misses on
+    different keys never wait on each other.
+
+    With ``stale_while_revalidate`` set to a number of seconds, an entry that expired less
+    than that long ago is still returned, while a background thread recomputes it. If the
+    refresh fails, the stale entry keeps being served until it is too old.
+
+    With ``persist=True``, in-memory misses are looked up in, and results written to, the
+    on-disk tier (see :py:func:`enable_persistent_cache`) when it is enabled. Only instances
+    providing a ``_cache_namespace()`` method use the on-disk tier. The namespace must be
+    stable across processes, which ``hash(instance)`` is not (``str`` hashes are salted per
+    process), and should identify the credentials the instance uses.
     """
 
+    # pylint: disable-next=too-many-statements
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        # Maps cache key -> (result, timestamp). Keyed by the JSON-derived hash, so
-        # unhashable positional/keyword arguments are supported.
-        cache: dict[str, tuple[Any, float]] = {}
+        # Maps cache key -> (result, timestamp), ordered from oldest to newest insertion.
+        cache: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
         stats = {"hits": 0, "misses": 0}
         lock = threading.RLock()
 
-        def _evict_if_needed() -> None:
-            # Bound the cache size by evicting the oldest entry by insertion timestamp.
-            if maxsize is not None and cache and len(cache) >= maxsize:
-                oldest_key = min(cache, key=lambda k: cache[k][1])
-                del cache[oldest_key]
+        # Maps cache key -> the pending computation of its result.
+        inflight: dict[Hashable, _InFlight] = {}
+
+        def _evict_if_needed(now: float) -> None:
+            # Drop entries too old to be served, which are all at the front, then bound the
+            # cache size by evicting the oldest entries.
+            while cache and now - next(iter(cache.values()))[1] >= ttl + stale_while_revalidate:
+                cache.popitem(last=False)
+            while maxsize is not None and cache and len(cache) >= maxsize:
+                cache.popitem(last=False)
+
+        def _call(self, args: tuple, kwargs: dict) -> Any:
+            if persist:
+                return _call_with_persistent_cache(func, self, args, kwargs)
+            return func(self, *args, **kwargs)
+
+        def _compute(self, key: Hashable, args: tuple, kwargs: dict, flight: _InFlight) -> Any:
+            # Compute the result for an in-flight key, then cache it and release any waiters.
+            try:
+                result = _call(self, args, kwargs)
+            except BaseException as err:
+                flight.error = err
+                with lock:
+                    if inflight.get(key) is flight:
+                        del inflight[key]
+                flight.done.set()
+                raise
+
+            with lock:
+                now = time.time()
+                cache.pop(key, None)
+                _evict_if_needed(now)
+                cache[key] = (result, now)
+                if inflight.get(key) is flight:
+                    del inflight[key]
+            flight.result = result
+            flight.done.set()
+            return result
+
+        def _refresh(self, key: Hashable, args: tuple, kwargs: dict, flight: _InFlight) -> None:
+            # Recompute a stale entry in the background, keeping the stale entry on failure.
+            try:
+                _compute(self, key, args, kwargs, flight)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                logger.debug("Failed to refresh stale cache entry of %s: %s", func.__name__, err)
 
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            # When caching is disabled (globally, per-instance, or maxsize=0) bypass
-            # the cache entirely: don't read, write, evict, or mutate stats.
-            if (
-                os.getenv("DISABLE_CACHE") == "1"
-                or getattr(self, "__cache_disabled", False)
-                or maxsize == 0
-            ):
+            # When caching is disabled (globally or per-instance) bypass the cache entirely:
+            # don't read, write, evict, or mutate stats.
+            if os.getenv("DISABLE_CACHE") == "1" or getattr(self, "__cache_disabled", False):
                 return func(self, *args, **kwargs)
+            if maxsize == 0:
+                return _call(self, args, kwargs)
             key = _generate_cache_key(self, func.__name__, args, kwargs)
 
+            refresh, flight, leader = None, None, False
             with lock:
-                if key in cache:
-                    cached_result, timestamp = cache[key]
-                    if (time.time() - timestamp) < ttl:
-                        stats["hits"] += 1
-                        return cached_result
-                stats["misses"] += 1
-
-            result = func(self, *args, **kwargs)
-
-            with lock:
-                _evict_if_needed()
-                cache[key] = (result, time.time())
-            return result
+                entry = cache.get(key)
+                age = time.time() - entry[1] if entry is not None else None
+                if age is not None and age < ttl + stale_while_revalidate:
+                    stats["hits"] += 1
+                    if age >= ttl and key not in inflight:
+                        refresh = inflight[key] = _InFlight()
+                else:
+                    entry = None
+                    stats["misses"] += 1
+                    flight = inflight.get(key)
+                    leader = flight is None
+                    if leader:
+                        flight = inflight[key] = _InFlight()
+
+            if entry is not None:
+                if refresh is not None:
+                    threading.Thread(
+                        target=_refresh, args=(self, key, args, kwargs, refresh), daemon=True
+                    ).start()
+                return entry[0]
+            if leader:
+                return _compute(self, key, args, kwargs, flight)
+            return flight.wait()
 
         def cache_clear() -> None:
             with lock:
@@ -156,11 +506,18 @@ def cached_method(__func: TFunc) -> TFunc: ...
 
 
 @overload
-def cached_method(*, maxsize: int = 128, ttl: int = 120) -> Callable[[TFunc], TFunc]: ...
+def cached_method(
+    *, maxsize: int = 128, ttl: int = 120, persist: bool = False, stale_while_revalidate: int = 0
+) -> Callable[[TFunc], TFunc]: ...
 
 
 def cached_method(
-    func: Optional[TFunc] = None, *, maxsize: int = 128, ttl: int = 120
+    func: Optional[TFunc] = None,
+    *,
+    maxsize: int = 128,
+    ttl: int = 120,
+    persist: bool = False,
+    stale_while_revalidate: int = 0,
 ) -> Callable[[TFunc], TFunc]:
     """
     AD decorator that applies default caching behavior when used without arguments,
@@ -177,10 +534,20 @@ def cached_method(
         @cached_method(maxsize=200, ttl=300)
         def some_other_method(self, param):
             pass
+
+        # Also stored on disk, if enabled with qbraid.enable_persistent_cache()
+        @cached_method(persist=True)
+        def some_metadata_method(self, param):
+            pass
     """
 
     def decorator(inner_func: TFunc) -> TFunc:
-        return _cached_method_wrapper(ttl=ttl, maxsize=maxsize)(inner_func)
+        return _cached_method_wrapper(
+            ttl=ttl,
+            maxsize=maxsize,
+            persist=persist,
+            stale_while_revalidate=stale_while_revalidate,
+        )(inner_func)
 
     return decorator if func is None else decorator(func)
 
@@ -215,7 +582,9 @@ def clear_cache():
 
     Use this function to completely reset the cache state for all decorated methods, which
     can be useful in testing environments or when you need to free up memory by discarding
-    cached results.
+    cached results. Results stored in the on-disk tier, if enabled, are removed as well.
     """
     for cache_clear in _CACHE_REGISTRY:
         cache_clear()
+    if _persistent_cache is not None:
+        _persistent_cache.clear()
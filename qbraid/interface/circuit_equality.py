@@ -18,7 +18,7 @@ Module for calculating unitary of quantum circuit/program
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 
@@ -49,7 +49,7 @@ def match_global_phase(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.nda
     if a.shape != b.shape or a.size == 0:
         return np.copy(a), np.copy(b)
 
-    k = max(np.ndindex(*a.shape), key=lambda t: abs(b[t]))
+    k = np.unravel_index(np.argmax(np.abs(b)), b.shape)
 
     def dephase(v):
         r = np.real(v)
@@ -84,13 +84,28 @@ def assert_allclose_up_to_global_phase(a: np.ndarray, b: np.ndarray, atol: float
     np.testing.assert_allclose(actual=a, desired=b, atol=atol, **kwargs)
 
 
-def circuits_allclose(  # pylint: disable=too-many-arguments
+def _random_product_states(
+    num_qubits: int, num_states: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Return a (num_states, 2^num_qubits) array of Haar-random product state vectors."""
+    states = np.ones((num_states, 1), dtype=complex)
+    for _ in range(num_qubits):
+        qubit_states = rng.normal(size=(num_states, 2)) + 1j * rng.normal(size=(num_states, 2))
+        qubit_states /= np.linalg.norm(qubit_states, axis=1, keepdims=True)
+        states = (states[:, :, None] * qubit_states[:, None, :]).reshape(num_states, -1)
+    return states
+
+
+def circuits_allclose(  # pylint: disable=too-many-arguments,too-many-locals
     circuit0: qbraid.programs.QPROGRAM,
     circuit1: qbraid.programs.QPROGRAM,
     index_contig: bool = False,
     allow_rev_qubits: bool = False,
     strict_gphase: bool = False,
     atol: float = 1e-7,
+    method: str = "unitary",
+    num_samples: int = 4,
+    seed: Optional[int] = None,
 ) -> bool:
     """Check if quantum program unitaries are equivalent.
 
@@ -103,11 +118,29 @@ def circuits_allclose(  # pylint: disable=too-many-arguments
         strict_gphase: If False, disregards global phase when verifying
             equivalence of the input circuit's unitaries.
         atol: Absolute tolerance parameter for np.allclose function.
+        method: ``"unitary"`` compares the full 2^N x 2^N unitaries of the circuits.
+            ``"statevector"`` instead compares the states each circuit produces from
+            ``num_samples`` random product states. Cirq, qiskit, and braket circuits are
+            simulated gate by gate, using O(num_samples * 2^N) memory. Other program types
+            still build their 2^N x 2^N unitary.
+        num_samples: Number of random input states compared by the ``"statevector"`` method.
+            Circuits that are not equivalent agree on a random state with probability zero,
+            so a few samples suffice, and more samples guard against near-misses within
+            ``atol``.
+        seed: Seed for the random input states of the ``"statevector"`` method.
 
     Returns:
         True if the input circuits pass unitary equality check
 
+    Raises:
+        ValueError: If ``method`` is not supported or ``num_samples`` is less than 1.
+        NotImplementedError: If ``method`` is ``"statevector"`` and a program type can neither
+            simulate the circuit nor build its unitary, e.g. OpenQASM programs.
     """
+    if method not in ("unitary", "statevector"):
+        raise ValueError(f"Invalid method '{method}'. Expected one of 'unitary' or 'statevector'.")
+    if num_samples < 1:
+        raise ValueError("num_samples must be a positive integer.")
 
     def unitary_equivalence_check(unitary0, unitary1, unitary_rev=None):
         if strict_gphase:
@@ -133,6 +166,19 @@ def circuits_allclose(  # pylint: disable=too-many-arguments
         program0.remove_idle_qubits()
         program1.remove_idle_qubits()
 
+    if method == "statevector":
+        # Compare the action of each circuit on random inputs instead of its unitary. The
+        # evolved states are stacked, so global phase is matched across all samples at once.
+        if program0.num_qubits != program1.num_qubits:
+            return False
+        states = _random_product_states(
+            program0.num_qubits, num_samples, np.random.default_rng(seed)
+        )
+        evolved0 = program0.evolve_states(states)
+        evolved1 = program1.evolve_states(states)
+        evolved_rev = program1.evolve_states_rev_qubits(states) if allow_rev_qubits else None
+        return unitary_equivalence_check(evolved0, evolved1, evolved_rev)
+
     unitary0 = program0.unitary()
     unitary1 = program1.unitary()
 
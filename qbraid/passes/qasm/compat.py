@@ -283,16 +283,20 @@ def convert_qasm_pi_to_decimal(qasm: str) -> str:
 
     gate_defs = set()
 
-    try:
-        program = parse(qasm)
-
-        for statement in program.statements:
-            if isinstance(statement, QuantumGate):
-                name = statement.name.name
-                if "pi" in name:
-                    gate_defs.add(name)
-    except QASM3ParsingError as err:
-        logger.debug("Failed to parse QASM program for pi conversion: %s", err)
+    # Parsing is only needed to find gates whose names contain 'pi', so it is skipped
+    # when no word other than the constant 'pi' itself contains it, and 'pi' is never
+    # applied to qubits as a gate named exactly 'pi'.
+    if re.search(r"\wpi|pi\w|\bpi\s+[A-Za-z_\[$]", qasm):
+        try:
+            program = parse(qasm)
+
+            for statement in program.statements:
+                if isinstance(statement, QuantumGate):
+                    name = statement.name.name
+                    if "pi" in name:
+                        gate_defs.add(name)
+        except QASM3ParsingError as err:
+            logger.debug("Failed to parse QASM program for pi conversion: %s", err)
 
     def replace_with_decimal(match: re.Match) -> str:
         expr: str = match.group()
@@ -18,146 +18,360 @@ Module defining input / output types for a quantum backend:
   * NATIVE_REGISTRY: Dict mapping all supported quantum software libraries / package
                      names to their respective program types.
 
+Quantum SDKs are not imported when this module is loaded. Installed packages are detected
+with :func:`importlib.util.find_spec`, and each program type is imported the first time its
+alias is looked up in the registry.
+
 """
+from __future__ import annotations
 
-from copy import deepcopy
+import importlib.util
+import sys
+from collections.abc import ItemsView, Iterable, Iterator, Mapping, MutableMapping, MutableSet
 from importlib import import_module
-from types import ModuleType
-from typing import Any, Type
+from importlib.machinery import (
+    BYTECODE_SUFFIXES,
+    EXTENSION_SUFFIXES,
+    SOURCE_SUFFIXES,
+    ExtensionFileLoader,
+    FileFinder,
+    SourceFileLoader,
+    SourcelessFileLoader,
+)
+from typing import Any, Callable, Optional, Type
+
+from qbraid._logging import logger
 
 from .typer import BOUND_QBRAID_META_TYPES, QBRAID_META_TYPES
 
+# Program types of supported quantum software libraries, as (alias, module, attribute path).
+_NATIVE_PROGRAM_TYPES: list[tuple[str, str, str]] = [
+    ("cirq", "cirq", "Circuit"),
+    ("qiskit", "qiskit", "QuantumCircuit"),
+    ("pennylane", "pennylane", "tape.QuantumTape"),
+    ("pyquil", "pyquil", "Program"),
+    ("pytket", "pytket", "_tket.circuit.Circuit"),
+    ("braket", "braket.circuits", "Circuit"),
+    ("braket_ahs", "braket.ahs", "AnalogHamiltonianSimulation"),
+    ("openqasm3", "openqasm3", "ast.Program"),
+    ("cpp_pyqubo", "cpp_pyqubo", "Model"),
+    ("cudaq", "cudaq", "PyKernel"),
+    ("qrisp", "qrisp", "QuantumCircuit"),
+    ("aqt_connector", "aqt_connector.models.circuits", "QuantumCircuit"),
+]
+_NON_NATIVE_PROGRAM_TYPES: list[tuple[str, str, str]] = [
+    ("bloqade", "bloqade.analog.builder.assign", "BatchAssign"),
+    ("qibo", "qibo", "Circuit"),
+    ("stim", "stim", "Circuit"),
+    ("pyqir", "pyqir", "Module"),
+    ("pulser", "pulser", "sequence.sequence.Sequence"),
+    ("pyqpanda3", "pyqpanda3", "core.QProg"),
+    ("autoqasm", "autoqasm", "program.program.Program"),
+    ("qat", "qat.core.wrappers.circuit", "Circuit"),
+]
+
+_UNAVAILABLE = object()
+
 
-def _assign_default_type_alias(imported: dict[str, Any], program_type: Type[Any]) -> str:
+_LOADER_DETAILS = [
+    (ExtensionFileLoader, EXTENSION_SUFFIXES),
+    (SourceFileLoader, SOURCE_SUFFIXES),
+    (SourcelessFileLoader, BYTECODE_SUFFIXES),
+]
+
+
+def _find_submodule(fullname: str, locations: Iterable[str]) -> Optional[list[str]]:
+    """
+    Locate a submodule within its parent package's search locations, without importing.
+
+    Returns:
+        Optional[list[str]]: The submodule's own search locations (empty for a plain module),
+            or None if it was not found.
     """
-    Determines a unique alias for the given program type based on its module name.
+    namespace_locations: list[str] = []
+    for location in locations:
+        spec = FileFinder(location, *_LOADER_DETAILS).find_spec(fullname)
+        if spec is None:
+            continue
+        if spec.loader is not None:
+            return list(spec.submodule_search_locations or [])
+        namespace_locations.extend(spec.submodule_search_locations or [])
+    return namespace_locations or None
+
+
+def _module_available(name: str) -> bool:
+    """
+    Check whether a module can be imported, without importing it or any of its parents.
 
     Args:
-        imported (dict[str, Any]): A dictionary of already imported program type aliases.
-        program_type (Type[Any]): The class or type for which to determine the alias.
+        name (str): The fully qualified module name.
 
     Returns:
-        str: The determined alias for the program type.
+        bool: True if a module spec was found for the module and each of its parents.
+    """
+    if name in sys.modules:
+        return True
+
+    root, *parts = name.split(".")
+    try:
+        spec = importlib.util.find_spec(root)
+    except (ImportError, ValueError):
+        return False
+    if spec is None:
+        return False
+
+    locations: Optional[list[str]] = list(spec.submodule_search_locations or [])
+    fullname = root
+    for part in parts:
+        if not locations:
+            return False
+        fullname = f"{fullname}.{part}"
+        locations = _find_submodule(fullname, locations)
+        if locations is None:
+            return False
+
+    return True
+
+
+class _LazyProgramType:
+    """Deferred reference to a program type defined in an optional dependency."""
 
-    Raises:
-        ValueError: If a unique alias cannot be determined due to duplicates.
+    __slots__ = ("module", "attr", "_program_type")
+
+    def __init__(self, module: str, attr: str):
+        self.module = module
+        self.attr = attr
+        self._program_type: Any = None
+
+    @property
+    def loaded(self) -> bool:
+        """Return True if the defining module has already been imported."""
+        return self._program_type is not None or self.module in sys.modules
+
+    def load(self) -> Optional[Type[Any]]:
+        """Import and return the program type, or None if it cannot be imported."""
+        if self._program_type is None:
+            try:
+                program_type: Any = import_module(self.module)
+                for name in self.attr.split("."):
+                    program_type = getattr(program_type, name)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                logger.debug("Failed to load program type %s.%s: %s", self.module, self.attr, err)
+                program_type = _UNAVAILABLE
+            self._program_type = program_type
+
+        return None if self._program_type is _UNAVAILABLE else self._program_type
+
+    def __repr__(self) -> str:
+        return f"<lazy {self.module}.{self.attr}>"
+
+
+class LazyTypeRegistry(MutableMapping):
     """
-    module_name = program_type.__module__
-    module_parts = module_name.split(".")
-    alias = module_parts[0]
-
-    if alias in imported:
-        if len(module_parts) > 1:
-            alias = f"{alias}_{module_parts[1]}"
-        else:
-            alias = f"{alias}_{program_type.__name__.lower()}"
-
-        if alias in imported:
-            raise ValueError(f"Duplicate alias {alias}")
-
-    return alias
-
-
-def _dynamic_importer(opt_modules: list[str]) -> dict[str, Type[Any]]:
-    imported: dict[str, Type[Any]] = {}
-
-    for m in opt_modules:
-        try:
-            data = m.split(".")
-            for i, _ in enumerate(data):
-                if data[:i]:
-                    globals()[".".join(data[:i])] = import_module(".".join(data[:i]))
-            # to be more secure, do not do module = globals()[m] = import_module(), as it could
-            # create globals()[m] and later throw an error as there is no module named like that.
-            # Is prefered to let module be import_module() and throw an exception if is needed
-            module: ModuleType = import_module(m)
-            globals()[m] = module
-            program_type = _get_class(module.__name__)
-            program_type_alias = _assign_default_type_alias(imported, program_type)
-            program_type_alias = data[0] if program_type_alias == "builtins" else program_type_alias
-            imported[program_type_alias] = program_type
-        except Exception:  # pylint: disable=broad-except
-            pass
-
-    return imported
-
-
-# pylint: disable=undefined-variable
-def _get_class(module: str):
-    if module == "aqt_connector.models.circuits":
-        return aqt_connector.models.circuits.QuantumCircuit  # type: ignore # noqa: F821
-    if module == "bloqade.analog.builder.assign":
-        return bloqade.analog.builder.assign.BatchAssign  # type: ignore # noqa: F821
-    if module == "cirq":
-        return cirq.Circuit  # type: ignore # noqa: F821
-    if module == "qiskit":
-        return qiskit.QuantumCircuit  # type: ignore # noqa: F821
-    if module == "braket.ahs":
-        return braket.ahs.AnalogHamiltonianSimulation  # type: ignore # noqa: F821
-    if module == "braket.circuits":
-        return braket.circuits.Circuit  # type: ignore # noqa: F821
-    if module == "pennylane":
-        return pennylane.tape.QuantumTape  # type: ignore # noqa: F821
-    if module == "pyquil":
-        return pyquil.Program  # type: ignore # noqa: F821
-    if module == "pytket":
-        return pytket._tket.circuit.Circuit  # type: ignore # noqa: F821
-    if module == "openqasm3":
-        return openqasm3.ast.Program  # type: ignore # noqa: F821
-    if module == "pyqir":
-        return pyqir.Module  # type: ignore # noqa: F821
-    if module == "cpp_pyqubo":
-        return cpp_pyqubo.Model  # type: ignore # noqa: F821
-    if module == "cudaq":
-        return cudaq.PyKernel  # type: ignore # noqa: F821
-    if module == "qibo":  # pragma: no cover
-        return qibo.Circuit  # type: ignore # noqa: F821
-    if module == "stim":  # pragma: no cover
-        return stim.Circuit  # type: ignore # noqa: F821
-    if module == "pulser":
-        return pulser.sequence.sequence.Sequence  # type: ignore # noqa: F821
-    if module == "pyqpanda3":  # pragma: no cover
-        return pyqpanda3.core.QProg  # type: ignore # noqa: F821
-    if module == "autoqasm":
-        return autoqasm.program.program.Program  # type: ignore # noqa: F821
-    if module == "qrisp":
-        return qrisp.QuantumCircuit  # type: ignore # noqa: F821
-    if module == "qat.core.wrappers.circuit":  # pragma: no cover
-        return qat.core.wrappers.circuit.Circuit  # type: ignore # noqa: F821
-    raise ValueError(f"Unsupported module '{module}'")
+    Dictionary of program type aliases to program types, whose values may be deferred.
+
+    Membership tests, iteration over aliases and ``len`` never import anything. A deferred
+    program type is imported the first time its alias is looked up, and the alias is
+    dropped from the registry if the import fails. Callbacks added with :meth:`on_drop`
+    are then called with the dropped alias.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._data: dict[str, Any] = {}
+        self._drop_callbacks: list[Callable[[str], None]] = []
+        self.update(*args, **kwargs)
+
+    def on_drop(self, callback: Callable[[str], None]) -> None:
+        """Call ``callback`` with each alias dropped because its program type failed to import."""
+        self._drop_callbacks.append(callback)
+
+    def _resolve(self, alias: str, value: Any) -> Type[Any]:
+        """Load a deferred program type, removing its alias if it cannot be imported."""
+        program_type = value.load()
+        if self._data.get(alias) is value:
+            if program_type is None:
+                del self._data[alias]
+                for callback in self._drop_callbacks:
+                    callback(alias)
+            else:
+                self._data[alias] = program_type
+        if program_type is None:
+            raise KeyError(alias)
+        return program_type
+
+    def __getitem__(self, alias: str) -> Type[Any]:
+        value = self._data[alias]
+        if isinstance(value, _LazyProgramType):
+            return self._resolve(alias, value)
+        return value
+
+    def __setitem__(self, alias: str, program_type: Type[Any]) -> None:
+        self._data[alias] = program_type
+
+    def __delitem__(self, alias: str) -> None:
+        del self._data[alias]
+
+    def __contains__(self, alias: object) -> bool:
+        return alias in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def defer(self, alias: str, module: str, attr: str) -> None:
+        """Register a program type by location, to be imported on first lookup."""
+        self._data[alias] = _LazyProgramType(module, attr)
+
+    def load_all(self) -> None:
+        """Import all deferred program types, dropping aliases that cannot be imported."""
+        for alias, value in list(self._data.items()):
+            if isinstance(value, _LazyProgramType):
+                try:
+                    self._resolve(alias, value)
+                except KeyError:
+                    pass
+
+    def items(self) -> ItemsView:
+        self.load_all()
+        return super().items()
+
+    def values(self):
+        self.load_all()
+        return super().values()
+
+    def loaded_items(self) -> Iterator[tuple[str, Type[Any]]]:
+        """
+        Iterate over the program types whose defining module has already been imported.
+
+        Objects can only be instances of classes whose modules are imported, so this is
+        sufficient for ``isinstance`` and identity checks, and never triggers an import.
+        """
+        for alias, value in list(self._data.items()):
+            if isinstance(value, _LazyProgramType):
+                if not value.loaded:
+                    continue
+                try:
+                    value = self._resolve(alias, value)
+                except KeyError:
+                    continue
+            yield alias, value
+
+    def types(self) -> LazyTypeSet:
+        """Return the set of registered program types, without importing deferred types."""
+        return LazyTypeSet(self._data.values())
+
+    def copy(self) -> LazyTypeRegistry:
+        """Return a shallow copy of the registry, preserving deferred entries."""
+        registry = type(self)()
+        registry._data = self._data.copy()  # pylint: disable=protected-access
+        return registry
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # pylint: disable=arguments-differ
+        """Update the registry from a mapping or iterable, preserving deferred entries."""
+        for other in (*args, kwargs):
+            if isinstance(other, LazyTypeRegistry):
+                self._data.update(other._data)  # pylint: disable=protected-access
+            elif isinstance(other, Mapping):
+                self._data.update(other)
+            else:
+                self._data.update(dict(other))
+
+
+class LazyTypeSet(MutableSet):
+    """
+    Set of program types, whose members may be deferred references to program types in
+    optional dependencies. Deferred members are only imported when the set is iterated, or
+    when a membership test could match them.
+    """
+
+    def __init__(self, program_types: Iterable[Any] = ()):
+        self._data: set[Any] = set(program_types)
+
+    def _load_all(self) -> None:
+        for value in [v for v in self._data if isinstance(v, _LazyProgramType)]:
+            self._data.discard(value)
+            program_type = value.load()
+            if program_type is not None:
+                self._data.add(program_type)
+
+    def __contains__(self, program_type: object) -> bool:
+        if program_type in self._data:
+            return True
+        for value in [v for v in self._data if isinstance(v, _LazyProgramType)]:
+            if value.loaded and value.load() is program_type:
+                self._data.discard(value)
+                self._data.add(program_type)
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[Any]:
+        self._load_all()
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        self._load_all()
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        self._load_all()
+        return repr(self._data)
+
+    def add(self, value: Any) -> None:
+        self._data.add(value)
+
+    def discard(self, value: Any) -> None:
+        self._data.discard(value)
+        for lazy in [v for v in self._data if isinstance(v, _LazyProgramType)]:
+            if lazy.loaded and lazy.load() is value:
+                self._data.discard(lazy)
+
+
+def loaded_items(registry: Mapping[str, Type[Any]]) -> Iterator[tuple[str, Type[Any]]]:
+    """
+    Iterate over the entries of a program type registry without importing deferred types.
+
+    Args:
+        registry (Mapping[str, Type[Any]]): A program type registry.
+
+    Returns:
+        Iterator[tuple[str, Type[Any]]]: The (alias, program type) pairs of the registry,
+            excluding deferred program types whose modules have not been imported.
+    """
+    if isinstance(registry, LazyTypeRegistry):
+        return registry.loaded_items()
+    return iter(list(registry.items()))
+
+
+def _lazy_importer(program_types: list[tuple[str, str, str]]) -> LazyTypeRegistry:
+    """Build a registry deferring each program type whose defining module is installed."""
+    registry = LazyTypeRegistry()
+
+    for alias, module, attr in program_types:
+        if _module_available(module):
+            registry.defer(alias, module, attr)
+
+    return registry
+
+
+def _get_class(module: str) -> Type[Any]:
+    """Import and return the program type defined by a supported module."""
+    for _, name, attr in _NATIVE_PROGRAM_TYPES + _NON_NATIVE_PROGRAM_TYPES:
+        if name == module:
+            program_type = _LazyProgramType(name, attr).load()
+            if program_type is None:
+                raise ImportError(f"Failed to import program type from module '{module}'")
+            return program_type
+    raise ValueError(f"Unsupported module '{module}'")
 
-# pylint: enable=undefined-variable
 
 # Supported quantum programs.
-dynamic_type_registry: dict[str, Type[Any]] = _dynamic_importer(
-    [
-        "cirq",
-        "qiskit",
-        "pennylane",
-        "pyquil",
-        "pytket",
-        "braket.circuits",
-        "braket.ahs",
-        "openqasm3",
-        "cpp_pyqubo",
-        "cudaq",
-        "qrisp",
-        "aqt_connector.models.circuits",
-    ]
-)
-dynamic_non_native: dict[str, Type[Any]] = _dynamic_importer(
-    [
-        "bloqade.analog.builder.assign",
-        "qibo",
-        "stim",
-        "pyqir",
-        "pulser",
-        "pyqpanda3",
-        "autoqasm",
-        "qat.core.wrappers.circuit",
-    ]
-)
+dynamic_type_registry: LazyTypeRegistry = _lazy_importer(_NATIVE_PROGRAM_TYPES)
+dynamic_non_native: LazyTypeRegistry = _lazy_importer(_NON_NATIVE_PROGRAM_TYPES)
 static_type_registry: dict[str, Type[Any]] = {
     metatype.__alias__: metatype.__bound__ for metatype in BOUND_QBRAID_META_TYPES
 }
@@ -165,9 +379,9 @@ qbraid_meta_type_registry: dict[str, Type[Any]] = {
     metatype.__alias__: metatype for metatype in QBRAID_META_TYPES
 }
 
-NATIVE_REGISTRY: dict[str, Type[Any]] = (
-    dynamic_type_registry | static_type_registry | qbraid_meta_type_registry
+NATIVE_REGISTRY: LazyTypeRegistry = LazyTypeRegistry(
+    dynamic_type_registry, static_type_registry, qbraid_meta_type_registry
 )
-_QPROGRAM_REGISTRY: dict[str, Type[Any]] = deepcopy(NATIVE_REGISTRY) | dynamic_non_native
-_QPROGRAM_TYPES: set[Type[Any]] = set(_QPROGRAM_REGISTRY.values())
+_QPROGRAM_REGISTRY: LazyTypeRegistry = LazyTypeRegistry(NATIVE_REGISTRY, dynamic_non_native)
+_QPROGRAM_TYPES: LazyTypeSet = _QPROGRAM_REGISTRY.types()
 _QPROGRAM_ALIASES: set[str] = set(_QPROGRAM_REGISTRY.keys())
@@ -18,21 +18,39 @@ Module for managing and retrieving custom program type aliases
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Type
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional, Type
 
+from ._import import loaded_items
 from .exceptions import ProgramTypeError
 from .exceptions import QasmError as QbraidQasmError
-from .registry import QPROGRAM_REGISTRY, QPROGRAM_TYPES
-from .typer import IonQDict, get_qasm_type_alias
+from .registry import QPROGRAM_REGISTRY, QPROGRAM_TYPES, get_registry_version
+from .typer import IonQDict, QbraidMetaType, get_qasm_type_alias
 
 if TYPE_CHECKING:
     import qbraid.programs
 
+# Alias of each concrete program class whose instances always resolve to the same alias,
+# i.e. classes that no registered content-checked (QbraidMetaType) type is bound to.
+_TYPE_ALIAS_CACHE: dict[type, str] = {}
+
+# Alias of recently seen dict programs (e.g. IonQ JSON or QUBO coefficients), whose type can
+# only be decided by inspecting every item. Keyed by id, holding a reference to the dict so that
+# the id cannot be reused, along with a fingerprint of its contents (see _dict_fingerprint).
+_DICT_ALIAS_MEMO: OrderedDict[int, tuple[dict, tuple, str]] = OrderedDict()
+_DICT_ALIAS_MEMO_SIZE = 16
+
+_ALIAS_CACHE_LOCK = threading.Lock()
+_ALIAS_CACHE_VERSION: Optional[int] = None
+
 
 def find_str_type_alias(registry: dict[str, Type] = QPROGRAM_REGISTRY) -> Optional[str]:
     """Find additional keys with type 'str' in the registry."""
     str_keys = [
-        k for k, v in registry.items() if v is str and k not in ("qasm2", "qasm3", "qasm2_kirin")
+        k
+        for k, v in loaded_items(registry)
+        if v is str and k not in ("qasm2", "qasm3", "qasm2_kirin")
     ]
 
     if len(str_keys) == 0:
@@ -42,6 +60,80 @@ def find_str_type_alias(registry: dict[str, Type] = QPROGRAM_REGISTRY) -> Option
     raise ValueError(f"Multiple additional keys with type 'str' found: {str_keys}")
 
 
+def _sync_alias_caches() -> int:
+    """
+    Clear the alias caches if the program type registry changed since they were filled.
+
+    Returns:
+        int: The registry version the alias caches now correspond to.
+    """
+    global _ALIAS_CACHE_VERSION  # pylint: disable=global-statement
+    version = get_registry_version()
+    if version != _ALIAS_CACHE_VERSION:
+        with _ALIAS_CACHE_LOCK:
+            _TYPE_ALIAS_CACHE.clear()
+            _DICT_ALIAS_MEMO.clear()
+            _ALIAS_CACHE_VERSION = version
+    return version
+
+
+def _dict_fingerprint(program: dict) -> tuple:
+    """
+    Return a cheap fingerprint of the contents of a dict program.
+
+    The fingerprint records each key with the identity of its value and, for list values
+    such as an IonQ ``circuit``, the identity and size of every element. It changes when
+    items or list elements are added, removed or replaced, or when an element such as a
+    gate dict gains or loses fields. The memoized dict holds references to all of these
+    objects, so their ids cannot be reused while the entry is alive.
+    """
+    parts: list[Any] = []
+    for key, value in program.items():
+        parts.append(key)
+        parts.append(id(value))
+        if isinstance(value, list):
+            parts.append(len(value))
+            parts.extend(map(id, value))
+            try:
+                parts.extend(map(len, value))
+            except TypeError:
+                pass
+    return tuple(parts)
+
+
+def _memoized_dict_alias(program: dict) -> Optional[str]:
+    """Return the alias previously determined for the given dict, if it is still valid."""
+    with _ALIAS_CACHE_LOCK:
+        entry = _DICT_ALIAS_MEMO.get(id(program))
+        if entry is None or entry[0] is not program or entry[1] != _dict_fingerprint(program):
+            return None
+        _DICT_ALIAS_MEMO.move_to_end(id(program))
+        return entry[2]
+
+
+def _cache_alias(program: Any, alias: str, version: int) -> None:
+    """
+    Cache the alias of a program by its type, or by identity if its type is content-checked.
+
+    Nothing is cached if the registry changed since the alias was determined at ``version``.
+    """
+    bound_types = (IonQDict.__bound__,) + tuple(
+        program_type.__bound__
+        for _, program_type in loaded_items(QPROGRAM_REGISTRY)
+        if isinstance(program_type, QbraidMetaType)
+    )
+    with _ALIAS_CACHE_LOCK:
+        if version != _ALIAS_CACHE_VERSION:
+            return
+        if not isinstance(program, bound_types):
+            _TYPE_ALIAS_CACHE[type(program)] = alias
+        elif isinstance(program, dict):
+            _DICT_ALIAS_MEMO[id(program)] = (program, _dict_fingerprint(program), alias)
+            _DICT_ALIAS_MEMO.move_to_end(id(program))
+            if len(_DICT_ALIAS_MEMO) > _DICT_ALIAS_MEMO_SIZE:
+                _DICT_ALIAS_MEMO.popitem(last=False)
+
+
 def _get_program_type_alias(program: qbraid.programs.QPROGRAM) -> str:
     """
     Get the type alias of a quantum program from registry.
@@ -58,6 +150,11 @@ def _get_program_type_alias(program: qbraid.programs.QPROGRAM) -> str:
     if isinstance(program, type):
         raise ProgramTypeError(message="Expected an instance of a quantum program, not a type.")
 
+    version = _sync_alias_caches()
+    alias = _TYPE_ALIAS_CACHE.get(type(program))
+    if alias is not None:
+        return alias
+
     if isinstance(program, str):
         try:
             return get_qasm_type_alias(program)
@@ -72,15 +169,24 @@ def _get_program_type_alias(program: qbraid.programs.QPROGRAM) -> str:
                 )
             ) from err
 
+    if isinstance(program, dict):
+        alias = _memoized_dict_alias(program)
+        if alias is not None:
+            return alias
+
     if isinstance(program, IonQDict):
+        _cache_alias(program, IonQDict.__alias__, version)
         return IonQDict.__alias__
 
+    # Program types whose modules were never imported cannot match, so they are skipped
+    # instead of importing every installed quantum SDK.
     matched = []
-    for alias, program_type in QPROGRAM_REGISTRY.items():
+    for alias, program_type in loaded_items(QPROGRAM_REGISTRY):
         if isinstance(program, (program_type, type(program_type))):
             matched.append(alias)
 
     if len(matched) == 1:
+        _cache_alias(program, matched[0], version)
         return matched[0]
 
     if len(matched) > 1:
@@ -41,23 +41,28 @@ Submodules
 
 """
 import importlib
+import importlib.util
 
 from ._model import AnnealingProgram, Problem, ProblemEncoder, ProblemType, QuboProblem
 
 _qbraid = importlib.import_module("qbraid.programs._import")
 NATIVE_REGISTRY = getattr(_qbraid, "NATIVE_REGISTRY", {})
 
-submodules = []
 base_path = "qbraid.programs.annealing."
 
-for lib in NATIVE_REGISTRY:
-    try:
-        imported_lib = importlib.import_module(base_path + lib)
-        submodules.append(lib)
-        globals()[lib] = imported_lib
+# Submodules import their quantum SDK, so they are located here and imported on first access.
+submodules = [
+    lib for lib in NATIVE_REGISTRY if importlib.util.find_spec(base_path + lib) is not None
+]
 
-    except ImportError:
-        pass
+
+def __getattr__(name):
+    if name in submodules:
+        try:
+            return importlib.import_module(base_path + name)
+        except ImportError as err:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from err
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = ["ProblemType", "Problem", "AnnealingProgram", "QuboProblem", "ProblemEncoder"]
@@ -25,6 +25,8 @@ Classes
    :toctree: ../stubs/
 
    GateModelProgram
+   CircuitStats
+   ResourceEstimate
 
 Submodules
 ------------
@@ -46,28 +48,31 @@ Submodules
 
 """
 import importlib
+import importlib.util
 
-from ._model import GateModelProgram
+from ._model import CircuitStats, GateModelProgram, ResourceEstimate
 
 _qbraid = importlib.import_module("qbraid.programs._import")
 NATIVE_REGISTRY = getattr(_qbraid, "NATIVE_REGISTRY", {})
 CIRCUIT_SUBMODULE_CHECKS = NATIVE_REGISTRY.copy()
 
-submodules = []
 base_path = "qbraid.programs.gate_model."
 
-key_set = set(CIRCUIT_SUBMODULE_CHECKS.keys())
+# Submodules import their quantum SDK, so they are located here and imported on first access.
+submodules = [
+    lib for lib in NATIVE_REGISTRY if importlib.util.find_spec(base_path + lib) is not None
+]
 
-for lib in key_set:
-    try:
-        imported_lib = importlib.import_module(base_path + lib)
-        submodules.append(lib)
-        globals()[lib] = imported_lib
 
-    except ImportError:
-        pass
+def __getattr__(name):
+    if name in submodules:
+        try:
+            return importlib.import_module(base_path + name)
+        except ImportError as err:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from err
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-__all__ = ["GateModelProgram"]
+__all__ = ["CircuitStats", "GateModelProgram", "ResourceEstimate"]
 
 __all__.extend(submodules)
@@ -19,6 +19,7 @@ Module defining GateModelProgram Class
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
@@ -27,12 +28,91 @@ from qbraid_core.services.runtime.schemas import Program
 from qbraid.programs.program import QuantumProgram
 
 if TYPE_CHECKING:
+    import qbraid.programs
     import qbraid.runtime
 
+# Program types whose native qubit ordering is little-endian, and so whose unitaries and
+# state vectors are reversed to match the big-endian convention of unitary().
+_LITTLE_ENDIAN_ALIASES = ("pyquil", "qiskit", "qasm3")
+
+
+def _reverse_state_qubits(states: np.ndarray) -> np.ndarray:
+    """Reverse the qubit order of each row of a (k, 2^N) batch of state vectors."""
+    num_states, dim = states.shape
+    num_qubits = dim.bit_length() - 1
+    if num_qubits <= 1:
+        return states.copy()
+    tensor = states.reshape((num_states,) + (2,) * num_qubits)
+    axes = [0] + list(range(num_qubits, 0, -1))
+    return np.ascontiguousarray(tensor.transpose(axes)).reshape(num_states, dim)
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    """Summary statistics of a gate-model circuit.
+
+    Attributes:
+        qubits (tuple): The qubits acted upon by the operations in the circuit.
+        num_qubits (int): The number of qubits in the circuit.
+        num_clbits (int): The number of classical bits in the circuit.
+        depth (int): The circuit depth (i.e., length of critical path).
+        gate_counts (dict[str, int]): The number of times each gate is applied, keyed by
+            gate name. Measurements are not counted.
+        measured_qubits (tuple): The qubits that are measured, in order of first measurement.
+        gates_by_num_qubits (dict[int, int]): The number of gates applied, keyed by the number
+            of qubits that each gate acts on, including any control qubits.
+    """
+
+    qubits: tuple[Any, ...]
+    num_qubits: int
+    num_clbits: int
+    depth: int
+    gate_counts: dict[str, int] = field(default_factory=dict)
+    measured_qubits: tuple[Any, ...] = ()
+    gates_by_num_qubits: dict[int, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ResourceEstimate:
+    """Estimate of the resources required to execute a gate-model circuit.
+
+    Attributes:
+        num_qubits (int): The number of qubits in the circuit.
+        depth (int): The circuit depth (i.e., length of critical path).
+        num_gates (int): The total number of gates applied. Measurements are not counted.
+        num_single_qubit_gates (int): The number of gates acting on a single qubit.
+        num_two_qubit_gates (int): The number of gates acting on exactly two qubits.
+        num_multi_qubit_gates (int): The number of gates acting on three or more qubits.
+        t_count (int): The number of T and T-dagger gates applied.
+        num_measured_qubits (int): The number of distinct qubits that are measured.
+    """
+
+    num_qubits: int
+    depth: int
+    num_gates: int
+    num_single_qubit_gates: int
+    num_two_qubit_gates: int
+    num_multi_qubit_gates: int
+    t_count: int
+    num_measured_qubits: int
+
 
 class GateModelProgram(QuantumProgram, ABC):
     """Abstract class for qbraid program wrapper objects."""
 
+    # Names under which T and T-dagger gates are keyed in the gate counts of the circuit.
+    _t_gate_names: frozenset[str] = frozenset()
+
+    def __init__(self, program: qbraid.programs.QPROGRAM):
+        self._stats: Optional[CircuitStats] = None
+        super().__init__(program)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Statistics are computed from the wrapped program, so replacing it invalidates them.
+        if name == "_program":
+            self.invalidate_stats()
+
     @property
     @abstractmethod
     def qubits(self) -> list[Any]:
@@ -53,16 +133,144 @@ class GateModelProgram(QuantumProgram, ABC):
         """Return the circuit depth (i.e., length of critical path)."""
         raise NotImplementedError
 
+    def _compute_stats(self) -> CircuitStats:
+        """Compute the statistics of the circuit, in as few passes over it as possible."""
+        raise NotImplementedError
+
+    def stats(self) -> CircuitStats:
+        """Return the qubits, depth, gate counts, and measured qubits of the circuit.
+
+        The statistics are computed together on first access and cached until the program
+        is modified through this wrapper. If the underlying program object is modified in
+        place, call :meth:`invalidate_stats` so that they are recomputed.
+
+        Returns:
+            CircuitStats: The statistics of the circuit. Treat them as read-only.
+        """
+        if self._stats is None:
+            self._stats = self._compute_stats()
+        return self._stats
+
+    def invalidate_stats(self) -> None:
+        """Discard the cached statistics of the circuit, so that they are recomputed."""
+        self._stats = None
+
+    def gate_counts(self) -> dict[str, int]:
+        """Return the number of times each gate is applied in the circuit.
+
+        Gates are keyed by their name in the program's own SDK (e.g. ``"cx"`` for qiskit,
+        ``"CNOT"`` for cirq). Measurements, resets, and barriers are not counted. For
+        OpenQASM programs, the gates of both branches of an if/else statement are counted.
+        The counts are read from :meth:`stats`, so the program is neither converted nor
+        traversed more than once.
+
+        Returns:
+            dict[str, int]: The number of times each gate is applied, keyed by gate name.
+        """
+        return dict(self.stats().gate_counts)
+
+    def resource_estimate(self) -> ResourceEstimate:
+        """Estimate the resources required to execute the circuit.
+
+        Returns:
+            ResourceEstimate: The qubit count, depth, gate counts by number of qubits acted
+                upon, T-count, and number of measured qubits of the circuit.
+        """
+        stats = self.stats()
+        by_num_qubits = stats.gates_by_num_qubits
+        return ResourceEstimate(
+            num_qubits=stats.num_qubits,
+            depth=stats.depth,
+            num_gates=sum(stats.gate_counts.values()),
+            num_single_qubit_gates=by_num_qubits.get(1, 0),
+            num_two_qubit_gates=by_num_qubits.get(2, 0),
+            num_multi_qubit_gates=sum(
+                count for num_qubits, count in by_num_qubits.items() if num_qubits > 2
+            ),
+            t_count=sum(stats.gate_counts.get(name, 0) for name in self._t_gate_names),
+            num_measured_qubits=len(stats.measured_qubits),
+        )
+
     def _unitary(self) -> np.ndarray:
         """Calculate unitary of circuit."""
         raise NotImplementedError
 
     def unitary(self) -> np.ndarray:
         """Calculate unitary of circuit."""
-        if self.spec.alias in ["pyquil", "qiskit", "qasm3"]:
+        if self.spec.alias in _LITTLE_ENDIAN_ALIASES:
             return self.unitary_rev_qubits()
         return self._unitary()
 
+    def _evolve_states(self, states: np.ndarray) -> np.ndarray:
+        """Apply unitary of circuit to each row of states, in the program's own qubit order."""
+        try:
+            matrix = self._unitary()
+        except NotImplementedError as err:
+            raise NotImplementedError(
+                f"Evolving states is not supported for '{self.spec.alias}' programs."
+            ) from err
+        if matrix.shape != (states.shape[1], states.shape[1]):
+            raise ValueError(
+                f"States of dimension {states.shape[1]} do not match the "
+                f"{matrix.shape[0]}-dimensional unitary of the circuit."
+            )
+        return states @ matrix.T
+
+    def evolve_states(self, states: np.ndarray) -> np.ndarray:
+        """Apply unitary of circuit to one or more state vectors.
+
+        The states use the same qubit ordering as :meth:`unitary`, so the result equals
+        ``states @ self.unitary().T``. Cirq, qiskit, and braket circuits are simulated gate
+        by gate, without building the full unitary. Other program types fall back to
+        building the unitary.
+
+        Args:
+            states (np.ndarray): A state vector of size 2^N, or a (k, 2^N) array with one
+                state vector per row.
+
+        Returns:
+            np.ndarray: The evolved state vectors, with the same shape as ``states``.
+
+        Raises:
+            ValueError: If the size of the state vectors is not a power of 2, or does not
+                match the number of qubits in the circuit.
+            NotImplementedError: If the program type can neither simulate the circuit nor
+                build its unitary, e.g. OpenQASM programs.
+        """
+        if self.spec.alias in _LITTLE_ENDIAN_ALIASES:
+            return self.evolve_states_rev_qubits(states)
+        states = np.asarray(states, dtype=complex)
+        return self._evolve_states(self._state_batch(states)).reshape(states.shape)
+
+    def evolve_states_rev_qubits(self, states: np.ndarray) -> np.ndarray:
+        """Apply unitary of circuit to one or more state vectors, with the qubit order of
+        both the states and the circuit reversed. The result equals
+        ``states @ self.unitary_rev_qubits().T``.
+
+        Args:
+            states (np.ndarray): A state vector of size 2^N, or a (k, 2^N) array with one
+                state vector per row.
+
+        Returns:
+            np.ndarray: The evolved state vectors, with the same shape as ``states``.
+
+        Raises:
+            ValueError: If the size of the state vectors is not a power of 2, or does not
+                match the number of qubits in the circuit.
+        """
+        states = np.asarray(states, dtype=complex)
+        batch = _reverse_state_qubits(self._state_batch(states))
+        return _reverse_state_qubits(self._evolve_states(batch)).reshape(states.shape)
+
+    @staticmethod
+    def _state_batch(states: np.ndarray) -> np.ndarray:
+        """Return states as a (k, 2^N) array, checking that their size is a power of 2."""
+        batch = np.atleast_2d(states)
+        dim = batch.shape[1]
+        if batch.ndim != 2 or dim == 0 or (dim & (dim - 1)) != 0:
+            raise ValueError("State vectors must have size 2^N for some integer N.")
+        return batch
+
     def unitary_rev_qubits(self) -> np.ndarray:
         """Performs Kronecker (tensor) product factor permutation of given matrix.
         Returns a matrix equivalent to that computed from a quantum circuit if its
@@ -86,25 +294,22 @@ class GateModelProgram(QuantumProgram, ABC):
         ):
             raise ValueError("Input matrix must be a square matrix of size 2^N for some integer N.")
 
-        # Determine the number of qubits from the matrix size
-        num_qubits = int(np.log2(matrix.shape[0]))
-
-        # Create an empty matrix of the same size
-        permuted_matrix = np.zeros((2**num_qubits, 2**num_qubits), dtype=complex)
-
-        for i in range(2**num_qubits):
-            for j in range(2**num_qubits):
-                # pylint: disable=consider-using-generator
-                # Convert indices to binary representations (qubit states)
-                bits_i = [((i >> bit) & 1) for bit in range(num_qubits)]
-                bits_j = [((j >> bit) & 1) for bit in range(num_qubits)]
-
-                # Reverse the bits
-                reversed_i = sum([bit << (num_qubits - 1 - k) for k, bit in enumerate(bits_i)])
-                reversed_j = sum([bit << (num_qubits - 1 - k) for k, bit in enumerate(bits_j)])
-
-                # Update the new matrix
-                permuted_matrix[reversed_i, reversed_j] = matrix[i, j]
+        # Viewed as a rank-2N tensor, each matrix index splits into N qubit axes ordered from
+        # the most significant bit, so reversing the qubits reverses the row and column axes.
+        dim = matrix.shape[0]
+        num_qubits = dim.bit_length() - 1
+        permuted_matrix = np.empty((dim, dim), dtype=complex)
+        if num_qubits <= 0:
+            permuted_matrix[...] = matrix
+            return permuted_matrix
+
+        tensor_shape = (2,) * (2 * num_qubits)
+        axes = list(reversed(range(num_qubits))) + list(reversed(range(num_qubits, 2 * num_qubits)))
+        np.copyto(
+            permuted_matrix.reshape(tensor_shape),
+            matrix.reshape(tensor_shape).transpose(axes),
+            casting="unsafe",
+        )
 
         return permuted_matrix
 
@@ -20,22 +20,27 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from braket.circuits import Circuit, Instruction, Qubit
+import numpy as np
+from braket.circuits import Circuit, Gate, Instruction, Qubit
+from braket.circuits.compiler_directive import CompilerDirective
 from braket.circuits.measure import Measure
+from braket.default_simulator.linalg_utils import controlled_matrix
 from qbraid_core.services.runtime.schemas import Program
+from scipy.linalg import fractional_matrix_power
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import CircuitStats, GateModelProgram
 
 if TYPE_CHECKING:
     import braket.circuits
-    import numpy as np
 
 
 class BraketCircuit(GateModelProgram):
     """Wrapper class for ``braket.circuits.Circuit`` objects."""
 
+    _t_gate_names = frozenset({"T", "Ti"})
+
     def __init__(self, program: braket.circuits.Circuit):
         super().__init__(program)
         if not isinstance(program, Circuit):
@@ -61,12 +66,72 @@ class BraketCircuit(GateModelProgram):
     @property
     def depth(self) -> int:
         """Return the circuit depth (i.e., length of critical path)."""
-        return self.program.depth
+        return self.stats().depth
+
+    def _compute_stats(self) -> CircuitStats:
+        """Compute the statistics of the circuit in a single pass over its instructions."""
+        gate_counts: dict[str, int] = {}
+        gates_by_num_qubits: dict[int, int] = {}
+        measured_qubits: dict[Qubit, None] = {}
+        for instruction in self.program.instructions:
+            operator = instruction.operator
+            if isinstance(operator, Measure):
+                measured_qubits.update(dict.fromkeys(instruction.target))
+            elif isinstance(operator, Gate):
+                gate_counts[operator.name] = gate_counts.get(operator.name, 0) + 1
+                size = len(instruction.target) + len(instruction.control)
+                gates_by_num_qubits[size] = gates_by_num_qubits.get(size, 0) + 1
+
+        qubits = self.program.qubits
+        return CircuitStats(
+            qubits=tuple(qubits),
+            num_qubits=len(qubits),
+            num_clbits=self.num_clbits,
+            depth=self.program.depth,
+            gate_counts=gate_counts,
+            measured_qubits=tuple(measured_qubits),
+            gates_by_num_qubits=gates_by_num_qubits,
+        )
 
     def _unitary(self) -> np.ndarray:
         """Calculate unitary of circuit."""
         return self.program.to_unitary()
 
+    def _evolve_states(self, states: np.ndarray) -> np.ndarray:
+        """Apply unitary of circuit to each row of states, one instruction at a time."""
+        qubits = sorted(self.program.qubits)
+        num_states, dim = states.shape
+        if dim != 2 ** len(qubits):
+            raise ValueError(
+                f"States of dimension {dim} do not match the {len(qubits)}-qubit circuit."
+            )
+        # Axis 0 indexes the states, and the remaining axes the qubits in sorted order, which
+        # is the big-endian order of Circuit.to_unitary.
+        axis_of = {qubit: axis for axis, qubit in enumerate(qubits, start=1)}
+        tensor = states.reshape((num_states,) + (2,) * len(qubits))
+        for instruction in self.program.instructions:
+            operator = instruction.operator
+            if isinstance(operator, (CompilerDirective, Measure)):
+                continue
+            if not isinstance(operator, Gate):
+                raise TypeError("Only Gate operators are supported to evolve states.")
+
+            matrix = operator.to_matrix()
+            power = instruction.power
+            matrix = (
+                np.linalg.matrix_power(matrix, int(power))
+                if int(power) == power
+                else fractional_matrix_power(matrix, power)
+            )
+            matrix = controlled_matrix(np.asarray(matrix, dtype=complex), instruction.control_state)
+
+            axes = [axis_of[qubit] for qubit in (*instruction.control, *instruction.target)]
+            num_axes = len(axes)
+            gate = matrix.reshape((2,) * 2 * num_axes)
+            tensor = np.tensordot(gate, tensor, axes=(range(num_axes, 2 * num_axes), axes))
+            tensor = np.moveaxis(tensor, range(num_axes), axes)
+        return tensor.reshape(num_states, dim)
+
     def populate_idle_qubits(self) -> None:
         """Checks whether the circuit uses contiguous qubits/indices,
         and if not, adds identity gates to vacant registers as needed."""
@@ -215,6 +280,7 @@ class BraketCircuit(GateModelProgram):
 
         # Store the original partial measurement qubits for result processing
         self._program.partial_measurement_qubits = partial_measurement_qubits
+        self.invalidate_stats()
 
     def replace_i_with_rz_zero(self) -> None:
         """Replace all 'i' gates with 'rz(0)' gates in the circuit.
@@ -22,12 +22,34 @@ import numpy as np
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import CircuitStats, GateModelProgram
+
+# Names of common fixed gates, which cirq otherwise only distinguishes by exponent.
+_GATE_NAMES = {
+    cirq.I: "I",
+    cirq.H: "H",
+    cirq.X: "X",
+    cirq.Y: "Y",
+    cirq.Z: "Z",
+    cirq.S: "S",
+    cirq.S**-1: "S**-1",
+    cirq.T: "T",
+    cirq.T**-1: "T**-1",
+    cirq.CNOT: "CNOT",
+    cirq.CZ: "CZ",
+    cirq.SWAP: "SWAP",
+    cirq.ISWAP: "ISWAP",
+    cirq.TOFFOLI: "TOFFOLI",
+    cirq.CCZ: "CCZ",
+    cirq.FREDKIN: "FREDKIN",
+}
 
 
 class CirqCircuit(GateModelProgram):
     """Wrapper class for ``cirq.Circuit`` objects."""
 
+    _t_gate_names = frozenset({"T", "T**-1"})
+
     def __init__(self, program: "cirq.Circuit"):
         super().__init__(program)
         if not isinstance(program, cirq.Circuit):
@@ -48,12 +70,66 @@ class CirqCircuit(GateModelProgram):
     @property
     def depth(self) -> int:
         """Return the circuit depth (i.e., length of critical path)."""
-        return len(cirq.Circuit(self.program.all_operations()))
+        return self.stats().depth
+
+    @staticmethod
+    def _gate_name(op: cirq.Operation) -> str:
+        """Return the name under which an operation is counted in the gate counts."""
+        gate = op.gate
+        if gate is None:
+            return type(op).__name__
+        try:
+            return _GATE_NAMES.get(gate) or type(gate).__name__
+        except TypeError:
+            return type(gate).__name__
+
+    def _compute_stats(self) -> CircuitStats:
+        """Compute the statistics of the circuit in a single pass over its operations."""
+        qubits = self.program.all_qubits()
+        gate_counts: dict[str, int] = {}
+        gates_by_num_qubits: dict[int, int] = {}
+        measured_qubits: dict[cirq.Qid, None] = {}
+        for op in self.program.all_operations():
+            if self.is_measurement_gate(op):
+                measured_qubits.update(dict.fromkeys(op.qubits))
+            elif not isinstance(op.gate, cirq.ResetChannel):
+                name = self._gate_name(op)
+                gate_counts[name] = gate_counts.get(name, 0) + 1
+                size = len(op.qubits)
+                gates_by_num_qubits[size] = gates_by_num_qubits.get(size, 0) + 1
+
+        return CircuitStats(
+            qubits=tuple(qubits),
+            num_qubits=len(qubits),
+            num_clbits=self.num_clbits,
+            depth=len(cirq.Circuit(self.program.all_operations())),
+            gate_counts=gate_counts,
+            measured_qubits=tuple(measured_qubits),
+            gates_by_num_qubits=gates_by_num_qubits,
+        )
 
     def _unitary(self) -> np.ndarray:
         """Calculate unitary of circuit."""
         return self.program.unitary()
 
+    def _evolve_states(self, states: np.ndarray) -> np.ndarray:
+        """Apply unitary of circuit to each row of states, one operation at a time."""
+        circuit = cirq.drop_terminal_measurements(self.program)
+        qubits = sorted(circuit.all_qubits())
+        num_states, dim = states.shape
+        if dim != 2 ** len(qubits):
+            raise ValueError(
+                f"States of dimension {dim} do not match the {len(qubits)}-qubit circuit."
+            )
+        tensor = states.reshape((num_states,) + (2,) * len(qubits)).copy()
+        args = cirq.ApplyUnitaryArgs(
+            target_tensor=tensor,
+            available_buffer=np.empty_like(tensor),
+            axes=range(1, len(qubits) + 1),
+        )
+        evolved = cirq.apply_unitaries(circuit.all_operations(), qubits, args)
+        return evolved.reshape(num_states, dim)
+
     @staticmethod
     def is_measurement_gate(op: cirq.Operation) -> bool:
         """Returns whether Cirq gate/operation is MeasurementGate."""
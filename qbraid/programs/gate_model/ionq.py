@@ -27,7 +27,7 @@ from qbraid_core.services.runtime.schemas import Program
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import IonQDict
 
-from ._model import GateModelProgram
+from ._model import CircuitStats, GateModelProgram
 
 # https://docs.ionq.com/api-reference/v0.3/writing-quantum-programs#supported-gates
 IONQ_QIS_GATES = [
@@ -95,6 +95,8 @@ class InputFormat(Enum):
 class IonQProgram(GateModelProgram):
     """Wrapper class for ``IonQDict`` objects."""
 
+    _t_gate_names = frozenset({"t", "ti"})
+
     def __init__(self, program: IonQDict):
         super().__init__(program)
         if not isinstance(program, IonQDict):
@@ -111,6 +113,46 @@ class IonQProgram(GateModelProgram):
         """Return the number of classical bits in the circuit."""
         return 0
 
+    @property
+    def depth(self) -> int:
+        """Return the circuit depth (i.e., length of critical path)."""
+        return self.stats().depth
+
+    @staticmethod
+    def _gate_qubits(instr: dict[str, Any]) -> list[int]:
+        """Return the control and target qubits of an IonQ circuit gate."""
+        qubits = list(instr.get("controls", []))
+        if "control" in instr:
+            qubits.append(instr["control"])
+        qubits.extend(instr.get("targets", []))
+        if "target" in instr:
+            qubits.append(instr["target"])
+        return qubits
+
+    def _compute_stats(self) -> CircuitStats:
+        """Compute the statistics of the circuit in a single pass over its gates."""
+        gate_counts: dict[str, int] = {}
+        gates_by_num_qubits: dict[int, int] = {}
+        # Depth is found by tracking the number of layers applied so far to each qubit.
+        layers: dict[int, int] = {}
+        for instr in self.program["circuit"]:
+            name = instr.get("gate")
+            gate_counts[name] = gate_counts.get(name, 0) + 1
+            qubits = self._gate_qubits(instr)
+            gates_by_num_qubits[len(qubits)] = gates_by_num_qubits.get(len(qubits), 0) + 1
+            layer = max((layers.get(qubit, 0) for qubit in qubits), default=0) + 1
+            layers.update(dict.fromkeys(qubits, layer))
+
+        qubits = self.qubits
+        return CircuitStats(
+            qubits=tuple(qubits),
+            num_qubits=len(qubits),
+            num_clbits=0,
+            depth=max(layers.values(), default=0),
+            gate_counts=gate_counts,
+            gates_by_num_qubits=gates_by_num_qubits,
+        )
+
     @staticmethod
     def determine_gateset(circuit: list[dict[str, Any]]) -> GateSet:
         """Determines the gate set of an IonQ circuit gate list.
@@ -28,7 +28,7 @@ from qbraid_core.services.runtime.schemas import Program
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import CircuitStats, GateModelProgram
 
 if TYPE_CHECKING:
     import numpy as np
@@ -37,6 +37,8 @@ if TYPE_CHECKING:
 class PyQuilProgram(GateModelProgram):
     """Wrapper class for ``pyQuil.Program`` objects."""
 
+    _t_gate_names = frozenset({"T"})
+
     def __init__(self, program: pyquil.Program):
         super().__init__(program)
         if not isinstance(program, pyquil.Program):
@@ -57,7 +59,32 @@ class PyQuilProgram(GateModelProgram):
     @property
     def depth(self) -> int:
         """Return the circuit depth (i.e., length of critical path)."""
-        return len(self.program)
+        return self.stats().depth
+
+    def _compute_stats(self) -> CircuitStats:
+        """Compute the statistics of the program in a single pass over its instructions."""
+        gate_counts: dict[str, int] = {}
+        gates_by_num_qubits: dict[int, int] = {}
+        measured_qubits: dict[int, None] = {}
+        for instruction in self.program:
+            if isinstance(instruction, Gate):
+                gate_counts[instruction.name] = gate_counts.get(instruction.name, 0) + 1
+                size = len(instruction.qubits)
+                gates_by_num_qubits[size] = gates_by_num_qubits.get(size, 0) + 1
+            elif isinstance(instruction, Measurement):
+                qubit = instruction.qubit
+                measured_qubits[getattr(qubit, "index", qubit)] = None
+
+        qubits = self.program.get_qubits()
+        return CircuitStats(
+            qubits=tuple(qubits),
+            num_qubits=len(qubits),
+            num_clbits=self.num_clbits,
+            depth=len(self.program),
+            gate_counts=gate_counts,
+            measured_qubits=tuple(measured_qubits),
+            gates_by_num_qubits=gates_by_num_qubits,
+        )
 
     def _remap_qubits(self, mapping: dict[int, int]) -> None:
         """Rebuild the program with each qubit index replaced via ``mapping``."""
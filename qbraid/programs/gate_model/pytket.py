@@ -36,7 +36,7 @@ from pytket.unit_id import Qubit
 
 from qbraid.programs.exceptions import ProgramTypeError, TransformError
 
-from ._model import GateModelProgram
+from ._model import CircuitStats, GateModelProgram
 
 IONQ_GATES = {
     OpType.X,
@@ -67,6 +67,8 @@ IONQ_GATES = {
 class PytketCircuit(GateModelProgram):
     """Wrapper class for ``pytket.circuit.Circuit`` objects."""
 
+    _t_gate_names = frozenset({"T", "Tdg"})
+
     def __init__(self, program: Circuit):
         super().__init__(program)
         if not isinstance(program, Circuit):
@@ -94,6 +96,30 @@ class PytketCircuit(GateModelProgram):
         """Return the circuit depth (i.e., length of critical path)."""
         return self.program.depth()
 
+    def _compute_stats(self) -> CircuitStats:
+        """Compute the statistics of the circuit in a single pass over its commands."""
+        gate_counts: dict[str, int] = {}
+        gates_by_num_qubits: dict[int, int] = {}
+        measured_qubits: dict[Qubit, None] = {}
+        for command in self.program.get_commands():
+            op_type = command.op.type
+            if op_type == OpType.Measure:
+                measured_qubits.update(dict.fromkeys(command.qubits))
+            elif op_type not in {OpType.Barrier, OpType.Reset}:
+                gate_counts[op_type.name] = gate_counts.get(op_type.name, 0) + 1
+                size = len(command.qubits)
+                gates_by_num_qubits[size] = gates_by_num_qubits.get(size, 0) + 1
+
+        return CircuitStats(
+            qubits=tuple(self.program.qubits),
+            num_qubits=self.program.n_qubits,
+            num_clbits=self.program.n_bits,
+            depth=self.program.depth(),
+            gate_counts=gate_counts,
+            measured_qubits=tuple(measured_qubits),
+            gates_by_num_qubits=gates_by_num_qubits,
+        )
+
     @staticmethod
     def remove_measurements(original_circuit):
         """
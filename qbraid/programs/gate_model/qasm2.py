@@ -29,7 +29,8 @@ from qbraid.passes.qasm import normalize_qasm_gate_params, rebase
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import Qasm2String, Qasm2StringType
 
-from ._model import GateModelProgram
+from ._model import CircuitStats, GateModelProgram
+from .qasm3 import _qasm_module_stats
 
 if TYPE_CHECKING:
     import qbraid.runtime
@@ -40,6 +41,8 @@ transpiler = LazyLoader("transpiler", globals(), "qbraid.transpiler")
 class OpenQasm2Program(GateModelProgram):
     """Wrapper class for OpenQASM 2 strings."""
 
+    _t_gate_names = frozenset({"t", "tdg"})
+
     def __init__(self, program: Qasm2StringType):
         super().__init__(program)
         if not isinstance(program, Qasm2String):
@@ -72,6 +75,10 @@ class OpenQasm2Program(GateModelProgram):
         """Return the circuit depth (i.e., length of critical path)."""
         return self._module.depth(decompose_native_gates=False)
 
+    def _compute_stats(self) -> CircuitStats:
+        """Compute the statistics of the circuit from its unrolled pyqasm module."""
+        return _qasm_module_stats(self._module)
+
     def _unitary(self) -> np.ndarray:
         """Return the unitary of the QASM"""
         raise NotImplementedError
@@ -18,30 +18,95 @@ Module defining OpenQasm3Program class.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
 
 import numpy as np
 import pyqasm
+from openqasm3 import ast as qasm3_ast
 from qbraid_core.services.runtime.schemas import Program
 
 from qbraid.passes.qasm import normalize_qasm_gate_params, rebase
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import Qasm3String, Qasm3StringType
 
-from ._model import GateModelProgram
+from ._model import CircuitStats, GateModelProgram
 
 if TYPE_CHECKING:
     import qbraid.runtime
 
 
+def _iter_statements(
+    statements: list[qasm3_ast.Statement],
+) -> Iterator[qasm3_ast.Statement]:
+    """Yield the statements of an unrolled program, including those nested in blocks.
+
+    Both branches of an if/else statement are yielded, so gates applied conditionally are
+    counted as if both branches ran.
+    """
+    for statement in statements:
+        if isinstance(statement, qasm3_ast.BranchingStatement):
+            yield from _iter_statements(statement.if_block)
+            yield from _iter_statements(statement.else_block)
+        elif isinstance(statement, qasm3_ast.Box):
+            yield from _iter_statements(statement.body)
+        else:
+            yield statement
+
+
+def _qasm_module_stats(module: pyqasm.Module) -> CircuitStats:
+    """Compute the statistics of an OpenQASM program from a single unrolling of the module."""
+    # Record qubit and clbit depths while unrolling, as pyqasm.Module.depth would from its
+    # own unrolled copy, so that the program is only unrolled once.
+    unrolled = module.copy()
+    unrolled._qubit_depths = {}
+    unrolled._clbit_depths = {}
+    unrolled._decompose_native_gates = False
+    unrolled.unroll(external_gates=module._external_gates)
+
+    gate_counts: dict[str, int] = {}
+    gates_by_num_qubits: dict[int, int] = {}
+    measured_qubits: dict[tuple[str, int], None] = {}
+    for statement in _iter_statements(unrolled.unrolled_ast.statements):
+        if isinstance(statement, qasm3_ast.QuantumGate):
+            name = statement.name.name
+            gate_counts[name] = gate_counts.get(name, 0) + 1
+            size = len(statement.qubits)
+            gates_by_num_qubits[size] = gates_by_num_qubits.get(size, 0) + 1
+        elif isinstance(statement, qasm3_ast.QuantumMeasurementStatement):
+            qubit = statement.measure.qubit
+            measured_qubits[(qubit.name.name, qubit.indices[0][0].value)] = None
+
+    depth_nodes = (*unrolled._qubit_depths.values(), *unrolled._clbit_depths.values())
+    qubits = tuple(
+        (register, index)
+        for register, size in unrolled._qubit_registers.items()
+        for index in range(size)
+    )
+    return CircuitStats(
+        qubits=qubits,
+        num_qubits=unrolled.num_qubits,
+        num_clbits=unrolled.num_clbits,
+        depth=max((node.depth for node in depth_nodes), default=0),
+        gate_counts=gate_counts,
+        measured_qubits=tuple(measured_qubits),
+        gates_by_num_qubits=gates_by_num_qubits,
+    )
+
+
 def auto_reparse(func):
-    """Decorator that ensures the quantum circuit's state
-    is validated and reparsed after method execution."""
+    """Decorator for methods that modify the pyqasm module in place. The module is validated
+    before the method executes, and the program string is marked out of date after it, to be
+    re-serialized from the module when next accessed."""
 
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        result = func(self, *args, **kwargs)
+        # pyqasm requires a module to be validated before it is modified, and skips the
+        # validation of a module that has already been validated.
         self._module.validate()
-        self._program = str(self._module)
+        result = func(self, *args, **kwargs)
+        self._program = None
         return result
 
     return wrapper
@@ -50,12 +115,27 @@ def auto_reparse(func):
 class OpenQasm3Program(GateModelProgram):
     """Wrapper class for OpenQASM 3 strings."""
 
+    _t_gate_names = frozenset({"t", "tdg"})
+
     def __init__(self, program: Qasm3StringType):
+        self._batch_depth = 0
         super().__init__(program)
-        if not isinstance(program, Qasm3String):
-            raise ProgramTypeError(message=f"Expected 'str' object, got '{type(program)}'.")
-        self._program: str = program
-        self._module = pyqasm.loads(program)
+
+    @property
+    def program(self) -> str:
+        """Return the OpenQASM 3 string, re-serialized from the pyqasm module if it was modified."""
+        if self._program is None:
+            # Serializing the module does not change the circuit, so the cached stats still apply.
+            self.__dict__["_program"] = str(self._module)
+        return self._program
+
+    @program.setter
+    def program(self, value: Qasm3StringType) -> None:
+        """Set the OpenQASM 3 string, and parse it into a new pyqasm module."""
+        if not isinstance(value, Qasm3String):
+            raise ProgramTypeError(message=f"Expected 'str' object, got '{type(value)}'.")
+        GateModelProgram.program.fset(self, value)
+        self._module = pyqasm.loads(value)
 
     @property
     def module(self) -> pyqasm.Module:
@@ -85,7 +165,11 @@ class OpenQasm3Program(GateModelProgram):
     @property
     def depth(self) -> int:
         """Return the unrolled circuit depth (i.e., length of critical path)."""
-        return self._module.depth(decompose_native_gates=False)
+        return self.stats().depth
+
+    def _compute_stats(self) -> CircuitStats:
+        """Compute the statistics of the circuit from its unrolled pyqasm module."""
+        return _qasm_module_stats(self._module)
 
     def _unitary(self) -> np.ndarray:
         """Calculate unitary of circuit."""
@@ -95,6 +179,31 @@ class OpenQasm3Program(GateModelProgram):
         """Validate the quantum circuit."""
         self._module.validate()
 
+    @contextmanager
+    def batch(self) -> Iterator[OpenQasm3Program]:
+        """Context manager for applying several modifications to the circuit, validating the
+        program once when the block exits rather than after each modification.
+
+        .. code-block:: python
+
+            with program.batch():
+                program.remove_idle_qubits()
+                program.reverse_qubit_order()
+                program.transform(device)
+
+        If the block raises an exception, the program is not validated.
+
+        Yields:
+            OpenQasm3Program: This program.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._module.validate()
+
     @auto_reparse
     def populate_idle_qubits(self) -> None:
         """Converts OpenQASM 3 string to contiguous qasm3 string with gate expansion."""
@@ -109,7 +218,6 @@ class OpenQasm3Program(GateModelProgram):
     @auto_reparse
     def reverse_qubit_order(self) -> None:
         """Reverse the order of the qubits in the circuit."""
-        self._module.validate()
         self._module.reverse_qubit_order()
 
     def transform(self, device: qbraid.runtime.QuantumDevice, **kwargs) -> None:
@@ -118,8 +226,9 @@ class OpenQasm3Program(GateModelProgram):
 
         if basis_gates is not None and len(basis_gates) > 0:
             transformed_qasm = rebase(self.program, basis_gates, **kwargs)
-            self._program = normalize_qasm_gate_params(transformed_qasm)
-            self._module.validate()
+            self.program = normalize_qasm_gate_params(transformed_qasm)
+            if self._batch_depth == 0:
+                self._module.validate()
 
     def serialize(self) -> Program:
         """Return the program in a format suitable for submission to the qBraid API."""
@@ -19,26 +19,25 @@ Module defining QiskitCircuit Class
 from __future__ import annotations
 
 from collections import OrderedDict
-from typing import TYPE_CHECKING
 
+import numpy as np
 import qiskit
 from packaging import version
 from qiskit.circuit import Qubit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
-from qiskit.quantum_info import Operator
+from qiskit.quantum_info import Operator, Statevector
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
-
-if TYPE_CHECKING:
-    import numpy as np
+from ._model import CircuitStats, GateModelProgram
 
 
 class QiskitCircuit(GateModelProgram):
     """Wrapper class for ``qiskit.QuantumCircuit`` objects"""
 
+    _t_gate_names = frozenset({"t", "tdg"})
+
     def __init__(self, program: qiskit.QuantumCircuit):
         super().__init__(program)
         if not isinstance(program, qiskit.QuantumCircuit):
@@ -66,6 +65,30 @@ class QiskitCircuit(GateModelProgram):
         """Return the circuit depth (i.e., length of critical path)."""
         return self.program.depth()
 
+    def _compute_stats(self) -> CircuitStats:
+        """Compute the statistics of the circuit in a single pass over its instructions."""
+        gate_counts: dict[str, int] = {}
+        gates_by_num_qubits: dict[int, int] = {}
+        measured_qubits: dict[Qubit, None] = {}
+        for instruction in self.program.data:
+            name = instruction.operation.name
+            if name == "measure":
+                measured_qubits.update(dict.fromkeys(instruction.qubits))
+            elif name not in {"barrier", "reset"}:
+                gate_counts[name] = gate_counts.get(name, 0) + 1
+                size = len(instruction.qubits)
+                gates_by_num_qubits[size] = gates_by_num_qubits.get(size, 0) + 1
+
+        return CircuitStats(
+            qubits=tuple(self.program.qubits),
+            num_qubits=self.program.num_qubits,
+            num_clbits=self.program.num_clbits,
+            depth=self.program.depth(),
+            gate_counts=gate_counts,
+            measured_qubits=tuple(measured_qubits),
+            gates_by_num_qubits=gates_by_num_qubits,
+        )
+
     def _unitary(self) -> np.ndarray:
         """Calculate unitary of circuit. Removes measurement gates to
         perform calculation if necessary."""
@@ -73,6 +96,18 @@ class QiskitCircuit(GateModelProgram):
         circuit.remove_final_measurements()
         return Operator(circuit).data
 
+    def _evolve_states(self, states: np.ndarray) -> np.ndarray:
+        """Apply unitary of circuit to each row of states, simulating it gate by gate.
+        Removes measurement gates to perform calculation if necessary."""
+        if states.shape[1] != 2**self.num_qubits:
+            raise ValueError(
+                f"States of dimension {states.shape[1]} do not match the "
+                f"{self.num_qubits}-qubit circuit."
+            )
+        circuit = self.program.copy()
+        circuit.remove_final_measurements()
+        return np.stack([Statevector(state).evolve(circuit).data for state in states])
+
     def remove_idle_qubits(self) -> None:
         """Checks whether the circuit uses contiguous qubits/indices,
         and if not, reduces dimension accordingly."""
@@ -22,11 +22,16 @@ from typing import Any, Optional, Type, TypeVar, Union
 
 from qbraid._entrypoints import get_entrypoints
 
-from ._import import _QPROGRAM_ALIASES, _QPROGRAM_REGISTRY, _QPROGRAM_TYPES, NATIVE_REGISTRY
+from ._import import (
+    _QPROGRAM_ALIASES,
+    _QPROGRAM_REGISTRY,
+    _QPROGRAM_TYPES,
+    NATIVE_REGISTRY,
+    loaded_items,
+)
 from .experiment import ExperimentType
 from .typer import QbraidMetaType
 
-QPROGRAM_NATIVE = Union[tuple(_QPROGRAM_TYPES)]
 QPROGRAM_REGISTRY = _QPROGRAM_REGISTRY
 QPROGRAM_ALIASES = _QPROGRAM_ALIASES
 QPROGRAM_TYPES = _QPROGRAM_TYPES
@@ -41,6 +46,54 @@ QPROGRAM = TypeVar("QPROGRAM", bound=Any)
 # competing writer "wins" a contested alias.
 _REGISTRY_LOCK = threading.RLock()
 
+# Monotonic counter incremented on every mutation of the registry. Caches derived
+# from the registry (e.g. the shared default ConversionGraph) record the version
+# they were built against and treat themselves as stale once it changes.
+_REGISTRY_VERSION = 0
+
+
+def __getattr__(name):
+    # QPROGRAM_NATIVE is built on first access, because it requires importing every
+    # installed quantum SDK.
+    if name == "QPROGRAM_NATIVE":
+        return Union[tuple(QPROGRAM_TYPES)]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _bump_registry_version() -> None:
+    """Increment the registry version. Must be called while holding ``_REGISTRY_LOCK``."""
+    global _REGISTRY_VERSION  # pylint: disable=global-statement
+    _REGISTRY_VERSION += 1
+
+
+def get_registry_version() -> int:
+    """
+    Return the current version of the program type registry.
+
+    The version increases every time a program type is registered or unregistered,
+    so it can be used to invalidate anything computed from the registry.
+
+    Returns:
+        int: The current registry version.
+    """
+    return _REGISTRY_VERSION
+
+
+def _drop_unavailable_alias(alias: str) -> None:
+    """
+    Forget an alias dropped from a registry because its program type failed to import.
+
+    Bumping the registry version also discards cached conversion graphs, so the alias no
+    longer appears as a graph node.
+    """
+    with _REGISTRY_LOCK:
+        QPROGRAM_ALIASES.discard(alias)
+        _bump_registry_version()
+
+
+QPROGRAM_REGISTRY.on_drop(_drop_unavailable_alias)
+NATIVE_REGISTRY.on_drop(_drop_unavailable_alias)
+
 
 def derive_program_type_alias(program_type: Type[Any], use_submodule: bool = False) -> str:
     """
@@ -111,8 +164,8 @@ def register_program_type(
 
     with _REGISTRY_LOCK:
         # Check if the alias is already used and if it maps to a different type
-        if normalized_alias in QPROGRAM_REGISTRY:
-            registered_type = QPROGRAM_REGISTRY[normalized_alias]
+        registered_type = QPROGRAM_REGISTRY.get(normalized_alias)
+        if registered_type is not None:
             if registered_type != program_type and overwrite is False:
                 if (
                     isinstance(registered_type, QbraidMetaType)
@@ -124,13 +177,16 @@ def register_program_type(
                         f"Alias '{alias}' is already registered with a different type."
                     )
 
-        # Check if the type is already registered under any other alias
-        existing_alias = next((k for k, v in QPROGRAM_REGISTRY.items() if v == program_type), None)
+        # Check if the type is already registered under any other alias. Program types whose
+        # modules were never imported cannot be equal to program_type, so they are skipped.
+        existing_alias = next(
+            (k for k, v in loaded_items(QPROGRAM_REGISTRY) if v == program_type), None
+        )
         if existing_alias and existing_alias != normalized_alias and overwrite is False:
             if program_type is str:
                 str_types = [
                     k
-                    for k, v in QPROGRAM_REGISTRY.items()
+                    for k, v in loaded_items(QPROGRAM_REGISTRY)
                     if v is str and k not in ("qasm2", "qasm3", "qasm2_kirin")
                 ]
                 if (
@@ -152,6 +208,7 @@ def register_program_type(
         QPROGRAM_REGISTRY[normalized_alias] = program_type
         QPROGRAM_ALIASES.add(normalized_alias)
         QPROGRAM_TYPES.add(program_type)
+        _bump_registry_version()
 
 
 def unregister_program_type(alias: str, raise_error: bool = True) -> None:
@@ -168,6 +225,9 @@ def unregister_program_type(alias: str, raise_error: bool = True) -> None:
     normalized_alias = alias.lower()
 
     with _REGISTRY_LOCK:
+        if normalized_alias in QPROGRAM_ALIASES or normalized_alias in QPROGRAM_REGISTRY:
+            _bump_registry_version()
+
         QPROGRAM_ALIASES.discard(normalized_alias)
 
         if normalized_alias not in QPROGRAM_REGISTRY:
@@ -175,9 +235,11 @@ def unregister_program_type(alias: str, raise_error: bool = True) -> None:
                 raise KeyError(f"No program type registered under the alias '{alias}'.")
             return
 
-        program_type = QPROGRAM_REGISTRY.pop(normalized_alias)
+        program_type = QPROGRAM_REGISTRY.pop(normalized_alias, None)
 
-        if not any(pt == program_type for pt in QPROGRAM_REGISTRY.values()):
+        if program_type is not None and not any(
+            pt == program_type for _, pt in loaded_items(QPROGRAM_REGISTRY)
+        ):
             QPROGRAM_TYPES.discard(program_type)
 
 
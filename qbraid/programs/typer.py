@@ -17,6 +17,7 @@ Module providing granular type checking for quantum programs
 that use Python's built-in types.
 
 """
+import re
 from abc import ABCMeta, abstractmethod
 from typing import Any, Optional, Type, TypeVar
 
@@ -29,6 +30,40 @@ from .exceptions import ValidationError as ProgramValidationError
 IonQDictType = TypeVar("IonQDictType", bound=dict)
 QuboCoefficientsDictType = TypeVar("QuboCoefficientsDictType", bound=dict)
 
+# Whitespace, or a single line or block comment, preceding the OpenQASM version header
+_QASM_PREAMBLE = re.compile(r"\s*(?://[^\n]*|/\*.*?\*/)?", re.DOTALL)
+_QASM_HEADER = re.compile(r"OPENQASM[^\S\n]+(\d+)(?:\.(\d+))?;")
+
+
+def extract_qasm_version(qasm: str) -> float:
+    """
+    Extracts the OpenQASM version from the header of an OpenQASM program.
+
+    Only the comments and whitespace preceding the version header are scanned, rather than
+    the whole program. Programs that do not start with their version header fall back to
+    :meth:`pyqasm.analyzer.Qasm3Analyzer.extract_qasm_version`.
+
+    Args:
+        qasm (str): The OpenQASM program string.
+
+    Returns:
+        float: The OpenQASM version, e.g. 2.0 or 3.0.
+
+    Raises:
+        QasmParsingError: If the OpenQASM version could not be determined.
+    """
+    pos = 0
+    while True:
+        end = _QASM_PREAMBLE.match(qasm, pos).end()
+        if end == pos:
+            break
+        pos = end
+
+    match = _QASM_HEADER.match(qasm, pos)
+    if match is None:
+        return Qasm3Analyzer.extract_qasm_version(qasm)
+    return float(f"{match.group(1)}.{match.group(2) or 0}")
+
 
 class QbraidMetaType(ABCMeta):
     """Abstract metaclass for custom program type checking based on built-in types."""
@@ -182,7 +217,7 @@ class BaseQasmInstanceMeta(QbraidMetaType):
         if not isinstance(instance, str):
             return False
         try:
-            return int(Qasm3Analyzer.extract_qasm_version(instance)) == cls.version
+            return int(extract_qasm_version(instance)) == cls.version
         except QasmParsingError:
             return False
 
@@ -238,7 +273,7 @@ class QasmStringType(str):
     def __new__(cls, value):
         if not isinstance(value, str):
             raise TypeError("OpenQASM strings must be initialized with a string.")
-        if not int(Qasm3Analyzer.extract_qasm_version(value)) == cls.version:
+        if not int(extract_qasm_version(value)) == cls.version:
             raise ValueError(f"String does not conform to OpenQASM {cls.version} format.")
         return str.__new__(cls, value)
 
@@ -268,9 +303,15 @@ def get_qasm_type_alias(qasm: str) -> str:
     Raises:
         QasmError: If the string does not represent a valid OpenQASM program.
     """
-    if isinstance(qasm, Qasm2String):
+    # Equivalent to checking against Qasm2String, Qasm3String, and Qasm2KirinString in turn,
+    # but extracts the version only once.
+    try:
+        version = int(extract_qasm_version(qasm)) if isinstance(qasm, str) else None
+    except QasmParsingError:
+        version = None
+    if version == Qasm2String.version:
         return Qasm2String.__alias__
-    if isinstance(qasm, Qasm3String):
+    if version == Qasm3String.version:
         return Qasm3String.__alias__
     if isinstance(qasm, Qasm2KirinString):
         return Qasm2KirinString.__alias__
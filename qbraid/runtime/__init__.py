@@ -41,6 +41,9 @@ Functions
     load_job
     get_providers
     load_provider
+    wait_all
+    as_completed
+    refresh_statuses
 
 Classes
 --------
@@ -52,6 +55,7 @@ Classes
     TargetProfile
     QuantumDevice
     QuantumJob
+    BackoffPolicy
     QuantumProvider
     Result
     ResultData
@@ -95,7 +99,7 @@ from .exceptions import (
     RuntimeAPIError,
 )
 from .group import GroupJobSession, GroupResult, get_active_group
-from .job import QuantumJob
+from .job import BackoffPolicy, QuantumJob
 from .loader import (
     JobLoaderError,
     ProviderLoaderError,
@@ -105,6 +109,15 @@ from .loader import (
 )
 from .noise import NoiseModel, NoiseModelSet
 from .options import RuntimeOptions
+from .polling import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    FIRST_FAILED,
+    DoneAndNotDoneJobs,
+    as_completed,
+    refresh_statuses,
+    wait_all,
+)
 from .profile import TargetProfile
 from .provider import QuantumProvider
 from .result import BatchResult, Result
@@ -128,6 +141,13 @@ __all__ = [
     "load_job",
     "get_providers",
     "load_provider",
+    "wait_all",
+    "as_completed",
+    "refresh_statuses",
+    "DoneAndNotDoneJobs",
+    "ALL_COMPLETED",
+    "FIRST_COMPLETED",
+    "FIRST_FAILED",
     "AuthorizationError",
     "JobNotFoundError",
     "JobStateError",
@@ -140,6 +160,7 @@ __all__ = [
     "ProviderLoaderError",
     "TargetProfile",
     "QuantumJob",
+    "BackoffPolicy",
     "QuantumProvider",
     "RuntimeOptions",
     "NoiseModel",
@@ -18,7 +18,8 @@ Module defining BraketQuantumTask Class
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 from braket.aws import AwsQuantumTask
 from braket.tasks.analog_hamiltonian_simulation_quantum_task_result import (
@@ -52,6 +53,10 @@ AWS_TASK_STATUS_MAP = {
 }
 
 
+# Maximum number of values in a single SearchQuantumTasks filter
+SEARCH_FILTER_MAX_VALUES = 10
+
+
 class AmazonBraketVersionError(Exception):
     """Exception raised for Amazon Braket SDK errors due to versioning."""
 
@@ -72,6 +77,49 @@ class BraketQuantumTask(QuantumJob):
         self._cache_metadata["status"] = status
         return status
 
+    @classmethod
+    def bulk_status(cls, jobs: Sequence[BraketQuantumTask]) -> list[Optional[JobStatus]]:
+        """Returns the statuses of many quantum tasks using the Braket SearchQuantumTasks API.
+
+        Tasks are looked up by ARN, up to ten per request, with one series of requests for
+        each distinct Braket client (i.e. region). Tasks the search does not return are
+        reported as None.
+        """
+        tasks_by_client: dict[int, list[BraketQuantumTask]] = defaultdict(list)
+        clients: dict[int, Any] = {}
+        for task in jobs:
+            client = task._task._aws_session.braket_client
+            clients[id(client)] = client
+            tasks_by_client[id(client)].append(task)
+
+        states: dict[str, str] = {}
+        for client_id, tasks in tasks_by_client.items():
+            arns = [task._task.id for task in tasks]
+            for start in range(0, len(arns), SEARCH_FILTER_MAX_VALUES):
+                chunk = arns[start : start + SEARCH_FILTER_MAX_VALUES]
+                kwargs: dict[str, Any] = {
+                    "filters": [{"name": "quantumTaskArn", "operator": "EQUAL", "values": chunk}],
+                    "maxResults": 100,
+                }
+                while True:
+                    response = clients[client_id].search_quantum_tasks(**kwargs)
+                    for summary in response.get("quantumTasks", []):
+                        states[summary["quantumTaskArn"]] = summary["status"]
+                    if not response.get("nextToken"):
+                        break
+                    kwargs["nextToken"] = response["nextToken"]
+
+        statuses: list[Optional[JobStatus]] = []
+        for task in jobs:
+            state = states.get(task._task.id)
+            if state is None:
+                statuses.append(None)
+                continue
+            status = AWS_TASK_STATUS_MAP.get(state, JobStatus.UNKNOWN)
+            task._cache_metadata["status"] = status
+            statuses.append(status)
+        return statuses
+
     def queue_position(self) -> Optional[int]:
         """Returns queue position from Braket QuantumTask.
         '>2000' returns as 2000 for typing consistency."""
@@ -21,9 +21,11 @@ Module defining abstract QuantumDevice Class
 
 from __future__ import annotations
 
+import contextvars
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, cast
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Sequence, cast
 
 from qbraid._logging import logger
 from qbraid.programs import (
@@ -44,12 +46,50 @@ from qbraid.transpiler import (
 from .enums import DeviceStatus, ValidationLevel
 from .exceptions import ProgramValidationError, ResourceNotFoundError
 from .options import RuntimeOptions
+from .polling import DEFAULT_MAX_WORKERS
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     import qbraid.programs
     import qbraid.runtime
 
 
+def _is_bool(value: Any) -> bool:
+    """Return True if the value is a boolean."""
+    return isinstance(value, bool)
+
+
+def _is_validation_level(value: Any) -> bool:
+    """Return True if the value is a ValidationLevel or its integer value."""
+    return isinstance(value, ValidationLevel) or (isinstance(value, int) and 0 <= value <= 2)
+
+
+def _apply_runtime_profile_chunk(
+    device: QuantumDevice, programs: list[qbraid.programs.QPROGRAM]
+) -> list[Any]:
+    """Apply the device runtime profile to each program, returning exceptions in place."""
+    results: list[Any] = []
+    for program in programs:
+        try:
+            results.append(device.apply_runtime_profile(program, suppress_device_warning=True))
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            results.append(err)
+    return results
+
+
+def _submit_in_context(executor: Executor, fn: Callable, *args, **kwargs) -> Future:
+    """Submit a call to an executor, carrying over the caller's context variables to threads.
+
+    Context variables (e.g. the active group job session) are not visible in threads started
+    by an executor, so each call is run in a copy of the caller's context. Process pools cannot
+    share context, so calls are submitted to them as-is.
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        return executor.submit(fn, *args, **kwargs)
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
 class QuantumDevice(ABC):
     """Abstract interface for quantum devices."""
 
@@ -119,16 +159,11 @@ class QuantumDevice(ABC):
             transpile=True, transform=True, validate=ValidationLevel.RAISE, prepare=True
         )
 
-        # pylint: disable=unnecessary-lambda
-        options.set_validator("transpile", lambda x: isinstance(x, bool))
-        options.set_validator("transform", lambda x: isinstance(x, bool))
-        options.set_validator(
-            "validate",
-            lambda x: isinstance(x, ValidationLevel) or (isinstance(x, int) and 0 <= x <= 2),
-        )
-        options.set_validator("prepare", lambda x: isinstance(x, bool))
-
-        # pylint: enable=unnecessary-lambda
+        # Validators are module-level functions so that devices can be pickled.
+        options.set_validator("transpile", _is_bool)
+        options.set_validator("transform", _is_bool)
+        options.set_validator("validate", _is_validation_level)
+        options.set_validator("prepare", _is_bool)
 
         return options
 
@@ -347,7 +382,7 @@ class QuantumDevice(ABC):
 
             try:
                 transpiled_run_input = transpile(
-                    run_input, target_alias, **conversion_scheme_fields
+                    run_input, target_alias, cache=self.scheme.cache, **conversion_scheme_fields
                 )
 
                 if not (
@@ -454,10 +489,15 @@ class QuantumDevice(ABC):
         return target_spec.serialize(run_input)
 
     def apply_runtime_profile(
-        self, run_input: qbraid.programs.QPROGRAM
+        self, run_input: qbraid.programs.QPROGRAM, suppress_device_warning: bool = False
     ) -> qbraid.programs.QPROGRAM:
         """Process quantum program before passing to device run method.
 
+        Args:
+            run_input: The quantum program to process.
+            suppress_device_warning: If True, skip the device status check performed
+                during validation. Defaults to False.
+
         Returns:
             Transpiled and transformed quantum program
         """
@@ -473,7 +513,7 @@ class QuantumDevice(ABC):
             logger.debug("Applying device-specific transformations (no-op in base class)")
             run_input = [self.transform(p) for p in cast(list, run_input)]
 
-        self.validate(run_input)
+        self.validate(run_input, suppress_device_warning=suppress_device_warning)
 
         run_input = [self.prepare(p) for p in cast(list, run_input)]
 
@@ -517,3 +557,133 @@ class QuantumDevice(ABC):
             self.id,
         )
         return self.submit(run_input_compat, *args, **kwargs)
+
+    def run_batch(
+        self,
+        run_input: Sequence[qbraid.programs.QPROGRAM],
+        *args,
+        executor: Executor | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        chunksize: int = 1,
+        **kwargs,
+    ) -> list[qbraid.runtime.QuantumJob | Exception]:
+        """
+        Run a batch of quantum programs on this device, pipelining preparation and submission.
+
+        Each program is processed with :meth:`apply_runtime_profile` (transpile, transform,
+        validate, prepare) on ``executor``, and is submitted with :meth:`submit` as soon as
+        it is ready, using up to ``max_workers`` concurrent submissions. Each program is
+        submitted as its own job.
+
+        Devices that override :meth:`run` may preprocess programs or consume run options
+        there, before :meth:`submit` is reached. On such devices, each program is instead
+        passed to :meth:`run` on its own, on a pool of ``max_workers`` threads, and
+        ``executor`` and ``chunksize`` are not used.
+
+        To apply the runtime profile in worker processes, pass a
+        :class:`~concurrent.futures.ProcessPoolExecutor`. The device, including its provider
+        credentials, and the programs are then pickled and sent to the workers with each
+        chunk.
+
+        Args:
+            run_input: The quantum programs to run on the device.
+            executor (Executor | None): The executor used to apply the runtime profile. If None,
+                a :class:`~concurrent.futures.ThreadPoolExecutor` with ``max_workers`` threads
+                is created for the duration of the call. Pass an executor to reuse its workers
+                across calls. Defaults to None.
+            max_workers (int): The maximum number of jobs submitted concurrently.
+                Defaults to 8.
+            chunksize (int): The number of programs sent to a worker at once. Defaults to 1.
+
+        Returns:
+            list[QuantumJob | Exception]: The submitted jobs, in the same order as the input
+                programs. A program that failed to be processed or submitted is represented
+                by the exception it raised.
+
+        Raises:
+            ValueError: If ``max_workers`` or ``chunksize`` is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive integer.")
+
+        programs = list(run_input)
+        if not programs:
+            return []
+
+        if type(self).run is not QuantumDevice.run:
+            return self._run_each(programs, *args, max_workers=max_workers, **kwargs)
+
+        # Check the device status once for the whole batch rather than once per program.
+        self.validate([])
+
+        logger.debug("Submitting batch of %d program(s) to device '%s'", len(programs), self.id)
+
+        results: dict[int, Any] = {}
+        pool = executor if executor is not None else ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            prepare_futures = {
+                _submit_in_context(
+                    pool, _apply_runtime_profile_chunk, self, programs[start : start + chunksize]
+                ): range(start, min(start + chunksize, len(programs)))
+                for start in range(0, len(programs), chunksize)
+            }
+
+            with ThreadPoolExecutor(max_workers=max_workers) as submit_pool:
+                submit_futures: dict[Future, int] = {}
+
+                for future in as_completed(prepare_futures):
+                    indices = prepare_futures[future]
+                    try:
+                        chunk_results = future.result()
+                    except Exception as err:  # pylint: disable=broad-exception-caught
+                        chunk_results = [err] * len(indices)
+
+                    for index, program in zip(indices, chunk_results):
+                        if isinstance(program, Exception):
+                            results[index] = program
+                        else:
+                            submit_futures[
+                                _submit_in_context(
+                                    submit_pool, self.submit, program, *args, **kwargs
+                                )
+                            ] = index
+
+                for future, index in submit_futures.items():
+                    try:
+                        results[index] = future.result()
+                    except Exception as err:  # pylint: disable=broad-exception-caught
+                        results[index] = err
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+        return [results[index] for index in range(len(programs))]
+
+    def _run_each(
+        self,
+        programs: list[qbraid.programs.QPROGRAM],
+        *args,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        **kwargs,
+    ) -> list[qbraid.runtime.QuantumJob | Exception]:
+        """Run each program with :meth:`run` on a thread pool, returning exceptions in place."""
+        logger.debug(
+            "Running batch of %d program(s) on device '%s' through its run method",
+            len(programs),
+            self.id,
+        )
+
+        results: list[qbraid.runtime.QuantumJob | Exception] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                _submit_in_context(pool, self.run, program, *args, **kwargs) for program in programs
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as err:  # pylint: disable=broad-exception-caught
+                    results.append(err)
+
+        return results
@@ -19,12 +19,17 @@ Module defining GroupJobSession context manager and GroupResult container.
 
 from __future__ import annotations
 
+import asyncio
 import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Callable
 
 from qbraid_core.services.runtime import QuantumRuntimeClient
 
 from qbraid._logging import logger
+from qbraid.runtime.enums import JobStatus
+from qbraid.runtime.job import _poll_delays
+from qbraid.runtime.polling import DEFAULT_MAX_WORKERS, as_completed, refresh_statuses
 from qbraid.runtime.result import Result
 
 if TYPE_CHECKING:
@@ -349,33 +354,104 @@ class GroupJobSession:
         self,
         timeout: int | None = None,
         poll_interval: int = 5,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> GroupResult:
         """Wait for all jobs to complete and return a GroupResult.
 
         Blocks until all jobs reach a terminal state (COMPLETED, FAILED,
-        CANCELLED) or until the timeout is reached.
+        CANCELLED) or until the timeout is reached. All jobs are polled
+        together each round (see :func:`~qbraid.runtime.as_completed`), and
+        each job's result is fetched in a worker thread as soon as the job
+        finishes, so a group takes about as long as its slowest job.
 
         Args:
-            timeout: Maximum seconds to wait **per job**. ``None`` = wait
-                indefinitely. Note: this is applied per job, not across the
-                whole group, so with N jobs the total blocking time may
-                reach up to N * timeout seconds.
-            poll_interval: Seconds between status checks per job.
+            timeout: Maximum seconds to wait for the **whole group**.
+                ``None`` = wait indefinitely.
+            poll_interval: Seconds between polling rounds.
+            max_workers: Maximum number of concurrent status queries and
+                result fetches.
 
         Returns:
             GroupResult mapping jobQrn -> Result[ResultDataType].
 
         Raises:
-            TimeoutError: If timeout reached before a job completes.
+            TimeoutError: If timeout reached before all jobs complete.
             RuntimeError: If group session was never opened.
         """
         if self._group_data is None:
             raise RuntimeError("Group session has not been opened.")
 
-        results: dict[str, Result] = {}
-        for job in self._jobs:
-            job.wait_for_final_state(timeout=timeout, poll_interval=poll_interval)
-            results[str(job.id)] = job.result()
+        jobs = list(self._jobs)
+        futures: dict[str, Future[Result]] = {}
+
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+                for job in as_completed(
+                    jobs, timeout=timeout, poll_interval=poll_interval, max_workers=max_workers
+                ):
+                    futures[str(job.id)] = executor.submit(job.result)
+
+        results = {str(job.id): futures[str(job.id)].result() for job in jobs}
+
+        return GroupResult(group_id=self._group_data.groupJobQrn, results=results)
+
+    async def aresults(
+        self,
+        timeout: int | None = None,
+        poll_interval: int = 5,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> GroupResult:
+        """Asynchronously wait for all jobs to complete and return a GroupResult.
+
+        Non-blocking counterpart of :meth:`results`. Status queries and
+        result fetches run in worker threads, and the event loop is free
+        between polling rounds.
+
+        Args:
+            timeout: Maximum seconds to wait for the **whole group**.
+                ``None`` = wait indefinitely.
+            poll_interval: Seconds between polling rounds.
+            max_workers: Maximum number of concurrent status queries.
+
+        Returns:
+            GroupResult mapping jobQrn -> Result[ResultDataType].
+
+        Raises:
+            TimeoutError: If timeout reached before all jobs complete.
+            RuntimeError: If group session was never opened.
+        """
+        if self._group_data is None:
+            raise RuntimeError("Group session has not been opened.")
+
+        jobs = list(self._jobs)
+        terminal_states = JobStatus.terminal_states()
+        delays = _poll_delays(timeout, poll_interval, None)
+        fetches: dict[str, asyncio.Task[Result]] = {}
+        pending = jobs
+
+        try:
+            while pending:
+                statuses = await asyncio.to_thread(refresh_statuses, pending, max_workers)
+                for job, status in zip(pending, statuses):
+                    if status in terminal_states:
+                        fetches[str(job.id)] = asyncio.create_task(asyncio.to_thread(job.result))
+                pending = [
+                    job for job, status in zip(pending, statuses) if status not in terminal_states
+                ]
+                if not pending:
+                    break
+
+                delay = next(delays)
+                if delay is None:
+                    raise TimeoutError(
+                        f"Timeout while waiting for {len(pending)} of {len(jobs)} jobs."
+                    )
+                await asyncio.sleep(delay)
+
+            results = {str(job.id): await fetches[str(job.id)] for job in jobs}
+        finally:
+            for fetch in fetches.values():
+                fetch.cancel()
 
         return GroupResult(group_id=self._group_data.groupJobQrn, results=results)
 
@@ -421,10 +497,9 @@ class GroupJobSession:
                         for job_id, result in results.items():
                             counts = result.data.get_counts()
                             print(f"{job_id}: {counts}")
-            timeout: Max seconds to wait **per job** for terminal state.
-                ``None`` = indefinite. Applied per job, so total blocking
-                time may reach up to N * timeout seconds for N jobs.
-            poll_interval: Seconds between status polls per job.
+            timeout: Max seconds to wait for all jobs to reach a terminal
+                state. ``None`` = indefinite.
+            poll_interval: Seconds between polling rounds.
 
         Example:
             >>> with GroupJobSession(name="sweep") as group:
@@ -19,9 +19,11 @@ Module defining abstract QuantumJob Class
 from __future__ import annotations
 
 import asyncio
+import random
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from time import sleep, time
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Sequence
 
 from .enums import JobStatus
 from .exceptions import ResourceNotFoundError
@@ -31,8 +33,90 @@ if TYPE_CHECKING:
     from qbraid.runtime.result_data import ResultDataType
 
 
+@dataclass(frozen=True)
+class BackoffPolicy:
+    """Schedule of delays between job status queries.
+
+    The first delay is ``initial_interval`` seconds, and each subsequent delay is ``multiplier``
+    times the previous one, capped at ``max_interval``. Each delay is then scaled by a random
+    factor in ``[1 - jitter, 1 + jitter]``, so that many jobs waited on together do not query
+    the provider in lockstep.
+
+    Attributes:
+        initial_interval (float): Seconds to wait before the second status query.
+        max_interval (Optional[float]): Upper bound on the delay, before jitter is applied.
+            If None, delays grow without bound.
+        multiplier (float): Factor by which the delay grows after each query. Must be >= 1.
+        jitter (float): Maximum fraction by which a delay is randomly shortened or lengthened,
+            ranging [0,1]. Defaults to 0, meaning no jitter.
+    """
+
+    initial_interval: float = 5.0
+    max_interval: Optional[float] = None
+    multiplier: float = 1.0
+    jitter: float = 0.0
+
+    def __post_init__(self):
+        if self.initial_interval < 0:
+            raise ValueError("initial_interval must be a non-negative number.")
+        if self.max_interval is not None and self.max_interval < self.initial_interval:
+            raise ValueError("max_interval must be greater than or equal to initial_interval.")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be greater than or equal to 1.")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("jitter must be a float between 0 and 1, inclusive.")
+
+    @classmethod
+    def fixed(cls, interval: float) -> BackoffPolicy:
+        """Return a policy that waits the same number of seconds between every query."""
+        return cls(initial_interval=interval, max_interval=interval)
+
+    def delays(self) -> Iterator[float]:
+        """Yield the successive delays, in seconds, between status queries."""
+        delay = self.initial_interval
+        while True:
+            if self.jitter:
+                yield delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+            else:
+                yield delay
+            delay *= self.multiplier
+            if self.max_interval is not None:
+                delay = min(delay, self.max_interval)
+
+
+def _poll_delays(
+    timeout: Optional[float], poll_interval: float, backoff: Optional[BackoffPolicy]
+) -> Iterator[Optional[float]]:
+    """Return an iterator over the seconds to wait before each status query after the first,
+    never sleeping past the timeout, which yields None once the timeout has expired. The
+    timeout is measured from when this function is called."""
+    policy = backoff if backoff is not None else BackoffPolicy.fixed(poll_interval)
+    deadline = None if timeout is None else time() + timeout
+
+    def delays() -> Iterator[Optional[float]]:
+        for delay in policy.delays():
+            if deadline is None:
+                yield delay
+                continue
+            remaining = deadline - time()
+            if remaining <= 0:
+                yield None
+                return
+            yield min(delay, remaining)
+
+    return delays()
+
+
 class QuantumJob(ABC):
-    """Abstract interface for job-like classes."""
+    """Abstract interface for job-like classes.
+
+    Attributes:
+        backoff_policy (Optional[BackoffPolicy]): Default schedule of delays between status
+            queries used by :meth:`wait_for_final_state` and :meth:`async_result` when no
+            ``backoff`` is given. If None, queries are spaced ``poll_interval`` seconds apart.
+    """
+
+    backoff_policy: Optional[BackoffPolicy] = None
 
     def __init__(
         self, job_id: str | int, device: Optional[qbraid.runtime.QuantumDevice] = None, **kwargs
@@ -62,60 +146,112 @@ class QuantumJob(ABC):
         status = self.status()
         return status in terminal_states
 
+    async def _async_is_terminal_state(self) -> bool:
+        """Asynchronously determine whether the job is in a final state, using
+        :meth:`async_status` so that the event loop is not blocked."""
+        terminal_states = JobStatus.terminal_states()
+        if self._cache_metadata.get("status", None) in terminal_states:
+            return True
+
+        status = await self.async_status()
+        return status in terminal_states
+
     @abstractmethod
     def status(self) -> JobStatus:
         """Return the status of the job / task , among the values of ``JobStatus``."""
 
+    @classmethod
+    def bulk_status(  # pylint: disable=unused-argument
+        cls, jobs: Sequence[QuantumJob]
+    ) -> Optional[list[Optional[JobStatus]]]:
+        """Return the statuses of many jobs of this class using as few requests as possible.
+
+        Providers with an endpoint that reports the status of many jobs at once should override
+        this method. It is used by :func:`~qbraid.runtime.wait_all` and
+        :func:`~qbraid.runtime.as_completed`, which otherwise query each job's :meth:`status`.
+
+        Args:
+            jobs (Sequence[QuantumJob]): The jobs to query, all instances of this class.
+
+        Returns:
+            Optional[list[Optional[JobStatus]]]: The status of each job, in order, with None for
+            any job the endpoint did not report. None if the provider has no bulk endpoint.
+        """
+        return None
+
+    async def async_status(self) -> JobStatus:
+        """Asynchronously return the status of the job, among the values of ``JobStatus``.
+
+        By default, the blocking :meth:`status` method is run in a worker thread. Providers
+        with an asynchronous API client should override this method to query it natively.
+        """
+        return await asyncio.to_thread(self.status)
+
     def metadata(self) -> dict[str, Any]:
         """Return the metadata regarding the job."""
         status = self.status()
         self._cache_metadata["status"] = status
         return self._cache_metadata
 
-    def wait_for_final_state(self, timeout: Optional[int] = None, poll_interval: int = 5) -> None:
+    def wait_for_final_state(
+        self,
+        timeout: Optional[int] = None,
+        poll_interval: int = 5,
+        backoff: Optional[BackoffPolicy] = None,
+    ) -> None:
         """Poll the job status until it progresses to a final state.
 
         Args:
             timeout: Seconds to wait for the job. If ``None``, wait indefinitely.
             poll_interval: Seconds between queries. Defaults to 5 seconds.
+            backoff: Schedule of delays between queries, overriding ``poll_interval``.
+                Defaults to the job's :attr:`backoff_policy`.
 
         Raises:
             JobStateError: If the job does not reach a final state before the specified timeout.
 
         """
-        start_time = time()
+        delays = _poll_delays(timeout, poll_interval, backoff or self.backoff_policy)
         while not self.is_terminal_state():
-            elapsed_time = time() - start_time
-            if timeout is not None and elapsed_time >= timeout:
+            delay = next(delays)
+            if delay is None:
                 raise TimeoutError(f"Timeout while waiting for job {self.id}.")
-            sleep(poll_interval)
+            sleep(delay)
 
     async def _wait_for_final_state(
-        self, timeout: Optional[int] = None, poll_interval: int = 5
+        self,
+        timeout: Optional[int] = None,
+        poll_interval: int = 5,
+        backoff: Optional[BackoffPolicy] = None,
     ) -> None:
         """Asynchronously wait for the job to reach a terminal state (e.g., COMPLETED, FAILED).
 
-        This non-blocking method uses asyncio to periodically poll the job's status,
-        allowing other coroutines to run while waiting. It is especially useful in
-        asynchronous applications where blocking the event loop is undesirable.
+        This non-blocking method uses asyncio to periodically poll the job's status with
+        :meth:`async_status`, allowing other coroutines to run while waiting. It is especially
+        useful in asynchronous applications where blocking the event loop is undesirable.
 
         Args:
             timeout (Optional[int]): Maximum number of seconds to wait for the job.
                 If None, waits indefinitely.
             poll_interval (int): Seconds between queries. Defaults to 5.
+            backoff (Optional[BackoffPolicy]): Schedule of delays between queries, overriding
+                ``poll_interval``. Defaults to the job's :attr:`backoff_policy`.
 
         Raises:
             TimeoutError: If the job does not reach a terminal state before the specified timeout.
         """
-        start_time = time()
-        while not self.is_terminal_state():
-            elapsed_time = time() - start_time
-            if timeout is not None and elapsed_time >= timeout:
+        delays = _poll_delays(timeout, poll_interval, backoff or self.backoff_policy)
+        while not await self._async_is_terminal_state():
+            delay = next(delays)
+            if delay is None:
                 raise TimeoutError(f"Timeout while waiting for job {self.id}.")
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(delay)
 
     async def async_result(
-        self, timeout: Optional[int] = None, poll_interval: int = 5
+        self,
+        timeout: Optional[int] = None,
+        poll_interval: int = 5,
+        backoff: Optional[BackoffPolicy] = None,
     ) -> qbraid.runtime.Result[ResultDataType]:
         """Asynchronously wait for the job to reach a final state and return the result.
 
@@ -127,6 +263,8 @@ class QuantumJob(ABC):
             timeout (Optional[int]): Maximum number of seconds to wait for the job.
                 If None, waits indefinitely.
             poll_interval (int): Seconds between status checks. Defaults to 5.
+            backoff (Optional[BackoffPolicy]): Schedule of delays between status checks,
+                overriding ``poll_interval``. Defaults to the job's :attr:`backoff_policy`.
 
         Returns:
             Result[ResultDataType]: The result object associated with the job,
@@ -135,8 +273,8 @@ class QuantumJob(ABC):
         Raises:
             TimeoutError: If the job does not reach a terminal state before the timeout expires.
         """
-        await self._wait_for_final_state(timeout, poll_interval)
-        return self.result()
+        await self._wait_for_final_state(timeout, poll_interval, backoff)
+        return await asyncio.to_thread(self.result)
 
     @abstractmethod
     def result(self) -> qbraid.runtime.Result[ResultDataType]:
@@ -18,7 +18,8 @@ Module defining QbraidJob class
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 from qbraid_core.services.runtime import (
     QuantumRuntimeClient,
@@ -40,6 +41,8 @@ if TYPE_CHECKING:
 
     import qbraid.runtime
 
+BULK_STATUS_PAGE_SIZE = 100
+
 
 class QbraidJob(QuantumJob):
     """Class representing a qBraid job."""
@@ -74,18 +77,67 @@ class QbraidJob(QuantumJob):
         """Return the position of the job in the queue."""
         return self.metadata()["queuePosition"]
 
+    def _update_from_model(self, job_model: qbraid_core.services.runtime.RuntimeJob) -> JobStatus:
+        """Cache the metadata of a job model returned by the runtime client."""
+        status = job_model.status
+        job_data = job_model.model_dump(exclude={"statusMsg"})
+        if job_model.statusMsg is not None:
+            status.set_status_message(job_model.statusMsg)
+        self._cache_metadata.update({**job_data, "status": status})
+        return status
+
     def status(self) -> JobStatus:
         """Return the status of the job / task , among the values of ``JobStatus``."""
         terminal_states = JobStatus.terminal_states()
         if self._cache_metadata.get("status") not in terminal_states:
-            job_model = self.client.get_job(self.id)
-            status = job_model.status
-            job_data = job_model.model_dump(exclude={"statusMsg"})
-            if job_model.statusMsg is not None:
-                status.set_status_message(job_model.statusMsg)
-            self._cache_metadata.update({**job_data, "status": status})
+            self._update_from_model(self.client.get_job(self.id))
         return self._cache_metadata["status"]
 
+    @classmethod
+    def bulk_status(cls, jobs: Sequence[QbraidJob]) -> list[Optional[JobStatus]]:
+        """Return the statuses of many jobs using the qBraid runtime job listing endpoints.
+
+        Jobs known to belong to a group job are looked up with one request per group. The
+        others are matched against the pending jobs of each distinct client, listed
+        ``BULK_STATUS_PAGE_SIZE`` at a time. Jobs that are no longer pending are not listed,
+        so they are reported as None and their final status is queried individually.
+        """
+        jobs_by_client: dict[int, list[QbraidJob]] = defaultdict(list)
+        clients: dict[int, QuantumRuntimeClient] = {}
+        groups: dict[str, QuantumRuntimeClient] = {}
+        for job in jobs:
+            client = job.client
+            group_qrn = job._cache_metadata.get("groupJobQrn")
+            if group_qrn:
+                groups[group_qrn] = client
+            else:
+                clients[id(client)] = client
+                jobs_by_client[id(client)].append(job)
+
+        job_models: dict[str, Any] = {}
+        for group_qrn, client in groups.items():
+            job_models.update({model.jobQrn: model for model in client.get_group_jobs(group_qrn)})
+
+        for client_id, client_jobs in jobs_by_client.items():
+            wanted = {job.id for job in client_jobs}
+            page = 1
+            while wanted:
+                listed = clients[client_id].list_jobs(
+                    status_group="pending", page=page, limit=BULK_STATUS_PAGE_SIZE
+                )
+                for model in listed:
+                    job_models[model.jobQrn] = model
+                    wanted.discard(model.jobQrn)
+                if len(listed) < BULK_STATUS_PAGE_SIZE:
+                    break
+                page += 1
+
+        statuses: list[Optional[JobStatus]] = []
+        for job in jobs:
+            job_model = job_models.get(job.id)
+            statuses.append(None if job_model is None else job._update_from_model(job_model))
+        return statuses
+
     def metadata(self) -> dict[str, Any]:
         """Return the metadata regarding the job."""
         self._cache_metadata.pop("job_id", None)
@@ -19,6 +19,7 @@ Module defining QbraidProvider class.
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -215,13 +216,24 @@ class QbraidProvider(QuantumProvider):
             batch_job_support=device.batchJobSupport,
         )
 
+    # Device data is only cached on disk; the devices built from it are cached in memory.
+    @cached_method(maxsize=0, persist=True)
+    def _list_device_data(self, include_retired: bool = False, **kwargs) -> list[RuntimeDevice]:
+        """Return the data of the devices matching the specified filtering."""
+        return self.client.list_devices(include_retired=include_retired, **kwargs)
+
+    @cached_method(maxsize=0, persist=True)
+    def _get_device_data(self, device_id: str) -> RuntimeDevice:
+        """Return the data of the device corresponding to the specified qBraid device ID."""
+        return self.client.get_device(device_id)
+
     @cached_method(ttl=120)
     def get_devices(self, include_retired: bool = False, **kwargs) -> list[QbraidDevice]:
         """Return a list of devices matching the specified filtering."""
 
         try:
             # TODO: Implement support for device query
-            devices = self.client.list_devices(include_retired=include_retired, **kwargs)
+            devices = self._list_device_data(include_retired=include_retired, **kwargs)
         except (ValueError, QuantumRuntimeServiceRequestError) as err:
             raise ResourceNotFoundError("No devices found matching given criteria.") from err
 
@@ -245,7 +257,7 @@ class QbraidProvider(QuantumProvider):
             ValueError: If qBraid does not support direct access to the device
         """
         try:
-            device_model = self.client.get_device(device_id)
+            device_model = self._get_device_data(device_id)
         except (ValueError, QuantumRuntimeServiceRequestError) as err:
             raise ResourceNotFoundError(f"Device '{device_id}' not found.") from err
 
@@ -257,12 +269,19 @@ class QbraidProvider(QuantumProvider):
         profile = self._build_runtime_profile(device_model)
         return QbraidDevice(profile, client=self.client)
 
+    def _credentials(self) -> tuple[str, str, str]:
+        """Return the values identifying the user and credentials of this provider."""
+        user_metadata = self.client._user_metadata
+        organization_user_id = user_metadata["organizationUserId"]
+        return (self.__class__.__name__, self.client.session.api_key, organization_user_id)
+
+    def _cache_namespace(self) -> str:
+        """Return a process-independent digest of the credentials, used to namespace the
+        on-disk tier of cached device metadata."""
+        return hashlib.sha256(json.dumps(self._credentials()).encode()).hexdigest()
+
     def __hash__(self):
         if not hasattr(self, "_hash"):
-            user_metadata = self.client._user_metadata
-            organization_user_id = user_metadata["organizationUserId"]
-            hash_value = hash(
-                (self.__class__.__name__, self.client.session.api_key, organization_user_id)
-            )
+            hash_value = hash(self._credentials())
             object.__setattr__(self, "_hash", hash_value)
         return self._hash  # pylint: disable=no-member
@@ -208,6 +208,19 @@ class RuntimeOptions:
         new_instance._validators = copy.copy(self._validators)
         return new_instance
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the RuntimeOptions object for pickling."""
+        return {
+            "_default_fields": self._default_fields,
+            "_fields": self._fields,
+            "_validators": self._validators,
+        }
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the RuntimeOptions object when unpickling."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def __eq__(self, other: Any) -> bool:
         """Custom equality check for RuntimeOptions objects."""
         if not isinstance(other, RuntimeOptions):
@@ -0,0 +1,224 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module for waiting on many quantum jobs at once
+
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from qbraid._logging import logger
+
+from .enums import JobStatus
+from .job import BackoffPolicy, QuantumJob, _poll_delays
+
+FIRST_COMPLETED = "FIRST_COMPLETED"
+FIRST_FAILED = "FIRST_FAILED"
+ALL_COMPLETED = "ALL_COMPLETED"
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class DoneAndNotDoneJobs(NamedTuple):
+    """Jobs that have and have not reached a final state, each in their original order."""
+
+    done: list[QuantumJob]
+    not_done: list[QuantumJob]
+
+
+def refresh_statuses(
+    jobs: Iterable[QuantumJob], max_workers: int = DEFAULT_MAX_WORKERS
+) -> list[JobStatus]:
+    """Query the current status of many jobs, batching the queries per job class.
+
+    Jobs already known to be in a final state are not queried again. Jobs of a class that
+    implements :meth:`QuantumJob.bulk_status` are queried through its bulk endpoint. Any other
+    job, or any job the bulk endpoint did not report, is queried with its own
+    :meth:`QuantumJob.status` on a pool of at most ``max_workers`` threads.
+
+    Args:
+        jobs (Iterable[QuantumJob]): The jobs to query.
+        max_workers (int): Maximum number of concurrent status queries for jobs without a bulk
+            endpoint. Defaults to 8.
+
+    Returns:
+        list[JobStatus]: The status of each job, in order.
+    """
+    jobs = list(jobs)
+    terminal_states = JobStatus.terminal_states()
+    statuses: list[Optional[JobStatus]] = [None] * len(jobs)
+
+    indices_by_class: dict[type, list[int]] = defaultdict(list)
+    for index, job in enumerate(jobs):
+        cached_status = job._cache_metadata.get("status")
+        if cached_status in terminal_states:
+            statuses[index] = cached_status
+        else:
+            indices_by_class[type(job)].append(index)
+
+    for job_class, indices in indices_by_class.items():
+        try:
+            bulk_statuses = job_class.bulk_status([jobs[index] for index in indices])
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "Bulk status query for %s failed, querying jobs individually: %s",
+                job_class.__name__,
+                err,
+            )
+            continue
+        if bulk_statuses is not None:
+            for index, status in zip(indices, bulk_statuses):
+                statuses[index] = status
+
+    remaining = [index for index, status in enumerate(statuses) if status is None]
+    if len(remaining) == 1:
+        statuses[remaining[0]] = jobs[remaining[0]].status()
+    elif remaining:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(remaining))) as executor:
+            for index, status in zip(
+                remaining, executor.map(lambda index: jobs[index].status(), remaining)
+            ):
+                statuses[index] = status
+
+    return statuses
+
+
+def _iter_completed_batches(
+    jobs: list[QuantumJob],
+    timeout: Optional[float],
+    poll_interval: float,
+    backoff: Optional[BackoffPolicy],
+    max_workers: int,
+) -> Iterator[list[tuple[QuantumJob, JobStatus]]]:
+    """Poll the given jobs until all are in a final state, yielding each batch of jobs found
+    to have finished since the previous poll.
+
+    Raises:
+        TimeoutError: If some jobs are still not in a final state once the timeout expires.
+    """
+    terminal_states = JobStatus.terminal_states()
+    delays = _poll_delays(timeout, poll_interval, backoff)
+    pending = list(jobs)
+
+    while pending:
+        statuses = refresh_statuses(pending, max_workers=max_workers)
+        finished = [
+            (job, status) for job, status in zip(pending, statuses) if status in terminal_states
+        ]
+        pending = [job for job, status in zip(pending, statuses) if status not in terminal_states]
+        if finished:
+            yield finished
+        if not pending:
+            return
+
+        delay = next(delays, None)
+        if delay is None:
+            raise TimeoutError(f"Timeout while waiting for {len(pending)} of {len(jobs)} jobs.")
+        sleep(delay)
+
+
+def as_completed(
+    jobs: Iterable[QuantumJob],
+    timeout: Optional[float] = None,
+    poll_interval: float = 5,
+    backoff: Optional[BackoffPolicy] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[QuantumJob]:
+    """Iterate over jobs as they reach a final state (e.g., COMPLETED, FAILED).
+
+    All pending jobs are polled together each round, so a round costs one bulk request per
+    provider that supports one (see :func:`refresh_statuses`), rather than one request per job.
+
+    Args:
+        jobs (Iterable[QuantumJob]): The jobs to wait for.
+        timeout (Optional[float]): Maximum number of seconds to wait for all of the jobs.
+            If None, waits indefinitely.
+        poll_interval (float): Seconds between polling rounds. Defaults to 5.
+        backoff (Optional[BackoffPolicy]): Schedule of delays between polling rounds,
+            overriding ``poll_interval``.
+        max_workers (int): Maximum number of concurrent status queries for jobs without a bulk
+            endpoint. Defaults to 8.
+
+    Yields:
+        QuantumJob: Each job, as soon as it has been seen in a final state.
+
+    Raises:
+        TimeoutError: If some jobs are still not in a final state once the timeout expires.
+    """
+    for batch in _iter_completed_batches(list(jobs), timeout, poll_interval, backoff, max_workers):
+        for job, _ in batch:
+            yield job
+
+
+# pylint: disable-next=too-many-arguments
+def wait_all(
+    jobs: Iterable[QuantumJob],
+    timeout: Optional[float] = None,
+    return_when: str = ALL_COMPLETED,
+    poll_interval: float = 5,
+    backoff: Optional[BackoffPolicy] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> DoneAndNotDoneJobs:
+    """Wait for jobs to reach a final state, polling their statuses in bulk.
+
+    Args:
+        jobs (Iterable[QuantumJob]): The jobs to wait for.
+        timeout (Optional[float]): Maximum number of seconds to wait. If None, waits until the
+            ``return_when`` condition is met. Unlike :func:`as_completed`, reaching the timeout
+            does not raise an error.
+        return_when (str): When to return. One of ``FIRST_COMPLETED`` (any job is in a final
+            state), ``FIRST_FAILED`` (any job has failed, otherwise all are in a final state),
+            or ``ALL_COMPLETED`` (all jobs are in a final state). Defaults to ``ALL_COMPLETED``.
+        poll_interval (float): Seconds between polling rounds. Defaults to 5.
+        backoff (Optional[BackoffPolicy]): Schedule of delays between polling rounds,
+            overriding ``poll_interval``.
+        max_workers (int): Maximum number of concurrent status queries for jobs without a bulk
+            endpoint. Defaults to 8.
+
+    Returns:
+        DoneAndNotDoneJobs: A named tuple of the jobs that are and are not in a final state.
+
+    Raises:
+        ValueError: If ``return_when`` is not a valid option.
+    """
+    if return_when not in (FIRST_COMPLETED, FIRST_FAILED, ALL_COMPLETED):
+        raise ValueError(
+            f"Invalid return_when '{return_when}'. Expected one of "
+            f"'{FIRST_COMPLETED}', '{FIRST_FAILED}', or '{ALL_COMPLETED}'."
+        )
+
+    jobs = list(jobs)
+    done_ids: set[int] = set()
+
+    try:
+        for batch in _iter_completed_batches(jobs, timeout, poll_interval, backoff, max_workers):
+            done_ids.update(id(job) for job, _ in batch)
+            if return_when == FIRST_COMPLETED:
+                break
+            if return_when == FIRST_FAILED and any(
+                status == JobStatus.FAILED for _, status in batch
+            ):
+                break
+    except TimeoutError:
+        pass
+
+    return DoneAndNotDoneJobs(
+        done=[job for job in jobs if id(job) in done_ids],
+        not_done=[job for job in jobs if id(job) not in done_ids],
+    )
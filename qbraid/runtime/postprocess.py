@@ -20,7 +20,17 @@ from __future__ import annotations
 
 import warnings
 from math import isclose
-from typing import Any, Union
+from typing import Any, NamedTuple, Optional, Union
+
+import numpy as np
+
+# Bitstrings longer than this are not packed into uint64 outcome arrays.
+MAX_PACKED_BITS = 63
+
+# Number of outcomes unpacked into bitstrings at a time, bounding the size of temporary arrays.
+_FORMAT_CHUNK_SIZE = 1 << 16
+
+_BINARY_KEY_CHARS = str.maketrans("", "", "01 ")
 
 
 def normalize_batch_bit_lengths(measurements: list[dict[str, int]]) -> list[dict[str, int]]:
@@ -119,6 +129,243 @@ def format_data(
     if not data:
         return data
 
+    formatted = _format_data_vectorized(data, include_zero_values, decimal)
+    if formatted is not None:
+        return formatted
+
+    return _format_data_python(data, include_zero_values, decimal)
+
+
+def _warn_if_large_state_space(num_bits: int) -> None:
+    """Warn if generating every state for the given number of bits may exhaust memory."""
+    if num_bits > 20:
+        warnings.warn(
+            f"Generating all {2**num_bits:,} possible states for {num_bits} qubits. "
+            "This may consume significant memory. "
+            "Consider using include_zero_values=False."
+        )
+
+
+def _pack_bits(bits: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Packs the concatenated bits of several bitstrings into one integer per bitstring."""
+    width = -(-int(lengths.max()) // 8) * 8
+
+    # Right-align the bits of each string in a row of the bit matrix.
+    matrix = np.zeros((len(lengths), width), dtype=np.uint8)
+    if lengths.min() == lengths.max():
+        matrix[:, width - int(lengths[0]) :] = bits.reshape(len(lengths), -1)
+    else:
+        ends = np.cumsum(lengths)
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        cols = np.arange(int(ends[-1])) + np.repeat(width - ends, lengths)
+        matrix[rows, cols] = bits
+
+    packed = np.zeros((len(lengths), 8), dtype=np.uint8)
+    packed[:, 8 - width // 8 :] = np.packbits(matrix, axis=1)
+    return packed.view(">u8").ravel().astype(np.uint64)
+
+
+def pack_bitstrings(bitstrings: list[str]) -> np.ndarray:
+    """
+    Parses binary strings into an array of the integers they represent.
+
+    Args:
+        bitstrings (list[str]): Non-empty strings of at most 63 characters, each '0' or '1'.
+
+    Returns:
+        np.ndarray: The integer value of each bitstring, as a ``uint64`` array.
+    """
+    lengths = np.fromiter(map(len, bitstrings), dtype=np.int64, count=len(bitstrings))
+    bits = np.frombuffer("".join(bitstrings).encode("ascii"), dtype=np.uint8) - ord("0")
+    return _pack_bits(bits, lengths)
+
+
+def unpack_bitstrings(outcomes: np.ndarray, num_bits: int) -> list[str]:
+    """
+    Formats integers as zero-padded binary strings.
+
+    Args:
+        outcomes (np.ndarray): Non-negative integers less than ``2**num_bits``.
+        num_bits (int): The length of each binary string, at most 63.
+
+    Returns:
+        list[str]: The binary string of each outcome.
+    """
+    bitstrings: list[str] = []
+    outcomes = np.asarray(outcomes, dtype=">u8")
+    for start in range(0, len(outcomes), _FORMAT_CHUNK_SIZE):
+        chunk = outcomes[start : start + _FORMAT_CHUNK_SIZE]
+        bits = np.unpackbits(chunk.view(np.uint8).reshape(-1, 8), axis=1)[:, 64 - num_bits :]
+        text = (bits + ord("0")).tobytes().decode("ascii")
+        bitstrings.extend(text[i : i + num_bits] for i in range(0, len(text), num_bits))
+    return bitstrings
+
+
+class _ParsedCounts(NamedTuple):
+    """Counts parsed into outcome integers, with the keys to reuse as formatted bitstrings."""
+
+    outcomes: np.ndarray
+    values: list[Any]
+    num_bits: int
+    bitstrings: Optional[list[str]]
+
+
+def _parse_str_keys(data: dict[str, Any]) -> Optional[_ParsedCounts]:
+    """Parses binary string keys, optionally '0b'-prefixed and space-separated."""
+    keys = list(data)
+    joined = "".join(keys)
+
+    if "b" in joined or " " in joined:
+        bodies = [key[2:] if key.startswith("0b") else key for key in keys]
+        if "".join(bodies).translate(_BINARY_KEY_CHARS):
+            return None
+
+        # Keys that are equal once spaces are removed overwrite one another, in order.
+        stripped = dict(zip((body.replace(" ", "") for body in bodies), data.values()))
+        keys = list(stripped)
+        values = list(stripped.values())
+        joined = "".join(keys)
+    else:
+        values = list(data.values())
+
+    lengths = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+    num_bits = int(lengths.max())
+    if num_bits > MAX_PACKED_BITS or lengths.min() == 0:
+        return None
+
+    bits = np.frombuffer(joined.encode("utf-8"), dtype=np.uint8) - ord("0")
+    if len(bits) != int(lengths.sum()) or bits.max() > 1:
+        return None
+
+    bitstrings = keys if lengths.min() == num_bits else None
+    return _ParsedCounts(_pack_bits(bits, lengths), values, num_bits, bitstrings)
+
+
+def _parse_int_keys(data: dict[int, Any]) -> Optional[_ParsedCounts]:
+    """Parses non-negative integer keys."""
+    keys = list(data)
+    if min(keys) < 0:
+        return None
+
+    num_bits = max(1, max(keys).bit_length())
+    if num_bits > MAX_PACKED_BITS:
+        return None
+
+    return _ParsedCounts(np.array(keys, dtype=np.uint64), list(data.values()), num_bits, None)
+
+
+def _format_data_vectorized(
+    data: dict[Any, Union[int, float]],
+    include_zero_values: bool = False,
+    decimal: bool = False,
+) -> Optional[dict[Any, Union[int, float]]]:
+    """
+    Formats and sorts a counts dictionary using outcome arrays. See :func:`format_data`.
+
+    Returns:
+        The formatted dictionary, or None if the keys are not binary strings or non-negative
+        integers of at most :data:`MAX_PACKED_BITS` bits, in which case
+        :func:`_format_data_python` should be used instead.
+    """
+    if all(isinstance(key, str) for key in data):
+        parsed = _parse_str_keys(data)
+    elif not decimal and all(isinstance(key, int) for key in data):
+        parsed = _parse_int_keys(data)
+    else:
+        parsed = None
+
+    if parsed is None:
+        return None
+
+    # Sort the outcomes, keeping the last value of any outcome given more than once.
+    order = np.argsort(parsed.outcomes, kind="stable")
+    outcomes = parsed.outcomes[order]
+    is_last = np.append(outcomes[1:] != outcomes[:-1], True)
+    if not is_last.all():
+        order = order[is_last]
+        outcomes = outcomes[is_last]
+
+    values = np.empty(len(parsed.values), dtype=object)
+    values[:] = parsed.values
+
+    bitstrings = None
+    if parsed.bitstrings is not None:
+        bitstrings = np.empty(len(parsed.bitstrings), dtype=object)
+        bitstrings[:] = parsed.bitstrings
+        bitstrings = bitstrings[order]
+
+    return format_outcomes(
+        outcomes,
+        values[order],
+        parsed.num_bits,
+        include_zero_values=include_zero_values,
+        decimal=decimal,
+        bitstrings=bitstrings,
+    )
+
+
+def format_outcomes(  # pylint: disable=too-many-arguments
+    outcomes: np.ndarray,
+    values: np.ndarray,
+    num_bits: int,
+    include_zero_values: bool = False,
+    decimal: bool = False,
+    bitstrings: Optional[np.ndarray] = None,
+) -> dict[Any, Union[int, float]]:
+    """
+    Formats measurement outcomes and their values as a counts dictionary.
+
+    Args:
+        outcomes (np.ndarray): The measurement outcomes as integers, sorted and unique.
+        values (np.ndarray): The count or probability of each outcome.
+        num_bits (int): The number of bits of each outcome, at most 63.
+        include_zero_values (bool, optional): Include missing states with zero counts.
+            Defaults to False.
+        decimal (bool, optional): Use the integer outcomes as keys instead of binary strings.
+            Defaults to False.
+        bitstrings (Optional[np.ndarray]): The binary string of each outcome, if already
+            known. Defaults to None.
+
+    Returns:
+        dict[Any, Union[int, float]]: Dictionary sorted by outcome, as returned by
+            :func:`format_data`.
+    """
+    if include_zero_values:
+        _warn_if_large_state_space(num_bits)
+        dense_values: list[Any] = [0] * (1 << num_bits)
+        for outcome, value in zip(outcomes.tolist(), values.tolist()):
+            dense_values[outcome] = value
+        if decimal:
+            return dict(zip(range(1 << num_bits), dense_values))
+        all_outcomes = np.arange(1 << num_bits, dtype=np.uint64)
+        return dict(zip(unpack_bitstrings(all_outcomes, num_bits), dense_values))
+
+    nonzero = values != 0
+    if not nonzero.all():
+        outcomes = outcomes[nonzero]
+        values = values[nonzero]
+        if bitstrings is not None:
+            bitstrings = bitstrings[nonzero]
+
+    if decimal:
+        keys = outcomes.tolist()
+    elif bitstrings is not None:
+        keys = bitstrings.tolist()
+    else:
+        keys = unpack_bitstrings(outcomes, num_bits)
+
+    return dict(zip(keys, values.tolist()))
+
+
+def _format_data_python(
+    data: dict[Any, Union[int, float]],
+    include_zero_values: bool = False,
+    decimal: bool = False,
+) -> dict[Any, Union[int, float]]:
+    """Formats and sorts a counts dictionary one key at a time. See :func:`format_data`."""
+    if not data:
+        return data
+
     input_is_dec = False
     input_is_bin = False
 
@@ -136,13 +383,7 @@ def format_data(
             num_bits = max(len(key) for key in normalized_data)
 
             if include_zero_values:
-                # Warn if generating a very large state space
-                if num_bits > 20:
-                    warnings.warn(
-                        f"Generating all {2**num_bits:,} possible states for {num_bits} qubits. "
-                        "This may consume significant memory. "
-                        "Consider using include_zero_values=False."
-                    )
+                _warn_if_large_state_space(num_bits)
                 all_keys = [format(i, f"0{num_bits}b") for i in range(2**num_bits)]
                 data = {key: normalized_data.get(key, 0) for key in all_keys}
             else:
@@ -191,8 +191,9 @@ class BatchResult(Generic[ResultDataType]):
         for r in self._results:
             rd = r.data
             if isinstance(rd, GateModelResultData):
-                if rd.measurement_counts is not None:
-                    counts.append(rd.measurement_counts)
+                rd_counts = rd._restore_measurement_counts()
+                if rd_counts is not None:
+                    counts.append(rd_counts)
                     has_counts = True
                 else:
                     counts.append({})
@@ -20,15 +20,23 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Type, TypeVar, Union
 
 import numpy as np
 
 from qbraid.programs import ExperimentType
 
-from .postprocess import counts_to_probabilities, normalize_data
+from .postprocess import (
+    MAX_PACKED_BITS,
+    counts_to_probabilities,
+    format_outcomes,
+    normalize_data,
+    pack_bitstrings,
+    unpack_bitstrings,
+)
 
 if TYPE_CHECKING:
+    import pyarrow
     import qbraid_core.services.runtime.schemas
 
 ResultDataType = TypeVar("ResultDataType", bound="ResultData")
@@ -39,6 +47,85 @@ MeasCount = dict[KeyType, int]
 
 MeasProb = dict[KeyType, float]
 
+_BITSTRING_CHARS = str.maketrans("", "", "01")
+
+
+class _PackedCounts(NamedTuple):
+    """Measurement counts stored as parallel arrays of outcomes and counts, in input order."""
+
+    outcomes: np.ndarray
+    counts: np.ndarray
+    num_bits: int
+
+    @classmethod
+    def from_dict(cls, counts: MeasCount) -> Optional[_PackedCounts]:
+        """Packs a counts dictionary, or returns None if it cannot be restored exactly.
+
+        Counts can be packed if every key is a binary string of the same length, of at
+        most :data:`~qbraid.runtime.postprocess.MAX_PACKED_BITS` bits, and every value
+        is an integer.
+        """
+        if not isinstance(counts, dict) or not counts:
+            return None
+
+        keys = list(counts)
+        if not all(isinstance(key, str) for key in keys):
+            return None
+
+        num_bits = len(keys[0])
+        if not 0 < num_bits <= MAX_PACKED_BITS or any(len(key) != num_bits for key in keys):
+            return None
+
+        if "".join(keys).translate(_BITSTRING_CHARS):
+            return None
+
+        values = np.asarray(list(counts.values()))
+        if values.dtype.kind != "i" or values.ndim != 1:
+            return None
+
+        return cls(pack_bitstrings(keys), values.astype(np.int64), num_bits)
+
+    def to_dict(self) -> MeasCount:
+        """Restores the counts dictionary, with keys in their original order."""
+        return dict(zip(unpack_bitstrings(self.outcomes, self.num_bits), self.counts.tolist()))
+
+    def sorted(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the outcomes and counts sorted by outcome."""
+        order = np.argsort(self.outcomes)
+        return self.outcomes[order], self.counts[order]
+
+    def format(self, include_zero_values: bool = False, decimal: bool = False) -> MeasCount:
+        """Returns the counts as :func:`~qbraid.runtime.postprocess.format_data` would."""
+        outcomes, counts = self.sorted()
+        return format_outcomes(
+            outcomes,
+            counts,
+            self.num_bits,
+            include_zero_values=include_zero_values,
+            decimal=decimal,
+        )
+
+    def nonzero(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the outcomes with nonzero counts and their counts, sorted by outcome."""
+        outcomes, counts = self.sorted()
+        nonzero = counts != 0
+        return outcomes[nonzero], counts[nonzero]
+
+
+def _pack_measurement_counts(
+    measurement_counts: Optional[Union[MeasCount, list[MeasCount]]],
+) -> Optional[Union[_PackedCounts, list[_PackedCounts]]]:
+    """Packs one counts dictionary or a list of them, or returns None if any cannot be packed."""
+    if isinstance(measurement_counts, dict):
+        return _PackedCounts.from_dict(measurement_counts)
+
+    if isinstance(measurement_counts, list) and measurement_counts:
+        packed = [_PackedCounts.from_dict(counts) for counts in measurement_counts]
+        if all(item is not None for item in packed):
+            return packed
+
+    return None
+
 
 class ResultData(ABC):
     """Abstract base class for runtime results linked to a
@@ -92,22 +179,18 @@ class GateModelResultData(ResultData):
         measurement_probabilities: Optional[Union[MeasProb, list[MeasProb]]] = None,
         **kwargs,
     ):
-        """Create a new GateModelResult instance."""
-        self._measurement_counts = measurement_counts
+        """Create a new GateModelResult instance.
+
+        Measurement counts whose keys are binary strings of equal length and whose values
+        are integers are stored as arrays of outcomes and counts. Each counts, probabilities,
+        or dictionary view is built from them on first access and cached.
+        """
+        self._packed_counts = _pack_measurement_counts(measurement_counts)
+        self._measurement_counts = measurement_counts if self._packed_counts is None else None
         self._measurements = measurements
         self._measurement_probabilities = measurement_probabilities
         self._unscoped_data = kwargs
-        self._cache = {
-            "bin_nz": None,
-            "bin_wz": None,
-            "dec_nz": None,
-            "dec_wz": None,
-            "prob_bin_nz": None,
-            "prob_bin_wz": None,
-            "prob_dec_nz": None,
-            "prob_dec_wz": None,
-            "to_dict": None,
-        }
+        self._cache: dict[str, Any] = {}
 
     @property
     def experiment_type(self) -> ExperimentType:
@@ -148,9 +231,102 @@ class GateModelResultData(ResultData):
 
     @property
     def measurement_counts(self) -> Optional[Union[MeasCount, list[MeasCount]]]:
-        """Returns the histogram data of the run as passed in the constructor."""
+        """Returns the histogram data of the run as passed in the constructor.
+
+        Packed counts are restored to a dictionary on first access, which is then kept in
+        place of the packed arrays and returned on later accesses.
+        """
+        self._measurement_counts = self._restore_measurement_counts()
+        self._packed_counts = None
+        return self._measurement_counts
+
+    def _restore_measurement_counts(self) -> Optional[Union[MeasCount, list[MeasCount]]]:
+        """Returns the histogram data as passed in the constructor, restoring packed counts
+        to a new dictionary without keeping it."""
+        if isinstance(self._packed_counts, list):
+            return [packed.to_dict() for packed in self._packed_counts]
+        if self._packed_counts is not None:
+            return self._packed_counts.to_dict()
         return self._measurement_counts
 
+    def _is_batch(self) -> bool:
+        """Returns True if the counts data holds the results of a batch of experiments."""
+        return isinstance(self._packed_counts, list) or isinstance(self._measurement_counts, list)
+
+    def _get_packed_counts(self) -> list[_PackedCounts]:
+        """Returns the packed counts of each experiment, packing the formatted counts if the
+        counts passed in the constructor could not be packed as-is."""
+        if isinstance(self._packed_counts, list):
+            return self._packed_counts
+        if self._packed_counts is not None:
+            return [self._packed_counts]
+
+        counts = self.get_counts()
+        packed = _pack_measurement_counts(counts)
+        if packed is None:
+            raise ValueError(
+                "Counts data cannot be represented as arrays. Outcomes must be binary strings "
+                f"of at most {MAX_PACKED_BITS} bits with integer counts."
+            )
+        return packed if isinstance(packed, list) else [packed]
+
+    def to_numpy(
+        self,
+    ) -> Union[tuple[np.ndarray, np.ndarray], list[tuple[np.ndarray, np.ndarray]]]:
+        """
+        Returns the measurement outcomes with nonzero counts and their counts as arrays.
+
+        Outcomes are the integer values of the measured bitstrings, as returned by
+        ``get_counts(decimal=True)``, and are sorted in increasing order.
+
+        Returns:
+            Union[tuple[np.ndarray, np.ndarray], list[tuple[np.ndarray, np.ndarray]]]: The
+                ``uint64`` outcomes and ``int64`` counts, or a list of them for each experiment
+                of a batch.
+
+        Raises:
+            ValueError: If counts data is not available, or its outcomes or counts
+                cannot be represented as arrays.
+        """
+        if self._packed_counts is None and self._measurement_counts is None:
+            raise ValueError("Counts data is not available.")
+
+        arrays = [packed.nonzero() for packed in self._get_packed_counts()]
+        return arrays if self._is_batch() else arrays[0]
+
+    def to_arrow(self) -> Union[pyarrow.Table, list[pyarrow.Table]]:
+        """
+        Returns the measurement outcomes with nonzero counts and their counts as Arrow tables.
+
+        Each table has an ``outcome`` (``uint64``) and a ``count`` (``int64``) column, as
+        returned by :meth:`to_numpy`, and records the number of measured bits in its
+        ``num_bits`` schema metadata. Requires ``pyarrow``.
+
+        Returns:
+            Union[pyarrow.Table, list[pyarrow.Table]]: The counts table, or a list of them for
+                each experiment of a batch.
+
+        Raises:
+            ValueError: If counts data is not available, or its outcomes or counts
+                cannot be represented as arrays.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import pyarrow as pa
+
+        if self._packed_counts is None and self._measurement_counts is None:
+            raise ValueError("Counts data is not available.")
+
+        tables = []
+        for packed in self._get_packed_counts():
+            outcomes, counts = packed.nonzero()
+            tables.append(
+                pa.table(
+                    {"outcome": pa.array(outcomes), "count": pa.array(counts)},
+                    metadata={"num_bits": str(packed.num_bits)},
+                )
+            )
+        return tables if self._is_batch() else tables[0]
+
     def get_counts(
         self, include_zero_values: bool = False, decimal: bool = False
     ) -> Union[MeasCount, list[MeasCount]]:
@@ -167,16 +343,27 @@ class GateModelResultData(ResultData):
         Raises:
             ValueError: If counts data is not available.
         """
-        if self._measurement_counts is None:
+        if self._measurement_counts is None and self._packed_counts is None:
             raise ValueError("Counts data is not available.")
 
         cache_key = f"{'dec' if decimal else 'bin'}_{'wz' if include_zero_values else 'nz'}"
 
-        if self._cache[cache_key] is not None:
+        if cache_key in self._cache:
             return self._cache[cache_key]
-        counts = normalize_data(
-            self._measurement_counts, include_zero_values=include_zero_values, decimal=decimal
-        )
+
+        if isinstance(self._packed_counts, list):
+            counts = [
+                packed.format(include_zero_values=include_zero_values, decimal=decimal)
+                for packed in self._packed_counts
+            ]
+        elif self._packed_counts is not None:
+            counts = self._packed_counts.format(
+                include_zero_values=include_zero_values, decimal=decimal
+            )
+        else:
+            counts = normalize_data(
+                self._measurement_counts, include_zero_values=include_zero_values, decimal=decimal
+            )
 
         self._cache[cache_key] = counts
 
@@ -201,7 +388,7 @@ class GateModelResultData(ResultData):
         """
         cache_key = f"prob_{'dec' if decimal else 'bin'}_{'wz' if include_zero_values else 'nz'}"
 
-        if self._cache[cache_key] is not None:
+        if cache_key in self._cache:
             return self._cache[cache_key]
 
         if self._measurement_probabilities is not None:
@@ -223,7 +410,7 @@ class GateModelResultData(ResultData):
 
     def to_dict(self) -> dict[str, Any]:
         """Converts the GateModelResulData instance to a dictionary."""
-        if self._cache["to_dict"] is not None:
+        if "to_dict" in self._cache:
             return self._cache["to_dict"]
 
         counts = self.get_counts()
@@ -266,7 +453,7 @@ class GateModelResultData(ResultData):
 
         return (
             f"{self.__class__.__name__}("
-            f"measurement_counts={self._measurement_counts}, "
+            f"measurement_counts={self.measurement_counts}, "
             f"measurements={measurements_info}, "
             f"measurement_probabilities={self._measurement_probabilities}"
             f")"
@@ -25,8 +25,12 @@ Classes
    :toctree: ../stubs/
 
    Conversion
+   ConversionCache
    ConversionGraph
+   ConversionPipeline
    ConversionScheme
+   MemoryConversionCache
+   SqliteConversionCache
 
 Functions
 -----------
@@ -36,7 +40,10 @@ Functions
 
    transpile
    translate
+   transpile_batch
+   compile_conversion
    requires_extras
+   non_mutating
 
 Exceptions
 -----------
@@ -49,8 +56,15 @@ Exceptions
    ConversionPathNotFoundError
 
 """
-from .annotations import requires_extras
-from .converter import translate, transpile
+from .annotations import non_mutating, requires_extras
+from .cache import ConversionCache, MemoryConversionCache, SqliteConversionCache
+from .converter import (
+    ConversionPipeline,
+    compile_conversion,
+    translate,
+    transpile,
+    transpile_batch,
+)
 from .edge import Conversion
 from .exceptions import ConversionPathNotFoundError, NodeNotFoundError, ProgramConversionError
 from .graph import ConversionGraph
@@ -58,11 +72,18 @@ from .scheme import ConversionScheme
 
 __all__ = [
     "requires_extras",
+    "non_mutating",
     "transpile",
     "translate",
+    "transpile_batch",
+    "compile_conversion",
     "Conversion",
+    "ConversionCache",
     "ConversionGraph",
+    "ConversionPipeline",
     "ConversionScheme",
+    "MemoryConversionCache",
+    "SqliteConversionCache",
     "ProgramConversionError",
     "NodeNotFoundError",
     "ConversionPathNotFoundError",
@@ -70,3 +70,27 @@ def weight(value: float) -> Callable[[F], F]:
         return cast(F, wrapper)
 
     return decorator
+
+
+def non_mutating(func: F) -> F:
+    """
+    Decorator to mark conversion functions that never modify the program passed to them.
+
+    The transpiler deep-copies a program before handing it to a conversion path, so that a
+    failed attempt cannot leave the caller's program (or the input to the next path) in a
+    partially modified state. Conversions marked as non-mutating are called on the original
+    program directly, skipping that copy.
+
+    Args:
+        func (Callable): The conversion function to mark.
+
+    Returns:
+        Callable: The conversion function, marked as non-mutating.
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return func(*args, **kwargs)
+
+    setattr(wrapper, "non_mutating", True)
+    return cast(F, wrapper)
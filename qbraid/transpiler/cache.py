@@ -0,0 +1,451 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module providing content-addressed caches for the results of program conversions.
+
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from qbraid._caching import CacheInfo
+from qbraid._logging import logger
+
+if TYPE_CHECKING:
+    import qbraid.programs
+    import qbraid.transpiler
+
+_MISSING = object()
+
+
+def _braket_text(program: Any) -> str:
+    # pylint: disable-next=import-outside-toplevel
+    from braket.circuits.serialization import IRType
+
+    return program.to_ir(IRType.OPENQASM).source
+
+
+def _cirq_text(program: Any) -> str:
+    # pylint: disable-next=import-outside-toplevel
+    import cirq
+
+    return cirq.to_json(program, indent=None)
+
+
+def _pytket_text(program: Any) -> str:
+    return json.dumps(program.to_dict(), sort_keys=True)
+
+
+def _qiskit_text(program: Any) -> str:
+    # pylint: disable-next=import-outside-toplevel
+    import qiskit.qasm3
+
+    return qiskit.qasm3.dumps(program)
+
+
+_PROGRAM_SERIALIZERS: dict[str, Callable[[Any], str]] = {
+    "braket": _braket_text,
+    "cirq": _cirq_text,
+    "pytket": _pytket_text,
+    "qiskit": _qiskit_text,
+}
+
+
+def _program_text(program: Any, source: str) -> Optional[bytes]:
+    """
+    Return a canonical text form of a program object, or None if there is none.
+
+    Uses the native OpenQASM or JSON serialization of program types listed in
+    ``_PROGRAM_SERIALIZERS``, which are cheap compared with a conversion, and otherwise the
+    program's serialized format for submission to the qBraid API.
+    """
+    serializer = _PROGRAM_SERIALIZERS.get(source)
+    if serializer is not None:
+        try:
+            return f"{source}\0{serializer(program)}".encode()
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.debug("Could not serialize '%s' program natively: %s", source, err)
+
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        from qbraid.programs import load_program
+
+        serialized = load_program(program).serialize()
+        data = serialized.data
+        if not isinstance(data, (str, bytes)):
+            data = json.dumps(data, sort_keys=True)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.debug("Could not serialize '%s' program: %s", source, err)
+        return None
+    data = data if isinstance(data, bytes) else data.encode()
+    return serialized.format.encode() + b"\0" + data
+
+
+def _program_digest(program: Any, source: str) -> Optional[bytes]:
+    """Return a canonical serialization of a program, or None if it cannot be serialized."""
+    if isinstance(program, str):
+        return b"s" + program.encode()
+    if isinstance(program, bytes):
+        return b"b" + program
+    text = _program_text(program, source)
+    return None if text is None else b"t" + text
+
+
+def _dumps(value: Any) -> Optional[bytes]:
+    """Pickle a conversion result, or return None if it cannot be pickled."""
+    try:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError) as err:
+        logger.debug("Skipping conversion cache: result is not picklable: %s", err)
+        return None
+
+
+def _func_signature(func: Callable[[Any], Any]) -> str:
+    """Return a string identifying a conversion function within a conversion path."""
+    conversion = getattr(func, "__self__", None)
+    # pylint: disable-next=protected-access
+    func = getattr(conversion, "_conversion_func", func)
+    module = getattr(func, "__module__", None)
+    name = getattr(func, "__qualname__", None) or repr(func)
+    return f"{module}.{name}"
+
+
+def conversion_cache_key(
+    program: qbraid.programs.QPROGRAM,
+    source: str,
+    target: str,
+    paths: list[list[Callable[[Any], Any]]],
+) -> Optional[str]:
+    """
+    Generate a cache key for converting a program along the given conversion paths.
+
+    The key is a SHA-256 digest of the program content, the source and target aliases, and
+    the conversion functions making up each candidate path. The content of string programs
+    is their text. Other programs are keyed on a canonical text serialization: OpenQASM for
+    qiskit and braket circuits, JSON for cirq and pytket circuits, and otherwise the
+    program's serialized format for the qBraid API.
+
+    Args:
+        program (qbraid.programs.QPROGRAM): The program to convert.
+        source (str): The alias of the program type.
+        target (str): The alias of the target program type.
+        paths (list[list[Callable]]): The conversion paths that would be attempted, in order.
+
+    Returns:
+        Optional[str]: The cache key, or None if the program cannot be serialized.
+    """
+    digest = _program_digest(program, source)
+    if digest is None:
+        return None
+
+    hasher = hashlib.sha256()
+    for part in (source, target, *("|".join(map(_func_signature, path)) for path in paths)):
+        hasher.update(part.encode())
+        hasher.update(b"\0")
+    hasher.update(digest)
+    return hasher.hexdigest()
+
+
+class ConversionCache(ABC):
+    """
+    Base class for caches of transpiled programs, keyed by the content of the source
+    program, the target program type, and the conversion paths.
+
+    Pass an instance to :func:`~qbraid.transpiler.transpile` (or set it on a
+    :class:`~qbraid.transpiler.ConversionScheme`) to reuse the results of previous
+    conversions of identical programs. Setting the environment variable ``DISABLE_CACHE=1``
+    bypasses all conversion caches.
+
+    Args:
+        maxsize (Optional[int]): The maximum number of cached conversions. When exceeded, the
+            least recently used entry is evicted. If None, the cache size is unbounded.
+        ttl (Optional[float]): The number of seconds after which a cached conversion expires.
+            If None, entries never expire.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, ttl: Optional[float] = None):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer or None.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number or None.")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        """Return the maximum number of cached conversions."""
+        return self._maxsize
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """Return the number of seconds after which a cached conversion expires."""
+        return self._ttl
+
+    def _is_expired(self, timestamp: float) -> bool:
+        """Return True if an entry created at the given time has expired."""
+        return self._ttl is not None and (time.time() - timestamp) >= self._ttl
+
+    @abstractmethod
+    def _get(self, key: str) -> Any:
+        """Return the value stored under key, or ``_MISSING`` if absent or expired."""
+
+    @abstractmethod
+    def _set(self, key: str, value: Any) -> None:
+        """Store a value under key, evicting entries as needed to respect maxsize."""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Remove all entries."""
+
+    @abstractmethod
+    def _size(self) -> int:
+        """Return the number of stored entries."""
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the conversion result stored under key, or default if there is none."""
+        with self._lock:
+            value = self._get(key)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a conversion result under key."""
+        if self._maxsize == 0:
+            return
+        with self._lock:
+            self._set(key, value)
+
+    def clear(self) -> None:
+        """Remove all cached conversions and reset the hit/miss statistics."""
+        with self._lock:
+            self._clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit/miss statistics and current size of the cache."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits, misses=self._misses, maxsize=self._maxsize, currsize=self._size()
+            )
+
+    def convert(
+        self,
+        pipeline: qbraid.transpiler.ConversionPipeline,
+        program: qbraid.programs.QPROGRAM,
+    ) -> qbraid.programs.QPROGRAM:
+        """
+        Convert a program with a compiled pipeline, reusing a cached result when available.
+
+        Args:
+            pipeline (ConversionPipeline): The compiled conversion to apply on a cache miss.
+            program (qbraid.programs.QPROGRAM): The program to convert.
+
+        Returns:
+            qbraid.programs.QPROGRAM: The converted program.
+        """
+        if os.getenv("DISABLE_CACHE") == "1" or self._maxsize == 0:
+            return pipeline(program)
+
+        key = conversion_cache_key(program, pipeline.source, pipeline.target, pipeline.paths)
+        if key is None:
+            logger.debug(
+                "Skipping conversion cache: '%s' program is not serializable.", pipeline.source
+            )
+            return pipeline(program)
+
+        result = self.get(key, _MISSING)
+        if result is _MISSING:
+            result = pipeline(program)
+            self.set(key, result)
+        return result
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(maxsize={self._maxsize}, ttl={self._ttl})"
+
+
+class MemoryConversionCache(ConversionCache):
+    """
+    In-memory LRU cache of conversion results.
+
+    Args:
+        maxsize (Optional[int]): The maximum number of cached conversions. Defaults to 128.
+        ttl (Optional[float]): The number of seconds after which a cached conversion expires.
+        copy_results (bool): If True, programs other than strings and bytes are stored
+            pickled and a fresh copy is returned on every hit, so modifying a transpiled
+            program never affects the cache. Results that cannot be pickled are not cached.
+            If False, the cached program object itself is returned, which is faster but
+            requires callers to treat transpiled programs as read-only. Defaults to True.
+    """
+
+    def __init__(
+        self, maxsize: Optional[int] = 128, ttl: Optional[float] = None, copy_results: bool = True
+    ):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._copy_results = copy_results
+        self._entries: OrderedDict[str, tuple[Any, bool, float]] = OrderedDict()
+
+    def _get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        value, pickled, timestamp = entry
+        if self._is_expired(timestamp):
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return pickle.loads(value) if pickled else value
+
+    def _set(self, key: str, value: Any) -> None:
+        pickled = self._copy_results and not isinstance(value, (str, bytes))
+        if pickled:
+            value = _dumps(value)
+            if value is None:
+                return
+        self._entries[key] = (value, pickled, time.time())
+        self._entries.move_to_end(key)
+        if self._maxsize is not None:
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def _clear(self) -> None:
+        self._entries.clear()
+
+    def _size(self) -> int:
+        return len(self._entries)
+
+
+class SqliteConversionCache(ConversionCache):
+    """
+    On-disk LRU cache of conversion results, backed by a sqlite database.
+
+    The cache can be shared between processes and persists across sessions. String and
+    bytes results, such as OpenQASM programs, are stored as is. Other results are stored
+    pickled, and results that cannot be pickled are not cached. Hit/miss statistics are
+    tracked per instance.
+
+    .. warning::
+
+        Pickled entries are unpickled on read, and unpickling data can execute arbitrary
+        code. Only open cache files that you created, or otherwise trust. New database files
+        are created readable and writable by their owner only.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the sqlite database file. It is created
+            if it does not exist.
+        maxsize (Optional[int]): The maximum number of cached conversions. Defaults to 1024.
+        ttl (Optional[float]): The number of seconds after which a cached conversion expires.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        maxsize: Optional[int] = 1024,
+        ttl: Optional[float] = None,
+    ):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._path = os.fspath(path)
+        if self._path != ":memory:" and not os.path.exists(self._path):
+            os.close(os.open(self._path, os.O_CREAT | os.O_WRONLY, 0o600))
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS conversions ("
+                "key TEXT PRIMARY KEY, kind TEXT NOT NULL, value BLOB NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+
+    @property
+    def path(self) -> str:
+        """Return the path of the sqlite database file."""
+        return self._path
+
+    def _get(self, key: str) -> Any:
+        row = self._conn.execute(
+            "SELECT kind, value, created FROM conversions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return _MISSING
+        kind, value, created = row
+        with self._conn:
+            if self._is_expired(created):
+                self._conn.execute("DELETE FROM conversions WHERE key = ?", (key,))
+                return _MISSING
+            self._conn.execute(
+                "UPDATE conversions SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        if kind == "str":
+            return value.decode()
+        if kind == "bytes":
+            return bytes(value)
+        try:
+            return pickle.loads(value)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.debug("Discarding unreadable conversion cache entry: %s", err)
+            return _MISSING
+
+    def _set(self, key: str, value: Any) -> None:
+        if isinstance(value, str):
+            kind, data = "str", value.encode()
+        elif isinstance(value, bytes):
+            kind, data = "bytes", value
+        else:
+            kind, data = "pickle", _dumps(value)
+            if data is None:
+                return
+
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO conversions (key, kind, value, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, kind, sqlite3.Binary(data), now, now),
+            )
+            if self._maxsize is not None:
+                self._conn.execute(
+                    "DELETE FROM conversions WHERE key IN (SELECT key FROM conversions "
+                    "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (self._maxsize,),
+                )
+
+    def _clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM conversions")
+
+    def _size(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM conversions").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the sqlite database."""
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self._path}', maxsize={self._maxsize}, ttl={self._ttl})"
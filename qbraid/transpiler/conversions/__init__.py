@@ -39,7 +39,9 @@ Submodules
 
 """
 import importlib
-import inspect
+from typing import Any, Callable, Optional
+
+from ._manifest import CONVERSION_MANIFEST
 
 # Dynamically import QPROGRAM_ALIASES when needed
 _qbraid = importlib.import_module("qbraid.programs._import")
@@ -52,56 +54,139 @@ valid_combinations_cache = set()
 
 conversion_functions = []
 
+# Manifest entries of each conversion function, grouped by the sub-module exporting it
+_manifest_by_name = {entry[3]: entry for entry in CONVERSION_MANIFEST}
+_submodules: dict[str, list[str]] = {}
+for _entry in CONVERSION_MANIFEST:
+    _submodules.setdefault(_entry[2].split(".")[3], []).append(_entry[3])
+
+_lazy_functions: dict[str, "LazyConversionFunction"] = {}
+
+
+class LazyConversionFunction:
+    """
+    Conversion function that is only imported from its module when first called.
+
+    Carries the ``weight``, ``requires_extras``, and ``non_mutating`` annotations of the
+    function it stands in for, so that a :class:`~qbraid.transpiler.Conversion` can be
+    built from it without importing the quantum SDKs the conversion depends on.
+
+    Args:
+        module (str): The module defining the conversion function.
+        name (str): The name of the conversion function.
+        weight (Optional[float]): The weight assigned with the ``@weight`` decorator, if any.
+        requires_extras (tuple[str, ...]): The packages listed with ``@requires_extras``.
+        non_mutating (bool): Whether the function is marked with ``@non_mutating``.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        module: str,
+        name: str,
+        weight: Optional[float] = None,
+        requires_extras: tuple[str, ...] = (),
+        non_mutating: bool = False,
+    ):
+        self.__module__ = module
+        self.__name__ = self.__qualname__ = name
+        self._func: Optional[Callable[[Any], Any]] = None
+        if weight is not None:
+            self.weight = weight
+        if requires_extras:
+            self.requires_extras = list(requires_extras)
+        if non_mutating:
+            self.non_mutating = True
+
+    def load(self) -> Callable[[Any], Any]:
+        """Import and return the conversion function."""
+        if self._func is None:
+            module = importlib.import_module(self.__module__)
+            self._func = getattr(module, self.__name__)
+        return self._func
+
+    def __call__(self, program: Any) -> Any:
+        return self.load()(program)
+
+    def __reduce__(self):
+        return (
+            type(self),
+            (
+                self.__module__,
+                self.__name__,
+                getattr(self, "weight", None),
+                tuple(getattr(self, "requires_extras", ())),
+                getattr(self, "non_mutating", False),
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return f"<lazy conversion function {self.__module__}.{self.__name__}>"
+
+
+def get_conversion_function(name: str) -> LazyConversionFunction:
+    """
+    Return the conversion function with the given name, without importing its module.
+
+    Args:
+        name (str): The name of the conversion function, e.g. "cirq_to_qasm2".
+
+    Returns:
+        LazyConversionFunction: A callable that imports the function when first called.
+
+    Raises:
+        KeyError: If no conversion function with the given name is shipped with qBraid.
+    """
+    func = _lazy_functions.get(name)
+    if func is None:
+        _, _, module, _, weight, extras, non_mutating = _manifest_by_name[name]
+        func = LazyConversionFunction(module, name, weight, extras, non_mutating)
+        _lazy_functions[name] = func
+    return func
+
 
 def _update_registered_conversions() -> None:
     """
-    Dynamically update the list of conversion functions based on current
-    NATIVE_REGISTRY and QPROGRAM_REGISTRY. Adds valid conversion functions
-    to the global namespace and maintains a cache of seen valid combinations.
+    Update the list of conversion functions based on current NATIVE_REGISTRY
+    and QPROGRAM_REGISTRY, and maintain a cache of seen valid combinations.
+
+    Conversion functions are read from the static manifest, so no conversion
+    sub-module (nor the quantum SDK it wraps) is imported.
     """
     conversion_functions.clear()
 
-    # Base path for the sub-modules
-    base_path = "qbraid.transpiler.conversions."
-
     for lib in NATIVE_REGISTRY:
-        try:
-            # Dynamically import the sub-module
-            sub_module = importlib.import_module(base_path + lib)
-
-            # Extract function names from the sub-module
-            function_names = [
-                name
-                for name in dir(sub_module)
-                if callable(getattr(sub_module, name))
-                and inspect.isfunction(getattr(sub_module, name))
-            ]
-
-            # Add functions to the current namespace
-            for name in function_names:
-                p1, p2 = name.split("_to_")
-                # Create tuples for both pair and its reverse
-                pair = (p1, p2)
-                reverse_pair = (p2, p1)
-
-                # Check if either pair or its reverse has been seen as valid before
-                if pair in valid_combinations_cache or reverse_pair in valid_combinations_cache:
-                    globals()[name] = getattr(sub_module, name)
-                    conversion_functions.append(name)
-                    continue
-
-                # Check if both p1 and p2 are in the set
-                if (p1 in NATIVE_REGISTRY or p2 in NATIVE_REGISTRY) and (
-                    p1 in QPROGRAM_REGISTRY and p2 in QPROGRAM_REGISTRY
-                ):
-                    globals()[name] = getattr(sub_module, name)
-                    conversion_functions.append(name)
-                    # Add both the pair and its reverse to the cache
-                    valid_combinations_cache.add(pair)
-                    valid_combinations_cache.add(reverse_pair)
-
-        except ModuleNotFoundError:
-            pass
+        for name in _submodules.get(lib, []):
+            p1, p2 = name.split("_to_")
+            # Create tuples for both pair and its reverse
+            pair = (p1, p2)
+            reverse_pair = (p2, p1)
+
+            # Check if either pair or its reverse has been seen as valid before
+            if pair in valid_combinations_cache or reverse_pair in valid_combinations_cache:
+                conversion_functions.append(name)
+                continue
+
+            # Check if both p1 and p2 are in the set
+            if (p1 in NATIVE_REGISTRY or p2 in NATIVE_REGISTRY) and (
+                p1 in QPROGRAM_REGISTRY and p2 in QPROGRAM_REGISTRY
+            ):
+                conversion_functions.append(name)
+                # Add both the pair and its reverse to the cache
+                valid_combinations_cache.add(pair)
+                valid_combinations_cache.add(reverse_pair)
+
+
+def __getattr__(name):
+    if name in conversion_functions:
+        func = get_conversion_function(name).load()
+        globals()[name] = func
+        return func
+
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 _update_registered_conversions()
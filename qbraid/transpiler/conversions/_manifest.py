@@ -0,0 +1,576 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Static manifest of the conversion functions in qbraid.transpiler.conversions.
+
+Generated by ``python bin/generate_conversion_graph.py --manifest``. Do not edit.
+
+"""
+from typing import Optional
+
+# (source, target, module, function, weight, requires_extras, non_mutating)
+ManifestEntry = tuple[str, str, str, str, Optional[float], tuple[str, ...], bool]
+
+CONVERSION_MANIFEST: list[ManifestEntry] = [
+    (
+        "braket",
+        "cirq",
+        "qbraid.transpiler.conversions.braket.braket_to_cirq",
+        "braket_to_cirq",
+        0.99,
+        (),
+        False,
+    ),
+    (
+        "braket",
+        "pytket",
+        "qbraid.transpiler.conversions.braket.braket_extras",
+        "braket_to_pytket",
+        None,
+        ("pytket.extensions.braket",),
+        False,
+    ),
+    (
+        "braket",
+        "qasm3",
+        "qbraid.transpiler.conversions.braket.braket_to_qasm3",
+        "braket_to_qasm3",
+        1,
+        (),
+        True,
+    ),
+    (
+        "braket",
+        "qiskit",
+        "qbraid.transpiler.conversions.braket.braket_extras",
+        "braket_to_qiskit",
+        None,
+        ("qiskit_braket_provider",),
+        False,
+    ),
+    (
+        "bloqade",
+        "braket_ahs",
+        "qbraid.transpiler.conversions.braket_ahs.braket_ahs_extras",
+        "bloqade_to_braket_ahs",
+        None,
+        ("bloqade",),
+        False,
+    ),
+    (
+        "cirq",
+        "braket",
+        "qbraid.transpiler.conversions.cirq.cirq_to_braket",
+        "cirq_to_braket",
+        0.85,
+        (),
+        False,
+    ),
+    (
+        "cirq",
+        "pyqir",
+        "qbraid.transpiler.conversions.cirq.cirq_extras",
+        "cirq_to_pyqir",
+        None,
+        ("qbraid_qir",),
+        False,
+    ),
+    (
+        "cirq",
+        "pyquil",
+        "qbraid.transpiler.conversions.cirq.cirq_to_pyquil",
+        "cirq_to_pyquil",
+        0.74,
+        (),
+        False,
+    ),
+    (
+        "cirq",
+        "pytket",
+        "qbraid.transpiler.conversions.cirq.cirq_extras",
+        "cirq_to_pytket",
+        None,
+        ("pytket.extensions.cirq",),
+        False,
+    ),
+    (
+        "cirq",
+        "qasm2",
+        "qbraid.transpiler.conversions.cirq.cirq_to_qasm2",
+        "cirq_to_qasm2",
+        1,
+        (),
+        True,
+    ),
+    (
+        "cirq",
+        "qat",
+        "qbraid.transpiler.conversions.cirq.cirq_extras",
+        "cirq_to_qat",
+        None,
+        ("qat.interop.cirq",),
+        False,
+    ),
+    (
+        "cirq",
+        "stim",
+        "qbraid.transpiler.conversions.cirq.cirq_extras",
+        "cirq_to_stim",
+        None,
+        ("stim", "stimcirq"),
+        False,
+    ),
+    (
+        "stim",
+        "cirq",
+        "qbraid.transpiler.conversions.cirq.cirq_extras",
+        "stim_to_cirq",
+        None,
+        ("stim", "stimcirq"),
+        False,
+    ),
+    (
+        "cudaq",
+        "pyqir",
+        "qbraid.transpiler.conversions.cudaq.cudaq_extras",
+        "cudaq_to_pyqir",
+        None,
+        ("pyqir",),
+        False,
+    ),
+    (
+        "cudaq",
+        "qasm2",
+        "qbraid.transpiler.conversions.cudaq.cudaq_to_qasm2",
+        "cudaq_to_qasm2",
+        1,
+        (),
+        False,
+    ),
+    (
+        "openqasm3",
+        "cudaq",
+        "qbraid.transpiler.conversions.openqasm3.openqasm3_to_cudaq",
+        "openqasm3_to_cudaq",
+        0.95,
+        (),
+        False,
+    ),
+    (
+        "openqasm3",
+        "ionq",
+        "qbraid.transpiler.conversions.openqasm3.openqasm3_to_ionq",
+        "openqasm3_to_ionq",
+        1,
+        (),
+        False,
+    ),
+    (
+        "openqasm3",
+        "pyquil",
+        "qbraid.transpiler.conversions.openqasm3.openqasm3_to_pyquil",
+        "openqasm3_to_pyquil",
+        1.0,
+        (),
+        False,
+    ),
+    (
+        "openqasm3",
+        "qasm3",
+        "qbraid.transpiler.conversions.openqasm3.openqasm3_to_qasm3",
+        "openqasm3_to_qasm3",
+        1,
+        (),
+        False,
+    ),
+    (
+        "pennylane",
+        "braket",
+        "qbraid.transpiler.conversions.pennylane.pennylane_extras",
+        "pennylane_to_braket",
+        None,
+        ("braket.pennylane_plugin",),
+        False,
+    ),
+    (
+        "pennylane",
+        "cirq",
+        "qbraid.transpiler.conversions.pennylane.pennylane_extras",
+        "pennylane_to_cirq",
+        None,
+        ("pennylane_cirq",),
+        False,
+    ),
+    (
+        "pennylane",
+        "qasm2",
+        "qbraid.transpiler.conversions.pennylane.pennylane_to_qasm2",
+        "pennylane_to_qasm2",
+        1,
+        (),
+        False,
+    ),
+    (
+        "pennylane",
+        "qiskit",
+        "qbraid.transpiler.conversions.pennylane.pennylane_extras",
+        "pennylane_to_qiskit",
+        None,
+        ("pennylane_qiskit",),
+        False,
+    ),
+    (
+        "pyquil",
+        "cirq",
+        "qbraid.transpiler.conversions.pyquil.pyquil_to_cirq",
+        "pyquil_to_cirq",
+        1,
+        (),
+        False,
+    ),
+    (
+        "pyquil",
+        "qasm3",
+        "qbraid.transpiler.conversions.pyquil.pyquil_to_qasm3",
+        "pyquil_to_qasm3",
+        1,
+        (),
+        False,
+    ),
+    (
+        "pytket",
+        "braket",
+        "qbraid.transpiler.conversions.pytket.pytket_extras",
+        "pytket_to_braket",
+        None,
+        ("pytket.extensions.braket",),
+        False,
+    ),
+    (
+        "pytket",
+        "cirq",
+        "qbraid.transpiler.conversions.pytket.pytket_extras",
+        "pytket_to_cirq",
+        None,
+        ("pytket.extensions.cirq",),
+        False,
+    ),
+    (
+        "pytket",
+        "pyqir",
+        "qbraid.transpiler.conversions.pytket.pytket_extras",
+        "pytket_to_pyqir",
+        None,
+        ("pytket.qir",),
+        False,
+    ),
+    (
+        "pytket",
+        "qasm2",
+        "qbraid.transpiler.conversions.pytket.pytket_to_qasm2",
+        "pytket_to_qasm2",
+        1,
+        (),
+        True,
+    ),
+    (
+        "pytket",
+        "qiskit",
+        "qbraid.transpiler.conversions.pytket.pytket_extras",
+        "pytket_to_qiskit",
+        None,
+        ("pytket.extensions.qiskit",),
+        False,
+    ),
+    (
+        "pyqpanda3",
+        "qasm2",
+        "qbraid.transpiler.conversions.qasm2.qasm2_extras",
+        "pyqpanda3_to_qasm2",
+        None,
+        ("pyqpanda3",),
+        False,
+    ),
+    (
+        "qasm2",
+        "cirq",
+        "qbraid.transpiler.conversions.qasm2.qasm2_to_cirq",
+        "qasm2_to_cirq",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qasm2",
+        "ionq",
+        "qbraid.transpiler.conversions.qasm2.qasm2_to_ionq",
+        "qasm2_to_ionq",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qasm2",
+        "pyqpanda3",
+        "qbraid.transpiler.conversions.qasm2.qasm2_extras",
+        "qasm2_to_pyqpanda3",
+        None,
+        ("pyqpanda3",),
+        False,
+    ),
+    (
+        "qasm2",
+        "pyquil",
+        "qbraid.transpiler.conversions.qasm2.qasm2_to_pyquil",
+        "qasm2_to_pyquil",
+        1.0,
+        (),
+        False,
+    ),
+    (
+        "qasm2",
+        "pytket",
+        "qbraid.transpiler.conversions.qasm2.qasm2_to_pytket",
+        "qasm2_to_pytket",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qasm2",
+        "qasm3",
+        "qbraid.transpiler.conversions.qasm2.qasm2_to_qasm3",
+        "qasm2_to_qasm3",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qasm2",
+        "qat",
+        "qbraid.transpiler.conversions.qasm2.qasm2_extras",
+        "qasm2_to_qat",
+        None,
+        ("qat.interop.openqasm",),
+        False,
+    ),
+    (
+        "qasm2",
+        "qibo",
+        "qbraid.transpiler.conversions.qasm2.qasm2_extras",
+        "qasm2_to_qibo",
+        None,
+        ("qibo",),
+        False,
+    ),
+    (
+        "qasm2",
+        "qiskit",
+        "qbraid.transpiler.conversions.qasm2.qasm2_to_qiskit",
+        "qasm2_to_qiskit",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qibo",
+        "qasm2",
+        "qbraid.transpiler.conversions.qasm2.qasm2_extras",
+        "qibo_to_qasm2",
+        None,
+        ("qibo",),
+        False,
+    ),
+    (
+        "autoqasm",
+        "qasm3",
+        "qbraid.transpiler.conversions.qasm3.qasm3_extras",
+        "autoqasm_to_qasm3",
+        None,
+        ("autoqasm",),
+        False,
+    ),
+    (
+        "qasm3",
+        "braket",
+        "qbraid.transpiler.conversions.qasm3.qasm3_to_braket",
+        "qasm3_to_braket",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qasm3",
+        "cirq",
+        "qbraid.transpiler.conversions.qasm3.qasm3_to_cirq",
+        "qasm3_to_cirq",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qasm3",
+        "ionq",
+        "qbraid.transpiler.conversions.qasm3.qasm3_to_ionq",
+        "qasm3_to_ionq",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qasm3",
+        "openqasm3",
+        "qbraid.transpiler.conversions.qasm3.qasm3_to_openqasm3",
+        "qasm3_to_openqasm3",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qasm3",
+        "pyqir",
+        "qbraid.transpiler.conversions.qasm3.qasm3_extras",
+        "qasm3_to_pyqir",
+        None,
+        ("qbraid_qir",),
+        False,
+    ),
+    (
+        "qasm3",
+        "qiskit",
+        "qbraid.transpiler.conversions.qasm3.qasm3_to_qiskit",
+        "qasm3_to_qiskit",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qiskit",
+        "aqt_connector",
+        "qbraid.transpiler.conversions.qiskit.qiskit_to_aqt_connector",
+        "qiskit_to_aqt_connector",
+        None,
+        ("aqt_connector",),
+        False,
+    ),
+    (
+        "qiskit",
+        "braket",
+        "qbraid.transpiler.conversions.qiskit.qiskit_extras",
+        "qiskit_to_braket",
+        None,
+        ("qiskit_braket_provider",),
+        False,
+    ),
+    (
+        "qiskit",
+        "ionq",
+        "qbraid.transpiler.conversions.qiskit.qiskit_extras",
+        "qiskit_to_ionq",
+        None,
+        ("qiskit_ionq",),
+        False,
+    ),
+    (
+        "qiskit",
+        "pennylane",
+        "qbraid.transpiler.conversions.qiskit.qiskit_extras",
+        "qiskit_to_pennylane",
+        None,
+        ("pennylane_qiskit",),
+        False,
+    ),
+    (
+        "qiskit",
+        "pyqir",
+        "qbraid.transpiler.conversions.qiskit.qiskit_extras",
+        "qiskit_to_pyqir",
+        None,
+        ("qbraid_qir.qiskit",),
+        False,
+    ),
+    (
+        "qiskit",
+        "qasm2",
+        "qbraid.transpiler.conversions.qiskit.qiskit_to_qasm2",
+        "qiskit_to_qasm2",
+        0.999,
+        (),
+        True,
+    ),
+    (
+        "qiskit",
+        "qasm3",
+        "qbraid.transpiler.conversions.qiskit.qiskit_to_qasm3",
+        "qiskit_to_qasm3",
+        1,
+        (),
+        True,
+    ),
+    (
+        "qiskit",
+        "qrisp",
+        "qbraid.transpiler.conversions.qiskit.qiskit_to_qrisp",
+        "qiskit_to_qrisp",
+        1.0,
+        (),
+        False,
+    ),
+    (
+        "qrisp",
+        "cirq",
+        "qbraid.transpiler.conversions.qrisp.qrisp_to_cirq",
+        "qrisp_to_cirq",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qrisp",
+        "pytket",
+        "qbraid.transpiler.conversions.qrisp.qrisp_to_pytket",
+        "qrisp_to_pytket",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qrisp",
+        "qasm2",
+        "qbraid.transpiler.conversions.qrisp.qrisp_to_qasm2",
+        "qrisp_to_qasm2",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qrisp",
+        "qasm3",
+        "qbraid.transpiler.conversions.qrisp.qrisp_to_qasm3",
+        "qrisp_to_qasm3",
+        1,
+        (),
+        False,
+    ),
+    (
+        "qrisp",
+        "qiskit",
+        "qbraid.transpiler.conversions.qrisp.qrisp_to_qiskit",
+        "qrisp_to_qiskit",
+        1,
+        (),
+        False,
+    ),
+]
@@ -21,10 +21,11 @@ from braket.circuits import Circuit
 from braket.circuits.serialization import IRType
 
 from qbraid.passes.qasm import replace_gate_names
-from qbraid.transpiler.annotations import weight
+from qbraid.transpiler.annotations import non_mutating, weight
 
 
 @weight(1)
+@non_mutating
 def braket_to_qasm3(circuit: Circuit) -> str:
     """Converts a ``braket.circuits.Circuit`` to an OpenQASM 3.0 string.
 
@@ -26,7 +26,7 @@ import pyqasm
 from cirq import ops, value
 
 from qbraid._version import __version__ as qbraid_version
-from qbraid.transpiler.annotations import weight
+from qbraid.transpiler.annotations import non_mutating, weight
 
 if TYPE_CHECKING:
     from qbraid.programs.typer import Qasm2StringType
@@ -135,6 +135,7 @@ def _to_qasm_output(
 
 
 @weight(1)
+@non_mutating
 def cirq_to_qasm2(
     circuit: cirq.Circuit,
     header: Optional[str] = None,
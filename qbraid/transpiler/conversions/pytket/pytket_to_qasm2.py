@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING
 
 from pytket.qasm import circuit_to_qasm_str
 
-from qbraid.transpiler.annotations import weight
+from qbraid.transpiler.annotations import non_mutating, weight
 
 if TYPE_CHECKING:
     import pytket.circuit
@@ -31,6 +31,7 @@ if TYPE_CHECKING:
 
 
 @weight(1)
+@non_mutating
 def pytket_to_qasm2(circuit: pytket.circuit.Circuit) -> Qasm2StringType:
     """Returns an OpenQASM 2 string equivalent to the input pytket circuit.
 
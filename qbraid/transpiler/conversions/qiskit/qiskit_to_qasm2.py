@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING
 
 from qiskit.qasm2 import dumps as qasm2_dumps
 
-from qbraid.transpiler.annotations import weight
+from qbraid.transpiler.annotations import non_mutating, weight
 
 if TYPE_CHECKING:
     import qiskit as qiskit_
@@ -31,6 +31,7 @@ if TYPE_CHECKING:
 
 
 @weight(0.999)
+@non_mutating
 def qiskit_to_qasm2(circuit: qiskit_.QuantumCircuit) -> Qasm2StringType:
     """Returns OpenQASM 2 string equivalent to the input Qiskit circuit.
 
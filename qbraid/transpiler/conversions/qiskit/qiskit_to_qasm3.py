@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING
 
 from qiskit.qasm3 import dumps
 
-from qbraid.transpiler.annotations import weight
+from qbraid.transpiler.annotations import non_mutating, weight
 
 if TYPE_CHECKING:
     import qiskit as qiskit_
@@ -31,6 +31,7 @@ if TYPE_CHECKING:
 
 
 @weight(1)
+@non_mutating
 def qiskit_to_qasm3(circuit: qiskit_.QuantumCircuit) -> Qasm3StringType:
     """Convert qiskit QuantumCircuit to QASM 3.0 string"""
     return dumps(circuit)
@@ -19,9 +19,12 @@ Module for transpiling quantum programs between different quantum programming la
 
 from __future__ import annotations
 
+import logging
 import warnings
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Union
 
 from qbraid._logging import logger
 from qbraid.programs import QPROGRAM_ALIASES
@@ -30,12 +33,13 @@ from qbraid.programs.alias_manager import (
     get_program_type_alias,
 )
 
+from .cache import ConversionCache
 from .exceptions import (
     ConversionPathNotFoundError,
     NodeNotFoundError,
     ProgramConversionError,
 )
-from .graph import ConversionGraph, _get_path_from_bound_methods
+from .graph import ConversionGraph, _get_path_from_bound_methods, get_default_graph
 
 if TYPE_CHECKING:
     import qbraid.programs
@@ -53,12 +57,291 @@ def _format_exception(err: Exception) -> str:
     return f"{type(err).__name__}: {str(err)}\n"
 
 
+COPY_MODES = ("deep", "none", "on_retry")
+
+
+def _is_non_mutating(path: list[Callable[[Any], Any]]) -> bool:
+    """Whether the first conversion in a path is declared not to modify its input.
+
+    Only the first conversion receives the caller's program; every later conversion in the
+    path receives a new program of a different type produced by the one before it.
+    """
+    conversion = getattr(path[0], "__self__", None) if path else None
+    return getattr(conversion, "non_mutating", False)
+
+
+def _resolve_graph(
+    conversion_graph: Optional[ConversionGraph], **kwargs
+) -> tuple[ConversionGraph, str]:
+    """Return the conversion graph to use, and whether it is the "Default" or "Provided" one."""
+    if conversion_graph:
+        graph = conversion_graph
+    elif "conversions" in kwargs:
+        graph = ConversionGraph(**kwargs)
+    else:
+        graph = get_default_graph(**kwargs)
+    graph_type = "Default" if conversion_graph is None else "Provided"
+    return graph, graph_type
+
+
+# pylint: disable-next=too-many-arguments
+def _compile_paths(
+    graph: ConversionGraph,
+    graph_type: str,
+    source: str,
+    target: str,
+    max_path_attempts: int,
+    max_path_depth: Optional[int],
+    copy_mode: str,
+) -> ConversionPipeline:
+    """Resolve the ordered fallback paths from source to target within a conversion graph."""
+    if not graph.has_node(source):
+        raise NodeNotFoundError(graph_type, source, graph.nodes())
+
+    if not graph.has_path(source, target):
+        raise ConversionPathNotFoundError(source, target)
+
+    if source == target:
+        return ConversionPipeline(source, target, [], copy_mode=copy_mode)
+
+    _warn_if_unsupported(source, "from")
+    _warn_if_unsupported(target, "to")
+
+    paths = graph.find_top_shortest_conversion_paths(source, target, top_n=max_path_attempts)
+
+    if max_path_depth is not None:
+        paths = [path for path in paths if len(path) <= max_path_depth]
+        if len(paths) == 0:
+            raise ConversionPathNotFoundError(source, target, max_path_depth)
+
+    return ConversionPipeline(source, target, paths, copy_mode=copy_mode)
+
+
+class ConversionPipeline:
+    """
+    A compiled, reusable conversion from one program type to another.
+
+    Holds the ordered list of conversion paths resolved from a :class:`ConversionGraph`,
+    and applies them to programs without consulting the graph again. Paths are attempted
+    in order, falling back to the next path if a conversion raises. Pipelines are
+    picklable provided that their conversion functions are, e.g. those included in the
+    default conversion graph.
+
+    Instances are created by :func:`compile_conversion`.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        target: str,
+        paths: list[list[Callable[[Any], Any]]],
+        copy_mode: str = "deep",
+    ):
+        """
+        Initialize a ConversionPipeline instance.
+
+        Args:
+            source (str): The alias of the program type accepted by the pipeline.
+            target (str): The alias of the program type produced by the pipeline.
+            paths (list[list[Callable]]): The conversion paths to attempt, in order. Each path
+                is a list of bound ``convert`` methods of Conversion instances.
+            copy_mode (str): When to deep-copy the input program before attempting a path.
+                See :func:`transpile`. Defaults to "deep".
+
+        Raises:
+            ValueError: If ``copy_mode`` is not one of "deep", "none", or "on_retry".
+        """
+        if copy_mode not in COPY_MODES:
+            raise ValueError(
+                f"Invalid copy_mode '{copy_mode}'. Expected one of: {', '.join(COPY_MODES)}."
+            )
+        self._source = source
+        self._target = target
+        self._paths = paths
+        self._copy_mode = copy_mode
+        self._path_details: Optional[list[str]] = None
+
+    @property
+    def source(self) -> str:
+        """The alias of the program type accepted by the pipeline."""
+        return self._source
+
+    @property
+    def target(self) -> str:
+        """The alias of the program type produced by the pipeline."""
+        return self._target
+
+    @property
+    def paths(self) -> list[list[Callable[[Any], Any]]]:
+        """The conversion paths attempted by the pipeline, in order."""
+        return self._paths
+
+    @property
+    def copy_mode(self) -> str:
+        """When the input program is deep-copied before attempting a path."""
+        return self._copy_mode
+
+    @property
+    def path_details(self) -> list[str]:
+        """String representations of the conversion paths, e.g. 'qiskit -> qasm3'."""
+        if self._path_details is None:
+            self._path_details = [_get_path_from_bound_methods(path) for path in self._paths]
+        return self._path_details
+
+    def __call__(self, program: qbraid.programs.QPROGRAM) -> qbraid.programs.QPROGRAM:
+        """
+        Convert a program of the pipeline's source type to its target type.
+
+        Args:
+            program (qbraid.programs.QPROGRAM): The quantum program to convert.
+
+        Returns:
+            qbraid.programs.QPROGRAM: The converted quantum program.
+
+        Raises:
+            ProgramConversionError: If the conversion fails through all paths.
+        """
+        if self._source == self._target:
+            return program
+
+        error_messages = []
+        last_index = len(self._paths) - 1
+
+        for index, path in enumerate(self._paths):
+            temp_program = self._prepare_input(program, path, is_last=index == last_index)
+            try:
+                for convert_func in path:
+                    try:
+                        temp_program = convert_func(temp_program)
+                    except Exception as err:  # pylint: disable=broad-exception-caught
+                        alias = get_program_type_alias(temp_program, safe=True)
+                        error_detail = (
+                            f"Conversion {self.path_details[index]} failed due to "
+                            f"exception raised while converting from '{alias}'."
+                        )
+                        error_messages.append(error_detail)
+                        error_messages.append(_format_exception(err))
+                        raise
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Successfully transpiled using conversions: %s", self.path_details[index]
+                    )
+                return temp_program
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Failed to transpile using conversions: %s", self.path_details[index]
+                    )
+                formatted_error = _format_exception(err)
+                if len(error_messages) == 0 or error_messages[-1] != formatted_error:
+                    error_messages.append(formatted_error)
+                continue
+
+        raise ProgramConversionError(
+            f"Failed to convert '{self._source}' to '{self._target}'"
+            + (
+                " due to the following error(s):\n\n" + "\n".join(error_messages)
+                if error_messages
+                else "."
+            )
+        )
+
+    def _prepare_input(
+        self, program: qbraid.programs.QPROGRAM, path: list[Callable[[Any], Any]], is_last: bool
+    ) -> qbraid.programs.QPROGRAM:
+        """
+        Return the program to pass to a conversion path, copying it if required.
+
+        Copies cannot be deferred until an attempt fails, because by then the failed path
+        may already have modified its input. Under "on_retry", every attempt but the last
+        therefore still receives a copy.
+        """
+        if self._copy_mode == "none" or _is_non_mutating(path):
+            return program
+
+        if self._copy_mode == "on_retry" and is_last:
+            return program
+
+        try:
+            return deepcopy(program)
+        except (RecursionError, TypeError) as err:
+            logger.info(
+                "Deepcopy failed due to a %s, likely caused by the internal structure of "
+                "the %s object. Continuing execution, but any subsequent errors during "
+                "transpilation may be unclear or misleading due to potential side effects.",
+                type(err).__name__,
+                type(program),
+            )
+            return program
+
+    def __repr__(self) -> str:
+        return (
+            f"ConversionPipeline('{self._source}' -> '{self._target}', paths={self.path_details})"
+        )
+
+
+# pylint: disable-next=too-many-arguments
+def compile_conversion(
+    source: str,
+    target: str,
+    conversion_graph: Optional[ConversionGraph] = None,
+    max_path_attempts: int = 3,
+    max_path_depth: Optional[int] = None,
+    copy_mode: str = "deep",
+    **kwargs,
+) -> ConversionPipeline:
+    """
+    Resolve the conversion paths between two program types once, for repeated use.
+
+    The returned pipeline converts programs exactly as :func:`transpile` would, but without
+    looking up the program type, graph nodes, or conversion paths on each call. This is
+    useful when converting many programs of the same type, e.g.
+
+    .. code-block:: python
+
+        to_qasm3 = compile_conversion("qiskit", "qasm3")
+        qasm3_programs = [to_qasm3(circuit) for circuit in circuits]
+
+    Args:
+        source (str): The alias of the program type to convert from.
+        target (str): The alias of the program type to convert to.
+        conversion_graph (Optional[ConversionGraph]): The graph representing available conversions.
+            If None, the shared default graph for the given ``kwargs`` is used. Defaults to None.
+        max_path_attempts (int): The maximum number of conversion paths to attempt before raising an
+            exception. Defaults to 3.
+        max_path_depth (Optional[int]): The maximum depth of conversions within a given path to
+            allow. Defaults to None, i.e. no limit set on the path depth.
+        copy_mode (str): When to deep-copy the input program before attempting a path.
+            See :func:`transpile`. Defaults to "deep".
+
+    Returns:
+        ConversionPipeline: A callable that converts programs from source to target.
+
+    Raises:
+        NodeNotFoundError: If the target or source package is not in the ConversionGraph.
+        ConversionPathNotFoundError: If no path is available to conversion between the
+            source and target packages.
+    """
+    graph, graph_type = _resolve_graph(conversion_graph, **kwargs)
+
+    if not graph.has_node(target):
+        raise NodeNotFoundError(graph_type, target, graph.nodes())
+
+    return _compile_paths(
+        graph, graph_type, source, target, max_path_attempts, max_path_depth, copy_mode
+    )
+
+
+# pylint: disable-next=too-many-arguments
 def transpile(
     program: qbraid.programs.QPROGRAM,
     target: str,
     conversion_graph: Optional[ConversionGraph] = None,
     max_path_attempts: int = 3,
     max_path_depth: Optional[int] = None,
+    copy_mode: str = "deep",
+    cache: Optional[ConversionCache] = None,
     **kwargs,
 ) -> qbraid.programs.QPROGRAM:
     """
@@ -67,11 +350,14 @@ def transpile(
     format to the target format. It can limit the search to a certain number of
     attempts and path depths.
 
+    To convert many programs of the same type, see :func:`compile_conversion`.
+
     Args:
         program (qbraid.programs.QPROGRAM): The quantum program to transpile.
         target (str): The target language to transpile to.
         conversion_graph (Optional[ConversionGraph]): The graph representing available conversions.
-            If None, a default graph is used. Defaults to None.
+            If None, the shared default graph for the given ``kwargs`` is used (see
+            :func:`~qbraid.transpiler.graph.get_default_graph`). Defaults to None.
         max_path_attempts (int): The maximum number of conversion paths to attempt before raising an
             exception. This is useful to avoid excessive computations when multiple paths are
             available. Defaults to 3.
@@ -79,6 +365,25 @@ def transpile(
             allow. For example, a path with a depth of 2 would be ['cirq' -> 'qasm2' -> 'qiskit'],
             whereas a depth  of 1 would be a direct conversion ['cirq' -> 'braket']. Defaults
             to None, i.e. no limit set on the path depth.
+        copy_mode (str): When to deep-copy the input program before attempting a conversion
+            path, protecting it from conversions that modify their input. Copies are always
+            skipped for paths that start with a conversion marked as
+            :func:`~qbraid.transpiler.annotations.non_mutating`. Otherwise:
+
+            - ``"deep"``: copy before every attempt; the input program is never modified.
+            - ``"on_retry"``: copy only to keep a pristine input for later attempts; the final
+              attempt uses the input program directly, and may modify it. A copy is still made
+              before each earlier attempt, since a failed attempt may already have modified its
+              input, so this only saves a copy when a single path is attempted, e.g. with
+              ``max_path_attempts=1``.
+            - ``"none"``: never copy. The input program may be modified, and a failed attempt
+              may affect the input seen by subsequent attempts.
+
+            Defaults to ``"deep"``.
+        cache (Optional[ConversionCache]): A cache of previous conversion results, keyed by
+            the program content, the target, and the conversion paths. If given, converting
+            a program identical to one converted before returns the cached result instead
+            of running the conversions again. Defaults to None.
 
     Returns:
         qbraid.programs.QPROGRAM: The transpiled quantum program.
@@ -89,79 +394,159 @@ def transpile(
             source and target packages.
         ProgramConversionError: If the conversion fails through all attempted paths.
     """
-    graph = conversion_graph or ConversionGraph(**kwargs)
-    graph_type = "Default" if conversion_graph is None else "Provided"
+    graph, graph_type = _resolve_graph(conversion_graph, **kwargs)
 
     if not graph.has_node(target):
         raise NodeNotFoundError(graph_type, target, graph.nodes())
 
     source = _get_program_type_alias(program)
 
-    if not graph.has_node(source):
-        raise NodeNotFoundError(graph_type, source, graph.nodes())
+    pipeline = _compile_paths(
+        graph, graph_type, source, target, max_path_attempts, max_path_depth, copy_mode
+    )
 
-    if not graph.has_path(source, target):
-        raise ConversionPathNotFoundError(source, target)
+    if cache is None or source == target:
+        return pipeline(program)
 
-    if source == target:
-        return program
+    return cache.convert(pipeline, program)
 
-    _warn_if_unsupported(source, "from")
-    _warn_if_unsupported(target, "to")
 
-    paths = graph.find_top_shortest_conversion_paths(source, target, top_n=max_path_attempts)
+def _convert_chunk(
+    pipeline: ConversionPipeline, programs: list[qbraid.programs.QPROGRAM]
+) -> list[Union[qbraid.programs.QPROGRAM, Exception]]:
+    """Convert a chunk of programs, returning each failure in place of its result."""
+    results: list[Union[qbraid.programs.QPROGRAM, Exception]] = []
+    for program in programs:
+        try:
+            results.append(pipeline(program))
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            results.append(err)
+    return results
 
-    if max_path_depth is not None:
-        paths = [path for path in paths if len(path) <= max_path_depth]
-        if len(paths) == 0:
-            raise ConversionPathNotFoundError(source, target, max_path_depth)
 
-    error_messages = []
+# pylint: disable-next=too-many-arguments,too-many-locals
+def transpile_batch(
+    programs: Sequence[qbraid.programs.QPROGRAM],
+    target: str,
+    conversion_graph: Optional[ConversionGraph] = None,
+    max_path_attempts: int = 3,
+    max_path_depth: Optional[int] = None,
+    copy_mode: str = "deep",
+    executor: Optional[Executor] = None,
+    chunksize: int = 1,
+    return_exceptions: bool = True,
+    **kwargs,
+) -> list[Union[qbraid.programs.QPROGRAM, Exception]]:
+    """
+    Transpile many quantum programs to a target language in parallel.
+
+    Programs are grouped by their program type, and the conversion paths for each group are
+    resolved once with :func:`compile_conversion`. The conversions themselves are then split
+    into chunks and distributed across ``executor``. Each program is converted exactly as
+    :func:`transpile` would convert it.
+
+    When using a process pool, the programs, the converted results, and the conversion
+    functions of the graph are pickled to be sent between processes. This holds for the
+    default conversion graph, but custom conversions defined with e.g. a ``lambda`` require
+    a thread pool instead.
 
-    for path in paths:
-        path_details = _get_path_from_bound_methods(path)
+    Args:
+        programs (Sequence[qbraid.programs.QPROGRAM]): The quantum programs to transpile.
+        target (str): The target language to transpile to.
+        conversion_graph (Optional[ConversionGraph]): The graph representing available conversions.
+            If None, the shared default graph for the given ``kwargs`` is used. Defaults to None.
+        max_path_attempts (int): The maximum number of conversion paths to attempt per program.
+            Defaults to 3.
+        max_path_depth (Optional[int]): The maximum depth of conversions within a given path to
+            allow. Defaults to None, i.e. no limit set on the path depth.
+        copy_mode (str): When to deep-copy each input program before attempting a path.
+            See :func:`transpile`. Defaults to "deep".
+        executor (Optional[Executor]): The executor used to run the conversions. If None, a
+            :class:`~concurrent.futures.ProcessPoolExecutor` is created for the duration of the
+            call. Pass an executor to reuse its workers across calls. Defaults to None.
+        chunksize (int): The number of programs of the same type sent to a worker at once.
+            Larger chunks reduce communication overhead for large batches of small programs.
+            Defaults to 1.
+        return_exceptions (bool): If True, a program that fails to convert is represented by
+            the exception it raised in the returned list. If False, a single
+            ProgramConversionError summarizing every failure is raised once all programs
+            have been processed. Defaults to True.
+
+    Returns:
+        list[Union[qbraid.programs.QPROGRAM, Exception]]: The transpiled programs, in the
+            same order as the input programs.
+
+    Raises:
+        ValueError: If ``chunksize`` is less than 1, or ``copy_mode`` is invalid.
+        NodeNotFoundError: If the target package is not in the ConversionGraph.
+        ProgramConversionError: If ``return_exceptions`` is False and any program fails to
+            convert.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+
+    graph, graph_type = _resolve_graph(conversion_graph, **kwargs)
+
+    if not graph.has_node(target):
+        raise NodeNotFoundError(graph_type, target, graph.nodes())
+
+    results: list[Union[qbraid.programs.QPROGRAM, Exception, None]] = [None] * len(programs)
+    groups: dict[str, list[int]] = defaultdict(list)
+
+    for index, program in enumerate(programs):
         try:
-            temp_program = deepcopy(program)
-        except (RecursionError, TypeError) as err:
-            logger.info(
-                "Deepcopy failed due to a %s, likely caused by the internal structure of "
-                "the %s object. Continuing execution, but any subsequent errors during "
-                "transpilation may be unclear or misleading due to potential side effects.",
-                type(err).__name__,
-                type(program),
+            groups[_get_program_type_alias(program)].append(index)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            results[index] = err
+
+    tasks: list[tuple[ConversionPipeline, list[int]]] = []
+
+    for source, indices in groups.items():
+        try:
+            pipeline = _compile_paths(
+                graph, graph_type, source, target, max_path_attempts, max_path_depth, copy_mode
             )
-            temp_program = program
+        except (NodeNotFoundError, ConversionPathNotFoundError) as err:
+            for index in indices:
+                results[index] = err
+            continue
+
+        if source == target:
+            for index in indices:
+                results[index] = programs[index]
+            continue
+
+        for start in range(0, len(indices), chunksize):
+            tasks.append((pipeline, indices[start : start + chunksize]))
+
+    if tasks:
+        pool = executor if executor is not None else ProcessPoolExecutor()
         try:
-            for convert_func in path:
+            futures = [
+                (pool.submit(_convert_chunk, pipeline, [programs[i] for i in indices]), indices)
+                for pipeline, indices in tasks
+            ]
+            for future, indices in futures:
                 try:
-                    temp_program = convert_func(temp_program)
+                    chunk_results = future.result()
                 except Exception as err:  # pylint: disable=broad-exception-caught
-                    alias = get_program_type_alias(temp_program, safe=True)
-                    error_detail = (
-                        f"Conversion {path_details} failed due to "
-                        f"exception raised while converting from '{alias}'."
-                    )
-                    error_messages.append(error_detail)
-                    error_messages.append(_format_exception(err))
-                    raise
-
-            logger.info("Successfully transpiled using conversions: %s", path_details)
-            return temp_program
-        except Exception as err:  # pylint: disable=broad-exception-caught
-            logger.info("Failed to transpile using conversions: %s", path_details)
-            formatted_error = _format_exception(err)
-            if len(error_messages) == 0 or error_messages[-1] != formatted_error:
-                error_messages.append(formatted_error)
-            continue
+                    chunk_results = [err] * len(indices)
+                for index, result in zip(indices, chunk_results):
+                    results[index] = result
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+    if not return_exceptions:
+        errors = [(i, err) for i, err in enumerate(results) if isinstance(err, Exception)]
+        if errors:
+            raise ProgramConversionError(
+                f"Failed to convert {len(errors)} of {len(programs)} program(s) to '{target}' "
+                "due to the following error(s):\n\n"
+                + "\n".join(f"[{index}] {_format_exception(err)}" for index, err in errors)
+            )
 
-    raise ProgramConversionError(
-        f"Failed to convert '{source}' to '{target}'"
-        + (
-            " due to the following error(s):\n\n" + "\n".join(error_messages)
-            if error_messages
-            else "."
-        )
-    )
+    return results
 
 
 def chain_calls(func: Callable[[Any, Any], Any], initial_value, *args, **kwargs) -> Any:
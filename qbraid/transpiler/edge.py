@@ -18,7 +18,6 @@ Module for defining custom conversions
 """
 from __future__ import annotations
 
-import importlib.util
 import inspect
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
@@ -26,6 +25,7 @@ import numpy as np
 
 from qbraid._logging import logger
 from qbraid.programs import QPROGRAM_REGISTRY, get_program_type_alias
+from qbraid.programs._import import _module_available
 
 if TYPE_CHECKING:
     import qbraid.programs
@@ -35,10 +35,10 @@ def _is_module_installed(module: str) -> bool:
     """
     Determine whether a module is installed and importable.
 
-    ``importlib.util.find_spec`` only returns None for the *leaf* of a dotted path; it
-    imports each ancestor along the way, and raises ModuleNotFoundError if one of them is
-    missing. A conversion requiring ``pytket.extensions.qiskit`` therefore raises, rather
-    than reporting unavailable, whenever pytket is installed without any of its extensions.
+    ``importlib.util.find_spec`` imports each ancestor of a dotted path, so checking for
+    ``pytket.extensions.qiskit`` would import pytket, and raise rather than report the module
+    unavailable whenever pytket is installed without any of its extensions. Instead, each
+    component of the path is located without importing any of them.
 
     Args:
         module (str): The (possibly dotted) name of the module to look for.
@@ -46,13 +46,10 @@ def _is_module_installed(module: str) -> bool:
     Returns:
         bool: True if the module can be located, otherwise False.
     """
-    try:
-        return importlib.util.find_spec(module) is not None
-    except (ImportError, ValueError) as err:
-        # ImportError: an ancestor package is not installed.
-        # ValueError: the module is in sys.modules, but has no __spec__.
-        logger.debug("Module '%s' is not available: %s", module, err)
-        return False
+    available = _module_available(module)
+    if not available:
+        logger.debug("Module '%s' is not available.", module)
+    return available
 
 
 class Conversion:
@@ -91,6 +88,7 @@ class Conversion:
         self._bias = bias if bias is not None else 0
         self._weight = self._get_adjusted_weight(weight)
         self._extras = getattr(conversion_func, "requires_extras", [])
+        self._non_mutating = getattr(conversion_func, "non_mutating", False)
         self._native = self._is_module_native(conversion_func)
         self._supported = self._is_conversion_supported()
 
@@ -124,6 +122,16 @@ class Conversion:
         """
         return self._native
 
+    @property
+    def non_mutating(self) -> bool:
+        """
+        True if the conversion function is declared to never modify its input program.
+
+        Returns:
+            bool: Whether the conversion function is safe to call without copying its input.
+        """
+        return self._non_mutating
+
     @property
     def supported(self) -> bool:
         """
@@ -183,10 +191,12 @@ class Conversion:
         Returns:
             bool: True if the module is 'qbraid' and requires no extras, False otherwise.
         """
+        # Lazily loaded conversion functions name a module that may not be imported yet.
         module = inspect.getmodule(func)
+        module_name = module.__name__ if module is not None else getattr(func, "__module__", None)
         is_native = (
-            module is not None
-            and module.__name__.split(".")[0] == "qbraid"
+            module_name is not None
+            and module_name.split(".")[0] == "qbraid"
             and len(self._extras) == 0
             and getattr(func, "weight", None) is not None
         )
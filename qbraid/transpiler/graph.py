@@ -17,17 +17,22 @@ Module providing tools to map, analyze, and visualize conversion paths between d
 quantum programs available through the qbraid.transpiler using directed graphs.
 
 """
+import heapq
+import os
+import threading
 from collections import deque
 from importlib import import_module
 from typing import Any, Callable, Optional, Union
 
 import rustworkx as rx
 
+from qbraid._caching import _CACHE_REGISTRY
 from qbraid.programs.exceptions import PackageValueError
 from qbraid.programs.experiment import ExperimentType
 from qbraid.programs.registry import (
     QPROGRAM_ALIASES,
     get_native_experiment_type,
+    get_registry_version,
     is_registered_alias_native,
 )
 
@@ -85,6 +90,95 @@ def parse_conversion_path(conv_repr: str) -> list[tuple[str, str]]:
     return conversions
 
 
+_RANKED_PATHS_PER_PAIR = 3
+"""Number of alternative paths ranked per node pair when the path table is built."""
+
+
+def _weighted_adjacency(graph: rx.PyDiGraph) -> dict[int, list[tuple[int, float]]]:
+    """Map each node index of a conversion graph to its ``(successor, edge weight)`` pairs."""
+    adjacency = {node_id: [] for node_id in graph.node_indices()}
+    for source_id, target_id, data in graph.weighted_edge_list():
+        adjacency[source_id].append((target_id, data["weight"]))
+    return adjacency
+
+
+def _lightest_simple_path(
+    adjacency: dict[int, list[tuple[int, float]]],
+    source: int,
+    target: int,
+    blocked_nodes: set[int],
+    blocked_edges: set[tuple[int, int]],
+) -> Optional[tuple[tuple[int, float], list[int]]]:
+    """
+    Find the path from ``source`` to ``target`` with the lowest ``(depth, weight)`` cost.
+
+    Nodes in ``blocked_nodes`` and edges in ``blocked_edges`` are skipped. Returns the
+    cost and node indices of the path, or None if the target is unreachable.
+    """
+    heap = [((0, 0.0), source, [source])]
+    settled = set()
+    while heap:
+        cost, node, path = heapq.heappop(heap)
+        if node == target:
+            return cost, path
+        if node in settled:
+            continue
+        settled.add(node)
+        for successor, weight in adjacency[node]:
+            if (
+                successor in settled
+                or successor in blocked_nodes
+                or (node, successor) in blocked_edges
+            ):
+                continue
+            heapq.heappush(heap, ((cost[0] + 1, cost[1] + weight), successor, path + [successor]))
+    return None
+
+
+def _k_shortest_simple_paths(
+    adjacency: dict[int, list[tuple[int, float]]], source: int, target: int, k: int
+) -> list[list[int]]:
+    """
+    Return up to ``k`` simple paths between two nodes, ordered by depth and then weight.
+
+    Uses Yen's algorithm, so the cost grows with ``k`` and the graph size rather than with
+    the total number of simple paths between the nodes.
+    """
+    if source == target:
+        return []
+    first = _lightest_simple_path(adjacency, source, target, set(), set())
+    if first is None:
+        return []
+
+    weights = {
+        (node, successor): weight
+        for node, successors in adjacency.items()
+        for successor, weight in successors
+    }
+    found = [first]
+    candidates: list[tuple[tuple[int, float], list[int]]] = []
+    seen = {tuple(first[1])}
+    while len(found) < k:
+        last_path = found[-1][1]
+        for i in range(len(last_path) - 1):
+            root = last_path[: i + 1]
+            blocked_edges = {(path[i], path[i + 1]) for _, path in found if path[: i + 1] == root}
+            spur = _lightest_simple_path(adjacency, root[-1], target, set(root[:-1]), blocked_edges)
+            if spur is None:
+                continue
+            spur_cost, spur_path = spur
+            path = root[:-1] + spur_path
+            if tuple(path) in seen:
+                continue
+            seen.add(tuple(path))
+            root_weight = sum(weights[(root[j], root[j + 1])] for j in range(i))
+            heapq.heappush(candidates, ((i + spur_cost[0], root_weight + spur_cost[1]), path))
+        if not candidates:
+            break
+        found.append(heapq.heappop(candidates))
+    return [path for _, path in found]
+
+
 # pylint: disable-next=too-many-public-methods
 class ConversionGraph(rx.PyDiGraph):
     """
@@ -131,6 +225,10 @@ class ConversionGraph(rx.PyDiGraph):
         self._node_alias_id_map: dict[str, int] = {}
         self._include_isolated = include_isolated
         self._init_nodes = set(nodes) if nodes is not None else set()
+        self._version = 0
+        self._path_table_stamp: Optional[tuple[int, int, int]] = None
+        self._shortest_paths: dict[tuple[int, int], tuple[list[int], int, float]] = {}
+        self._ranked_paths: dict[tuple[int, int], list[list[int]]] = {}
         self._validate_init_nodes()
         self.create_conversion_graph()
 
@@ -164,6 +262,9 @@ class ConversionGraph(rx.PyDiGraph):
         """
         Create a list of default conversion nodes using predefined conversion functions.
 
+        Conversions are built from the static manifest of conversion functions, and each
+        function's module is only imported when the conversion is first executed.
+
         Returns:
             list[Conversion]: List of default conversion edges.
         """
@@ -180,7 +281,7 @@ class ConversionGraph(rx.PyDiGraph):
 
         def construct_conversion(name: list[str, str]) -> Conversion:
             source, target = name
-            conversion_func = getattr(transpiler, f"{source}_to_{target}")
+            conversion_func = transpiler.get_conversion_function(f"{source}_to_{target}")
             return Conversion(source, target, conversion_func, bias=bias)
 
         return [construct_conversion(conversion) for conversion in registered_conversion_pairs]
@@ -206,7 +307,7 @@ class ConversionGraph(rx.PyDiGraph):
 
         if self._include_isolated:
             nodes = nodes or QPROGRAM_ALIASES
-            for alias in nodes:
+            for alias in list(nodes):
                 if alias not in self._node_alias_id_map and (
                     not self.require_native or is_registered_alias_native(alias)
                 ):
@@ -279,6 +380,7 @@ class ConversionGraph(rx.PyDiGraph):
                 break
 
         self._conversions.append(edge)
+        self._version += 1
 
         if source not in self._node_alias_id_map:
             self._node_alias_id_map[source] = self.add_node(source)
@@ -302,6 +404,79 @@ class ConversionGraph(rx.PyDiGraph):
             for conv in self._conversions.copy()
             if not (conv.source == source and conv.target == target)
         ]
+        self._version += 1
+
+    def _path_table(self) -> dict[tuple[int, int], tuple[list[int], int, float]]:
+        """
+        Return the all-pairs table of shortest conversion paths, rebuilding it if stale.
+
+        The table maps each reachable ``(source_id, target_id)`` node index pair to the
+        minimum-weight path between them, together with that path's depth (number of
+        conversions) and total edge weight. It is computed lazily on first use and reused
+        until the graph is modified, which is detected by comparing the graph's
+        :attr:`version` and its node and edge counts (the latter also catching edits
+        made through the underlying rustworkx API). The top :data:`_RANKED_PATHS_PER_PAIR`
+        alternative paths of every reachable pair are ranked alongside it and share its
+        lifetime.
+
+        Returns:
+            dict[tuple[int, int], tuple[list[int], int, float]]: The shortest path table.
+        """
+        stamp = (self._version, self.num_nodes(), self.num_edges())
+        if self._path_table_stamp == stamp:
+            return self._shortest_paths
+
+        shortest_paths = {}
+        all_pairs = rx.all_pairs_dijkstra_shortest_paths(self, lambda edge: edge["weight"])
+        for source_id, paths in all_pairs.items():
+            for target_id, path in paths.items():
+                path = list(path)
+                weight = sum(
+                    self.get_edge_data(path[i], path[i + 1])["weight"] for i in range(len(path) - 1)
+                )
+                shortest_paths[(source_id, target_id)] = (path, len(path) - 1, weight)
+
+        adjacency = _weighted_adjacency(self)
+        self._ranked_paths = {
+            key: _k_shortest_simple_paths(adjacency, *key, _RANKED_PATHS_PER_PAIR)
+            for key in shortest_paths
+        }
+        self._shortest_paths = shortest_paths
+        self._path_table_stamp = stamp
+        return shortest_paths
+
+    def _ranked_path_ids(self, source_id: int, target_id: int, top_n: int) -> list[list[int]]:
+        """
+        Return up to ``top_n`` simple paths between two nodes, ordered by depth and then weight.
+
+        Paths come from the ranked table built with :meth:`_path_table`. Requests for more
+        paths than the table holds extend that pair's entry in place, so each pair is only
+        ranked as deeply as it has been queried per version of the graph.
+        """
+        self._path_table()
+        key = (source_id, target_id)
+        ranked = self._ranked_paths.get(key, [])
+        if len(ranked) < top_n and len(ranked) >= _RANKED_PATHS_PER_PAIR:
+            ranked = _k_shortest_simple_paths(_weighted_adjacency(self), *key, top_n)
+            self._ranked_paths[key] = ranked
+        return ranked[:top_n]
+
+    def _path_weight(self, path: list[int]) -> float:
+        """Sum the edge weights along a path of node indices."""
+        return sum(self.get_edge_data(path[i], path[i + 1])["weight"] for i in range(len(path) - 1))
+
+    def _path_funcs(self, path: list[int]) -> list[Callable]:
+        """Map a path of node indices to the conversion functions along its edges."""
+        return [self.get_edge_data(path[i], path[i + 1])["func"] for i in range(len(path) - 1)]
+
+    def _path_depth_and_weight(self, source: str, target: str) -> Optional[tuple[int, float]]:
+        """Return the depth and weight of the shortest path between two nodes, if any."""
+        source_id = self._node_alias_id_map.get(source)
+        target_id = self._node_alias_id_map.get(target)
+        if source_id is None or target_id is None:
+            return None
+        entry = self._path_table().get((source_id, target_id))
+        return None if entry is None else entry[1:]
 
     def find_shortest_conversion_path(self, source: str, target: str) -> list[Callable]:
         """
@@ -318,23 +493,14 @@ class ConversionGraph(rx.PyDiGraph):
         Raises:
             ValueError: If no path is found between source and target.
         """
-        path = rx.dijkstra_shortest_paths(
-            self,
-            self._node_alias_id_map[source],
-            target=self._node_alias_id_map[target],
-            weight_fn=lambda edge: edge["weight"],
+        entry = self._path_table().get(
+            (self._node_alias_id_map[source], self._node_alias_id_map[target])
         )
 
-        if len(path) == 0:
+        if entry is None:
             raise ConversionPathNotFoundError(source, target)
 
-        return [
-            self.get_edge_data(
-                path[self._node_alias_id_map[target]][i],
-                path[self._node_alias_id_map[target]][i + 1],
-            )["func"]
-            for i in range(len(path[self._node_alias_id_map[target]]) - 1)
-        ]
+        return self._path_funcs(entry[0])
 
     def find_top_shortest_conversion_paths(
         self, source: str, target: str, top_n: int = 3
@@ -342,6 +508,9 @@ class ConversionGraph(rx.PyDiGraph):
         """
         Find the top shortest conversion paths between two nodes in a graph.
 
+        Paths are ranked by depth (number of conversions), with ties broken by the
+        total weight of the path's edges.
+
         Args:
             source (str): The starting node for the path.
             target (str): The target node for the path.
@@ -353,19 +522,14 @@ class ConversionGraph(rx.PyDiGraph):
         Raises:
             ConversionPathNotFoundError: If no path is found between source and target.
         """
-        all_paths = rx.all_simple_paths(
-            self, self._node_alias_id_map[source], self._node_alias_id_map[target]
+        ranked_paths = self._ranked_path_ids(
+            self._node_alias_id_map[source], self._node_alias_id_map[target], top_n
         )
 
-        # rx.all_simple_paths returns an empty list if no path is found
-        if len(all_paths) == 0:
+        if len(ranked_paths) == 0:
             raise ConversionPathNotFoundError(source, target)
 
-        sorted_paths = sorted(all_paths, key=len)[:top_n]
-        return [
-            [self.get_edge_data(path[i], path[i + 1])["func"] for i in range(len(path) - 1)]
-            for path in sorted_paths
-        ]
+        return [self._path_funcs(path) for path in ranked_paths]
 
     def has_path(self, source: str, target: str) -> bool:
         """
@@ -381,13 +545,7 @@ class ConversionGraph(rx.PyDiGraph):
         if source == target:
             return True
 
-        source_node = self._node_alias_id_map.get(source)
-        target_node = self._node_alias_id_map.get(target)
-
-        if source_node is None or target_node is None:
-            return False
-
-        return rx.has_path(self, source_node, target_node)
+        return self._path_depth_and_weight(source, target) is not None
 
     def shortest_path(self, source: str, target: str) -> str:
         """
@@ -425,41 +583,30 @@ class ConversionGraph(rx.PyDiGraph):
         return [_get_path_from_bound_methods(path) for path in paths]
 
     @staticmethod
-    def _calculate_depth_and_weight(
-        path: str, conv_weights: dict[tuple[str, str], int]
-    ) -> tuple[int, int]:
-        """Calculate the depth and weight of a given path."""
-        conv_nodes = path.split(" -> ")
-        conv_pairs = list(zip(conv_nodes, conv_nodes[1:]))
-        depth = len(conv_pairs)
-        weight = sum(conv_weights.get(pair, 0) for pair in conv_pairs)
-        return depth, weight
-
-    def _find_closest(
-        self,
+    def _get_sorted_closest(
         pivot: str,
-        candidates: list[str],
-        has_path_func: Callable[[str, str], Optional[str]],
-        shortest_path_func: Callable[[str, str], str],
-    ) -> Optional[str]:
-        """Find the closest item in candidates to/from pivot based on conversion paths."""
-        closest = None
-        min_depth = float("inf")
-        min_weight = float("inf")
-
-        conv_weights = {(conv.source, conv.target): conv.weight for conv in self.conversions()}
-
-        for candidate in candidates:
-            if has_path_func(pivot, candidate):
-                path = shortest_path_func(pivot, candidate)
-                depth, weight = self._calculate_depth_and_weight(path, conv_weights)
+        items: list[str],
+        depth_and_weight_func: Callable[[str, str], Optional[tuple[int, float]]],
+    ) -> list[str]:
+        """
+        Sort a list of items from closest to least close based on conversion paths.
 
-                if (depth < min_depth) or (depth == min_depth and weight < min_weight):
-                    min_depth = depth
-                    min_weight = weight
-                    closest = candidate
+        Items are ordered by the depth and then the weight of their shortest path to/from
+        the pivot, with the pivot itself first. The sort is stable, so equally close items
+        keep their relative order, and items without a conversion path are appended at the
+        end in their original order.
+        """
+        reachable = []
+        unreachable = []
+        for item in items:
+            distance = (0, 0.0) if item == pivot else depth_and_weight_func(pivot, item)
+            if distance is None:
+                unreachable.append(item)
+            else:
+                reachable.append((distance, item))
 
-        return closest
+        reachable.sort(key=lambda pair: pair[0])
+        return [item for _, item in reachable] + unreachable
 
     def closest_target(self, source: str, targets: list[str]) -> Optional[str]:
         """
@@ -477,9 +624,10 @@ class ConversionGraph(rx.PyDiGraph):
                 from the source or has higher weights in tie cases. Returns `None` if no
                 conversion paths are available.
         """
-        if source in targets:
-            return source
-        return self._find_closest(source, targets, self.has_path, self.shortest_path)
+        sorted_targets = self.get_sorted_closest_targets(source, targets)
+        if sorted_targets and self.has_path(source, sorted_targets[0]):
+            return sorted_targets[0]
+        return None
 
     def closest_source(self, target: str, sources: list[str]) -> Optional[str]:
         """
@@ -497,32 +645,10 @@ class ConversionGraph(rx.PyDiGraph):
                 to the target or has higher weights in tie cases. Returns `None` if no
                 conversion paths are available.
         """
-        if target in sources:
-            return target
-        return self._find_closest(
-            target,
-            sources,
-            lambda tgt, src: self.has_path(src, tgt),
-            lambda tgt, src: self.shortest_path(src, tgt),
-        )
-
-    @staticmethod
-    def _get_sorted_closest(
-        pivot: str, items: list[str], closest_func: Callable[[str, list[str]], Optional[str]]
-    ) -> list[str]:
-        """Sort a list of items from closest to least close based on conversion paths."""
-        sorted_items = []
-        remaining = items.copy()
-
-        while remaining:
-            closest = closest_func(pivot, remaining)
-            if closest is None:
-                sorted_items.extend(remaining)
-                break
-            sorted_items.append(closest)
-            remaining.remove(closest)
-
-        return sorted_items
+        sorted_sources = self.get_sorted_closest_sources(target, sources)
+        if sorted_sources and self.has_path(sorted_sources[0], target):
+            return sorted_sources[0]
+        return None
 
     def get_sorted_closest_targets(self, source: str, targets: list[str]) -> list[str]:
         """
@@ -537,7 +663,7 @@ class ConversionGraph(rx.PyDiGraph):
             list[str]: A list of target aliases ordered by proximity to the source,
                     with unreachable targets appended at the end.
         """
-        return self._get_sorted_closest(source, targets, self.closest_target)
+        return self._get_sorted_closest(source, targets, self._path_depth_and_weight)
 
     def get_sorted_closest_sources(self, target: str, sources: list[str]) -> list[str]:
         """
@@ -552,7 +678,9 @@ class ConversionGraph(rx.PyDiGraph):
             list[str]: A list of source aliases ordered by proximity to the target,
                     with unreachable sources appended at the end.
         """
-        return self._get_sorted_closest(target, sources, self.closest_source)
+        return self._get_sorted_closest(
+            target, sources, lambda tgt, src: self._path_depth_and_weight(src, tgt)
+        )
 
     def get_node_experiment_types(self) -> dict[str, ExperimentType]:
         """
@@ -607,8 +735,19 @@ class ConversionGraph(rx.PyDiGraph):
         self.clear()
         self._conversions = conversions or self.load_default_conversions()
         self._node_alias_id_map = {}
+        self._version += 1
         self.create_conversion_graph()
 
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented each time the conversions of this graph are modified.
+
+        Returns:
+            int: The current version of the graph.
+        """
+        return self._version
+
     def copy(self):
         """
         Create a copy of this graph, returning a new instance of ConversionGraph.
@@ -623,6 +762,25 @@ class ConversionGraph(rx.PyDiGraph):
             nodes=self._init_nodes,
         )
 
+    def _copy_with_path_tables(self) -> "ConversionGraph":
+        """
+        Create a copy of this graph that reuses its path tables instead of recomputing them.
+
+        The tables are keyed by node index, so they are only handed over if the copy assigned
+        the same index to every node and edge. Each graph rebuilds its own tables as soon as
+        it is modified, so changes to either graph never leak into the other.
+        """
+        graph = self.copy()
+        shortest_paths = self._path_table()
+        if (
+            graph._node_alias_id_map == self._node_alias_id_map
+            and graph.edge_list() == self.edge_list()
+        ):
+            graph._shortest_paths = shortest_paths
+            graph._ranked_paths = self._ranked_paths
+            graph._path_table_stamp = (graph._version, graph.num_nodes(), graph.num_edges())
+        return graph
+
     def subgraph(
         self, experiment_type: Union[ExperimentType, list[ExperimentType]]
     ) -> "ConversionGraph":
@@ -686,3 +844,78 @@ class ConversionGraph(rx.PyDiGraph):
         from qbraid.visualization.plot_conversions import plot_conversion_graph
 
         plot_conversion_graph(self, **kwargs)
+
+
+_DEFAULT_GRAPH_CACHE: dict[tuple, tuple[int, int, ConversionGraph]] = {}
+_DEFAULT_GRAPH_LOCK = threading.Lock()
+
+
+def get_default_graph(
+    require_native: bool = False,
+    include_isolated: bool = True,
+    edge_bias: Optional[float] = None,
+    nodes: Optional[Union[list[str], set[str]]] = None,
+) -> ConversionGraph:
+    """
+    Return a process-wide, shared ConversionGraph built from the default conversions.
+
+    Building the default graph loads every registered conversion function, probes the
+    environment for each conversion's optional dependencies, and constructs the underlying
+    rustworkx graph. Graphs are therefore memoized by their construction arguments and
+    reused across calls. A cached graph is rebuilt if a program type has since been
+    (un)registered, or if the cached instance itself was modified, e.g. via
+    :meth:`ConversionGraph.add_conversion`.
+
+    The returned graph is shared, so callers that intend to modify it should operate on
+    a :meth:`ConversionGraph.copy`. Setting the ``DISABLE_CACHE`` environment variable
+    to ``"1"`` bypasses the cache and returns a freshly built graph.
+
+    Args:
+        require_native (bool): If True, only include "native" conversion functions.
+            Defaults to False.
+        include_isolated (bool): If True, includes all registered program type aliases, even
+            those that are not connected to any other nodes in the graph. Defaults to True.
+        edge_bias (float, optional): Factor used to fine-tune the edge weight calculations.
+            Defaults to 0.25.
+        nodes (list[str], optional): List of nodes to include in the graph.
+
+    Returns:
+        ConversionGraph: The default conversion graph for the given arguments.
+    """
+    kwargs = {
+        "require_native": require_native,
+        "include_isolated": include_isolated,
+        "edge_bias": edge_bias,
+        "nodes": nodes,
+    }
+
+    if os.getenv("DISABLE_CACHE") == "1":
+        return ConversionGraph(**kwargs)
+
+    key = (
+        require_native,
+        include_isolated,
+        edge_bias if edge_bias is not None else 0.25,
+        frozenset(nodes) if nodes is not None else None,
+    )
+
+    with _DEFAULT_GRAPH_LOCK:
+        registry_version = get_registry_version()
+        entry = _DEFAULT_GRAPH_CACHE.get(key)
+        if entry is not None:
+            built_registry_version, built_graph_version, graph = entry
+            if built_registry_version == registry_version and built_graph_version == graph.version:
+                return graph
+
+        graph = ConversionGraph(**kwargs)
+        _DEFAULT_GRAPH_CACHE[key] = (registry_version, graph.version, graph)
+        return graph
+
+
+def clear_default_graph_cache() -> None:
+    """Discard all memoized default conversion graphs."""
+    with _DEFAULT_GRAPH_LOCK:
+        _DEFAULT_GRAPH_CACHE.clear()
+
+
+_CACHE_REGISTRY.append(clear_default_graph_cache)
@@ -18,17 +18,80 @@ Module for managing conversion configurations for quantum runtime.
 """
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import os
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass, field, fields
 from typing import TYPE_CHECKING, Any, Optional, Union
 
+from qbraid._caching import _CACHE_REGISTRY
+from qbraid.programs.registry import get_registry_version
 from qbraid.programs.spec import ProgramSpec
 
-from .graph import ConversionGraph, parse_conversion_path
+from .cache import ConversionCache
+from .graph import ConversionGraph, get_default_graph
 
 if TYPE_CHECKING:
     import rustworkx as rx
 
 
+def _bfs_distances(
+    neighbors: Mapping[str, list[str]],
+    sources: Collection[str],
+    max_depth: int,
+    blocked: Collection[str] = (),
+) -> dict[str, int]:
+    """Return the distance of each node within ``max_depth`` edges of the sources, found by
+    following ``neighbors`` breadth-first without entering any of the blocked nodes."""
+    if max_depth < 0:
+        return {}
+
+    distances = {node: 0 for node in sources if node not in blocked}
+    frontier = list(distances)
+    for depth in range(1, max_depth + 1):
+        next_frontier = []
+        for node in frontier:
+            for neighbor in neighbors.get(node, ()):
+                if neighbor not in distances and neighbor not in blocked:
+                    distances[neighbor] = depth
+                    next_frontier.append(neighbor)
+        if not next_frontier:
+            break
+        frontier = next_frontier
+    return distances
+
+
+def _target_edge_on_path(
+    predecessors: Mapping[str, list[str]],
+    targets: set[str],
+    edge: tuple[str, str],
+    max_steps: int,
+) -> bool:
+    """Determine whether an edge leaving a target node can lie on a path of at most
+    ``max_steps`` edges from a non-target node to a target node.
+
+    The edge is kept if the nearest non-target node that reaches its source, plus the edge,
+    plus the distance from its head to a target without returning to the source, fits
+    within ``max_steps``. Both distances come from breadth-first searches, so the check is
+    polynomial. Deciding whether the two halves can also be made vertex-disjoint is NP-hard
+    on directed graphs, so an edge is occasionally kept that only lies on non-simple paths.
+    Graphs built by :meth:`ConversionScheme.update_graph_for_target` have no edges leaving
+    target nodes.
+    """
+    src, tgt = edge
+
+    dist_from_source = _bfs_distances(predecessors, [src], max_steps - 1, {tgt})
+    min_prefix = min(
+        (depth for node, depth in dist_from_source.items() if node not in targets), default=None
+    )
+    if min_prefix is None:
+        return False
+
+    dist_to_target = _bfs_distances(predecessors, targets, max_steps - 1 - min_prefix, {src})
+    return tgt in dist_to_target and min_prefix + 1 + dist_to_target[tgt] <= max_steps
+
+
 @dataclass
 class ConversionScheme:
     """
@@ -44,6 +107,9 @@ class ConversionScheme:
             Defaults to None, meaning no limit.
         extra_kwargs (dict[str, Any]): A dictionary to hold any additional keyword arguments that
             users want to pass to the transpile function at runtime.
+        cache (Optional[ConversionCache]): A cache of previous conversion results, reused when
+            an identical program is transpiled to the same target. Defaults to None, meaning
+            every program is converted.
 
     Methods:
         to_dict: Converts the conversion scheme to a flat dictionary suitable for passing as kwargs.
@@ -54,6 +120,7 @@ class ConversionScheme:
     max_path_attempts: int = 3
     max_path_depth: Optional[int] = None
     extra_kwargs: dict[str, Any] = field(default_factory=dict)
+    cache: Optional[ConversionCache] = None
 
     def __str__(self):
         kwargs_str = ", ".join(f"{key}={value}" for key, value in self.extra_kwargs.items())
@@ -68,13 +135,19 @@ class ConversionScheme:
         """
         Convert the ConversionScheme fields to a flat dictionary suitable for passing as kwargs.
 
+        The :attr:`cache` is not included, so the dictionary can be reported as device
+        metadata. Pass it to :func:`~qbraid.transpiler.transpile` separately.
+
         Returns:
             A dictionary with all fields ready to be passed as keyword arguments,
             including nested extra_kwargs.
         """
-        scheme = asdict(self)
-        scheme.update(scheme.pop("extra_kwargs", {}))
-        scheme.update({"conversion_graph": self.conversion_graph})
+        scheme = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in ("extra_kwargs", "cache")
+        }
+        scheme.update(self.extra_kwargs)
         return scheme
 
     def update_values(self, **kwargs) -> None:
@@ -150,6 +223,13 @@ class ConversionScheme:
         """
         Prune edges that do not contribute to paths within n steps of any of the target nodes.
 
+        An edge is kept if it lies on a simple path of at most ``n_steps`` conversions that
+        starts at a non-target node and ends at a target node. Rather than enumerating every
+        such path, which takes exponential time on densely connected graphs, edges are checked
+        against depth-bounded breadth-first searches from the target nodes. Edges leaving a
+        target node are checked by distance alone, so a few that only lie on paths revisiting
+        a node may be kept.
+
         Args:
             graph (ConversionGraph): The graph to prune
             target_nodes (List[str]): The list of node indices to center the pruning around
@@ -160,30 +240,48 @@ class ConversionScheme:
         """
         graph = graph.copy()
 
-        all_nodes: set[str] = set(graph.nodes())
-        target_set: set[str] = set(target_nodes)
-        sources: set[str] = all_nodes - target_set
-        all_used_paths: set[tuple[str, str]] = set()
-
-        # Collect all paths within n_steps for each target node
-        for target_node in target_nodes:
-            for source in sources:
-                if graph.has_path(source, target_node):
-                    for path_str in graph.all_paths(source, target_node):
-                        path_tuple_lst = parse_conversion_path(path_str)
-                        if n_steps is None or len(path_tuple_lst) <= n_steps:
-                            all_used_paths.update(path_tuple_lst)
+        graph_nodes: list[str] = graph.nodes()
+        target_set: set[str] = set(target_nodes).intersection(graph_nodes)
+        max_steps = len(graph_nodes) if n_steps is None else n_steps
 
         # Create a mapping from node IDs to aliases
         node_id_to_alias = {value: key for key, value in graph._node_alias_id_map.items()}
 
-        # Prune edges not in used paths
-        for edge in graph.edge_list():
-            src_node_id, target_node_id = edge
+        edges: list[tuple[str, str]] = []
+        successors: dict[str, list[str]] = defaultdict(list)
+        predecessors: dict[str, list[str]] = defaultdict(list)
+        for src_node_id, target_node_id in graph.edge_list():
             src_node_alias = node_id_to_alias[src_node_id]
             target_node_alias = node_id_to_alias[target_node_id]
+            edges.append((src_node_alias, target_node_alias))
+            successors[src_node_alias].append(target_node_alias)
+            predecessors[target_node_alias].append(src_node_alias)
 
-            if (src_node_alias, target_node_alias) not in all_used_paths:
+        distances = _bfs_distances(predecessors, target_set, max_steps - 1)
+        distances_avoiding: dict[str, dict[str, int]] = {}
+
+        def contributes(src: str, tgt: str) -> bool:
+            if src == tgt or tgt not in distances:
+                return False
+
+            if src in target_set:
+                return _target_edge_on_path(predecessors, target_set, (src, tgt), max_steps)
+
+            # A path through (src, tgt) may as well start at src, so the edge is used iff tgt
+            # reaches a target without revisiting src. That holds for every shortest path from
+            # tgt unless src is strictly closer to the targets than tgt is.
+            if distances.get(src, max_steps) >= distances[tgt]:
+                return True
+
+            if src not in distances_avoiding:
+                distances_avoiding[src] = _bfs_distances(
+                    predecessors, target_set, max_steps - 1, blocked={src}
+                )
+            return tgt in distances_avoiding[src]
+
+        # Prune edges not in used paths
+        for src_node_alias, target_node_alias in edges:
+            if not contributes(src_node_alias, target_node_alias):
                 graph.remove_conversion(src_node_alias, target_node_alias)
 
         return graph
@@ -194,18 +292,50 @@ class ConversionScheme:
 
     def update_graph_for_target(self, target_spec: Union[ProgramSpec, list[ProgramSpec]]) -> None:
         """Update the conversion graph to include only nodes with paths to the target node(s), and
-        remove all conversions that do not end in the target node(s)."""
-        graph = (
-            self.conversion_graph.copy()
-            if self.conversion_graph
-            else ConversionGraph(include_isolated=True)
-        )
+        remove all conversions that do not end in the target node(s).
 
-        target_nodes = {
+        The pruned graph is memoized by the contents of the current graph, the target aliases,
+        and ``max_path_depth``, so devices sharing a program spec prune the graph and compute its
+        conversion paths only once. Each scheme is given its own copy of the memoized graph, which
+        reuses those paths until it is modified, so changes made through one device's scheme do
+        not affect any other. Setting the ``DISABLE_CACHE`` environment variable to ``"1"``
+        bypasses the cache."""
+        graph = self.conversion_graph or get_default_graph(include_isolated=True)
+
+        target_nodes = frozenset(
             spec.alias for spec in (target_spec if isinstance(target_spec, list) else [target_spec])
-        }
+        )
+
+        graph_key = None if os.getenv("DISABLE_CACHE") == "1" else _graph_cache_key(graph)
+        if graph_key is None:
+            pruned_graph = self._build_target_graph(graph, target_nodes, self.max_path_depth)
+            self.update_values(conversion_graph=pruned_graph)
+            return
+
+        key = (graph_key, target_nodes, self.max_path_depth)
+
+        with _TARGET_GRAPH_LOCK:
+            entry = _TARGET_GRAPH_CACHE.get(key)
+            if entry is not None and entry[0] == entry[1].version:
+                _TARGET_GRAPH_CACHE.move_to_end(key)
+                cached_graph = entry[1]
+            else:
+                cached_graph = self._build_target_graph(graph, target_nodes, self.max_path_depth)
+                _TARGET_GRAPH_CACHE[key] = (cached_graph.version, cached_graph)
+                _TARGET_GRAPH_CACHE.move_to_end(key)
+                while len(_TARGET_GRAPH_CACHE) > _TARGET_GRAPH_CACHE_SIZE:
+                    _TARGET_GRAPH_CACHE.popitem(last=False)
 
-        nodes = self.find_nodes_reachable_within_max_edges(graph, target_nodes, self.max_path_depth)
+            pruned_graph = cached_graph._copy_with_path_tables()  # pylint: disable=protected-access
+
+        self.update_values(conversion_graph=pruned_graph)
+
+    @classmethod
+    def _build_target_graph(
+        cls, graph: ConversionGraph, target_nodes: frozenset[str], max_path_depth: Optional[int]
+    ) -> ConversionGraph:
+        """Build a new graph containing only the conversions on paths to the target node(s)."""
+        nodes = cls.find_nodes_reachable_within_max_edges(graph, target_nodes, max_path_depth)
 
         conversions = [conv for conv in graph.conversions() if conv.source not in target_nodes]
 
@@ -217,8 +347,40 @@ class ConversionScheme:
             nodes=nodes,
         )
 
-        pruned_graph = self.prune_graph_to_target_paths(
-            updated_graph, target_nodes, self.max_path_depth
-        )
+        return cls.prune_graph_to_target_paths(updated_graph, target_nodes, max_path_depth)
 
-        self.update_values(conversion_graph=pruned_graph)
+
+_TARGET_GRAPH_CACHE: OrderedDict[tuple, tuple[int, ConversionGraph]] = OrderedDict()
+_TARGET_GRAPH_CACHE_SIZE = 32
+_TARGET_GRAPH_LOCK = threading.Lock()
+
+
+def _graph_cache_key(graph: ConversionGraph) -> Optional[tuple]:
+    """Return a hashable key identifying the contents of a graph, or None if the graph holds
+    a conversion function that cannot be hashed."""
+    key = (
+        get_registry_version(),
+        graph.require_native,
+        graph._include_isolated,
+        graph.edge_bias,
+        frozenset(graph._init_nodes),
+        frozenset(graph.nodes()),
+        tuple(
+            (conv.source, conv.target, conv._conversion_func, conv.weight)
+            for conv in graph.conversions()
+        ),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def clear_target_graph_cache() -> None:
+    """Discard all memoized target-pruned conversion graphs."""
+    with _TARGET_GRAPH_LOCK:
+        _TARGET_GRAPH_CACHE.clear()
+
+
+_CACHE_REGISTRY.append(clear_target_graph_cache)
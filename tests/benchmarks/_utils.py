@@ -0,0 +1,43 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared helpers for performance benchmarks.
+
+Benchmarks are skipped by default. Run them with ``pytest tests/benchmarks --benchmark=true``
+(or ``QBRAID_RUN_BENCHMARKS=true``), adding ``-s`` to see the reported timings.
+
+"""
+import time
+from typing import Any, Callable
+
+
+def time_per_call(func: Callable[[], Any], number: int = 10, repeat: int = 3) -> float:
+    """Return the best-of-``repeat`` mean wall-clock time of ``func`` in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def report(name: str, before: float, after: float) -> None:
+    """Print a before/after comparison of per-call timings."""
+    speedup = before / after if after > 0 else float("inf")
+    print(
+        f"\n{name}: before={before * 1e3:.3f} ms/call, "
+        f"after={after * 1e3:.3f} ms/call ({speedup:.1f}x)"
+    )
@@ -0,0 +1,110 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for the hit and miss latency of qbraid._caching.cached_method.
+
+"""
+import pytest
+
+from qbraid._caching import _generate_cache_key, _json_cache_key, cached_method
+
+from ._utils import report, time_per_call
+
+pytestmark = pytest.mark.benchmark
+
+
+class Provider:
+    """Stand-in for a provider whose device lookups are cached."""
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+
+    def __hash__(self):
+        return hash(self.api_key)
+
+    def get_device(self, device_id: str) -> str:
+        """Return a device for the given ID."""
+        return device_id
+
+    @cached_method(maxsize=16)
+    def get_device_small(self, device_id: str) -> str:
+        """Cached lookup with a small cache."""
+        return device_id
+
+    @cached_method(maxsize=4096)
+    def get_device_large(self, device_id: str) -> str:
+        """Cached lookup with a large cache."""
+        return device_id
+
+
+def test_cache_key_generation():
+    """Compare the JSON digest cache key with the tuple cache key."""
+    provider = Provider("key")
+    args, kwargs = ("qbraid:qbraid:sim:qir-sv",), {"refresh": False}
+
+    before = time_per_call(
+        lambda: _json_cache_key(provider, "get_device", args, kwargs), number=10000
+    )
+    after = time_per_call(
+        lambda: _generate_cache_key(provider, "get_device", args, kwargs), number=10000
+    )
+
+    report("cache key generation", before, after)
+    assert after < before
+
+
+def test_cached_method_hit_latency(monkeypatch):
+    """Compare a cache hit with hashable vs. unhashable (JSON-keyed) arguments."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    provider = Provider("key")
+    device_ids = ["qbraid:qbraid:sim:qir-sv"]
+    provider.get_device_small(device_ids[0])
+    provider.get_device_small(device_ids)
+
+    before = time_per_call(lambda: provider.get_device_small(device_ids), number=10000)
+    after = time_per_call(lambda: provider.get_device_small(device_ids[0]), number=10000)
+
+    report("cached_method hit (json key -> tuple key)", before, after)
+    assert after < before
+    Provider.get_device_small.cache_clear()
+
+
+def test_cached_method_miss_latency_independent_of_maxsize(monkeypatch):
+    """Compare miss latency on a full cache of 16 vs. 4096 entries.
+
+    Eviction pops the oldest entry rather than scanning the cache, so a miss on a full
+    large cache costs about the same as a miss on a full small one.
+    """
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    provider = Provider("key")
+    counter = iter(range(10**9))
+
+    def miss_small():
+        provider.get_device_small(str(next(counter)))
+
+    def miss_large():
+        provider.get_device_large(str(next(counter)))
+
+    for _ in range(4096):
+        miss_small()
+        miss_large()
+
+    small = time_per_call(miss_small, number=5000)
+    large = time_per_call(miss_large, number=5000)
+
+    report("cached_method miss on full cache (maxsize 16 -> 4096)", small, large)
+    assert large < small * 3
+    Provider.get_device_small.cache_clear()
+    Provider.get_device_large.cache_clear()
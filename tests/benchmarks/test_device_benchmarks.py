@@ -0,0 +1,64 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for running batches of programs on a quantum device.
+
+"""
+import time
+
+import pytest
+
+from qbraid.programs import ExperimentType
+from qbraid.runtime import DeviceStatus, QuantumDevice, TargetProfile
+
+from ._utils import report, time_per_call
+
+pytestmark = pytest.mark.benchmark
+
+SUBMIT_LATENCY = 0.02
+TRANSFORM_TIME = 0.005
+
+
+class _LatencyDevice(QuantumDevice):
+    """Device with a CPU-bound transform and a submit call that waits on the network."""
+
+    def status(self):
+        return DeviceStatus.ONLINE
+
+    def transform(self, run_input):
+        end = time.perf_counter() + TRANSFORM_TIME
+        while time.perf_counter() < end:
+            pass
+        return run_input
+
+    def submit(self, run_input, *args, **kwargs):
+        time.sleep(SUBMIT_LATENCY * (len(run_input) if isinstance(run_input, list) else 1))
+        return run_input
+
+
+def test_run_batch_against_serial_run():
+    """Compare serial processing and submission with the pipelined batch run."""
+    device = _LatencyDevice(
+        TargetProfile(
+            device_id="latency-device", simulator=True, experiment_type=ExperimentType.GATE_MODEL
+        )
+    )
+    programs = [f"program{i}" for i in range(100)]
+
+    before = time_per_call(lambda: device.run(programs), number=1, repeat=1)
+    after = time_per_call(lambda: device.run_batch(programs, chunksize=10), number=1, repeat=2)
+
+    report("run 100 programs (serial run -> run_batch)", before, after)
+    assert after < before
@@ -0,0 +1,71 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for the cold-start import time of qbraid.
+
+"""
+import subprocess
+import sys
+
+import pytest
+
+from qbraid.programs._import import NATIVE_REGISTRY
+
+from ._utils import report
+
+pytestmark = pytest.mark.benchmark
+
+
+SDKS = ["cirq", "qiskit", "braket", "pytket", "pennylane", "pyquil", "cudaq", "qrisp"]
+
+
+def import_time(statement: str) -> tuple[float, set[str]]:
+    """Run ``statement`` in a fresh interpreter with ``python -X importtime``.
+
+    Returns the total cumulative import time in seconds of the top-level imports, and the
+    names of all imported modules.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0.0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):
+            total += int(cumulative) / 1e6
+    return total, modules
+
+
+def test_import_programs_without_sdks():
+    """Compare importing qbraid.programs against eagerly importing the installed SDKs."""
+    sdks = [sdk for sdk in SDKS if sdk in NATIVE_REGISTRY]
+    if not sdks:
+        pytest.skip("No quantum SDKs installed.")
+
+    before, _ = import_time("; ".join(f"import {sdk}" for sdk in sdks) + "; import qbraid.programs")
+    after, modules = import_time("import qbraid.programs")
+
+    report(f"import qbraid.programs ({', '.join(sdks)} installed)", before, after)
+    assert not set(sdks) & modules
+    assert after < before
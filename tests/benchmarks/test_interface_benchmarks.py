@@ -0,0 +1,92 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for circuit equivalence checking in qbraid.interface.
+
+"""
+import cirq
+import numpy as np
+import pytest
+import qiskit
+
+from qbraid.interface import circuits_allclose
+from qbraid.interface.circuit_equality import match_global_phase
+
+from ._utils import report, time_per_call
+
+pytestmark = pytest.mark.benchmark
+
+
+def _random_layers(num_qubits: int, depth: int, seed: int = 0):
+    """Return equivalent cirq and qiskit circuits of random rotation and CNOT layers."""
+    rng = np.random.default_rng(seed)
+    qubits = cirq.LineQubit.range(num_qubits)
+    cirq_circuit = cirq.Circuit()
+    qiskit_circuit = qiskit.QuantumCircuit(num_qubits)
+    for layer in range(depth):
+        for i, angle in enumerate(rng.uniform(0, 2 * np.pi, num_qubits)):
+            cirq_circuit.append(cirq.ry(angle).on(qubits[i]))
+            qiskit_circuit.ry(angle, i)
+        for i in range(layer % 2, num_qubits - 1, 2):
+            cirq_circuit.append(cirq.CNOT(qubits[i], qubits[i + 1]))
+            qiskit_circuit.cx(i, i + 1)
+    return cirq_circuit, qiskit_circuit
+
+
+@pytest.mark.parametrize("num_qubits", [6, 8, 10])
+def test_circuits_allclose_statevector_against_unitary(num_qubits):
+    """Compare checking equivalence with full unitaries vs. random product states."""
+    cirq_circuit, qiskit_circuit = _random_layers(num_qubits, depth=10)
+
+    before = time_per_call(lambda: circuits_allclose(cirq_circuit, qiskit_circuit), number=1)
+    after = time_per_call(
+        lambda: circuits_allclose(cirq_circuit, qiskit_circuit, method="statevector"), number=1
+    )
+
+    report(f"circuits_allclose ({num_qubits} qubits)", before, after)
+    assert circuits_allclose(cirq_circuit, qiskit_circuit, method="statevector")
+
+
+def test_circuits_allclose_statevector_16_qubits():
+    """Time the statevector check of 16-qubit circuits, whose unitaries would need 64 GiB."""
+    cirq_circuit, qiskit_circuit = _random_layers(16, depth=10)
+
+    after = time_per_call(
+        lambda: circuits_allclose(cirq_circuit, qiskit_circuit, method="statevector"),
+        number=1,
+        repeat=1,
+    )
+
+    print(f"\ncircuits_allclose statevector (16 qubits): {after * 1e3:.3f} ms/call")
+    assert circuits_allclose(cirq_circuit, qiskit_circuit, method="statevector")
+
+
+@pytest.mark.parametrize("dim", [2**6, 2**8, 2**10])
+def test_match_global_phase_argmax(dim):
+    """Compare finding the phase pivot by scanning indices in Python vs. with np.argmax."""
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+    b = a * np.exp(0.7j)
+
+    def python_scan():
+        k = max(np.ndindex(*a.shape), key=lambda t: abs(b[t]))
+        return a * a[k], b * b[k]
+
+    before = time_per_call(python_scan, number=1)
+    after = time_per_call(lambda: match_global_phase(a, b), number=1)
+
+    report(f"match_global_phase ({dim}x{dim})", before, after)
+    a_prime, b_prime = match_global_phase(a, b)
+    assert np.allclose(a_prime, b_prime)
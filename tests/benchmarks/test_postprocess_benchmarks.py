@@ -0,0 +1,69 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for formatting measurement counts.
+
+"""
+import random
+import warnings
+
+import pytest
+
+from qbraid.runtime.postprocess import _format_data_python, format_data
+
+from ._utils import report, time_per_call
+
+pytestmark = pytest.mark.benchmark
+
+
+def _random_counts(num_bits: int, num_keys: int, seed: int = 0) -> dict[str, int]:
+    """Counts for up to num_keys distinct random bitstrings of num_bits bits."""
+    rng = random.Random(seed)
+    return {
+        format(rng.getrandbits(num_bits), f"0{num_bits}b"): rng.randrange(1, 100)
+        for _ in range(num_keys)
+    }
+
+
+@pytest.mark.parametrize("num_bits", [10, 16, 22, 28])
+@pytest.mark.parametrize("decimal", [False, True])
+def test_format_counts_against_python(num_bits, decimal):
+    """Compare per-key and vectorized formatting of the nonzero counts."""
+    counts = _random_counts(num_bits, 100_000)
+
+    before = time_per_call(lambda: _format_data_python(counts, decimal=decimal), number=3)
+    after = time_per_call(lambda: format_data(counts, decimal=decimal), number=3)
+
+    report(f"format {len(counts)} counts, {num_bits} qubits, decimal={decimal}", before, after)
+    assert format_data(counts, decimal=decimal) == _format_data_python(counts, decimal=decimal)
+
+
+@pytest.mark.parametrize("num_bits", [10, 16, 20])
+@pytest.mark.parametrize("decimal", [False, True])
+def test_format_counts_include_zero_values_against_python(num_bits, decimal):
+    """Compare per-key and vectorized formatting of every state, including zero counts."""
+    counts = _random_counts(num_bits, 1_000)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        before = time_per_call(
+            lambda: _format_data_python(counts, include_zero_values=True, decimal=decimal),
+            number=1,
+        )
+        after = time_per_call(
+            lambda: format_data(counts, include_zero_values=True, decimal=decimal), number=1
+        )
+
+    report(f"format all states, {num_bits} qubits, decimal={decimal}", before, after)
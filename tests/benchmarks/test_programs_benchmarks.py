@@ -0,0 +1,184 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for program type detection, unitaries, circuit statistics, and gate counts
+in qbraid.programs.
+
+"""
+from unittest.mock import Mock
+
+import braket.circuits
+import cirq
+import numpy as np
+import pytest
+from openqasm3.parser import parse
+from pyqasm.analyzer import Qasm3Analyzer
+
+from qbraid.passes.qasm import normalize_qasm_gate_params
+from qbraid.programs import alias_manager, load_program
+from qbraid.programs.alias_manager import get_program_type_alias
+from qbraid.programs.gate_model import GateModelProgram
+from qbraid.programs.gate_model.cirq import CirqCircuit
+from qbraid.programs.gate_model.qasm3 import OpenQasm3Program
+from qbraid.programs.typer import extract_qasm_version
+from qbraid.transpiler import transpile
+
+from ._utils import report, time_per_call
+
+QASM3_LARGE = 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[2] q;\n' + "cx q[0], q[1];\n" * 5000
+
+IONQ_LARGE = {"qubits": 2, "circuit": [{"gate": "cnot", "control": 0, "target": 1}] * 5000}
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_qasm_version_header_scan():
+    """Compare reading the OpenQASM version from the header vs. the whole program."""
+    before = time_per_call(lambda: Qasm3Analyzer.extract_qasm_version(QASM3_LARGE), number=100)
+    after = time_per_call(lambda: extract_qasm_version(QASM3_LARGE), number=100)
+
+    report("extract_qasm_version (5000 gates)", before, after)
+    assert after < before
+
+
+def test_ionq_program_type_alias_memo():
+    """Compare IonQ program type alias lookup with a cold vs. warm alias memo."""
+
+    def cold():
+        alias_manager._ALIAS_CACHE_VERSION = None
+        get_program_type_alias(IONQ_LARGE)
+
+    before = time_per_call(cold, number=100)
+    after = time_per_call(lambda: get_program_type_alias(IONQ_LARGE), number=100)
+
+    report("get_program_type_alias (ionq, 5000 gates)", before, after)
+    assert after < before
+
+
+def _unitary_rev_qubits_loop(matrix: np.ndarray) -> np.ndarray:
+    """Element-by-element bit-reversal permutation, as unitary_rev_qubits was implemented."""
+    num_qubits = int(np.log2(matrix.shape[0]))
+    permuted_matrix = np.zeros((2**num_qubits, 2**num_qubits), dtype=complex)
+    for i in range(2**num_qubits):
+        for j in range(2**num_qubits):
+            bits_i = [((i >> bit) & 1) for bit in range(num_qubits)]
+            bits_j = [((j >> bit) & 1) for bit in range(num_qubits)]
+            reversed_i = sum(bit << (num_qubits - 1 - k) for k, bit in enumerate(bits_i))
+            reversed_j = sum(bit << (num_qubits - 1 - k) for k, bit in enumerate(bits_j))
+            permuted_matrix[reversed_i, reversed_j] = matrix[i, j]
+    return permuted_matrix
+
+
+def _random_matrix(num_qubits: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    dim = 2**num_qubits
+    return rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+
+
+@pytest.mark.parametrize("num_qubits", [4, 6, 8, 10])
+def test_unitary_rev_qubits_against_loop(num_qubits):
+    """Compare the element-wise loop and the tensor axis reversal of unitary_rev_qubits."""
+    matrix = _random_matrix(num_qubits)
+    program = Mock(spec=GateModelProgram, _unitary=lambda: matrix)
+    number = 1 if num_qubits >= 8 else 3
+
+    before = time_per_call(lambda: _unitary_rev_qubits_loop(matrix), number=number, repeat=1)
+    after = time_per_call(lambda: GateModelProgram.unitary_rev_qubits(program), number=number)
+
+    report(f"unitary_rev_qubits ({num_qubits} qubits)", before, after)
+    assert np.array_equal(
+        GateModelProgram.unitary_rev_qubits(program), _unitary_rev_qubits_loop(matrix)
+    )
+
+
+def test_unitary_rev_qubits_12_qubits():
+    """Time the qubit reversal of a 12-qubit unitary, which took minutes element by element."""
+    matrix = _random_matrix(12)
+    program = Mock(spec=GateModelProgram, _unitary=lambda: matrix)
+
+    after = time_per_call(lambda: GateModelProgram.unitary_rev_qubits(program), number=1)
+
+    print(f"\nunitary_rev_qubits (12 qubits): {after * 1e3:.3f} ms/call")
+    assert after < 5
+
+
+def test_cirq_circuit_cached_stats():
+    """Compare recomputing qubit count and depth on every access vs. the cached stats."""
+    qubits = cirq.LineQubit.range(20)
+    circuit = cirq.Circuit(cirq.CNOT(qubits[i % 20], qubits[(i + 1) % 20]) for i in range(2000))
+    program = CirqCircuit(circuit)
+
+    def recompute():
+        return len(list(circuit.all_qubits())), len(cirq.Circuit(circuit.all_operations()))
+
+    before = time_per_call(recompute, number=10)
+    after = time_per_call(lambda: (program.num_qubits, program.depth), number=10)
+
+    report("CirqCircuit num_qubits and depth (2000 gates)", before, after)
+    assert (program.num_qubits, program.depth) == recompute()
+
+
+def test_qasm3_program_cached_depth():
+    """Compare unrolling an OpenQASM 3 program for its depth on every access vs. once."""
+    program = OpenQasm3Program(QASM3_LARGE)
+    module = program.module
+
+    before = time_per_call(lambda: module.depth(decompose_native_gates=False), number=3)
+    after = time_per_call(lambda: program.depth, number=3)
+
+    report("OpenQasm3Program depth (5000 gates)", before, after)
+    assert program.depth == module.depth(decompose_native_gates=False)
+
+
+def _cirq_mixed() -> cirq.Circuit:
+    qubits = cirq.LineQubit.range(4)
+    return cirq.Circuit(
+        gate(qubits[i % 4], qubits[(i + 1) % 4]) if gate is cirq.CNOT else gate(qubits[i % 4])
+        for i, gate in enumerate([cirq.H, cirq.T, cirq.CNOT, cirq.T**-1] * 500)
+    )
+
+
+def _braket_mixed() -> braket.circuits.Circuit:
+    circuit = braket.circuits.Circuit()
+    for i in range(500):
+        circuit.h(i % 4).t(i % 4).cnot(i % 4, (i + 1) % 4).ti(i % 4)
+    return circuit
+
+
+@pytest.mark.parametrize("make_program", [_cirq_mixed, _braket_mixed], ids=["cirq", "braket"])
+def test_gate_counts_against_qiskit_count_ops(make_program):
+    """Compare converting a program to qiskit for count_ops vs. counting gates natively."""
+    program = make_program()
+
+    before = time_per_call(lambda: transpile(program, "qiskit").count_ops(), number=3)
+    after = time_per_call(lambda: load_program(program).resource_estimate(), number=3)
+
+    report(f"gate counts via qiskit vs. native ({load_program(program).spec.alias})", before, after)
+    assert sum(load_program(program).gate_counts().values()) == 2000
+    assert after < before
+
+
+def test_qasm3_transform_normalization_skips_parse():
+    """Compare normalizing rebased gate parameters with vs. without parsing the program."""
+    qasm = (
+        'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[2] q;\n'
+        + "rz(pi/2) q[0];\ncx q[0], q[1];\n" * 1000
+    )
+
+    before = time_per_call(lambda: (parse(qasm), normalize_qasm_gate_params(qasm)), number=1)
+    after = time_per_call(lambda: normalize_qasm_gate_params(qasm), number=1)
+
+    report("normalize_qasm_gate_params (2000 gates)", before, after)
+    assert after < before
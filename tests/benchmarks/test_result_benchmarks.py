@@ -0,0 +1,83 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for storing and formatting gate model result counts.
+
+"""
+import random
+import tracemalloc
+
+import pytest
+
+from qbraid.runtime.postprocess import normalize_data
+from qbraid.runtime.result_data import GateModelResultData
+
+from ._utils import report, time_per_call
+
+pytestmark = pytest.mark.benchmark
+
+
+def _random_counts(num_bits: int, num_keys: int, seed: int) -> dict[str, int]:
+    """Counts for up to num_keys distinct random bitstrings of num_bits bits."""
+    rng = random.Random(seed)
+    return {
+        format(rng.getrandbits(num_bits), f"0{num_bits}b"): rng.randrange(1, 100)
+        for _ in range(num_keys)
+    }
+
+
+def _retained_bytes(build) -> int:
+    """Return the memory still allocated by the objects that build returns."""
+    tracemalloc.start()
+    objects = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return retained
+
+
+def test_result_data_memory_against_dict():
+    """Compare holding many results as counts dictionaries and as packed arrays."""
+    num_results, num_keys = 200, 2_000
+
+    before = _retained_bytes(
+        lambda: [_random_counts(28, num_keys, seed) for seed in range(num_results)]
+    )
+    after = _retained_bytes(
+        lambda: [
+            GateModelResultData(measurement_counts=_random_counts(28, num_keys, seed))
+            for seed in range(num_results)
+        ]
+    )
+
+    print(
+        f"\nhold {num_results} results of {num_keys} outcomes: "
+        f"before={before / 2**20:.1f} MiB, after={after / 2**20:.1f} MiB "
+        f"({before / after:.1f}x)"
+    )
+    assert after < before
+
+
+@pytest.mark.parametrize("num_bits", [16, 28])
+def test_result_data_get_counts_against_dict(num_bits):
+    """Compare formatting counts from a dictionary and from packed arrays."""
+    counts = _random_counts(num_bits, 100_000, seed=0)
+
+    before = time_per_call(lambda: normalize_data(counts, decimal=True), number=3)
+    after = time_per_call(
+        lambda: GateModelResultData(measurement_counts=counts).get_counts(decimal=True), number=3
+    )
+
+    report(f"get_counts of {len(counts)} counts, {num_bits} qubits", before, after)
@@ -0,0 +1,118 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for pruning conversion graphs to the paths that reach a target.
+
+"""
+import random
+
+import pytest
+
+from qbraid.programs.spec import ProgramSpec
+from qbraid.transpiler.edge import Conversion
+from qbraid.transpiler.graph import ConversionGraph, parse_conversion_path
+from qbraid.transpiler.scheme import ConversionScheme, clear_target_graph_cache
+
+from ._utils import report, time_per_call
+
+pytestmark = pytest.mark.benchmark
+
+
+def _identity(program):
+    return program
+
+
+def _synthetic_graph(num_nodes: int, out_degree: int, seed: int = 0) -> ConversionGraph:
+    """Build a random conversion graph in which each node converts to out_degree others."""
+    rng = random.Random(seed)
+    nodes = [f"node{i}" for i in range(num_nodes)]
+    conversions = [
+        Conversion(src, tgt, _identity)
+        for src in nodes
+        for tgt in rng.sample([node for node in nodes if node != src], out_degree)
+    ]
+    return ConversionGraph(conversions=conversions, include_isolated=False)
+
+
+def _prune_by_path_enumeration(graph: ConversionGraph, target_nodes, n_steps) -> ConversionGraph:
+    """Previous implementation, which enumerated every path from each source to each target."""
+    graph = graph.copy()
+    used = set()
+    for target_node in target_nodes:
+        for source in set(graph.nodes()) - set(target_nodes):
+            if graph.has_path(source, target_node):
+                for path_str in graph.all_paths(source, target_node):
+                    path = parse_conversion_path(path_str)
+                    if n_steps is None or len(path) <= n_steps:
+                        used.update(path)
+
+    node_id_to_alias = {value: key for key, value in graph._node_alias_id_map.items()}
+    for src, tgt in graph.edge_list():
+        if (node_id_to_alias[src], node_id_to_alias[tgt]) not in used:
+            graph.remove_conversion(node_id_to_alias[src], node_id_to_alias[tgt])
+    return graph
+
+
+def test_prune_graph_against_path_enumeration():
+    """Compare path enumeration with BFS pruning on a graph small enough to enumerate."""
+    graph = _synthetic_graph(16, 3)
+    targets = ["node0", "node1"]
+
+    before = time_per_call(
+        lambda: _prune_by_path_enumeration(graph, targets, 4), number=1, repeat=1
+    )
+    after = time_per_call(
+        lambda: ConversionScheme.prune_graph_to_target_paths(graph, targets, 4), number=5
+    )
+
+    report("prune 16-node graph (path enumeration -> BFS)", before, after)
+    assert after < before
+
+
+@pytest.mark.parametrize("num_nodes", [50, 100, 200])
+@pytest.mark.parametrize("n_steps", [3, None])
+def test_prune_graph_scaling(num_nodes, n_steps):
+    """Time BFS pruning of synthetic graphs that are far too large to enumerate paths in."""
+    graph = _synthetic_graph(num_nodes, 4)
+    targets = ["node0", "node1"]
+
+    elapsed = time_per_call(
+        lambda: ConversionScheme.prune_graph_to_target_paths(graph, targets, n_steps),
+        number=1,
+    )
+
+    print(f"\nprune {num_nodes}-node graph (n_steps={n_steps}): {elapsed * 1e3:.1f} ms")
+    assert elapsed < 10
+
+
+def test_update_graph_for_target_per_device(monkeypatch):
+    """Compare targeting 50 device schemes at one program spec without vs. with the cache."""
+    target_spec = ProgramSpec(str, alias="qasm2")
+    num_devices = 50
+
+    def update_schemes():
+        for _ in range(num_devices):
+            ConversionScheme().update_graph_for_target(target_spec)
+
+    monkeypatch.setenv("DISABLE_CACHE", "1")
+    before = time_per_call(update_schemes, number=1)
+
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    clear_target_graph_cache()
+    after = time_per_call(update_schemes, number=1)
+
+    report(f"update_graph_for_target x{num_devices} (rebuild -> cached)", before, after)
+    assert after < before
+    clear_target_graph_cache()
@@ -0,0 +1,190 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for the per-call overhead of qbraid.transpiler.
+
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from qbraid.transpiler.cache import MemoryConversionCache
+from qbraid.transpiler.converter import (
+    ConversionPipeline,
+    compile_conversion,
+    transpile,
+    transpile_batch,
+)
+from qbraid.transpiler.edge import Conversion
+from qbraid.transpiler.graph import ConversionGraph, clear_default_graph_cache
+
+from ._utils import report, time_per_call
+
+QASM2_BELL = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+creg c[2];
+h q[0];
+cx q[0],q[1];
+measure q -> c;
+"""
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_default_graph_overhead(monkeypatch):
+    """Compare transpile overhead with a freshly built vs. shared default graph."""
+    monkeypatch.setenv("DISABLE_CACHE", "1")
+    before = time_per_call(lambda: transpile(QASM2_BELL, "qasm3"))
+
+    monkeypatch.delenv("DISABLE_CACHE")
+    clear_default_graph_cache()
+    transpile(QASM2_BELL, "qasm3")
+    after = time_per_call(lambda: transpile(QASM2_BELL, "qasm3"))
+
+    report("transpile qasm2 -> qasm3 (default graph)", before, after)
+    assert after < before
+
+
+def test_path_table_ranking():
+    """Compare target ranking with a cold vs. warm all-pairs path table."""
+    graph = ConversionGraph()
+    source = "qasm2"
+    targets = sorted(graph.nodes())
+
+    def cold():
+        graph._path_table_stamp = None
+        graph.get_sorted_closest_targets(source, targets)
+        graph.find_top_shortest_conversion_paths(source, "qasm3")
+
+    def warm():
+        graph.get_sorted_closest_targets(source, targets)
+        graph.find_top_shortest_conversion_paths(source, "qasm3")
+
+    before = time_per_call(cold, number=50)
+    after = time_per_call(warm, number=50)
+
+    report(f"rank {len(targets)} targets + top paths", before, after)
+    assert after < before
+
+
+def test_compiled_pipeline_overhead():
+    """Compare transpile against a pipeline compiled once with compile_conversion.
+
+    A no-op conversion is used so that the timings reflect dispatch overhead only."""
+    graph = ConversionGraph([Conversion("qasm2", "qasm3", lambda program: program)])
+    before = time_per_call(lambda: transpile(QASM2_BELL, "qasm3", conversion_graph=graph), 200)
+
+    pipeline = compile_conversion("qasm2", "qasm3", conversion_graph=graph)
+    after = time_per_call(lambda: pipeline(QASM2_BELL), 200)
+
+    report("qasm2 -> qasm3 dispatch (compiled pipeline)", before, after)
+    assert after < before
+
+
+def _layered_cirq_circuit(num_qubits: int = 10, num_gates: int = 1000):
+    """Return a cirq circuit of ``num_gates`` alternating H and CNOT gates."""
+    cirq = pytest.importorskip("cirq")
+    qubits = cirq.LineQubit.range(num_qubits)
+    ops = []
+    for i in range(num_gates):
+        qubit = i % num_qubits
+        if i % 2:
+            ops.append(cirq.CNOT(qubits[qubit], qubits[(qubit + 1) % num_qubits]))
+        else:
+            ops.append(cirq.H(qubits[qubit]))
+    return cirq.Circuit(ops)
+
+
+def test_copy_mode_cirq_to_braket():
+    """Compare transpiling a 1k-gate cirq circuit with copy_mode 'deep' vs. 'on_retry'."""
+    pytest.importorskip("braket.circuits")
+    circuit = _layered_cirq_circuit()
+
+    def convert(copy_mode):
+        return transpile(circuit, "braket", max_path_attempts=1, copy_mode=copy_mode)
+
+    before = time_per_call(lambda: convert("deep"), number=5)
+    after = time_per_call(lambda: convert("on_retry"), number=5)
+
+    report("cirq -> braket, 1k gates (copy_mode)", before, after)
+    assert after < before
+
+
+def test_non_mutating_cirq_to_qasm2():
+    """Compare converting a 1k-gate cirq circuit with and without the non_mutating mark."""
+    from qbraid.transpiler.conversions.cirq import (  # pylint: disable=import-outside-toplevel
+        cirq_to_qasm2,
+    )
+
+    circuit = _layered_cirq_circuit()
+    # A plain wrapper function does not carry the non_mutating mark.
+    unmarked = Conversion(
+        "cirq",
+        "qasm2",
+        lambda program: cirq_to_qasm2(program),  # pylint: disable=unnecessary-lambda
+    )
+    marked = Conversion("cirq", "qasm2", cirq_to_qasm2)
+    assert marked.non_mutating and not unmarked.non_mutating
+
+    unmarked_pipeline = ConversionPipeline("cirq", "qasm2", [[unmarked.convert]])
+    marked_pipeline = ConversionPipeline("cirq", "qasm2", [[marked.convert]])
+    before = time_per_call(lambda: unmarked_pipeline(circuit), number=5)
+    after = time_per_call(lambda: marked_pipeline(circuit), number=5)
+
+    report("cirq -> qasm2, 1k gates (non_mutating)", before, after)
+    assert after < before
+
+
+def test_transpile_batch_process_pool():
+    """Compare transpiling 32 cirq circuits in a loop vs. with transpile_batch on 4 processes."""
+    pytest.importorskip("braket.circuits")
+    if hasattr(os, "sched_getaffinity"):
+        num_cpus = len(os.sched_getaffinity(0))
+    else:
+        num_cpus = os.cpu_count() or 1
+    if num_cpus < 2:
+        pytest.skip("Requires at least two CPUs to measure a parallel speedup.")
+
+    circuits = [_layered_cirq_circuit(num_gates=500) for _ in range(32)]
+
+    before = time_per_call(lambda: [transpile(circuit, "braket") for circuit in circuits], number=1)
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        transpile_batch(circuits[:4], "braket", executor=executor)
+        after = time_per_call(
+            lambda: transpile_batch(circuits, "braket", executor=executor, chunksize=4),
+            number=1,
+        )
+
+    report("cirq -> braket, 32 x 500 gates (transpile_batch)", before, after)
+    assert after < before
+
+
+def test_conversion_cache_repeated_program(monkeypatch):
+    """Compare re-transpiling an identical 1k-gate cirq circuit with and without a cache."""
+    pytest.importorskip("braket.circuits")
+    monkeypatch.delenv("DISABLE_CACHE", raising=False)
+    circuit = _layered_cirq_circuit()
+    cache = MemoryConversionCache()
+
+    before = time_per_call(lambda: transpile(circuit, "braket"), number=5)
+    transpile(circuit, "braket", cache=cache)
+    after = time_per_call(lambda: transpile(circuit, "braket", cache=cache), number=5)
+
+    report("cirq -> braket, 1k gates (conversion cache hit)", before, after)
+    assert after < before
@@ -62,21 +62,34 @@ def pytest_addoption(parser):
         default=None,
         help="Run tests that interface with remote, credentialed services: true or false",
     )
+    parser.addoption(
+        "--benchmark",
+        action="store",
+        default=None,
+        help="Run performance benchmarks: true or false",
+    )
+
+
+def _is_option_enabled(config, option: str, env_var: str) -> bool:
+    """Resolve a true/false command-line option, falling back to an environment variable."""
+    value = config.getoption(option)
+    if value is None:
+        value = os.getenv(env_var, "False")
+    return value.lower() == "true"
 
 
 def pytest_collection_modifyitems(config, items):
-    """Skip tests marked with `remote` if remote tests are disabled."""
-    remote_option = config.getoption("--remote")
-    if remote_option is None:
-        remote_option = os.getenv("QBRAID_RUN_REMOTE_TESTS", "False").lower() == "true"
-    else:
-        remote_option = remote_option.lower() == "true"
-
-    if not remote_option:
-        skip_remote = pytest.mark.skip(reason="Remote tests are disabled.")
-        for item in items:
-            if "remote" in item.keywords:
-                item.add_marker(skip_remote)
+    """Skip tests marked with `remote` or `benchmark` unless they are enabled."""
+    remote_option = _is_option_enabled(config, "--remote", "QBRAID_RUN_REMOTE_TESTS")
+    benchmark_option = _is_option_enabled(config, "--benchmark", "QBRAID_RUN_BENCHMARKS")
+
+    skip_remote = pytest.mark.skip(reason="Remote tests are disabled.")
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks are disabled.")
+    for item in items:
+        if not remote_option and "remote" in item.keywords:
+            item.add_marker(skip_remote)
+        if not benchmark_option and "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 @pytest.fixture(autouse=True)
@@ -18,6 +18,7 @@ Unit tests for QASM preprocessing functions
 """
 import re
 import textwrap
+from unittest.mock import patch
 
 import pytest
 
@@ -328,6 +329,34 @@ def test_convert_qasm_pi_to_decimal_gpi2_iso():
     assert convert_qasm_pi_to_decimal(qasm) == expected
 
 
+def test_convert_qasm_pi_to_decimal_skips_parse_without_pi_names():
+    """Test that the program is only parsed when a name other than 'pi' contains 'pi'."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[1] q;
+    rx(pi/2) q[0];
+    """
+    with patch("qbraid.passes.qasm.compat.parse") as mock_parse:
+        assert "rx(1.5707963267948966)" in convert_qasm_pi_to_decimal(qasm)
+        mock_parse.assert_not_called()
+
+        convert_qasm_pi_to_decimal(qasm.replace("rx(pi/2)", "gpi2(pi/2)"))
+        mock_parse.assert_called_once()
+
+
+def test_convert_qasm_pi_to_decimal_keeps_gate_named_pi():
+    """Test that a gate named exactly 'pi' is found by parsing and left unconverted."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    gate pi a { x a; }
+    qubit[1] q;
+    pi q[0];
+    """
+    assert convert_qasm_pi_to_decimal(qasm) == qasm
+
+
 def test_convert_qasm_pi_to_decimal_qasm3_fns_gates_vars():
     """Test converting pi symbol to decimal in a qasm3 string
     with custom functions, gates, and variables."""
@@ -33,6 +33,7 @@ from qbraid.programs import get_program_type_alias, load_program
 from qbraid.programs.analog import AnalogHamiltonianProgram
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.gate_model import GateModelProgram
+from qbraid.transpiler import transpile
 
 from ..fixtures import packages_bell, packages_shared15
 
@@ -180,6 +181,70 @@ def test_unitary_rev_qubits_value_errors(matrix, fake_program):
     assert expected_error_msg in str(excinfo.value)
 
 
+@pytest.mark.parametrize("num_qubits", [0, 1, 2, 3, 5])
+@pytest.mark.parametrize("dtype", [complex, float, int])
+def test_unitary_rev_qubits_matches_bit_reversed_indices(num_qubits, dtype, fake_program):
+    """Test that unitary_rev_qubits moves each entry to its bit-reversed row and column."""
+    dim = 2**num_qubits
+    matrix = np.arange(dim * dim).reshape(dim, dim).astype(dtype)
+    if dtype is complex:
+        matrix = matrix * (1 - 2j)
+    original = matrix.copy()
+
+    def reverse_bits(index):
+        return int(format(index, f"0{num_qubits}b")[::-1], 2) if num_qubits else index
+
+    expected = np.zeros((dim, dim), dtype=complex)
+    for i in range(dim):
+        for j in range(dim):
+            expected[reverse_bits(i), reverse_bits(j)] = matrix[i, j]
+
+    fake_program._unitary = lambda: matrix
+    permuted = fake_program.unitary_rev_qubits()
+
+    assert permuted.dtype == np.complex128
+    assert np.array_equal(permuted, expected)
+    assert np.array_equal(matrix, original)
+
+
+@pytest.mark.parametrize("package", ["braket", "cirq", "qiskit", "pytket"])
+def test_evolve_states_matches_unitary(package):
+    """Test that evolve_states applies the unitary of the circuit to single and batched states."""
+    qasm = """
+    OPENQASM 2.0;
+    include "qelib1.inc";
+    qreg q[3];
+    h q[0];
+    cx q[0], q[2];
+    ry(0.4) q[1];
+    t q[2];
+    cz q[1], q[0];
+    """
+    program = load_program(transpile(qasm, package))
+    unitary = program.unitary()
+    unitary_rev = program.unitary_rev_qubits()
+    rng = np.random.default_rng(0)
+    states = rng.normal(size=(3, unitary.shape[0])) + 1j * rng.normal(size=(3, unitary.shape[0]))
+
+    assert np.allclose(program.evolve_states(states), states @ unitary.T)
+    assert np.allclose(program.evolve_states(states[0]), unitary @ states[0])
+    assert np.allclose(program.evolve_states_rev_qubits(states), states @ unitary_rev.T)
+
+
+@pytest.mark.parametrize("states", [np.ones(3), np.ones((2, 6)), np.ones((1, 0))])
+def test_evolve_states_invalid_size(states, fake_program):
+    """Test that evolve_states raises a ValueError for states whose size is not a power of 2."""
+    with pytest.raises(ValueError, match="State vectors must have size 2"):
+        fake_program.evolve_states(states)
+
+
+def test_evolve_states_dimension_mismatch(fake_program):
+    """Test that evolve_states raises a ValueError for states that do not fit the circuit."""
+    fake_program._unitary = lambda: np.eye(4)
+    with pytest.raises(ValueError, match="do not match"):
+        fake_program.evolve_states(np.ones(8))
+
+
 @pytest.mark.parametrize(
     "matrix",
     [
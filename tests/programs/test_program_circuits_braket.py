@@ -420,3 +420,67 @@ def test_replace_i_with_rz_zero():
     for instr in qprogram.program.instructions:
         if instr.operator.name.lower() == "rz":
             assert instr.operator.angle == 0
+
+
+def test_braket_circuit_stats():
+    """Test that stats returns the qubits, depth, gate counts, and measured qubits together."""
+    circuit = Circuit().h(0).cnot(0, 2).t(2).cnot(0, 2).measure(2)
+    stats = BraketCircuit(circuit).stats()
+
+    assert stats.qubits == (0, 2)
+    assert stats.num_qubits == 2
+    assert stats.num_clbits == 0
+    assert stats.depth == circuit.depth
+    assert stats.gate_counts == {"H": 1, "CNot": 2, "T": 1}
+    assert stats.measured_qubits == (2,)
+
+
+def test_braket_circuit_stats_recomputed_after_pad_measurements():
+    """Test that padding measurements in place invalidates the cached stats."""
+    qprogram = BraketCircuit(Circuit().h(0).cnot(0, 1).measure(0))
+    assert qprogram.stats().measured_qubits == (0,)
+
+    qprogram.pad_measurements()
+    assert qprogram.stats().measured_qubits == (0, 1)
+
+
+def test_braket_circuit_resource_estimate():
+    """Test that controlled gates are counted by the total number of qubits they act on."""
+    circuit = Circuit().h(0).t(0).ti(1).cnot(0, 1).x(2, control=[0, 1]).measure([0, 2])
+    qprogram = BraketCircuit(circuit)
+    estimate = qprogram.resource_estimate()
+
+    assert qprogram.gate_counts() == {"H": 1, "T": 1, "Ti": 1, "CNot": 1, "X": 1}
+    assert estimate.num_qubits == 3
+    assert estimate.depth == circuit.depth
+    assert estimate.num_gates == 5
+    assert estimate.num_single_qubit_gates == 3
+    assert estimate.num_two_qubit_gates == 1
+    assert estimate.num_multi_qubit_gates == 1
+    assert estimate.t_count == 2
+    assert estimate.num_measured_qubits == 2
+
+
+def test_braket_evolve_states_matches_unitary():
+    """Test that simulating the circuit gate by gate matches applying its unitary."""
+    circuit = (
+        Circuit()
+        .h(0)
+        .cnot(0, 3)
+        .rx(3, 0.3)
+        .t(1)
+        .swap(1, 3)
+        .cphaseshift(3, 0, 0.7)
+        .ccnot(0, 1, 3)
+        .x(1, control=[0], control_state=[0])
+        .h(0, power=0.5)
+        .measure(0)
+    )
+    program = BraketCircuit(circuit)
+    rng = np.random.default_rng(0)
+    states = rng.normal(size=(3, 8)) + 1j * rng.normal(size=(3, 8))
+
+    assert np.allclose(program.evolve_states(states), states @ program.unitary().T)
+    assert np.allclose(
+        program.evolve_states_rev_qubits(states), states @ program.unitary_rev_qubits().T
+    )
@@ -25,6 +25,7 @@ from cirq import CNOT, Circuit, GridQubit, H, LineQubit, Moment, NamedQubit, X,
 
 from qbraid.interface import circuits_allclose
 from qbraid.programs.exceptions import ProgramTypeError
+from qbraid.programs.gate_model import ResourceEstimate
 from qbraid.programs.gate_model.cirq import CirqCircuit
 
 
@@ -346,3 +347,79 @@ def test_cirq_circuit_depth():
 
     # The depth should be the number of moments in a circuit created from all operations
     assert program.depth == len(cirq.Circuit(circuit.all_operations()))
+
+
+def test_cirq_circuit_stats():
+    """Test that stats returns the qubits, depth, gate counts, and measured qubits together."""
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.T(q1) ** -1,
+        cirq.rz(0.3).on(q2),
+        cirq.CNOT(q0, q1),
+        cirq.CNOT(q1, q2),
+        cirq.measure(q2, q0, key="m"),
+    )
+    stats = CirqCircuit(circuit).stats()
+
+    assert set(stats.qubits) == {q0, q1, q2}
+    assert stats.num_qubits == 3
+    assert stats.num_clbits == 0
+    assert stats.depth == len(cirq.Circuit(circuit.all_operations()))
+    assert stats.gate_counts == {"H": 1, "T**-1": 1, "Rz": 1, "CNOT": 2}
+    assert stats.measured_qubits == (q2, q0)
+
+
+def test_cirq_circuit_stats_cached_until_modified():
+    """Test that stats are cached, and recomputed after the circuit is modified."""
+    circuit = cirq.Circuit(cirq.H(cirq.LineQubit(1)), cirq.X(cirq.LineQubit(3)))
+    program = CirqCircuit(circuit)
+    stats = program.stats()
+    assert program.stats() is stats
+    assert set(program.qubits) == set(stats.qubits)
+
+    program.remove_idle_qubits()
+    assert program.stats() is not stats
+    assert sorted(program.qubits) == cirq.LineQubit.range(2)
+
+    program.program.append(cirq.X(cirq.LineQubit(5)))
+    assert program.num_qubits == 3
+    assert program.stats().num_qubits == 2
+    program.invalidate_stats()
+    assert program.stats().num_qubits == 3
+
+
+def test_cirq_circuit_resource_estimate():
+    """Test that resource_estimate summarizes gate counts, T-count, and measurements."""
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.T(q0),
+        cirq.T(q1) ** -1,
+        cirq.CNOT(q0, q1),
+        cirq.TOFFOLI(q0, q1, q2),
+        cirq.reset(q2),
+        cirq.measure(q0, q1, q2, key="m"),
+    )
+    program = CirqCircuit(circuit)
+    estimate = program.resource_estimate()
+
+    assert estimate == ResourceEstimate(
+        num_qubits=3,
+        depth=program.depth,
+        num_gates=5,
+        num_single_qubit_gates=3,
+        num_two_qubit_gates=1,
+        num_multi_qubit_gates=1,
+        t_count=2,
+        num_measured_qubits=3,
+    )
+
+
+def test_cirq_circuit_gate_counts_returns_copy():
+    """Test that modifying the returned gate counts does not modify the cached stats."""
+    program = CirqCircuit(cirq.Circuit(cirq.H(cirq.LineQubit(0))))
+    counts = program.gate_counts()
+    counts["H"] = 5
+
+    assert program.gate_counts() == {"H": 1}
@@ -56,6 +56,32 @@ def test_ionq_program_bits(ionq_program: IonQProgram):
     assert ionq_program.num_clbits == 0
 
 
+def test_ionq_program_resource_estimate():
+    """Test that controls and targets are both counted, and depth found from gate layers."""
+    ionq_dict = {
+        "qubits": 3,
+        "circuit": [
+            {"gate": "h", "target": 0},
+            {"gate": "t", "target": 2},
+            {"gate": "cnot", "control": 0, "target": 1},
+            {"gate": "ti", "target": 1},
+            {"gate": "x", "controls": [0, 1], "target": 2},
+            {"gate": "ms", "targets": [0, 2], "phases": [0, 0]},
+        ],
+    }
+    qprogram = IonQProgram(ionq_dict)
+    estimate = qprogram.resource_estimate()
+
+    assert qprogram.gate_counts() == {"h": 1, "t": 1, "cnot": 1, "ti": 1, "x": 1, "ms": 1}
+    assert qprogram.depth == 5
+    assert estimate.num_gates == 6
+    assert estimate.num_single_qubit_gates == 3
+    assert estimate.num_two_qubit_gates == 2
+    assert estimate.num_multi_qubit_gates == 1
+    assert estimate.t_count == 2
+    assert estimate.num_measured_qubits == 0
+
+
 def test_ionq_program_serialize(ionq_program: IonQProgram, ionq_dict: IonQDict):
     """Test the qubits and clbits properties."""
     program_expected = Program(
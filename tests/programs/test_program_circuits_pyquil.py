@@ -21,7 +21,7 @@ import pytest
 
 try:
     from pyquil import Program
-    from pyquil.gates import CNOT, CZ, MEASURE, H
+    from pyquil.gates import CNOT, CZ, MEASURE, H, T
     from pyquil.quilbase import Declare
     from qbraid_core.services.runtime.schemas import Program as RuntimeProgram
 
@@ -125,3 +125,46 @@ def test_remove_idle_qubits_remaps_measurements_and_passes_through_declarations(
     assert "DECLARE ro BIT[1]" in out
     assert "H 0" in out
     assert "MEASURE 0 ro[0]" in out
+
+
+def test_pyquil_program_stats():
+    """Test that stats returns the qubits, depth, gate counts, and measured qubits together."""
+    program = Program()
+    ro = program.declare("ro", "BIT", 2)
+    program += H(0)
+    program += CNOT(0, 2)
+    program += CZ(2, 0)
+    program += MEASURE(2, ro[0])
+    program += MEASURE(0, ro[1])
+    qprogram = PyQuilProgram(program)
+    stats = qprogram.stats()
+
+    assert set(stats.qubits) == {0, 2}
+    assert stats.num_qubits == 2
+    assert stats.depth == len(program)
+    assert stats.gate_counts == {"H": 1, "CNOT": 1, "CZ": 1}
+    assert stats.measured_qubits == (2, 0)
+
+    qprogram.remove_idle_qubits()
+    assert set(qprogram.stats().qubits) == {0, 1}
+    assert qprogram.stats().measured_qubits == (1, 0)
+
+
+def test_pyquil_program_resource_estimate():
+    """Test that daggered T gates count towards the T-count of the program."""
+    program = Program()
+    ro = program.declare("ro", "BIT", 1)
+    program += H(0)
+    program += T(0)
+    program += T(1).dagger()
+    program += CNOT(0, 1)
+    program += MEASURE(1, ro[0])
+    qprogram = PyQuilProgram(program)
+    estimate = qprogram.resource_estimate()
+
+    assert qprogram.gate_counts() == {"H": 1, "T": 2, "CNOT": 1}
+    assert estimate.num_gates == 4
+    assert estimate.num_single_qubit_gates == 3
+    assert estimate.num_two_qubit_gates == 1
+    assert estimate.t_count == 2
+    assert estimate.num_measured_qubits == 1
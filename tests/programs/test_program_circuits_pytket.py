@@ -128,3 +128,23 @@ def test_raise_program_type_error():
     """Test raising ProgramTypeError"""
     with pytest.raises(ProgramTypeError):
         PytketCircuit("OPENQASM 2.0;qreg q[2];h q[0];cx q[0],q[1];")
+
+
+def test_pytket_resource_estimate():
+    """Test that barriers, resets, and measurements are not counted as gates."""
+    circuit = Circuit(3, 2)
+    circuit.H(0).T(0).Tdg(1).CX(0, 1).CCX(0, 1, 2)
+    circuit.add_barrier([0, 1, 2])
+    circuit.Reset(1)
+    circuit.Measure(0, 0).Measure(2, 1)
+    qprogram = PytketCircuit(circuit)
+    estimate = qprogram.resource_estimate()
+
+    assert qprogram.gate_counts() == {"H": 1, "T": 1, "Tdg": 1, "CX": 1, "CCX": 1}
+    assert estimate.num_qubits == 3
+    assert estimate.depth == circuit.depth()
+    assert estimate.num_single_qubit_gates == 3
+    assert estimate.num_two_qubit_gates == 1
+    assert estimate.num_multi_qubit_gates == 1
+    assert estimate.t_count == 2
+    assert estimate.num_measured_qubits == 2
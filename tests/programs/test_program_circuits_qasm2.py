@@ -113,3 +113,27 @@ def test_qasm2_program_serialize(simple_qasm):
     assert serialized.format == "qasm2"
     assert "OPENQASM 2.0" in serialized.data
     assert "h q[0]" in serialized.data
+
+
+def test_qasm2_program_resource_estimate():
+    """Test gate counts and resource estimate of an OpenQASM 2 program."""
+    qasm = """
+    OPENQASM 2.0;
+    include "qelib1.inc";
+    qreg q[2];
+    creg c[2];
+    h q[0];
+    t q[0];
+    cx q[0], q[1];
+    tdg q[1];
+    measure q[1] -> c[1];
+    """
+    qprogram = OpenQasm2Program(textwrap.dedent(qasm).strip())
+    estimate = qprogram.resource_estimate()
+
+    assert qprogram.gate_counts() == {"h": 1, "t": 1, "cx": 1, "tdg": 1}
+    assert estimate.num_qubits == 2
+    assert estimate.depth == qprogram.depth
+    assert estimate.num_two_qubit_gates == 1
+    assert estimate.t_count == 2
+    assert estimate.num_measured_qubits == 1
@@ -16,6 +16,8 @@
 Unit tests for qbraid.programs.qasm.OpenQasm3Program
 
 """
+from unittest.mock import MagicMock, patch
+
 import numpy as np
 import pytest
 from qiskit.qasm3 import dumps, loads
@@ -238,3 +240,201 @@ def test_raise_program_type_error():
             OpenQasm3Program(42)
     finally:
         unregister_program_type("int")
+
+
+def test_qasm3_program_stats():
+    """Test that stats returns the qubits, depth, gate counts, and measured qubits together."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[3] q;
+    qubit r;
+    bit[2] c;
+    h q;
+    ccx q[0], q[1], q[2];
+    c[0] = measure q[2];
+    c[1] = measure r;
+    """
+    program = OpenQasm3Program(qasm)
+    stats = program.stats()
+
+    assert stats.qubits == (("q", 0), ("q", 1), ("q", 2), ("r", 0))
+    assert stats.num_qubits == 4
+    assert stats.num_clbits == 2
+    assert stats.depth == program.module.depth(decompose_native_gates=False)
+    assert stats.gate_counts == {"h": 3, "ccx": 1}
+    assert stats.measured_qubits == (("q", 2), ("r", 0))
+    assert program.stats() is stats
+
+
+def test_qasm3_program_stats_depth_matches_module_depth():
+    """Test that the depth read while unrolling for stats matches the pyqasm module depth."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    gate foo a, b { h a; cx a, b; h b; }
+    qubit[3] q;
+    bit[3] c;
+    foo q[0], q[1];
+    ccx q[0], q[1], q[2];
+    rzz(0.3) q[0], q[2];
+    c = measure q;
+    if (c[0]) { x q[1]; }
+    """
+    program = OpenQasm3Program(qasm)
+    assert program.depth == program.module.depth(decompose_native_gates=False)
+
+
+def test_qasm3_program_stats_recomputed_after_remove_idle_qubits():
+    """Test that the cached stats are recomputed after the circuit is modified."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[4] q;
+    bit[1] c;
+    h q[1];
+    cx q[1], q[3];
+    c[0] = measure q[3];
+    """
+    program = OpenQasm3Program(qasm)
+    stats = program.stats()
+    assert stats.num_qubits == 4
+    assert stats.measured_qubits == (("q", 3),)
+
+    program.remove_idle_qubits()
+    assert program.stats() is not stats
+    assert program.stats().num_qubits == 2
+    assert program.stats().measured_qubits == (("q", 1),)
+
+
+@pytest.fixture
+def cz_device() -> MagicMock:
+    """Return a mock device whose profile has the basis gates h, s, rz, and cx."""
+    device = MagicMock()
+    device.profile.get.return_value = {"h", "s", "rz", "cx"}
+    return device
+
+
+CZ_QASM = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[3] q;
+h q[0];
+cz q[0], q[2];
+"""
+
+
+def test_qasm3_program_string_serialized_on_access():
+    """Test that chained modifications re-serialize the program string once, when accessed."""
+    expected = OpenQasm3Program(CZ_QASM)
+    expected.populate_idle_qubits()
+    expected.reverse_qubit_order()
+    expected_qasm = expected.program
+
+    program = OpenQasm3Program(CZ_QASM)
+    module_type = type(program.module)
+    with patch.object(
+        module_type, "__str__", autospec=True, side_effect=module_type.__str__
+    ) as mock_str:
+        program.populate_idle_qubits()
+        program.reverse_qubit_order()
+        assert mock_str.call_count == 0
+
+        assert program.program == expected_qasm
+        assert program.program == expected_qasm
+        assert mock_str.call_count == 1
+
+
+def test_qasm3_program_transform_updates_module(cz_device):
+    """Test that the module and stats reflect the rebased program after transform."""
+    program = OpenQasm3Program(CZ_QASM)
+    assert program.gate_counts() == {"h": 1, "cz": 1}
+
+    program.transform(cz_device)
+    assert str(program.module) == str(OpenQasm3Program(program.program).module)
+    assert program.gate_counts() == {"h": 1, "rz": 2, "cx": 2, "s": 1}
+
+
+def test_qasm3_program_setter_reparses_module():
+    """Test that setting the program string replaces the pyqasm module."""
+    program = OpenQasm3Program(CZ_QASM)
+    program.program = qasm3_bell()
+
+    assert program.num_qubits == 2
+    assert program.gate_counts() == {"h": 1, "cx": 1}
+
+
+def test_qasm3_program_batch_validates_on_exit(cz_device):
+    """Test that a transform within a batch is validated when the block exits."""
+    program = OpenQasm3Program(CZ_QASM)
+    module_type = type(program.module)
+    with patch.object(
+        module_type, "validate", autospec=True, side_effect=module_type.validate
+    ) as mock_validate:
+        with program.batch() as batch_program:
+            assert batch_program is program
+            program.transform(cz_device)
+            assert mock_validate.call_count == 0
+        mock_validate.assert_called_once_with(program.module)
+
+        program.transform(cz_device)
+        assert mock_validate.call_count == 2
+
+
+def test_qasm3_program_batch_not_validated_on_error():
+    """Test that the program is not validated when the batch raises an exception."""
+    program = OpenQasm3Program(CZ_QASM)
+    with patch.object(type(program.module), "validate") as mock_validate:
+        with pytest.raises(RuntimeError):
+            with program.batch():
+                raise RuntimeError("interrupted")
+    mock_validate.assert_not_called()
+
+
+def test_qasm3_program_resource_estimate():
+    """Test that gates are counted after unrolling, including those on whole registers."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[3] q;
+    bit[3] c;
+    h q;
+    t q[0];
+    tdg q[1];
+    cx q[0], q[1];
+    ccx q[0], q[1], q[2];
+    c = measure q;
+    """
+    program = OpenQasm3Program(qasm)
+    estimate = program.resource_estimate()
+
+    assert program.gate_counts() == {"h": 3, "t": 1, "tdg": 1, "cx": 1, "ccx": 1}
+    assert estimate.num_qubits == 3
+    assert estimate.num_gates == 7
+    assert estimate.num_single_qubit_gates == 5
+    assert estimate.num_two_qubit_gates == 1
+    assert estimate.num_multi_qubit_gates == 1
+    assert estimate.t_count == 2
+    assert estimate.num_measured_qubits == 3
+
+
+def test_qasm3_program_gate_counts_include_branches():
+    """Test that gates inside both branches of an if/else statement are counted, and that
+    resets and barriers are not."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    bit[2] c;
+    c[0] = measure q[0];
+    if (c[0]) { x q[1]; t q[1]; cx q[0], q[1]; } else { h q[0]; c[1] = measure q[1]; }
+    reset q[0];
+    barrier q;
+    """
+    program = OpenQasm3Program(qasm)
+    estimate = program.resource_estimate()
+
+    assert program.gate_counts() == {"x": 1, "t": 1, "cx": 1, "h": 1}
+    assert estimate.num_gates == 4
+    assert estimate.num_two_qubit_gates == 1
+    assert estimate.t_count == 1
+    assert estimate.num_measured_qubits == 2
@@ -69,3 +69,29 @@ def test_circuit_properties():
     assert qprogram.num_qubits == 2
     assert qprogram.num_clbits == 0
     assert qprogram.depth == 2
+
+
+def test_circuit_resource_estimate():
+    """Test that gate counts match count_ops, excluding barriers, resets, and measurements."""
+    circuit = QuantumCircuit(3, 2)
+    circuit.h(0)
+    circuit.t(0)
+    circuit.tdg(1)
+    circuit.cx(0, 1)
+    circuit.ccx(0, 1, 2)
+    circuit.barrier()
+    circuit.reset(1)
+    circuit.measure([0, 2], [0, 1])
+    qprogram = QiskitCircuit(circuit)
+    estimate = qprogram.resource_estimate()
+
+    expected = dict(circuit.count_ops())
+    del expected["barrier"], expected["reset"], expected["measure"]
+    assert qprogram.gate_counts() == expected
+    assert estimate.num_qubits == 3
+    assert estimate.depth == circuit.depth()
+    assert estimate.num_gates == 5
+    assert estimate.num_two_qubit_gates == 1
+    assert estimate.num_multi_qubit_gates == 1
+    assert estimate.t_count == 2
+    assert estimate.num_measured_qubits == 2
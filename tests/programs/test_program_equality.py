@@ -147,3 +147,109 @@ def test_circuits_allclose_empty_target_unitary_returns_false():
     target = transpile(source, "braket")
 
     assert circuits_allclose(source, target) is False
+
+
+def test_match_global_phase_uses_first_largest_entry():
+    """Test that the phase is taken from the first largest-magnitude entry of the second array."""
+    a = np.array([[1j, 2], [-2j, 0.5]])
+    b = np.array([[1j, 2j], [2, 0.5]])
+    a_prime, b_prime = match_global_phase(a, b)
+
+    assert np.allclose(a_prime, a)
+    assert np.allclose(b_prime, b * -1j)
+
+
+def _ghz_circuits(num_qubits):
+    """Return equivalent GHZ-state circuits in cirq and qiskit."""
+    cirq = pytest.importorskip("cirq")
+    qiskit = pytest.importorskip("qiskit")
+
+    qubits = cirq.LineQubit.range(num_qubits)
+    cirq_circuit = cirq.Circuit(cirq.H(qubits[0]))
+    cirq_circuit.append(cirq.CNOT(qubits[i], qubits[i + 1]) for i in range(num_qubits - 1))
+    cirq_circuit.append(cirq.rz(0.3).on(qubits[-1]))
+
+    qiskit_circuit = qiskit.QuantumCircuit(num_qubits)
+    qiskit_circuit.h(0)
+    for i in range(num_qubits - 1):
+        qiskit_circuit.cx(i, i + 1)
+    qiskit_circuit.rz(0.3, num_qubits - 1)
+    return cirq_circuit, qiskit_circuit
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"strict_gphase": True}, {"allow_rev_qubits": True}, {"index_contig": True}],
+)
+def test_circuits_allclose_statevector_matches_unitary_method(kwargs):
+    """Test that the statevector method agrees with the unitary method across program types."""
+    from qbraid.interface import circuits_allclose  # pylint: disable=import-outside-toplevel
+
+    cirq_circuit, qiskit_circuit = _ghz_circuits(4)
+    reversed_circuit = qiskit_circuit.reverse_bits()
+    different_circuit = qiskit_circuit.copy()
+    different_circuit.t(1)
+
+    for other in (qiskit_circuit, reversed_circuit, different_circuit):
+        expected = circuits_allclose(cirq_circuit, other, **kwargs)
+        assert circuits_allclose(cirq_circuit, other, method="statevector", **kwargs) is expected
+
+
+def test_circuits_allclose_statevector_beyond_unitary_size():
+    """Test that the statevector method compares circuits too wide for dense unitaries."""
+    from qbraid.interface import circuits_allclose  # pylint: disable=import-outside-toplevel
+
+    cirq_circuit, qiskit_circuit = _ghz_circuits(16)
+    assert circuits_allclose(cirq_circuit, qiskit_circuit, method="statevector", num_samples=2)
+
+    qiskit_circuit.x(3)
+    assert not circuits_allclose(cirq_circuit, qiskit_circuit, method="statevector", seed=7)
+
+
+def test_circuits_allclose_statevector_braket_beyond_unitary_size():
+    """Test that braket circuits are simulated without building their dense unitaries."""
+    # pylint: disable-next=import-outside-toplevel
+    from braket.circuits import Circuit
+
+    from qbraid.interface import circuits_allclose  # pylint: disable=import-outside-toplevel
+
+    cirq_circuit, _ = _ghz_circuits(16)
+    braket_circuit = Circuit().h(0)
+    for i in range(15):
+        braket_circuit.cnot(i, i + 1)
+    braket_circuit.rz(15, 0.3)
+    assert circuits_allclose(cirq_circuit, braket_circuit, method="statevector", num_samples=2)
+
+
+def test_circuits_allclose_statevector_unsupported_program_type():
+    """Test that program types without a unitary fail clearly in statevector mode."""
+    from qbraid.interface import circuits_allclose  # pylint: disable=import-outside-toplevel
+
+    qasm = 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[2] q;\nh q[0];\ncx q[0], q[1];\n'
+    with pytest.raises(NotImplementedError, match="not supported for 'qasm3' programs"):
+        circuits_allclose(qasm, qasm, method="statevector")
+
+
+def test_circuits_allclose_statevector_mismatched_qubits_returns_false():
+    """Test that circuits on different numbers of qubits compare False in statevector mode."""
+    from qbraid.interface import circuits_allclose  # pylint: disable=import-outside-toplevel
+
+    cirq_circuit, _ = _ghz_circuits(3)
+    _, qiskit_circuit = _ghz_circuits(2)
+    assert circuits_allclose(cirq_circuit, qiskit_circuit, method="statevector") is False
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"method": "density"}, "Invalid method 'density'"),
+        ({"method": "statevector", "num_samples": 0}, "num_samples must be a positive integer"),
+    ],
+)
+def test_circuits_allclose_invalid_statevector_args(kwargs, message):
+    """Test that circuits_allclose rejects unsupported methods and sample counts."""
+    from qbraid.interface import circuits_allclose  # pylint: disable=import-outside-toplevel
+
+    cirq_circuit, _ = _ghz_circuits(2)
+    with pytest.raises(ValueError, match=message):
+        circuits_allclose(cirq_circuit, cirq_circuit, **kwargs)
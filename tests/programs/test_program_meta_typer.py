@@ -20,6 +20,7 @@ Unit tests for the typer module
 from unittest.mock import patch
 
 import pytest
+from pyqasm.analyzer import Qasm3Analyzer
 from pyqasm.exceptions import QasmParsingError
 
 from qbraid.programs.typer import (
@@ -34,6 +35,7 @@ from qbraid.programs.typer import (
     Qasm3StringType,
     QasmStringType,
     QuboCoefficientsDict,
+    extract_qasm_version,
     get_qasm_type_alias,
 )
 
@@ -317,3 +319,36 @@ def test_qubo_coefficients_dict_instance_meta_alias():
 def test_qubo_coefficients_dictt_instance_meta_bound():
     """Test that __bound__ property returns dict."""
     assert QuboCoefficientsDict.__bound__ is dict  # pylint: disable=comparison-with-callable
+
+
+@pytest.mark.parametrize(
+    "qasm, expected",
+    [
+        (valid_qasm2_string, 2.0),
+        (valid_qasm3_string, 3.0),
+        ("OPENQASM 3;\nqubit q;", 3.0),
+        ("// comment\n/* block\ncomment */ OPENQASM 3.1;\nqubit q;", 3.1),
+        ("  \n\t// OPENQASM 2.0;\nOPENQASM 3.0;", 3.0),
+        ('include "stdgates.inc";\nOPENQASM 3.0;\nqubit q;', 3.0),
+        ("OPENQASM 3.0\n;\nOPENQASM 2.0;", 2.0),
+    ],
+)
+def test_extract_qasm_version_matches_pyqasm(qasm, expected):
+    """Test that the header scan agrees with pyqasm's full-program version extraction."""
+    assert extract_qasm_version(qasm) == expected
+    assert extract_qasm_version(qasm) == Qasm3Analyzer.extract_qasm_version(qasm)
+
+
+@pytest.mark.parametrize("qasm", ["", "qubit q;", "/* OPENQASM 3.0; unterminated"])
+def test_extract_qasm_version_missing_header(qasm):
+    """Test that a program without a version header raises a QasmParsingError."""
+    with pytest.raises(QasmParsingError):
+        extract_qasm_version(qasm)
+
+
+def test_extract_qasm_version_only_scans_header():
+    """Test that the version is read from the header without parsing the rest of the program."""
+    qasm = valid_qasm3_string + "h q[0];\n" * 10
+    with patch.object(Qasm3Analyzer, "extract_qasm_version") as mock_extract:
+        assert extract_qasm_version(qasm) == 3.0
+    mock_extract.assert_not_called()
@@ -16,12 +16,19 @@
 Unit tests for managing quantum program type aliases.
 
 """
+import sys
 from unittest.mock import Mock
 
 import pytest
 
-from qbraid.programs._import import _assign_default_type_alias, _get_class
+from qbraid.programs._import import (
+    LazyTypeRegistry,
+    _get_class,
+    _module_available,
+    loaded_items,
+)
 from qbraid.programs.alias_manager import (
+    _TYPE_ALIAS_CACHE,
     _get_program_type_alias,
     find_str_type_alias,
     get_program_type_alias,
@@ -29,7 +36,15 @@ from qbraid.programs.alias_manager import (
 )
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.exceptions import QasmError as QbraidQasmError
-from qbraid.programs.registry import derive_program_type_alias
+from qbraid.programs.registry import (
+    QPROGRAM_ALIASES,
+    QPROGRAM_REGISTRY,
+    derive_program_type_alias,
+    get_registry_version,
+    register_program_type,
+    unregister_program_type,
+)
+from qbraid.transpiler.graph import ConversionGraph
 
 from ..fixtures import packages_bell
 
@@ -279,18 +294,62 @@ def test_submodule_insufficient_error():
         derive_program_type_alias(SinglePartModule, use_submodule=True)
 
 
-def test_single_part_module_name():
-    """Test alias assignment with a single-part module name."""
-    imported_aliases = {"quantum": object}
-    alias = _assign_default_type_alias(imported_aliases, SinglePartModule)
-    assert alias == "quantum_singlepartmodule"
+def test_module_available_does_not_import():
+    """Test that installed modules are detected without importing them."""
+    assert _module_available("json.decoder")
+    assert not _module_available("json.not_a_submodule")
+    assert not _module_available("not_a_module.submodule")
+
+
+def test_lazy_registry_defers_import_until_lookup(tmp_path, monkeypatch):
+    """Test that deferred program types are only imported when their alias is looked up."""
+    (tmp_path / "lazy_sdk.py").write_text("class Circuit:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_sdk", raising=False)
+
+    registry = LazyTypeRegistry({"str": str})
+    registry.defer("lazy_sdk", "lazy_sdk", "Circuit")
+    registry.defer("missing", "not_a_module", "Circuit")
+
+    assert "lazy_sdk" in registry and "missing" in registry
+    assert len(registry) == 3
+    assert dict(loaded_items(registry)) == {"str": str}
+    assert "lazy_sdk" not in sys.modules
+
+    circuit_type = registry["lazy_sdk"]
+    assert circuit_type is sys.modules["lazy_sdk"].Circuit
+    assert registry.get("missing") is None
+    assert "missing" not in registry
+    assert dict(registry.items()) == {"str": str, "lazy_sdk": circuit_type}
+
 
+def test_lazy_registry_copy_preserves_deferred_entries():
+    """Test that copying and updating a lazy registry does not import deferred types."""
+    registry = LazyTypeRegistry()
+    registry.defer("missing", "not_a_module", "Circuit")
+    copied = registry.copy()
+    merged = LazyTypeRegistry(registry, {"str": str})
 
-def test_duplicate_alias_raises_value_error():
-    """Ensure ValueError is raised for duplicate alias."""
-    imported_aliases = {"quantum": object, "quantum_singlepartmodule": object}
-    with pytest.raises(ValueError, match="Duplicate alias quantum_singlepartmodule"):
-        _assign_default_type_alias(imported_aliases, SinglePartModule)
+    assert list(copied) == ["missing"]
+    assert list(merged) == ["missing", "str"]
+    assert copied.get("missing") is None
+    assert "missing" in registry
+
+
+def test_failed_deferred_import_drops_alias_everywhere():
+    """Test that an alias whose deferred import fails leaves the aliases and graph nodes."""
+    QPROGRAM_REGISTRY.defer("broken_sdk", "not_a_module", "Circuit")
+    QPROGRAM_ALIASES.add("broken_sdk")
+    try:
+        assert "broken_sdk" in ConversionGraph().nodes()
+        version = get_registry_version()
+
+        assert QPROGRAM_REGISTRY.get("broken_sdk") is None
+        assert "broken_sdk" not in QPROGRAM_ALIASES
+        assert get_registry_version() > version
+        assert "broken_sdk" not in ConversionGraph().nodes()
+    finally:
+        unregister_program_type("broken_sdk", raise_error=False)
 
 
 def test_get_ionq_program_type_alias():
@@ -311,3 +370,56 @@ def test_get_class_none_for_unsupported_program():
     with pytest.raises(ValueError) as excinfo:
         _get_class("not a module")
     assert "Unsupported module 'not a module'" == str(excinfo.value)
+
+
+class _CachedProgram:
+    """Program type registered by the alias cache tests."""
+
+
+def test_program_type_alias_cached_by_type():
+    """Test that the alias of a concrete program class is cached until the registry changes."""
+    register_program_type(_CachedProgram, "cached_program")
+    try:
+        assert _get_program_type_alias(_CachedProgram()) == "cached_program"
+        assert _TYPE_ALIAS_CACHE[_CachedProgram] == "cached_program"
+    finally:
+        unregister_program_type("cached_program")
+
+    with pytest.raises(ProgramTypeError):
+        _get_program_type_alias(_CachedProgram())
+    assert _CachedProgram not in _TYPE_ALIAS_CACHE
+
+
+def test_dict_program_type_alias_not_cached_by_type():
+    """Test that dict programs are identified by content, not by a cached alias for dict."""
+    circuit = {"qubits": 1, "circuit": [{"gate": "h", "target": 0}]}
+    assert _get_program_type_alias(circuit) == "ionq"
+    assert _get_program_type_alias(circuit) == "ionq"
+    assert dict not in _TYPE_ALIAS_CACHE
+    assert get_program_type_alias({"not": "a program"}, safe=True) is None
+
+
+def test_dict_program_type_alias_memo_invalidated_by_resize():
+    """Test that a memoized dict alias is recomputed once items are added to the dict."""
+    circuit = {"qubits": 1, "circuit": [{"gate": "h", "target": 0}]}
+    assert _get_program_type_alias(circuit) == "ionq"
+    circuit["gateset"] = 0
+    assert get_program_type_alias(circuit, safe=True) is None
+
+
+def test_dict_program_type_alias_memo_invalidated_by_content_changes():
+    """Test that a memoized dict alias is recomputed when items are replaced in place."""
+    circuit = {"qubits": 1, "circuit": [{"gate": "h", "target": 0}]}
+    assert _get_program_type_alias(circuit) == "ionq"
+    circuit["qubits"] = "one"
+    assert get_program_type_alias(circuit, safe=True) is None
+
+    circuit = {"qubits": 1, "circuit": [{"gate": "h", "target": 0}]}
+    assert _get_program_type_alias(circuit) == "ionq"
+    circuit["circuit"][0] = "h"
+    assert get_program_type_alias(circuit, safe=True) is None
+
+    circuit = {"qubits": 1, "circuit": [{"gate": "h", "target": 0}]}
+    assert _get_program_type_alias(circuit) == "ionq"
+    circuit["circuit"][0]["rotation"] = "pi"
+    assert get_program_type_alias(circuit, safe=True) is None
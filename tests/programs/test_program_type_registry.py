@@ -40,7 +40,11 @@ from qbraid.programs import (
     unregister_program_type,
 )
 from qbraid.programs.exceptions import ProgramTypeError
-from qbraid.programs.registry import get_native_experiment_type, is_registered_alias_native
+from qbraid.programs.registry import (
+    get_native_experiment_type,
+    get_registry_version,
+    is_registered_alias_native,
+)
 from qbraid.programs.typer import IonQDict
 
 
@@ -330,3 +334,19 @@ def test_concurrent_registration_thread_safe():
         stop.set()
         for alias in churn_aliases + reg_aliases:
             unregister_program_type(alias, raise_error=False)
+
+
+def test_registry_version_tracks_mutations():
+    """Test that the registry version increases on (un)registration only."""
+
+    class FakeType:
+        """Fake program type for testing."""
+
+    alias = generate_unique_key(QPROGRAM_REGISTRY)
+    start = get_registry_version()
+    register_program_type(FakeType, alias)
+    assert get_registry_version() == start + 1
+    unregister_program_type(alias)
+    assert get_registry_version() == start + 2
+    unregister_program_type(alias, raise_error=False)
+    assert get_registry_version() == start + 2
@@ -41,6 +41,7 @@ from qbraid.runtime import (
     DeviceProgramTypeMismatchError,
     DeviceStatus,
     GateModelResultData,
+    JobStatus,
     TargetProfile,
 )
 from qbraid.runtime.aws.availability import _calculate_future_time
@@ -717,6 +718,62 @@ def test_job_queue_position_raises_version_error(mock_aws_quantum_task):
     assert "Queue visibility is only available for amazon-braket-sdk>=1.56.0" in str(excinfo.value)
 
 
+def _mock_braket_task(arn: str, client: Mock) -> BraketQuantumTask:
+    """Return a BraketQuantumTask wrapping a mock AwsQuantumTask that uses the given client."""
+    task = Mock()
+    task.id = arn
+    task._aws_session.braket_client = client
+    return BraketQuantumTask(arn, task=task)
+
+
+def test_bulk_status_searches_tasks_by_arn():
+    """Test that task statuses are fetched ten ARNs at a time, following pagination."""
+    arns = [f"arn:aws:braket:us-east-1:123:quantum-task/{i}" for i in range(12)]
+    client = Mock()
+
+    def search_quantum_tasks(filters, maxResults, nextToken=None):  # pylint: disable=invalid-name
+        assert maxResults == 100
+        values = filters[0]["values"]
+        assert filters[0]["name"] == "quantumTaskArn" and len(values) <= 10
+        if len(values) == 10 and nextToken is None:
+            summaries = [{"quantumTaskArn": arn, "status": "COMPLETED"} for arn in values[:5]]
+            return {"quantumTasks": summaries, "nextToken": "page2"}
+        if nextToken == "page2":
+            return {
+                "quantumTasks": [{"quantumTaskArn": arn, "status": "RUNNING"} for arn in values[5:]]
+            }
+        return {"quantumTasks": [{"quantumTaskArn": values[0], "status": "FAILED"}]}
+
+    client.search_quantum_tasks.side_effect = search_quantum_tasks
+    tasks = [_mock_braket_task(arn, client) for arn in arns]
+
+    statuses = BraketQuantumTask.bulk_status(tasks)
+
+    assert statuses == (
+        [JobStatus.COMPLETED] * 5 + [JobStatus.RUNNING] * 5 + [JobStatus.FAILED, None]
+    )
+    assert client.search_quantum_tasks.call_count == 3
+    assert tasks[0]._cache_metadata["status"] == JobStatus.COMPLETED
+    for task in tasks:
+        task._task.state.assert_not_called()
+
+
+def test_bulk_status_groups_tasks_by_client():
+    """Test that tasks in different regions are searched with their own client."""
+    east, west = Mock(), Mock()
+    east.search_quantum_tasks.return_value = {
+        "quantumTasks": [{"quantumTaskArn": "east", "status": "QUEUED"}]
+    }
+    west.search_quantum_tasks.return_value = {
+        "quantumTasks": [{"quantumTaskArn": "west", "status": "CANCELLED"}]
+    }
+    tasks = [_mock_braket_task("east", east), _mock_braket_task("west", west)]
+
+    assert BraketQuantumTask.bulk_status(tasks) == [JobStatus.QUEUED, JobStatus.CANCELLED]
+    east.search_quantum_tasks.assert_called_once()
+    west.search_quantum_tasks.assert_called_once()
+
+
 def test_job_raise_for_cancel_terminal():
     """Test raising an error when trying to cancel a completed/failed job."""
     with patch("qbraid.runtime.job.QuantumJob.is_terminal_state", return_value=True):
@@ -17564,6 +17564,48 @@ def test_job_status_queued_to_completed(aquila_job):
     assert status2 == JobStatus.COMPLETED
 
 
+def _job_model(job_qrn: str, status: str, group_qrn=None) -> RuntimeJob:
+    """Return a copy of the SV1 job model with the given QRN, status and group."""
+    return SV1_GET_JOB.model_copy(
+        update={"jobQrn": job_qrn, "status": JobStatus(status), "groupJobQrn": group_qrn}
+    )
+
+
+def test_job_bulk_status_lists_pending_jobs(monkeypatch):
+    """Test that bulk status pages through the pending jobs of each client."""
+    monkeypatch.setattr("qbraid.runtime.native.job.BULK_STATUS_PAGE_SIZE", 2)
+    client = Mock()
+    client.list_jobs.side_effect = [
+        [_job_model("job-a", "QUEUED"), _job_model("other", "RUNNING")],
+        [_job_model("job-b", "RUNNING")],
+    ]
+    jobs = [QbraidJob(qrn, client=client) for qrn in ("job-a", "job-b", "job-done")]
+
+    statuses = QbraidJob.bulk_status(jobs)
+
+    assert statuses == [JobStatus.QUEUED, JobStatus.RUNNING, None]
+    assert client.list_jobs.call_count == 2
+    client.list_jobs.assert_called_with(status_group="pending", page=2, limit=2)
+    client.get_job.assert_not_called()
+    assert jobs[0]._cache_metadata["status"] == JobStatus.QUEUED
+
+
+def test_job_bulk_status_queries_groups_once():
+    """Test that jobs of a group job are looked up with a single request per group."""
+    client = Mock()
+    client.get_group_jobs.return_value = [
+        _job_model("job-a", "COMPLETED", "group-1"),
+        _job_model("job-b", "RUNNING", "group-1"),
+    ]
+    jobs = [QbraidJob(qrn, client=client) for qrn in ("job-a", "job-b")]
+    for job in jobs:
+        job._cache_metadata["groupJobQrn"] = "group-1"
+
+    assert QbraidJob.bulk_status(jobs) == [JobStatus.COMPLETED, JobStatus.RUNNING]
+    client.get_group_jobs.assert_called_once_with("group-1")
+    client.list_jobs.assert_not_called()
+
+
 def test_job_metadata(sv1_job):
     """Test getting job metadata."""
     metadata = sv1_job.metadata()
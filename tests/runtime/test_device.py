@@ -21,7 +21,10 @@ Unit tests for QbraidDevice and QbraidProvider classes.
 import importlib.util
 import json
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -30,12 +33,13 @@ import numpy as np
 import pytest
 from qbraid_core.services.runtime.schemas import DeviceCalibration, Program, RuntimeDevice
 
-from qbraid._caching import cache_disabled
+from qbraid._caching import cache_disabled, disable_persistent_cache, enable_persistent_cache
 from qbraid.programs import ExperimentType, ProgramSpec, unregister_program_type
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import IonQDict
-from qbraid.runtime import Result, TargetProfile, ValidationLevel
+from qbraid.runtime import DeviceStatus, QuantumDevice, Result, TargetProfile, ValidationLevel
 from qbraid.runtime.exceptions import ProgramValidationError, ResourceNotFoundError
+from qbraid.runtime.group import _active_group, get_active_group
 from qbraid.runtime.native import QbraidDevice, QbraidJob, QbraidProvider
 from qbraid.runtime.native.provider import (
     _serialize_sequence,
@@ -339,6 +343,40 @@ def test_provider_get_devices_bypass_cache(mock_client, device_data_qir, monkeyp
     provider.get_devices.cache_clear()
 
 
+def test_provider_get_devices_from_persistent_cache(
+    mock_client, device_data_qir, monkeypatch, tmp_path
+):
+    """Test that device data stored on disk is reused after the in-memory cache is cleared,
+    as it would be by a new process."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    enable_persistent_cache(tmp_path / "cache.sqlite")
+    try:
+        client = mock_client
+        client.list_devices = Mock()
+        client.list_devices.return_value = [RuntimeDevice.model_validate(device_data_qir["data"])]
+
+        devices = QbraidProvider(client=client).get_devices()
+        QbraidProvider.get_devices.cache_clear()
+        cached_devices = QbraidProvider(client=client).get_devices()
+
+        assert client.list_devices.call_count == 1
+        assert [d.id for d in cached_devices] == [d.id for d in devices]
+        assert cached_devices[0].client is client
+    finally:
+        disable_persistent_cache()
+        QbraidProvider.get_devices.cache_clear()
+
+
+def test_provider_cache_namespace_is_stable(mock_client):
+    """Test that the on-disk cache namespace depends only on the credentials."""
+    provider = QbraidProvider(client=mock_client)
+    namespace = provider._cache_namespace()
+
+    assert namespace == QbraidProvider(client=mock_client)._cache_namespace()
+    assert len(namespace) == 64
+    assert mock_client.session.api_key not in namespace
+
+
 def test_provider_search_devices_raises_for_bad_client(mock_client):
     """Test raising ResourceNotFoundError when the client fails to authenticate."""
     provider = QbraidProvider(client=mock_client)
@@ -1080,3 +1118,168 @@ def test_coupling_map_cached_per_device(mock_profile):
 
     assert first == second
     client.get_device_calibrations.assert_called_once()
+
+
+class _BatchDevice(QuantumDevice):
+    """Device that tags each program with the process that transformed it, and records
+    the programs it submits."""
+
+    def __init__(self, profile, fail_transform=(), fail_submit=(), submit_delay=0.0, lock=None):
+        super().__init__(profile=profile)
+        self.lock = lock
+        self.fail_transform = set(fail_transform)
+        self.fail_submit = set(fail_submit)
+        self.submit_delay = submit_delay
+        self.status_calls = 0
+
+    def status(self):
+        self.status_calls += 1
+        return DeviceStatus.ONLINE
+
+    def transform(self, run_input):
+        if run_input in self.fail_transform:
+            raise ValueError(f"cannot transform {run_input}")
+        return (run_input, os.getpid())
+
+    def submit(self, run_input, *args, **kwargs):
+        time.sleep(self.submit_delay)
+        program, _ = run_input
+        if program in self.fail_submit:
+            raise RuntimeError(f"cannot submit {program}")
+        return {"program": run_input, "args": args, "kwargs": kwargs, "group": get_active_group()}
+
+
+@pytest.fixture
+def batch_profile():
+    """Profile without a program spec, so programs are passed through to transform."""
+    return TargetProfile(
+        device_id="batch-device", simulator=True, experiment_type=ExperimentType.GATE_MODEL
+    )
+
+
+def test_run_batch_preserves_order_and_collects_failures(batch_profile):
+    """Jobs are returned in input order, with failed programs represented by their exception."""
+    device = _BatchDevice(batch_profile, fail_transform={"p1"}, fail_submit={"p3"})
+    programs = [f"p{i}" for i in range(6)]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        jobs = device.run_batch(programs, 100, executor=executor, name="sweep")
+
+    assert isinstance(jobs[1], ValueError)
+    assert isinstance(jobs[3], RuntimeError)
+    for index in (0, 2, 4, 5):
+        assert jobs[index]["program"][0] == programs[index]
+        assert jobs[index]["args"] == (100,)
+        assert jobs[index]["kwargs"] == {"name": "sweep"}
+
+
+def test_run_batch_checks_device_status_once(batch_profile):
+    """The device status is checked once per batch, not once per program."""
+    device = _BatchDevice(batch_profile)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        device.run_batch([f"p{i}" for i in range(5)], executor=executor, chunksize=2)
+
+    assert device.status_calls == 1
+
+
+def test_run_batch_uses_threads_by_default(batch_profile):
+    """Without an executor, the runtime profile is applied in threads of this process."""
+    device = _BatchDevice(batch_profile, lock=threading.Lock())
+
+    jobs = device.run_batch(["a", "b", "c"], chunksize=2)
+
+    assert [job["program"] for job in jobs] == [(name, os.getpid()) for name in "abc"]
+
+
+def test_run_batch_process_pool_executor(batch_profile):
+    """A caller-provided process pool applies the runtime profile in worker processes."""
+    device = _BatchDevice(batch_profile)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        jobs = device.run_batch(["a", "b", "c"], executor=executor, chunksize=2)
+
+    assert [job["program"][0] for job in jobs] == ["a", "b", "c"]
+    assert all(job["program"][1] != os.getpid() for job in jobs)
+
+
+def test_run_batch_bounds_concurrent_submissions(batch_profile):
+    """No more than max_workers submissions are in flight at any time."""
+    device = _BatchDevice(batch_profile, submit_delay=0.05)
+    lock = threading.Lock()
+    in_flight = [0, 0]
+    submit = device.submit
+
+    def tracked_submit(run_input, *args, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        try:
+            return submit(run_input, *args, **kwargs)
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    device.submit = tracked_submit
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        start = time.perf_counter()
+        jobs = device.run_batch([f"p{i}" for i in range(8)], executor=executor, max_workers=2)
+        elapsed = time.perf_counter() - start
+
+    assert len(jobs) == 8
+    assert in_flight[1] == 2
+    assert elapsed < 8 * 0.05
+
+
+def test_run_batch_submits_in_caller_context(batch_profile):
+    """Submissions see the context variables of the caller, e.g. the active group."""
+    device = _BatchDevice(batch_profile)
+    token = _active_group.set("qbraid:group:123")
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            jobs = device.run_batch(["a", "b"], executor=executor)
+    finally:
+        _active_group.reset(token)
+
+    assert [job["group"] for job in jobs] == ["qbraid:group:123"] * 2
+
+
+def test_run_batch_empty_input(batch_profile):
+    """An empty batch submits nothing and does not check the device status."""
+    device = _BatchDevice(batch_profile)
+
+    assert not device.run_batch([])
+    assert device.status_calls == 0
+
+
+class _RunOverrideDevice(_BatchDevice):
+    """Device that consumes a run option in its own run method."""
+
+    def run(self, run_input, *args, label=None, **kwargs):
+        job = super().run(run_input, *args, **kwargs)
+        job["label"] = label
+        return job
+
+
+def test_run_batch_uses_run_override(batch_profile):
+    """Devices that override run have each program of the batch run through it."""
+    device = _RunOverrideDevice(batch_profile, fail_transform={"b"})
+
+    jobs = device.run_batch(["a", "b", "c"], 100, label="sweep", name="job")
+
+    assert isinstance(jobs[1], ValueError)
+    for index, name in ((0, "a"), (2, "c")):
+        assert jobs[index]["program"][0] == name
+        assert jobs[index]["args"] == (100,)
+        assert jobs[index]["kwargs"] == {"name": "job"}
+        assert jobs[index]["label"] == "sweep"
+
+
+@pytest.mark.parametrize("kwargs", [{"max_workers": 0}, {"chunksize": 0}])
+def test_run_batch_raises_for_invalid_arguments(batch_profile, kwargs):
+    """max_workers and chunksize must be positive."""
+    device = _BatchDevice(batch_profile)
+
+    with pytest.raises(ValueError):
+        device.run_batch(["a"], **kwargs)
@@ -12,14 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# pylint: disable=too-many-lines
+
 """Unit tests for GroupJobSession and GroupResult."""
 
+import asyncio
 import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 from qbraid_core.services.runtime.schemas import Program
 
+from qbraid.runtime.enums import JobStatus
 from qbraid.runtime.group import (
     GroupJobSession,
     GroupResult,
@@ -30,6 +35,7 @@ from qbraid.runtime.group import (
     reset_active_group,
     reset_active_group_session,
 )
+from qbraid.runtime.job import QuantumJob
 from qbraid.runtime.result import Result
 
 from ._resources import MockClient
@@ -45,15 +51,37 @@ def _make_mock_result(job_id: str, success: bool = True) -> Result:
     return Result(device_id="mock-device", job_id=job_id, success=success, data=data)
 
 
-def _make_mock_job(job_id: str, result: Result | None = None):
-    """Create a mock QuantumJob-like object."""
-    job = MagicMock()
-    job.id = job_id
-    job.__str__ = lambda self: job_id
+class _MockJob(QuantumJob):
+    """QuantumJob whose status, result, and cancel methods are mocks."""
+
+    def __init__(self, job_id: str, result: Result, statuses: list[JobStatus]):
+        super().__init__(job_id)
+        self._statuses = list(statuses)
+        self.status = MagicMock(side_effect=self._next_status)
+        self.result = MagicMock(return_value=result)
+        self.cancel = MagicMock()
+
+    def _next_status(self) -> JobStatus:
+        """Return the next scripted status, repeating the last one indefinitely."""
+        return self._statuses.pop(0) if len(self._statuses) > 1 else self._statuses[0]
+
+    def status(self):  # pylint: disable=method-hidden
+        """Overridden by a mock in __init__."""
+
+    def result(self):  # pylint: disable=method-hidden
+        """Overridden by a mock in __init__."""
+
+    def cancel(self):  # pylint: disable=method-hidden
+        """Overridden by a mock in __init__."""
+
+
+def _make_mock_job(
+    job_id: str, result: Result | None = None, statuses: list[JobStatus] | None = None
+):
+    """Create a mock QuantumJob that reports the given statuses, ending COMPLETED by default."""
     if result is None:
         result = _make_mock_result(job_id)
-    job.result.return_value = result
-    return job
+    return _MockJob(job_id, result, statuses or [JobStatus.COMPLETED])
 
 
 # ===========================================================================
@@ -400,18 +428,79 @@ class TestResults:
         with GroupJobSession(client=client) as group:
             jobs = []
             for i in range(3):
-                job = _make_mock_job(f"job-{i}")
+                job = _make_mock_job(
+                    f"job-{i}", statuses=[JobStatus.RUNNING] * i + [JobStatus.COMPLETED]
+                )
                 group._register_job(job)
                 jobs.append(job)
 
-        result = group.results(timeout=10, poll_interval=1)
+        result = group.results(timeout=10, poll_interval=0.01)
         assert isinstance(result, GroupResult)
-        assert len(result) == 3
+        assert list(result) == ["job-0", "job-1", "job-2"]
 
-        for job in jobs:
-            job.wait_for_final_state.assert_called_once_with(timeout=10, poll_interval=1)
+        for i, job in enumerate(jobs):
+            assert job.status.call_count == i + 1
             job.result.assert_called_once()
 
+    def test_results_polls_jobs_concurrently_against_one_deadline(self):
+        """Verify the timeout applies to the whole group rather than to each job."""
+        client = MockClient()
+        with GroupJobSession(client=client) as group:
+            for i in range(5):
+                group._register_job(_make_mock_job(f"job-{i}", statuses=[JobStatus.RUNNING]))
+
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError, match="5 of 5 jobs"):
+            group.results(timeout=0.2, poll_interval=0.05)
+        assert time.perf_counter() - start < 0.6
+
+    def test_results_fetches_results_in_parallel(self):
+        """Verify results of finished jobs are fetched concurrently."""
+        client = MockClient()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(job_id):
+            barrier.wait()
+            return _make_mock_result(job_id)
+
+        with GroupJobSession(client=client) as group:
+            for i in range(3):
+                job = _make_mock_job(f"job-{i}")
+                job.result.side_effect = lambda job_id=f"job-{i}": fetch(job_id)
+                group._register_job(job)
+
+        result = group.results(timeout=10, max_workers=3)
+        assert len(result) == 3
+
+    def test_aresults(self):
+        """Verify aresults() waits for all jobs without blocking the event loop."""
+        client = MockClient()
+        with GroupJobSession(client=client) as group:
+            for i in range(3):
+                group._register_job(
+                    _make_mock_job(f"job-{i}", statuses=[JobStatus.QUEUED] * i + [JobStatus.FAILED])
+                )
+
+        result = asyncio.run(group.aresults(timeout=10, poll_interval=0.01))
+        assert list(result) == ["job-0", "job-1", "job-2"]
+        assert result.group_id == group.group_id
+
+    def test_aresults_timeout(self):
+        """Verify aresults() raises TimeoutError once the group-wide deadline passes."""
+        client = MockClient()
+        with GroupJobSession(client=client) as group:
+            group._register_job(_make_mock_job("done"))
+            group._register_job(_make_mock_job("stuck", statuses=[JobStatus.RUNNING]))
+
+        with pytest.raises(TimeoutError, match="1 of 2 jobs"):
+            asyncio.run(group.aresults(timeout=0.1, poll_interval=0.02))
+
+    def test_aresults_before_enter_raises(self):
+        """Verify aresults() before open raises RuntimeError."""
+        session = GroupJobSession(client=MockClient())
+        with pytest.raises(RuntimeError, match="not been opened"):
+            asyncio.run(session.aresults())
+
     def test_results_empty_group(self):
         """Verify results() returns an empty GroupResult for groups with no jobs."""
         client = MockClient()
@@ -463,15 +552,18 @@ class TestOnAllComplete:
         assert collected["j1"] is r1
 
     def test_callback_respects_timeout_and_poll_interval(self):
-        """Verify the callback passes timeout and poll_interval to wait_for_final_state."""
+        """Verify the callback passes timeout and poll_interval to results()."""
         client = MockClient()
         job = _make_mock_job("j1")
 
-        with GroupJobSession(client=client) as group:
-            group._register_job(job)
-            group.on_all_complete(lambda r: None, timeout=42, poll_interval=2)
+        with patch.object(
+            GroupJobSession, "results", return_value=GroupResult("g", {})
+        ) as mock_results:
+            with GroupJobSession(client=client) as group:
+                group._register_job(job)
+                group.on_all_complete(lambda r: None, timeout=42, poll_interval=2)
 
-        job.wait_for_final_state.assert_called_once_with(timeout=42, poll_interval=2)
+        mock_results.assert_called_once_with(timeout=42, poll_interval=2)
 
     def test_callback_not_invoked_if_not_registered(self):
         """If no callback is registered, __exit__ just closes without waiting."""
@@ -481,8 +573,8 @@ class TestOnAllComplete:
         with GroupJobSession(client=client) as group:
             group._register_job(job)
 
-        # wait_for_final_state should NOT be called if no callback registered
-        job.wait_for_final_state.assert_not_called()
+        # No status should be polled if no callback registered
+        job.status.assert_not_called()
 
 
 # ===========================================================================
@@ -18,12 +18,15 @@
 Unit tests for quantum jobs functions and data types
 
 """
+import asyncio
+import itertools
+import time
 from unittest.mock import patch
 
 import pytest
 
 from qbraid.programs import ExperimentType
-from qbraid.runtime import QuantumJob
+from qbraid.runtime import BackoffPolicy, QuantumJob
 from qbraid.runtime.enums import JobStatus
 from qbraid.runtime.exceptions import (
     DeviceProgramTypeMismatchError,
@@ -207,14 +210,17 @@ def quantum_job():
 @pytest.mark.asyncio
 async def test_async_wait_for_final_state_success(quantum_job):
     """Ensures the async method completes when the job reaches a terminal state."""
-    with patch.object(quantum_job, "is_terminal_state", side_effect=[False, False, True]):
-        await quantum_job._wait_for_final_state(timeout=1, poll_interval=0.1)
+    statuses = [JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.COMPLETED]
+    with patch.object(quantum_job, "status", side_effect=statuses):
+        with patch.object(quantum_job, "is_terminal_state") as mock_is_terminal_state:
+            await quantum_job._wait_for_final_state(timeout=1, poll_interval=0.1)
+    mock_is_terminal_state.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_async_wait_for_final_state_timeout(quantum_job):
     """Ensures the async method raises TimeoutError if the job never completes."""
-    with patch.object(quantum_job, "is_terminal_state", return_value=False):
+    with patch.object(quantum_job, "status", return_value=JobStatus.RUNNING):
         with pytest.raises(TimeoutError):
             await quantum_job._wait_for_final_state(timeout=0.2, poll_interval=0.1)
 
@@ -224,7 +230,7 @@ async def test_async_result_success(quantum_job):
     """Test that async_result returns the job result after reaching terminal state."""
     mock_result = "expected_result"
 
-    with patch.object(quantum_job, "is_terminal_state", side_effect=[False, True]):
+    with patch.object(quantum_job, "status", side_effect=[JobStatus.RUNNING, JobStatus.COMPLETED]):
         with patch.object(quantum_job, "result", return_value=mock_result):
             result = await quantum_job.async_result(timeout=1, poll_interval=0.1)
             assert result == mock_result
@@ -233,11 +239,114 @@ async def test_async_result_success(quantum_job):
 @pytest.mark.asyncio
 async def test_async_result_timeout(quantum_job):
     """Test that async_result raises TimeoutError if job never reaches terminal state."""
-    with patch.object(quantum_job, "is_terminal_state", return_value=False):
+    with patch.object(quantum_job, "status", return_value=JobStatus.RUNNING):
         with pytest.raises(TimeoutError):
             await quantum_job.async_result(timeout=0.2, poll_interval=0.1)
 
 
+@pytest.mark.asyncio
+async def test_async_wait_for_final_state_uses_async_status(quantum_job):
+    """Test that the async waiter polls a natively implemented async_status."""
+
+    async def async_status():
+        return next(statuses)
+
+    statuses = iter([JobStatus.RUNNING, JobStatus.COMPLETED])
+    quantum_job.async_status = async_status
+    with patch.object(quantum_job, "status") as mock_status:
+        await quantum_job._wait_for_final_state(timeout=1, poll_interval=0.01)
+    mock_status.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_final_state_does_not_block_event_loop(quantum_job):
+    """Test that a slow blocking status query does not stall other coroutines."""
+    ticks = 0
+
+    def slow_status():
+        time.sleep(0.2)
+        return JobStatus.COMPLETED
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    with patch.object(quantum_job, "status", side_effect=slow_status):
+        await quantum_job._wait_for_final_state(timeout=1, poll_interval=0.01)
+    task.cancel()
+    assert ticks > 5
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        (BackoffPolicy(initial_interval=1), [1, 1, 1, 1]),
+        (BackoffPolicy.fixed(0.5), [0.5, 0.5, 0.5, 0.5]),
+        (BackoffPolicy(initial_interval=1, multiplier=2), [1, 2, 4, 8]),
+        (BackoffPolicy(initial_interval=1, max_interval=3, multiplier=2), [1, 2, 3, 3]),
+    ],
+)
+def test_backoff_policy_delays(policy, expected):
+    """Test that the backoff policy grows delays geometrically up to the maximum."""
+    assert list(itertools.islice(policy.delays(), len(expected))) == expected
+
+
+def test_backoff_policy_jitter():
+    """Test that jittered delays stay within the jitter fraction of the base delay."""
+    policy = BackoffPolicy(initial_interval=2, max_interval=8, multiplier=2, jitter=0.5)
+    delays = list(itertools.islice(policy.delays(), 200))
+    bases = [2, 4] + [8] * 198
+    assert all(0.5 * base <= delay <= 1.5 * base for delay, base in zip(delays, bases))
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"initial_interval": -1},
+        {"initial_interval": 5, "max_interval": 1},
+        {"multiplier": 0.5},
+        {"jitter": 1.5},
+    ],
+)
+def test_backoff_policy_invalid(kwargs):
+    """Test that invalid backoff policy parameters raise a ValueError."""
+    with pytest.raises(ValueError):
+        BackoffPolicy(**kwargs)
+
+
+def test_wait_for_final_state_with_backoff(quantum_job):
+    """Test that the waiter sleeps for the delays given by the backoff policy."""
+    policy = BackoffPolicy(initial_interval=1, max_interval=3, multiplier=2)
+    statuses = [JobStatus.QUEUED] * 4 + [JobStatus.COMPLETED]
+    with patch.object(quantum_job, "status", side_effect=statuses):
+        with patch("qbraid.runtime.job.sleep") as mock_sleep:
+            quantum_job.wait_for_final_state(backoff=policy)
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2, 3, 3]
+
+
+def test_wait_for_final_state_default_backoff_policy(quantum_job):
+    """Test that the job's backoff_policy is used when no backoff is given."""
+    quantum_job.backoff_policy = BackoffPolicy(initial_interval=0.5, multiplier=3)
+    statuses = [JobStatus.QUEUED] * 2 + [JobStatus.COMPLETED]
+    with patch.object(quantum_job, "status", side_effect=statuses):
+        with patch("qbraid.runtime.job.sleep") as mock_sleep:
+            quantum_job.wait_for_final_state(poll_interval=10)
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.5]
+
+
+def test_wait_for_final_state_does_not_sleep_past_timeout(quantum_job):
+    """Test that the waiter never sleeps beyond the remaining timeout."""
+    with patch.object(quantum_job, "status", return_value=JobStatus.RUNNING):
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            quantum_job.wait_for_final_state(timeout=0.1, poll_interval=5)
+    assert time.perf_counter() - start < 1
+
+
 def test_wait_for_final_state_success(quantum_job):
     """Mocking the status to change to a final state after some time"""
     with patch.object(quantum_job, "is_terminal_state", side_effect=[False, False, True]):
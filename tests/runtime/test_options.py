@@ -17,6 +17,7 @@ Unit tests for the qBraid runtime Options dataclass.
 
 """
 import copy
+import pickle
 
 import pytest
 
@@ -317,6 +318,29 @@ def test_options_copy_with_dynamic_fields():
     assert options.dynamic_field == "dynamic_value"
 
 
+def _is_bool(value):
+    return isinstance(value, bool)
+
+
+def test_options_pickle_round_trip():
+    """Test that pickling preserves fields, default fields, and validators."""
+    options = RuntimeOptions(transpile=True)
+    options.set_validator("transpile", _is_bool)
+    options.dynamic_field = "dynamic_value"
+
+    restored = pickle.loads(pickle.dumps(options))
+
+    assert restored == options
+    assert restored.dynamic_field == "dynamic_value"
+    assert restored._default_fields == {"transpile": True}
+
+    with pytest.raises(ValueError):
+        restored.transpile = "invalid"
+
+    with pytest.raises(KeyError):
+        del restored["transpile"]
+
+
 def test_options_reserved_keyword_set_validator():
     """Test that 'set_validator' keyword raises a ValueError."""
     with pytest.raises(
@@ -0,0 +1,212 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=redefined-outer-name
+
+"""
+Unit tests for waiting on many quantum jobs at once
+
+"""
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from qbraid.runtime import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    FIRST_FAILED,
+    BackoffPolicy,
+    JobStatus,
+    QuantumJob,
+    as_completed,
+    refresh_statuses,
+    wait_all,
+)
+
+
+class ScriptedJob(QuantumJob):
+    """Job whose status() returns the next of a scripted sequence of statuses."""
+
+    def __init__(self, job_id, statuses):
+        super().__init__(job_id)
+        self._statuses = list(statuses)
+        self.status_calls = 0
+
+    def status(self):
+        self.status_calls += 1
+        if len(self._statuses) > 1:
+            return self._statuses.pop(0)
+        return self._statuses[0]
+
+    def cancel(self):
+        pass
+
+    def result(self):
+        return self.id
+
+
+class BulkJob(ScriptedJob):
+    """Scripted job whose class reports statuses through a bulk endpoint."""
+
+    bulk_calls: list[list[str]] = []
+
+    @classmethod
+    def bulk_status(cls, jobs):
+        cls.bulk_calls.append([job.id for job in jobs])
+        return [job.status() if job.id != "unreported" else None for job in jobs]
+
+
+@pytest.fixture(autouse=True)
+def fast_polling():
+    """Skip the sleeps between polling rounds."""
+    BulkJob.bulk_calls = []
+    with patch("qbraid.runtime.polling.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+RUN = JobStatus.RUNNING
+DONE = JobStatus.COMPLETED
+FAIL = JobStatus.FAILED
+
+
+def test_refresh_statuses_uses_bulk_endpoint_and_falls_back():
+    """Test that bulk-capable jobs are queried together and the rest individually."""
+    bulk_jobs = [BulkJob(f"bulk{i}", [RUN]) for i in range(3)]
+    unreported = BulkJob("unreported", [DONE])
+    plain = ScriptedJob("plain", [FAIL])
+
+    statuses = refresh_statuses([bulk_jobs[0], plain, *bulk_jobs[1:], unreported])
+
+    assert statuses == [RUN, FAIL, RUN, RUN, DONE]
+    assert BulkJob.bulk_calls == [["bulk0", "bulk1", "bulk2", "unreported"]]
+    assert unreported.status_calls == 1
+
+
+def test_refresh_statuses_skips_cached_terminal_jobs():
+    """Test that jobs already known to be finished are not queried again."""
+    job = ScriptedJob("job", [RUN])
+    job._cache_metadata["status"] = DONE
+
+    assert refresh_statuses([job]) == [DONE]
+    assert job.status_calls == 0
+
+
+def test_refresh_statuses_bounds_concurrency():
+    """Test that individual status queries run on at most max_workers threads."""
+    lock = threading.Lock()
+    active, peak = 0, 0
+
+    class SlowJob(ScriptedJob):
+        """Job whose status query takes a while."""
+
+        def status(self):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.02)
+            with lock:
+                active -= 1
+            return DONE
+
+    jobs = [SlowJob(str(i), [DONE]) for i in range(12)]
+    assert refresh_statuses(jobs, max_workers=3) == [DONE] * 12
+    assert 1 < peak <= 3
+
+
+def test_refresh_statuses_bulk_error_falls_back():
+    """Test that a failing bulk endpoint falls back to individual status queries."""
+
+    class BrokenBulkJob(ScriptedJob):
+        """Job whose bulk endpoint raises."""
+
+        @classmethod
+        def bulk_status(cls, jobs):
+            raise ConnectionError("unavailable")
+
+    jobs = [BrokenBulkJob("a", [RUN]), BrokenBulkJob("b", [DONE])]
+    assert refresh_statuses(jobs) == [RUN, DONE]
+
+
+def test_as_completed_yields_jobs_as_they_finish():
+    """Test that jobs are yielded in the order in which they reach a final state."""
+    slow = BulkJob("slow", [RUN, RUN, DONE])
+    fast = BulkJob("fast", [RUN, FAIL])
+    instant = ScriptedJob("instant", [DONE])
+
+    assert [job.id for job in as_completed([slow, fast, instant])] == ["instant", "fast", "slow"]
+    assert BulkJob.bulk_calls == [["slow", "fast"], ["slow", "fast"], ["slow"]]
+
+
+def test_as_completed_timeout(fast_polling):
+    """Test that as_completed raises once the timeout expires with jobs still pending."""
+    fast_polling.side_effect = lambda seconds: None
+    jobs = [ScriptedJob("done", [DONE]), ScriptedJob("stuck", [RUN])]
+
+    completed = []
+    with patch("qbraid.runtime.job.time", side_effect=[0, 0, 2]):
+        with pytest.raises(TimeoutError, match="1 of 2 jobs"):
+            for job in as_completed(jobs, timeout=1):
+                completed.append(job.id)
+    assert completed == ["done"]
+
+
+def test_as_completed_uses_backoff(fast_polling):
+    """Test that polling rounds are spaced by the backoff policy."""
+    job = ScriptedJob("job", [RUN, RUN, RUN, DONE])
+    policy = BackoffPolicy(initial_interval=1, multiplier=2)
+
+    list(as_completed([job], backoff=policy))
+
+    assert [call.args[0] for call in fast_polling.call_args_list] == [1, 2, 4]
+
+
+@pytest.mark.parametrize(
+    "return_when, expected_done",
+    [
+        (ALL_COMPLETED, ["a", "b", "c"]),
+        (FIRST_COMPLETED, ["b"]),
+        (FIRST_FAILED, ["b", "c"]),
+    ],
+)
+def test_wait_all_return_when(return_when, expected_done):
+    """Test that wait_all returns once its return_when condition is met."""
+    jobs = [
+        ScriptedJob("a", [RUN, RUN, RUN, DONE]),
+        ScriptedJob("b", [RUN, DONE]),
+        ScriptedJob("c", [RUN, RUN, FAIL]),
+    ]
+
+    done, not_done = wait_all(jobs, return_when=return_when)
+
+    assert [job.id for job in done] == expected_done
+    assert [job.id for job in not_done] == [job.id for job in jobs if job.id not in expected_done]
+
+
+def test_wait_all_timeout_returns_pending_jobs():
+    """Test that wait_all returns rather than raises when the timeout expires."""
+    jobs = [ScriptedJob("done", [DONE]), ScriptedJob("stuck", [RUN])]
+
+    with patch("qbraid.runtime.job.time", side_effect=[0, 2]):
+        result = wait_all(jobs, timeout=1)
+
+    assert [job.id for job in result.done] == ["done"]
+    assert [job.id for job in result.not_done] == ["stuck"]
+
+
+def test_wait_all_invalid_return_when():
+    """Test that an unknown return_when option raises a ValueError."""
+    with pytest.raises(ValueError, match="Invalid return_when"):
+        wait_all([], return_when="SOMETIMES")
@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-# pylint: disable=redefined-outer-name
+# pylint: disable=redefined-outer-name,too-many-lines
 
 """
 Unit tests for retrieving and post-processing experimental results.
 
 """
 import datetime
+import random
 from collections import Counter
 
 import numpy as np
@@ -26,11 +27,15 @@ import pytest
 
 from qbraid.programs import ExperimentType
 from qbraid.runtime.postprocess import (
+    _format_data_python,
+    _format_data_vectorized,
     distribute_counts,
     format_data,
     normalize_batch_bit_lengths,
     normalize_bit_lengths,
     normalize_data,
+    pack_bitstrings,
+    unpack_bitstrings,
 )
 from qbraid.runtime.result import BatchResult, Result
 from qbraid.runtime.result_data import (
@@ -260,13 +265,37 @@ def test_get_counts_raises_for_no_measurements():
 def test_get_counts_from_cache_key():
     """Test that counts are retrieved from the cache key."""
     data = GateModelResultData(measurement_counts={"10": 2})
-    assert all(value is None for value in data._cache.values())
+    assert not data._cache
     counts = data.get_counts()
     assert data._cache["bin_nz"] == counts
     data._cache["bin_nz"] = 42
     assert data.get_counts() == 42
 
 
+def test_result_data_caches_each_view_once():
+    """Test that each counts and probabilities view is built once, and only when requested."""
+    data = GateModelResultData(measurement_counts={"00": 3, "10": 5})
+    counts = data.get_counts()
+    assert counts == {"00": 3, "10": 5}
+    assert data.get_counts(include_zero_values=True, decimal=True) == {0: 3, 1: 0, 2: 5, 3: 0}
+    probabilities = data.get_probabilities()
+    assert set(data._cache) == {"bin_nz", "dec_wz", "prob_bin_nz"}
+    assert data.get_counts() is counts
+    assert data.get_probabilities() is probabilities
+
+
+def test_measurement_counts_restored_once():
+    """Test that packed counts are restored to one dictionary, which keeps in-place edits."""
+    data = GateModelResultData(measurement_counts={"01": 2, "11": 4})
+    counts = data.measurement_counts
+    assert counts == {"01": 2, "11": 4}
+    assert data.measurement_counts is counts
+
+    counts["00"] = 1
+    assert data.measurement_counts == {"01": 2, "11": 4, "00": 1}
+    assert data.get_counts() == {"00": 1, "01": 2, "11": 4}
+
+
 class MockBatchResult:
     """Mock batch result for testing."""
 
@@ -343,10 +372,10 @@ def test_to_dict_basic(gate_model_result_data):
 
 def test_to_dict_cache(gate_model_result_data):
     """Test that the to_dict method uses caching correctly."""
-    assert gate_model_result_data._cache["to_dict"] is None
+    assert "to_dict" not in gate_model_result_data._cache
     gate_model_result_data.to_dict()
 
-    assert gate_model_result_data._cache["to_dict"] is not None
+    assert "to_dict" in gate_model_result_data._cache
 
     cached_result = gate_model_result_data._cache["to_dict"]
     result_dict = gate_model_result_data.to_dict()
@@ -376,7 +405,7 @@ def test_to_dict_probabilities(gate_model_result_data):
 
 def test_get_probabilities_from_cache(gate_model_result_data):
     """Test that probabilities are retrieved from cache if present."""
-    assert gate_model_result_data._cache["prob_dec_nz"] is None
+    assert "prob_dec_nz" not in gate_model_result_data._cache
     calculated_probs = gate_model_result_data.get_probabilities(decimal=True)
     assert gate_model_result_data._cache["prob_dec_nz"] == calculated_probs
     mock_cached_probs = {}
@@ -627,6 +656,190 @@ def test_format_counts_include_zero_values_decimal(counts):
     assert result == expected
 
 
+def _random_counts(num_bits: int, num_keys: int, seed: int) -> dict[str, int]:
+    """Random counts with unpadded, spaced, and '0b'-prefixed keys, and some zero values."""
+    rng = random.Random(seed)
+    counts = {}
+    for _ in range(num_keys):
+        key = format(rng.getrandbits(num_bits), "b")
+        style = rng.randrange(3)
+        if style == 1:
+            key = " ".join(key)
+        elif style == 2:
+            key = "0b" + key
+        counts[key] = rng.choice([0, rng.randrange(1, 1000), rng.random()])
+    return counts
+
+
+@pytest.mark.parametrize(
+    "counts",
+    [
+        {"1 1": 13, "0 0": 46, "1 0": 79},
+        {"01": 1, "1": 2, "0 1": 3},
+        {"1": 2, "01": 1, "0b1": 4},
+        {"0b101": 5, "0b 0 1": 0, "11": 2.5},
+        {3: 10, 0: 5, True: 2},
+        {0: 0, 1: 0},
+        {"1" * 63: 1, "0": 2},
+        _random_counts(6, 40, seed=0),
+        _random_counts(12, 500, seed=1),
+        _random_counts(40, 300, seed=2),
+    ],
+)
+@pytest.mark.parametrize("include_zero_values", [False, True])
+@pytest.mark.parametrize("decimal", [False, True])
+def test_format_counts_vectorized_matches_python(counts, include_zero_values, decimal):
+    """The vectorized formatting returns the same keys, values, order, and value types."""
+    if include_zero_values and max(len(str(key)) for key in counts) > 16:
+        pytest.skip("State space too large to enumerate.")
+
+    expected = _format_data_python(counts, include_zero_values, decimal)
+    result = _format_data_vectorized(counts, include_zero_values, decimal)
+
+    if decimal and not all(isinstance(key, str) for key in counts):
+        assert result is None
+        return
+
+    assert list(result.items()) == list(expected.items())
+    assert [type(value) for value in result.values()] == [
+        type(value) for value in expected.values()
+    ]
+    assert [type(key) for key in result] == [type(key) for key in expected]
+
+
+@pytest.mark.parametrize(
+    "counts",
+    [
+        {"1" * 64: 1, "0": 2},
+        {-1: 3, 2: 4},
+        {"2": 3, "10": 1},
+        {"abc": 1, "def": 2},
+        {"0é": 1, "1": 2},
+        {"": 1, "1": 2},
+        {1.0: 1},
+    ],
+)
+def test_format_counts_falls_back_for_unsupported_keys(counts):
+    """Keys the vectorized formatting does not support are formatted one at a time."""
+    assert _format_data_vectorized(counts) is None
+    assert format_data(counts) == _format_data_python(counts)
+
+
+def test_pack_unpack_bitstrings_round_trip():
+    """Bitstrings of any length up to 63 bits are packed into integers and back."""
+    bitstrings = ["0", "1", "101", "0" * 8, "1" * 9, "1" * 63]
+    outcomes = pack_bitstrings(bitstrings)
+
+    assert outcomes.dtype == np.uint64
+    assert outcomes.tolist() == [int(bitstring, 2) for bitstring in bitstrings]
+    assert unpack_bitstrings(outcomes, 63) == [bitstring.zfill(63) for bitstring in bitstrings]
+
+
+def test_format_counts_include_zero_values_warns_for_large_state_space():
+    """Generating every state for more than 20 qubits warns about memory usage."""
+    with pytest.warns(UserWarning, match="Generating all 2,097,152 possible states"):
+        result = format_data({"1" * 21: 1}, include_zero_values=True, decimal=True)
+
+    assert len(result) == 2**21
+    assert result[2**21 - 1] == 1
+
+
+@pytest.mark.parametrize(
+    "counts",
+    [
+        {"10": 5, "00": 7, "11": 0},
+        {
+            format(outcome, "012b"): outcome % 7
+            for outcome in random.Random(4).sample(range(4096), 300)
+        },
+        [{"1": 3, "0": 4}, {"110": 2, "011": 1}],
+    ],
+)
+def test_gate_model_result_data_packs_counts(counts):
+    """Bitstring counts are stored as arrays and their views match the dictionary formatting."""
+    data = GateModelResultData(measurement_counts=counts)
+
+    assert data._measurement_counts is None
+    assert data._packed_counts is not None
+    assert data.measurement_counts == counts
+    if isinstance(counts, dict):
+        assert list(data.measurement_counts) == list(counts)
+
+    for include_zero_values in (False, True):
+        for decimal in (False, True):
+            expected = normalize_data(counts, include_zero_values, decimal)
+            result = data.get_counts(include_zero_values=include_zero_values, decimal=decimal)
+            assert result == expected
+            if isinstance(result, dict):
+                assert list(result.items()) == list(expected.items())
+
+
+@pytest.mark.parametrize(
+    "counts",
+    [
+        {"1 0": 5, "0 0": 7},
+        {"10": 5, "0": 7},
+        {"10": 0.5, "00": 0.5},
+        {2: 5, 0: 7},
+        {"1" * 64: 1, "0" * 64: 2},
+        [{"1": 3}, {"1 1": 2}],
+        {},
+    ],
+)
+def test_gate_model_result_data_keeps_unpackable_counts(counts):
+    """Counts that cannot be restored exactly from arrays are stored as passed."""
+    data = GateModelResultData(measurement_counts=counts)
+
+    assert data._packed_counts is None
+    assert data.measurement_counts is counts
+
+
+def test_gate_model_result_data_to_numpy():
+    """to_numpy returns the sorted outcomes with nonzero counts and their counts."""
+    data = GateModelResultData(measurement_counts={"11": 3, "00": 1, "01": 0})
+
+    outcomes, counts = data.to_numpy()
+
+    assert outcomes.dtype == np.uint64
+    assert counts.dtype == np.int64
+    assert outcomes.tolist() == [0, 3]
+    assert counts.tolist() == [1, 3]
+
+
+def test_gate_model_result_data_to_numpy_batch_and_unpacked_counts():
+    """to_numpy formats counts that were not packed, and returns one pair per experiment."""
+    data = GateModelResultData(measurement_counts=[{"1 1": 2, "0": 1}, {"1": 4}])
+
+    (outcomes_0, counts_0), (outcomes_1, counts_1) = data.to_numpy()
+
+    assert outcomes_0.tolist() == [0, 3]
+    assert counts_0.tolist() == [1, 2]
+    assert outcomes_1.tolist() == [1]
+    assert counts_1.tolist() == [4]
+
+
+def test_gate_model_result_data_to_numpy_raises():
+    """to_numpy raises if there are no counts, or they cannot be represented as arrays."""
+    with pytest.raises(ValueError, match="Counts data is not available."):
+        GateModelResultData().to_numpy()
+
+    with pytest.raises(ValueError, match="cannot be represented as arrays"):
+        GateModelResultData(measurement_counts={"1": 0.5, "0": 0.5}).to_numpy()
+
+
+def test_gate_model_result_data_to_arrow():
+    """to_arrow returns the counts as a table recording the number of measured bits."""
+    pa = pytest.importorskip("pyarrow")
+    data = GateModelResultData(measurement_counts={"110": 3, "001": 1})
+
+    table = data.to_arrow()
+
+    assert table.column("outcome").type == pa.uint64()
+    assert table.column("outcome").to_pylist() == [1, 6]
+    assert table.column("count").to_pylist() == [1, 3]
+    assert table.schema.metadata[b"num_bits"] == b"3"
+
+
 def test_format_value_string(result_instance):
     """Test _format_value with a string input."""
     assert result_instance._format_value("hello") == "'hello'"
@@ -18,11 +18,22 @@ Unit tests for caching module.
 """
 
 import math
+import os
+import threading
 import time
 
 import pytest
 
-from qbraid._caching import _generate_cache_key, cache_disabled, cached_method, clear_cache
+from qbraid._caching import (
+    PersistentMethodCache,
+    _generate_cache_key,
+    _json_cache_key,
+    cache_disabled,
+    cached_method,
+    clear_cache,
+    disable_persistent_cache,
+    enable_persistent_cache,
+)
 
 
 class TestClass:
@@ -48,8 +59,48 @@ def test_instance():
 
 
 def test_generate_cache_key(test_instance):
-    """Test cache key generation."""
-    key = _generate_cache_key(test_instance, "get_data", (1,), {})
+    """Test cache key generation for hashable arguments."""
+    key = _generate_cache_key(test_instance, "get_data", (1,), {"b": 2, "a": 1})
+    assert isinstance(key, tuple)
+    assert key == _generate_cache_key(TestClass(1, 2), "get_data", (1,), {"a": 1, "b": 2})
+    assert key != _generate_cache_key(test_instance, "get_data", (2,), {"a": 1, "b": 2})
+    assert key != _generate_cache_key(TestClass(2, 2), "get_data", (1,), {"a": 1, "b": 2})
+
+
+def test_generate_cache_key_distinguishes_equal_values_of_different_types(
+    test_instance, monkeypatch
+):
+    """Test that arguments that compare equal but differ in type get separate cache keys."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    keys = {
+        _generate_cache_key(test_instance, "get_data", (value,), {"flag": value})
+        for value in (1, True, 1.0)
+    }
+    assert len(keys) == 3
+
+    class Counter:
+        """Class with a cached method that records its calls."""
+
+        def __init__(self):
+            self.calls = []
+
+        @cached_method
+        def echo(self, value):
+            """Record and return the value."""
+            self.calls.append(value)
+            return value
+
+    counter = Counter()
+    assert counter.echo(1) == 1
+    assert counter.echo(True) is True
+    assert isinstance(counter.echo(1.0), float)
+    assert counter.calls == [1, True, 1.0]
+
+
+def test_generate_cache_key_unhashable_args_fall_back_to_json(test_instance):
+    """Test that unhashable arguments produce a SHA-256 of their JSON serialization."""
+    key = _generate_cache_key(test_instance, "get_data", ([1],), {"tags": {"a": 1}})
+    assert key == _json_cache_key(test_instance, "get_data", ([1],), {"tags": {"a": 1}})
     assert isinstance(key, str)
     assert len(key) == 64  # SHA-256 hash length
 
@@ -340,3 +391,296 @@ def test_cache_disabled_does_not_populate_cache(monkeypatch):
     assert obj.call_count == 3
     assert obj.square.cache_info().currsize == 1
     obj.square.cache_clear()
+
+
+def test_cached_method_drops_expired_entries_on_insert(monkeypatch):
+    """Expired entries are dropped when a new entry is inserted, not only when re-read."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    now = [0.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+
+    class Expiring:
+        """Class whose cached method has a short ``ttl``."""
+
+        @cached_method(ttl=10)
+        def square(self, n: int) -> int:
+            """Return ``n`` squared."""
+            return n * n
+
+    obj = Expiring()
+    obj.square(1)
+    obj.square(2)
+    now[0] = 5.0
+    obj.square(3)
+    assert obj.square.cache_info().currsize == 3
+
+    # Entries 1 and 2 have expired by the time 4 is inserted; 3 is still fresh.
+    now[0] = 12.0
+    obj.square(4)
+    assert list(obj.square.cache) == [
+        _generate_cache_key(obj, "square", (3,), {}),
+        _generate_cache_key(obj, "square", (4,), {}),
+    ]
+    obj.square.cache_clear()
+
+
+def test_cached_method_accepts_hashable_non_json_args(monkeypatch):
+    """Hashable arguments that JSON cannot serialize are cached by the tuple key."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    obj = ListArgClass()
+    obj.total.cache_clear()
+
+    items = frozenset({1, 2, 3})
+    assert obj.total(items) == 6
+    assert obj.total(items) == 6
+    assert obj.call_count == 1
+    obj.total.cache_clear()
+
+
+class NamespacedClass:
+    """Class whose cached method is also stored on disk, namespaced by an API key."""
+
+    calls = 0
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+
+    def __hash__(self):
+        return hash(self.api_key)
+
+    def _cache_namespace(self) -> str:
+        return self.api_key
+
+    @cached_method(persist=True)
+    def get_data(self, name: str) -> dict:
+        """Return data for ``name``; counts real invocations across instances."""
+        NamespacedClass.calls += 1
+        return {"name": name, "key": self.api_key}
+
+
+@pytest.fixture
+def persistent_cache(tmp_path):
+    """Enable the on-disk cache tier in a temporary directory."""
+    store = enable_persistent_cache(tmp_path / "cache" / "methods.sqlite")
+    NamespacedClass.calls = 0
+    yield store
+    disable_persistent_cache()
+    NamespacedClass.get_data.cache_clear()
+
+
+def test_persistent_cache_serves_in_memory_misses(persistent_cache, monkeypatch):
+    """Results are read back from disk once the in-memory cache no longer has them."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+
+    assert NamespacedClass("alice").get_data("a") == {"name": "a", "key": "alice"}
+    NamespacedClass.get_data.cache_clear()
+    assert NamespacedClass("alice").get_data("a") == {"name": "a", "key": "alice"}
+
+    assert NamespacedClass.calls == 1
+    assert len(persistent_cache) == 1
+
+
+def test_persistent_cache_namespaces_credentials(persistent_cache, monkeypatch):
+    """Instances with different namespaces never read each other's stored results."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+
+    NamespacedClass("alice").get_data("a")
+    NamespacedClass.get_data.cache_clear()
+    assert NamespacedClass("bob").get_data("a") == {"name": "a", "key": "bob"}
+
+    assert NamespacedClass.calls == 2
+    persistent_cache.clear("alice")
+    assert len(persistent_cache) == 1
+
+
+def test_persistent_cache_shared_between_stores(persistent_cache, monkeypatch):
+    """A new store on the same file, as opened by another process, sees stored results."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    NamespacedClass("alice").get_data("a")
+
+    other = PersistentMethodCache(persistent_cache.path)
+    try:
+        assert len(other) == 1
+        other.clear()
+    finally:
+        other.close()
+    NamespacedClass.get_data.cache_clear()
+
+    NamespacedClass("alice").get_data("a")
+    assert NamespacedClass.calls == 2
+
+
+def test_persistent_cache_ttl_and_maxsize(tmp_path, monkeypatch):
+    """Stored results expire after the ttl, and the oldest are evicted beyond maxsize."""
+    now = [0.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    store = PersistentMethodCache(tmp_path / "methods.sqlite", maxsize=2, ttl=10)
+    try:
+        for i in range(3):
+            now[0] = float(i)
+            store.set("ns", str(i), i)
+        assert store.get("ns", "0") is None
+        assert store.get("ns", "1") == 1
+
+        now[0] = 11.5
+        assert store.get("ns", "1") is None
+        assert store.get("ns", "2") == 2
+        assert len(store) == 1
+    finally:
+        store.close()
+
+
+def test_persistent_cache_file_permissions(tmp_path):
+    """The database file and its new parent directory are private to their owner."""
+    path = tmp_path / "cache" / "methods.sqlite"
+    store = PersistentMethodCache(path)
+    store.set("ns", "key", 1)
+    store.close()
+
+    if os.name == "posix":
+        assert os.stat(path.parent).st_mode & 0o777 == 0o700
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+def test_persistent_cache_skipped_without_namespace(persistent_cache, monkeypatch):
+    """Instances without a cache namespace, or calls with cache disabled, stay off disk."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+
+    class Anonymous:
+        """Class without a ``_cache_namespace`` method."""
+
+        @cached_method(persist=True)
+        def get_data(self) -> int:
+            """Return a constant."""
+            return 1
+
+    assert Anonymous().get_data() == 1
+    obj = NamespacedClass("alice")
+    with cache_disabled(obj):
+        obj.get_data("a")
+
+    assert len(persistent_cache) == 0
+
+
+def test_persistent_cache_enabled_by_environment(tmp_path, monkeypatch):
+    """QBRAID_PERSISTENT_CACHE=1 enables the on-disk tier at the default path."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    monkeypatch.setenv("QBRAID_PERSISTENT_CACHE", "1")
+    monkeypatch.setattr(
+        "qbraid._caching.DEFAULT_PERSISTENT_CACHE_PATH", tmp_path / "default.sqlite"
+    )
+    monkeypatch.setattr("qbraid._caching._persistent_cache_configured", False)
+    NamespacedClass.calls = 0
+    try:
+        NamespacedClass("alice").get_data("a")
+        assert (tmp_path / "default.sqlite").exists()
+        clear_cache()
+        NamespacedClass("alice").get_data("a")
+        assert NamespacedClass.calls == 2
+    finally:
+        disable_persistent_cache()
+        NamespacedClass.get_data.cache_clear()
+
+
+class SlowClass:
+    """Class whose cached method blocks until released, to hold a computation in flight."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+        self.fail = False
+
+    def __hash__(self):
+        return id(self)
+
+    @cached_method(ttl=10, stale_while_revalidate=60)
+    def fetch(self, n: int) -> int:
+        """Return ``n`` plus the number of prior calls once released."""
+        self.calls += 1
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("remote API unavailable")
+        return n + self.calls - 1
+
+
+def _start_callers(obj: SlowClass, count: int, results: list, errors: list) -> list:
+    """Start threads that call ``obj.fetch(1)``, collecting results and errors."""
+
+    def call():
+        try:
+            results.append(obj.fetch(1))
+        except RuntimeError as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_cached_method_coalesces_concurrent_misses(monkeypatch):
+    """Concurrent misses on one key share a single computation."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    obj = SlowClass()
+    results, errors = [], []
+
+    threads = _start_callers(obj, 16, results, errors)
+    time.sleep(0.1)
+    obj.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert obj.calls == 1
+    assert results == [1] * 16
+    SlowClass.fetch.cache_clear()
+
+
+def test_cached_method_coalesced_waiters_receive_error(monkeypatch):
+    """Callers waiting on a failed computation receive its error, and nothing is cached."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    obj = SlowClass()
+    obj.fail = True
+    results, errors = [], []
+
+    threads = _start_callers(obj, 8, results, errors)
+    time.sleep(0.1)
+    obj.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert obj.calls == 1
+    assert len(errors) == 8 and not results
+    assert obj.fetch.cache_info().currsize == 0
+
+    # The next call computes again rather than waiting on the finished computation.
+    obj.fail = False
+    assert obj.fetch(1) == 2
+    SlowClass.fetch.cache_clear()
+
+
+def test_cached_method_stale_while_revalidate(monkeypatch):
+    """An expired entry within the stale window is served while one background refresh runs."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    now = [0.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    obj = SlowClass()
+    obj.release.set()
+    assert obj.fetch(1) == 1
+
+    obj.release.clear()
+    now[0] = 30.0
+    assert obj.fetch(1) == 1
+    assert obj.fetch(1) == 1
+    obj.release.set()
+    for _ in range(100):
+        if obj.fetch(1) == 2:
+            break
+        time.sleep(0.01)
+
+    assert obj.calls == 2
+    assert obj.fetch(1) == 2
+
+    # Beyond the stale window, the caller waits for a fresh result.
+    now[0] = 200.0
+    assert obj.fetch(1) == 3
+    SlowClass.fetch.cache_clear()
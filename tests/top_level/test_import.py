@@ -16,6 +16,8 @@
 Unit tests for lazy loading of modules, objects and entry points
 
 """
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -23,7 +25,7 @@ import pytest
 import qbraid
 from qbraid._entrypoints import get_entrypoints, load_entrypoint
 from qbraid.exceptions import QbraidError
-from qbraid.programs._import import _dynamic_importer
+from qbraid.programs._import import _lazy_importer
 
 
 def test_load_entrypoint_success():
@@ -54,25 +56,24 @@ def test_load_entrypoint_raises_qbraiderror_on_general_exception():
             load_entrypoint("programs", "test")
 
 
-def mock_get_class(name):
-    return type(name, (), {})
-
-
-def mock_assign_default_type_alias(imported, program_type):
-    return "mock_alias"
-
-
-def test_dynamic_importer_exception():
-    opt_modules = ["nonexistent.module"]
-
-    with patch("qbraid.programs._import.import_module", side_effect=Exception("Import error")):
-        with patch("qbraid.programs._import._get_class", side_effect=mock_get_class):
-            with patch(
-                "qbraid.programs._import._assign_default_type_alias",
-                side_effect=mock_assign_default_type_alias,
-            ):
-                imported = _dynamic_importer(opt_modules)
-                assert imported == {}
+def test_lazy_importer_skips_missing_modules():
+    """Test that program types are only registered for installed modules."""
+    with patch("qbraid.programs._import.import_module") as mock_import:
+        registry = _lazy_importer(
+            [("json", "json", "JSONDecoder"), ("x", "nonexistent.module", "X")]
+        )
+        mock_import.assert_not_called()
+    assert list(registry) == ["json"]
+
+
+def test_import_programs_does_not_import_sdks():
+    """Test that importing qbraid.programs does not import any quantum SDKs."""
+    sdks = ["cirq", "qiskit", "braket", "pytket", "pennylane", "pyquil", "cudaq", "qrisp"]
+    code = f"import sys, qbraid.programs; print([m for m in {sdks!r} if m in sys.modules])"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
 
 
 @patch("qbraid._entrypoints.importlib.metadata.entry_points")
@@ -0,0 +1,227 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the conversion result caches.
+
+"""
+import os
+import sqlite3
+import unittest.mock
+
+import pytest
+
+from qbraid._caching import CacheInfo
+from qbraid.transpiler import (
+    ConversionScheme,
+    MemoryConversionCache,
+    SqliteConversionCache,
+    compile_conversion,
+    transpile,
+)
+from qbraid.transpiler.cache import conversion_cache_key
+from qbraid.transpiler.edge import Conversion
+from qbraid.transpiler.graph import ConversionGraph
+
+QASM2_BELL = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+creg c[2];
+h q[0];
+cx q[0],q[1];
+measure q -> c;
+"""
+
+
+@pytest.fixture(autouse=True)
+def enable_cache(monkeypatch):
+    """Enable conversion caches, which are bypassed when DISABLE_CACHE is set."""
+    monkeypatch.delenv("DISABLE_CACHE", raising=False)
+
+
+@pytest.fixture
+def counting_graph():
+    """Return a qasm2 -> qasm3 graph whose conversion records each call."""
+    calls = []
+
+    def convert(program):
+        calls.append(program)
+        return program.upper()
+
+    graph = ConversionGraph([Conversion("qasm2", "qasm3", convert)], include_isolated=False)
+    return graph, calls
+
+
+def test_conversion_cache_key():
+    """Test that cache keys depend on the program content, target, and paths."""
+    pipeline = compile_conversion("qasm2", "qasm3")
+    key = conversion_cache_key(QASM2_BELL, "qasm2", "qasm3", pipeline.paths)
+    assert key == conversion_cache_key(QASM2_BELL, "qasm2", "qasm3", pipeline.paths)
+    assert key != conversion_cache_key(QASM2_BELL + " ", "qasm2", "qasm3", pipeline.paths)
+    assert key != conversion_cache_key(QASM2_BELL, "qasm2", "qasm3", [])
+    assert key != conversion_cache_key(QASM2_BELL, "qasm2", "cirq", pipeline.paths)
+    assert conversion_cache_key(lambda: None, "qasm2", "qasm3", pipeline.paths) is None
+
+
+def test_conversion_cache_key_is_canonical():
+    """Test that equal program objects share a key, independent of their internal caches."""
+    cirq = pytest.importorskip("cirq")
+    pipeline = compile_conversion("qasm2", "qasm3")
+
+    def bell():
+        q0, q1 = cirq.LineQubit.range(2)
+        return cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1))
+
+    circuit = bell()
+    key = conversion_cache_key(circuit, "cirq", "qasm3", pipeline.paths)
+    circuit.all_qubits()
+    circuit.unitary()
+    assert conversion_cache_key(circuit, "cirq", "qasm3", pipeline.paths) == key
+    assert conversion_cache_key(bell(), "cirq", "qasm3", pipeline.paths) == key
+
+    other = bell() + cirq.X(cirq.LineQubit(0))
+    assert conversion_cache_key(other, "cirq", "qasm3", pipeline.paths) != key
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_transpile_reuses_cached_conversion(backend, counting_graph, tmp_path):
+    """Test that transpiling an identical program twice runs the conversion once."""
+    graph, calls = counting_graph
+    if backend == "memory":
+        cache = MemoryConversionCache()
+    else:
+        cache = SqliteConversionCache(tmp_path / "conversions.db")
+
+    first = transpile(QASM2_BELL, "qasm3", conversion_graph=graph, cache=cache)
+    second = transpile(QASM2_BELL, "qasm3", conversion_graph=graph, cache=cache)
+
+    assert first == second == QASM2_BELL.upper()
+    assert len(calls) == 1
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=cache.maxsize, currsize=1)
+
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=cache.maxsize, currsize=0)
+
+
+def test_cache_bypassed_when_disabled(counting_graph, monkeypatch):
+    """Test that DISABLE_CACHE=1 bypasses conversion caches."""
+    monkeypatch.setenv("DISABLE_CACHE", "1")
+    graph, calls = counting_graph
+    cache = MemoryConversionCache()
+    for _ in range(2):
+        transpile(QASM2_BELL, "qasm3", conversion_graph=graph, cache=cache)
+    assert len(calls) == 2
+    assert cache.cache_info().currsize == 0
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Test that the in-memory cache evicts the least recently used entry."""
+    cache = MemoryConversionCache(maxsize=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"
+    cache.set("c", "C")
+    assert cache.get("b") is None
+    assert cache.get("a") == "A" and cache.get("c") == "C"
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_cache_entries_expire(backend, tmp_path):
+    """Test that cached conversions expire after the TTL."""
+    if backend == "memory":
+        cache = MemoryConversionCache(ttl=10)
+    else:
+        cache = SqliteConversionCache(tmp_path / "conversions.db", ttl=10)
+
+    with unittest.mock.patch("qbraid.transpiler.cache.time.time", return_value=100.0):
+        cache.set("key", "value")
+    with unittest.mock.patch("qbraid.transpiler.cache.time.time", return_value=105.0):
+        assert cache.get("key") == "value"
+    with unittest.mock.patch("qbraid.transpiler.cache.time.time", return_value=110.0):
+        assert cache.get("key") is None
+    assert cache.cache_info().currsize == 0
+
+
+def test_memory_cache_returns_copies():
+    """Test that modifying a cached result does not affect the cache."""
+    cache = MemoryConversionCache()
+    result = ["h", "cx"]
+    cache.set("key", result)
+    result.append("measure")
+    cached = cache.get("key")
+    cached.append("x")
+    assert cache.get("key") == ["h", "cx"]
+
+    shared = MemoryConversionCache(copy_results=False)
+    shared.set("key", result)
+    assert shared.get("key") is result
+
+
+def test_sqlite_cache_persists_and_evicts(tmp_path):
+    """Test that the sqlite cache is shared across instances and bounded by maxsize."""
+    path = tmp_path / "conversions.db"
+    cache = SqliteConversionCache(path, maxsize=2)
+    cache.set("a", {"program": "A"})
+    cache.set("b", {"program": "B"})
+    cache.close()
+
+    cache = SqliteConversionCache(path, maxsize=2)
+    assert cache.get("a") == {"program": "A"}
+    cache.set("c", {"program": "C"})
+    assert cache.get("b") is None
+    assert cache.cache_info().currsize == 2
+
+    cache.set("unpicklable", lambda: None)
+    assert cache.get("unpicklable") is None
+    cache.close()
+
+
+def test_sqlite_cache_file_permissions_and_text_entries(tmp_path):
+    """Test that the database is private to its owner and text results are not pickled."""
+    path = tmp_path / "conversions.db"
+    cache = SqliteConversionCache(path)
+    cache.set("qasm", QASM2_BELL)
+    cache.set("bytes", b"\x00\x01")
+    assert cache.get("qasm") == QASM2_BELL
+    assert cache.get("bytes") == b"\x00\x01"
+    cache.close()
+
+    if os.name == "posix":
+        assert os.stat(path).st_mode & 0o777 == 0o600
+    with sqlite3.connect(path) as conn:
+        kinds = dict(conn.execute("SELECT key, kind FROM conversions"))
+    assert kinds == {"qasm": "str", "bytes": "bytes"}
+
+
+def test_invalid_cache_arguments():
+    """Test that invalid maxsize and ttl values are rejected."""
+    with pytest.raises(ValueError, match="maxsize"):
+        MemoryConversionCache(maxsize=-1)
+    with pytest.raises(ValueError, match="ttl"):
+        MemoryConversionCache(ttl=0)
+
+
+def test_conversion_scheme_passes_cache_to_transpile(counting_graph):
+    """Test that a cache set on a ConversionScheme is used by transpile."""
+    graph, calls = counting_graph
+    cache = MemoryConversionCache()
+    scheme = ConversionScheme(conversion_graph=graph, cache=cache)
+    fields = scheme.to_dict()
+    assert "cache" not in fields
+
+    for _ in range(3):
+        transpile(QASM2_BELL, "qasm3", cache=scheme.cache, **fields)
+    assert len(calls) == 1
+    assert cache.cache_info().hits == 2
@@ -26,7 +26,7 @@ import pytest
 
 from qbraid.interface.random import random_circuit
 from qbraid.programs.exceptions import ProgramTypeError
-from qbraid.transpiler.annotations import requires_extras, weight
+from qbraid.transpiler.annotations import non_mutating, requires_extras, weight
 from qbraid.transpiler.conversions.braket import braket_to_cirq
 from qbraid.transpiler.edge import Conversion
 from qbraid.transpiler.graph import ConversionGraph
@@ -45,6 +45,20 @@ def test_requires_extras_appends_dependency():
     assert getattr(dummy_func, "requires_extras") == ["alice", "bob"]
 
 
+def test_non_mutating_marks_conversion():
+    """Test that the non_mutating decorator is reflected on Conversion instances."""
+
+    @weight(1)
+    @non_mutating
+    def conversion_function(program):
+        return program
+
+    assert conversion_function.non_mutating is True
+    assert conversion_function.weight == 1
+    assert Conversion("qasm2", "qasm3", conversion_function).non_mutating
+    assert not Conversion("qasm2", "qasm3", lambda x: x).non_mutating
+
+
 def test_raise_for_unsupported_program_input():
     """Test that an exception is raised for an unsupported program input."""
     conversion = Conversion("braket", "cirq", braket_to_cirq)
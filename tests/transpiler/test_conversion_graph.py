@@ -19,7 +19,11 @@ Tests of functions that create and operate on directed graph
 used to dictate transpiler conversions.
 
 """
+import importlib
 import importlib.util
+import pickle
+import subprocess
+import sys
 from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
@@ -38,12 +42,22 @@ from qbraid.programs.annealing import submodules as annealing_submodules
 from qbraid.programs.exceptions import PackageValueError
 from qbraid.programs.gate_model import submodules as gate_model_submodules
 from qbraid.programs.registry import QPROGRAM_ALIASES, QPROGRAM_REGISTRY
-from qbraid.transpiler.conversions import conversion_functions
+from qbraid.transpiler.conversions import (
+    LazyConversionFunction,
+    conversion_functions,
+    get_conversion_function,
+)
+from qbraid.transpiler.conversions._manifest import CONVERSION_MANIFEST
 from qbraid.transpiler.conversions.qiskit import qiskit_to_pyqir
 from qbraid.transpiler.converter import transpile
 from qbraid.transpiler.edge import Conversion
 from qbraid.transpiler.exceptions import ConversionPathNotFoundError
-from qbraid.transpiler.graph import ConversionGraph, _get_path_from_bound_methods
+from qbraid.transpiler.graph import (
+    ConversionGraph,
+    _get_path_from_bound_methods,
+    clear_default_graph_cache,
+    get_default_graph,
+)
 
 qiskit_qir_installed = importlib.util.find_spec("qiskit_qir") is not None
 
@@ -503,3 +517,228 @@ def test_custom_conversion_endpoints_allowed_as_nodes():
         conversions=[conversion], nodes=["custom_a", "custom_b"], include_isolated=True
     )
     assert set(graph.nodes()) == {"custom_a", "custom_b"}
+
+
+def test_top_shortest_paths_ranked_by_depth_then_weight():
+    """Paths of equal depth are ordered by their total edge weight."""
+    conversions = [
+        Conversion("a", "b", lambda x: x, weight=0.5),
+        Conversion("b", "d", lambda x: x, weight=0.5),
+        Conversion("a", "c", lambda x: x, weight=0.9),
+        Conversion("c", "d", lambda x: x, weight=0.9),
+        Conversion("a", "d", lambda x: x, weight=0.1),
+    ]
+    graph = ConversionGraph(conversions=conversions, include_isolated=False)
+    paths = [
+        _get_path_from_bound_methods(path)
+        for path in graph.find_top_shortest_conversion_paths("a", "d")
+    ]
+    assert paths == ["a -> d", "a -> c -> d", "a -> b -> d"]
+    assert graph.shortest_path("a", "d") == "a -> c -> d"
+
+
+def test_ranked_paths_match_exhaustive_ranking():
+    """Top paths from the ranked table agree with ranking every simple path."""
+    nodes = ["a", "b", "c", "d", "e"]
+    conversions = [
+        Conversion(source, target, lambda x: x, weight=0.1 * (i % 7) + 0.2)
+        for i, (source, target) in enumerate((s, t) for s in nodes for t in nodes if s != t)
+    ]
+    graph = ConversionGraph(conversions=conversions, include_isolated=False)
+    node_ids = graph._node_alias_id_map
+
+    def cost(path):
+        return (len(path), round(graph._path_weight(path), 9))
+
+    for source in nodes:
+        for target in nodes:
+            if source == target:
+                continue
+            expected = sorted(
+                (
+                    list(path)
+                    for path in rx.all_simple_paths(graph, node_ids[source], node_ids[target])
+                ),
+                key=cost,
+            )
+            for top_n in (3, len(expected) + 1):
+                ranked = graph._ranked_path_ids(node_ids[source], node_ids[target], top_n)
+                assert [cost(path) for path in ranked] == [cost(path) for path in expected[:top_n]]
+                assert len({tuple(path) for path in ranked}) == len(ranked)
+
+
+def test_ranked_paths_built_with_path_table(basic_conversion_graph):
+    """The path table ranks alternatives for every reachable pair when it is built."""
+    basic_conversion_graph.add_conversion(Conversion("a", "c", lambda x: x))
+    basic_conversion_graph._path_table()
+    node_ids = basic_conversion_graph._node_alias_id_map
+    assert set(basic_conversion_graph._ranked_paths) == set(basic_conversion_graph._shortest_paths)
+    assert len(basic_conversion_graph._ranked_paths[(node_ids["a"], node_ids["c"])]) == 2
+
+
+def test_path_table_invalidated_by_graph_changes(basic_conversion_graph):
+    """Path queries reflect conversions added or removed after the table was built."""
+    assert not basic_conversion_graph.has_path("b", "d")
+    assert basic_conversion_graph.all_paths("a", "c") == ["a -> b -> c"]
+
+    basic_conversion_graph.add_conversion(Conversion("c", "d", lambda x: x))
+    basic_conversion_graph.add_conversion(Conversion("a", "c", lambda x: x))
+    assert basic_conversion_graph.has_path("b", "d")
+    assert basic_conversion_graph.all_paths("a", "c") == ["a -> c", "a -> b -> c"]
+
+    basic_conversion_graph.remove_conversion("b", "c")
+    assert not basic_conversion_graph.has_path("b", "d")
+    assert basic_conversion_graph.all_paths("a", "c") == ["a -> c"]
+
+
+def test_path_table_invalidated_by_raw_edge_changes(basic_conversion_graph):
+    """Edges removed through the rustworkx API also invalidate the path table."""
+    assert basic_conversion_graph.has_path("a", "c")
+    node_ids = basic_conversion_graph._node_alias_id_map
+    basic_conversion_graph.remove_edge(node_ids["b"], node_ids["c"])
+    assert not basic_conversion_graph.has_path("a", "c")
+
+
+def test_get_sorted_closest_targets_and_sources(basic_conversion_graph):
+    """Targets and sources are ordered by proximity, with unreachable items last."""
+    graph = basic_conversion_graph
+    assert graph.get_sorted_closest_targets("a", ["c", "x", "b", "a", "d"]) == [
+        "a",
+        "b",
+        "d",
+        "c",
+        "x",
+    ]
+    assert graph.get_sorted_closest_sources("c", ["d", "a", "b"]) == ["b", "a", "d"]
+    assert graph.closest_source("c", ["d", "a"]) == "a"
+    assert graph.closest_source("c", ["d"]) is None
+
+
+@pytest.fixture
+def default_graph_cache(monkeypatch):
+    """Enable caching and start from an empty default graph cache."""
+    monkeypatch.delenv("DISABLE_CACHE")
+    clear_default_graph_cache()
+    yield
+    clear_default_graph_cache()
+
+
+@pytest.mark.usefixtures("default_graph_cache")
+def test_default_graph_is_shared():
+    """Default graphs are memoized by their construction arguments."""
+    graph = get_default_graph()
+    assert get_default_graph() is graph
+    assert get_default_graph(edge_bias=0.25) is graph
+    assert get_default_graph(require_native=True) is not graph
+    assert get_default_graph(nodes=["qasm2", "qasm3"]) is get_default_graph(
+        nodes={"qasm3", "qasm2"}
+    )
+    assert graph == ConversionGraph()
+
+
+def test_default_graph_not_shared_when_cache_disabled():
+    """Setting DISABLE_CACHE=1 returns a freshly built graph on every call."""
+    assert get_default_graph() is not get_default_graph()
+
+
+@pytest.mark.usefixtures("default_graph_cache")
+def test_default_graph_invalidated_by_registry_change():
+    """Registering or unregistering a program type rebuilds the default graph."""
+
+    class FakeProgram:
+        """Fake program type for testing."""
+
+    graph = get_default_graph()
+    register_program_type(FakeProgram, "fake_default_graph")
+    try:
+        updated_graph = get_default_graph()
+        assert updated_graph is not graph
+        assert updated_graph.has_node("fake_default_graph")
+    finally:
+        unregister_program_type("fake_default_graph")
+
+    restored_graph = get_default_graph()
+    assert restored_graph is not updated_graph
+    assert not restored_graph.has_node("fake_default_graph")
+
+
+@pytest.mark.usefixtures("default_graph_cache")
+def test_default_graph_invalidated_by_add_conversion():
+    """Modifying a shared default graph evicts it from the cache."""
+    graph = get_default_graph()
+    graph.add_conversion(Conversion("qasm2", "fake_target", lambda x: x))
+    assert graph.version == 1
+
+    rebuilt_graph = get_default_graph()
+    assert rebuilt_graph is not graph
+    assert not rebuilt_graph.has_node("fake_target")
+
+
+@pytest.mark.usefixtures("default_graph_cache")
+def test_transpile_uses_default_graph():
+    """transpile only builds a new graph when explicit conversions are passed."""
+    qasm2 = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[1];\nh q[0];\n'
+    with patch(
+        "qbraid.transpiler.converter.ConversionGraph", wraps=ConversionGraph
+    ) as mock_graph_cls:
+        transpile(qasm2, "qasm3")
+        transpile(qasm2, "qasm3")
+        mock_graph_cls.assert_not_called()
+
+        conversions = [e for e in ConversionGraph.load_default_conversions() if e.native]
+        transpile(qasm2, "qasm3", conversions=conversions)
+        mock_graph_cls.assert_called_once()
+
+
+@pytest.mark.parametrize("entry", CONVERSION_MANIFEST, ids=lambda entry: entry[3])
+def test_conversion_manifest_matches_function(entry):
+    """Test that each manifest entry describes the conversion function it names."""
+    _, _, module, name, weight, extras, non_mutating = entry
+    try:
+        func = getattr(importlib.import_module(module), name)
+    except ImportError:
+        pytest.skip(f"{module} is not importable in this environment")
+
+    assert getattr(func, "weight", None) == weight
+    assert tuple(getattr(func, "requires_extras", ())) == extras
+    assert getattr(func, "non_mutating", False) == non_mutating
+
+
+def test_lazy_conversion_function_carries_annotations():
+    """Test that a lazy conversion function exposes the annotations of the real function."""
+    lazy = get_conversion_function("qasm2_to_qasm3")
+    func = lazy.load()
+
+    assert isinstance(lazy, LazyConversionFunction)
+    assert get_conversion_function("qasm2_to_qasm3") is lazy
+    assert lazy.__name__ == func.__name__
+    assert lazy.__module__ == func.__module__
+    assert lazy.weight == func.weight
+    assert Conversion("qasm2", "qasm3", lazy) == Conversion("qasm2", "qasm3", func)
+
+
+def test_lazy_conversion_function_pickle_round_trip():
+    """Test that a lazy conversion function survives pickling and still converts."""
+    lazy = pickle.loads(pickle.dumps(get_conversion_function("qasm2_to_qasm3")))
+    qasm2 = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[1];\nh q[0];\n'
+
+    assert isinstance(lazy, LazyConversionFunction)
+    assert lazy.weight == 1
+    assert lazy(qasm2).startswith("OPENQASM 3.0;")
+
+
+def test_default_graph_does_not_import_sdks():
+    """Test that building the default graph and converting between qasm versions imports
+    none of the quantum SDKs that other conversions depend on."""
+    code = (
+        "import sys\n"
+        "from qbraid.transpiler import ConversionGraph, transpile\n"
+        "ConversionGraph()\n"
+        "transpile('OPENQASM 2.0;\\nqreg q[1];\\n', 'qasm3')\n"
+        "sdks = ('cirq', 'qiskit', 'braket', 'pytket', 'pyquil', 'pennylane')\n"
+        "print(sorted(m for m in sdks if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
@@ -134,3 +134,15 @@ def test_committed_svgs_match_the_current_graph(diagram, parsed_edges):
         assert (
             path.read_text() == expected
         ), f"{path.name} is stale -- run `python bin/generate_conversion_graph.py`"
+
+
+def test_committed_manifest_matches_the_conversion_modules(diagram):
+    """The conversion manifest is regenerated whenever a conversion function changes.
+
+    The default graph is built from the manifest without importing any conversion module,
+    so a stale manifest would silently drop a new conversion or keep an outdated weight.
+    """
+    expected = diagram.render_manifest(diagram.parse_manifest())
+    assert (
+        diagram.MANIFEST.read_text() == expected
+    ), f"{diagram.MANIFEST.name} is stale -- run `python bin/{SCRIPT.name} --manifest`"
@@ -16,15 +16,28 @@
 Unit test for the graph-based transpiler
 
 """
+import pickle
 import unittest.mock
+from concurrent.futures import ThreadPoolExecutor
 
 import braket.circuits
 import pytest
 
 from qbraid.programs import register_program_type
-from qbraid.transpiler.converter import _warn_if_unsupported, transpile
+from qbraid.transpiler.converter import (
+    ConversionPipeline,
+    _compile_paths,
+    _warn_if_unsupported,
+    compile_conversion,
+    transpile,
+    transpile_batch,
+)
 from qbraid.transpiler.edge import Conversion
-from qbraid.transpiler.exceptions import ConversionPathNotFoundError, NodeNotFoundError
+from qbraid.transpiler.exceptions import (
+    ConversionPathNotFoundError,
+    NodeNotFoundError,
+    ProgramConversionError,
+)
 from qbraid.transpiler.graph import ConversionGraph
 
 
@@ -78,3 +91,199 @@ def test_raise_no_conversion_path_found_max_depth(bell_circuit):
     qiskit_circuit, _ = bell_circuit
     with pytest.raises(ConversionPathNotFoundError):
         transpile(qiskit_circuit, "braket", max_path_depth=1, require_native=True)
+
+
+QASM2_BELL = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+h q[0];
+cx q[0],q[1];
+"""
+
+
+def test_compile_conversion_matches_transpile():
+    """Test that a compiled pipeline converts programs the same way as transpile."""
+    pipeline = compile_conversion("qasm2", "qasm3")
+    assert isinstance(pipeline, ConversionPipeline)
+    assert pipeline.source == "qasm2" and pipeline.target == "qasm3"
+    assert pipeline.path_details[0] == "qasm2 -> qasm3"
+    assert pipeline(QASM2_BELL) == transpile(QASM2_BELL, "qasm3")
+    assert pipeline(QASM2_BELL) == pipeline(QASM2_BELL)
+
+
+def test_compile_conversion_identity():
+    """Test that a pipeline between identical program types returns its input."""
+    pipeline = compile_conversion("qasm2", "qasm2")
+    assert pipeline.paths == []
+    assert pipeline(QASM2_BELL) is QASM2_BELL
+
+
+def test_compile_conversion_is_picklable():
+    """Test that a pipeline built from the default graph can be pickled."""
+    pipeline = compile_conversion("qasm2", "qasm3", max_path_attempts=1)
+    restored = pickle.loads(pickle.dumps(pipeline))
+    assert restored.path_details == pipeline.path_details
+    assert restored(QASM2_BELL) == pipeline(QASM2_BELL)
+
+
+def test_compile_conversion_raises_for_missing_nodes_and_paths():
+    """Test that compile_conversion validates nodes and paths up front."""
+    graph = ConversionGraph(
+        [Conversion("a", "b", lambda x: x), Conversion("c", "d", lambda x: x)],
+        include_isolated=False,
+    )
+    with pytest.raises(NodeNotFoundError):
+        compile_conversion("a", "z", conversion_graph=graph)
+    with pytest.raises(NodeNotFoundError):
+        compile_conversion("z", "b", conversion_graph=graph)
+    with pytest.raises(ConversionPathNotFoundError):
+        compile_conversion("a", "d", conversion_graph=graph)
+    with pytest.raises(ConversionPathNotFoundError):
+        compile_conversion("qasm2", "braket", max_path_depth=0)
+
+
+def test_compiled_pipeline_falls_back_and_aggregates_errors():
+    """Test that a pipeline falls back to later paths and reports every failure."""
+
+    def fail(_program):
+        raise ValueError("broken conversion")
+
+    pipeline = ConversionPipeline(
+        "qasm2",
+        "qasm3",
+        [
+            [Conversion("qasm2", "qasm3", fail).convert],
+            [Conversion("qasm2", "qasm3", str.upper).convert],
+        ],
+    )
+    assert pipeline(QASM2_BELL) == QASM2_BELL.upper()
+
+    failing = ConversionPipeline("qasm2", "qasm3", pipeline.paths[:1])
+    with pytest.raises(ProgramConversionError, match="broken conversion"):
+        failing(QASM2_BELL)
+
+
+class _MutableProgram:
+    """Stand-in for a mutable program type, recording in-place modifications."""
+
+    def __init__(self):
+        self.mutated = False
+
+
+def _mutating_pipeline(copy_mode, fail_first=False):
+    """Build a two-path qasm2 -> qasm3 pipeline whose conversions mutate their input."""
+
+    def mutate(program):
+        program.mutated = True
+        return "converted"
+
+    def mutate_and_fail(program):
+        program.mutated = True
+        raise ValueError("failed after mutating")
+
+    first = mutate_and_fail if fail_first else mutate
+    paths = [
+        [unittest.mock.Mock(side_effect=first)],
+        [unittest.mock.Mock(side_effect=mutate)],
+    ]
+    return ConversionPipeline("qasm2", "qasm3", paths, copy_mode=copy_mode)
+
+
+@pytest.mark.parametrize(
+    "copy_mode, fail_first, input_mutated, copies",
+    [
+        ("deep", False, False, 1),
+        ("deep", True, False, 2),
+        ("on_retry", False, False, 1),
+        ("on_retry", True, True, 1),
+        ("none", False, True, 0),
+        ("none", True, True, 0),
+    ],
+)
+def test_pipeline_copy_modes(copy_mode, fail_first, input_mutated, copies):
+    """Test when each copy mode deep-copies the input program."""
+    program = _MutableProgram()
+    pipeline = _mutating_pipeline(copy_mode, fail_first=fail_first)
+    with unittest.mock.patch(
+        "qbraid.transpiler.converter.deepcopy", side_effect=lambda x: _MutableProgram()
+    ) as mock_deepcopy:
+        assert pipeline(program) == "converted"
+    assert program.mutated is input_mutated
+    assert mock_deepcopy.call_count == copies
+
+
+def test_pipeline_skips_copy_for_non_mutating_conversion():
+    """Test that paths starting with a non-mutating conversion are not copied."""
+    conversion = Conversion("qasm2", "qasm3", lambda program: program)
+    conversion._non_mutating = True
+    pipeline = ConversionPipeline("qasm2", "qasm3", [[conversion.convert]])
+    with unittest.mock.patch("qbraid.transpiler.converter.deepcopy") as mock_deepcopy:
+        assert pipeline(QASM2_BELL) is QASM2_BELL
+    mock_deepcopy.assert_not_called()
+
+
+def test_transpile_invalid_copy_mode():
+    """Test that an unrecognized copy_mode raises a ValueError."""
+    with pytest.raises(ValueError, match="Invalid copy_mode"):
+        transpile(QASM2_BELL, "qasm3", copy_mode="shallow")
+
+
+def test_transpile_batch_matches_transpile():
+    """Test that batch transpilation returns the same programs, in input order."""
+    qasm3_bell = transpile(QASM2_BELL, "qasm3")
+    programs = [QASM2_BELL, qasm3_bell, QASM2_BELL.replace("q[1]", "q[0]", 1)]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = transpile_batch(programs, "qasm3", executor=executor, chunksize=2)
+    assert results[0] == qasm3_bell
+    assert results[1] is qasm3_bell
+    assert results[2] == transpile(programs[2], "qasm3")
+
+
+def test_transpile_batch_process_pool():
+    """Test batch transpilation with the default process pool executor."""
+    results = transpile_batch([QASM2_BELL] * 3, "qasm3", max_path_attempts=1)
+    assert results == [transpile(QASM2_BELL, "qasm3")] * 3
+
+
+def test_transpile_batch_compiles_paths_once_per_source():
+    """Test that conversion paths are resolved once for each group of program types."""
+    with unittest.mock.patch(
+        "qbraid.transpiler.converter._compile_paths", wraps=_compile_paths
+    ) as mock_compile:
+        with ThreadPoolExecutor() as executor:
+            transpile_batch([QASM2_BELL] * 4, "qasm3", executor=executor)
+    assert mock_compile.call_count == 1
+
+
+def test_transpile_batch_reports_per_item_errors():
+    """Test that failing programs do not abort the rest of the batch."""
+    graph = ConversionGraph(
+        [Conversion("qasm2", "qasm3", lambda program: program.upper())],
+        include_isolated=False,
+    )
+    programs = [QASM2_BELL, 42, None, QASM2_BELL]
+    with ThreadPoolExecutor() as executor:
+        results = transpile_batch(programs, "qasm3", conversion_graph=graph, executor=executor)
+    assert results[0] == results[3] == QASM2_BELL.upper()
+    assert isinstance(results[1], Exception)
+    assert isinstance(results[2], Exception)
+
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(ProgramConversionError, match=r"Failed to convert 2 of 4") as excinfo:
+            transpile_batch(
+                programs,
+                "qasm3",
+                conversion_graph=graph,
+                executor=executor,
+                return_exceptions=False,
+            )
+    assert "[1]" in str(excinfo.value) and "[2]" in str(excinfo.value)
+
+
+def test_transpile_batch_invalid_arguments():
+    """Test that batch transpilation validates its arguments up front."""
+    with pytest.raises(ValueError, match="chunksize"):
+        transpile_batch([QASM2_BELL], "qasm3", chunksize=0)
+    with pytest.raises(NodeNotFoundError):
+        transpile_batch([QASM2_BELL], "alice")
@@ -16,13 +16,16 @@
 Unit tests for defining and updating runtime conversion schemes
 
 """
+import random
 
 import pytest
 import rustworkx as rx
 
+from qbraid.programs import unregister_program_type
 from qbraid.programs.spec import ProgramSpec
+from qbraid.transpiler.edge import Conversion
 from qbraid.transpiler.graph import ConversionGraph
-from qbraid.transpiler.scheme import ConversionScheme
+from qbraid.transpiler.scheme import ConversionScheme, clear_target_graph_cache
 
 
 def test_initialization():
@@ -140,9 +143,208 @@ def test_update_graph_for_target():
     assert len(updated_nodes) == len(original_nodes) - len(non_qasm_nodes)
 
 
+@pytest.fixture
+def target_graph_cache(monkeypatch):
+    """Enable caching and start from an empty cache of target-pruned graphs."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    clear_target_graph_cache()
+    yield
+    clear_target_graph_cache()
+
+
+@pytest.mark.usefixtures("target_graph_cache")
+def test_update_graph_for_target_shares_pruned_graph():
+    """Test that schemes with equal graphs and targets reuse a single pruned graph's paths."""
+    target_spec = ProgramSpec(str, alias="qasm2")
+    schemes = [
+        ConversionScheme(conversion_graph=ConversionGraph(include_isolated=True)),
+        ConversionScheme(conversion_graph=ConversionGraph(include_isolated=True)),
+        ConversionScheme(),
+    ]
+
+    for scheme in schemes:
+        scheme.update_graph_for_target(target_spec)
+
+    first, second, third = (scheme.conversion_graph for scheme in schemes)
+    assert first is not second and first is not third
+    assert first == second == third
+    assert first._path_table() is second._path_table() is third._path_table()
+
+    shallow = ConversionScheme(max_path_depth=1)
+    shallow.update_graph_for_target(target_spec)
+    assert shallow.conversion_graph._path_table() is not first._path_table()
+
+    other_target = ConversionScheme()
+    other_target.update_graph_for_target(ProgramSpec(str, alias="qasm3"))
+    assert other_target.conversion_graph._path_table() is not first._path_table()
+
+
+@pytest.mark.usefixtures("target_graph_cache")
+def test_update_graph_for_target_rebuilds_modified_graph():
+    """Test that a pruned graph can be modified without affecting other schemes, and that the
+    cache is not reused for a modified base graph."""
+
+    def base_graph():
+        conversions = [
+            Conversion("a", "t", _identity),
+            Conversion("b", "a", _identity),
+            Conversion("b", "t", _identity),
+        ]
+        return ConversionGraph(conversions=conversions, include_isolated=False)
+
+    target_spec = ProgramSpec(str, alias="t")
+    try:
+        scheme = ConversionScheme(conversion_graph=base_graph())
+        scheme.update_graph_for_target(target_spec)
+        other = ConversionScheme(conversion_graph=base_graph())
+        other.update_graph_for_target(target_spec)
+        assert other.conversion_graph.has_path("b", "t")
+
+        scheme.conversion_graph.add_conversion(Conversion("c", "t", _identity))
+        scheme.conversion_graph.remove_conversion("a", "t")
+        assert _edge_aliases(scheme.conversion_graph) == {("b", "a"), ("b", "t"), ("c", "t")}
+        assert scheme.conversion_graph.has_path("c", "t")
+        assert _edge_aliases(other.conversion_graph) == {("a", "t"), ("b", "a"), ("b", "t")}
+        assert other.conversion_graph.find_shortest_conversion_path("a", "t")
+
+        scheme = ConversionScheme(conversion_graph=base_graph())
+        scheme.update_graph_for_target(target_spec)
+        assert _edge_aliases(scheme.conversion_graph) == {("a", "t"), ("b", "a"), ("b", "t")}
+
+        modified_graph = base_graph()
+        modified_graph.remove_conversion("b", "a")
+        scheme = ConversionScheme(conversion_graph=modified_graph)
+        scheme.update_graph_for_target(target_spec)
+        assert _edge_aliases(scheme.conversion_graph) == {("a", "t"), ("b", "t")}
+    finally:
+        unregister_program_type("t")
+
+
+def test_update_graph_for_target_cache_disabled(monkeypatch):
+    """Test that every scheme builds its own pruned graph when caching is disabled."""
+    monkeypatch.setenv("DISABLE_CACHE", "1")
+    target_spec = ProgramSpec(str, alias="qasm2")
+    first, second = ConversionScheme(), ConversionScheme()
+
+    first.update_graph_for_target(target_spec)
+    second.update_graph_for_target(target_spec)
+
+    assert first.conversion_graph is not second.conversion_graph
+    assert first.conversion_graph == second.conversion_graph
+
+
 def test_find_nodes_reachable_within_max_edges_raises_for_negative(rx_graph):
     """Test that an error is raised when the max_edges is negative."""
     with pytest.raises(
         ValueError, match="The maximum number of edges must be a non-negative integer."
     ):
         ConversionScheme.find_nodes_reachable_within_max_edges(rx_graph, ["A"], -1)
+
+
+def _identity(program):
+    return program
+
+
+def _edge_aliases(graph: ConversionGraph) -> set[tuple[str, str]]:
+    """Return the set of (source, target) alias pairs of the edges in a graph."""
+    node_id_to_alias = {value: key for key, value in graph._node_alias_id_map.items()}
+    return {(node_id_to_alias[src], node_id_to_alias[tgt]) for src, tgt in graph.edge_list()}
+
+
+def _edges_on_target_paths(graph: ConversionGraph, target_nodes, n_steps):
+    """Collect the edges of every simple path of at most n_steps edges from a non-target node
+    to a target node, by exhaustive enumeration."""
+    node_id_to_alias = {value: key for key, value in graph._node_alias_id_map.items()}
+    used = set()
+    for target in target_nodes:
+        for source in set(graph.nodes()) - set(target_nodes):
+            for path in rx.all_simple_paths(
+                graph, graph._node_alias_id_map[source], graph._node_alias_id_map[target]
+            ):
+                if n_steps is None or len(path) - 1 <= n_steps:
+                    aliases = [node_id_to_alias[node] for node in path]
+                    used.update(zip(aliases, aliases[1:]))
+    return used
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_prune_graph_to_target_paths_matches_path_enumeration(seed):
+    """Test that pruning keeps every edge on a short enough source-to-target path, and only
+    those edges apart from some that leave a target node."""
+    rng = random.Random(seed)
+    nodes = [f"node{i}" for i in range(rng.randint(3, 8))]
+    density = rng.uniform(0.2, 0.6)
+    conversions = [
+        Conversion(src, tgt, _identity)
+        for src in nodes
+        for tgt in nodes
+        if src != tgt and rng.random() < density
+    ]
+    if not conversions:
+        pytest.skip("Randomly generated graph has no edges.")
+    graph = ConversionGraph(conversions=conversions, include_isolated=False)
+    target_nodes = rng.sample(nodes, rng.randint(1, 3))
+
+    for n_steps in (None, 0, 1, 2, 3, 5):
+        pruned = ConversionScheme.prune_graph_to_target_paths(graph, target_nodes, n_steps)
+        expected = _edges_on_target_paths(graph, target_nodes, n_steps)
+        kept = _edge_aliases(pruned)
+        assert expected <= kept
+        assert all(src in target_nodes for src, _ in kept - expected)
+        assert set(pruned.nodes()) == set(graph.nodes())
+
+
+def test_prune_graph_to_target_paths_requires_simple_paths():
+    """Test that an edge is only kept if it continues to a target without revisiting nodes."""
+    conversions = [
+        Conversion("a", "b", _identity),
+        Conversion("b", "a", _identity),
+        Conversion("a", "t", _identity),
+        Conversion("t", "c", _identity),
+        Conversion("c", "t", _identity),
+    ]
+    graph = ConversionGraph(conversions=conversions, include_isolated=False)
+
+    pruned = ConversionScheme.prune_graph_to_target_paths(graph, ["t"], None)
+
+    assert _edge_aliases(pruned) == {("b", "a"), ("a", "t"), ("c", "t")}
+    assert _edge_aliases(ConversionScheme.prune_graph_to_target_paths(graph, ["t"], 1)) == {
+        ("a", "t"),
+        ("c", "t"),
+    }
+
+
+def test_prune_graph_to_target_paths_through_target_node():
+    """Test that edges leaving a target are kept on paths that continue to another target."""
+    conversions = [
+        Conversion("a", "t1", _identity),
+        Conversion("t1", "b", _identity),
+        Conversion("b", "t2", _identity),
+        Conversion("t2", "a", _identity),
+    ]
+    graph = ConversionGraph(conversions=conversions, include_isolated=False)
+
+    assert _edge_aliases(ConversionScheme.prune_graph_to_target_paths(graph, ["t1", "t2"], 3)) == {
+        ("a", "t1"),
+        ("t1", "b"),
+        ("b", "t2"),
+        ("t2", "a"),
+    }
+    assert _edge_aliases(ConversionScheme.prune_graph_to_target_paths(graph, ["t1", "t2"], 2)) == {
+        ("a", "t1"),
+        ("b", "t2"),
+    }
+
+
+def test_prune_graph_to_target_paths_dense_graph_with_edges_leaving_targets():
+    """Test that edges leaving targets of a complete graph are decided without enumerating
+    its exponentially many simple paths."""
+    nodes = [f"node{i}" for i in range(40)]
+    conversions = [Conversion(src, tgt, _identity) for src in nodes for tgt in nodes if src != tgt]
+    graph = ConversionGraph(conversions=conversions, include_isolated=False)
+
+    pruned = ConversionScheme.prune_graph_to_target_paths(graph, nodes[:2], None)
+    assert pruned.num_edges() == graph.num_edges()
+
+    pruned = ConversionScheme.prune_graph_to_target_paths(graph, nodes[:2], 1)
+    assert _edge_aliases(pruned) == {(src, tgt) for src in nodes[2:] for tgt in nodes[:2]}